@@ -18,6 +18,7 @@ from ._client import (
     RequestOptions,
 )
 from ._models import BaseModel
+from ._ndjson import StreamFrameStats
 from ._version import __title__, __version__
 from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
 from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
@@ -77,6 +78,7 @@ __all__ = [
     "ENVIRONMENTS",
     "file_from_path",
     "BaseModel",
+    "StreamFrameStats",
     "DEFAULT_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_CONNECTION_LIMITS",
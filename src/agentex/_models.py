@@ -757,7 +757,11 @@ def _build_discriminated_union_meta(*, union: type, meta_annotations: tuple[Any,
                 # Note: if one variant defines an alias then they all should
                 discriminator_alias = field_info.alias
 
-                if (annotation := getattr(field_info, "annotation", None)) and is_literal_type(annotation):
+                annotation = getattr(field_info, "annotation", None)
+                if annotation is not None and is_union(get_origin(annotation)):
+                    # `Optional[Literal[...]]`
+                    annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+                if annotation is not None and is_literal_type(annotation):
                     for entry in get_args(annotation):
                         if isinstance(entry, str):
                             mapping[entry] = variant
@@ -770,6 +774,9 @@ def _build_discriminated_union_meta(*, union: type, meta_annotations: tuple[Any,
                 discriminator_alias = field.get("serialization_alias")
 
                 field_schema = field["schema"]
+                # `Optional[Literal[...]] = None` wraps the literal in default/nullable schemas
+                while field_schema["type"] in ("default", "nullable"):
+                    field_schema = cast(Any, field_schema)["schema"]
 
                 if field_schema["type"] == "literal":
                     for entry in cast("LiteralSchema", field_schema)["expected"]:
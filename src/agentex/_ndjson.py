@@ -0,0 +1,223 @@
+"""Typed decoding of newline-delimited JSON RPC streams.
+
+Agents answer streamed RPCs (e.g. ``message/send`` with ``stream: true``) with
+one JSON document per line, optionally prefixed with ``data:``.
+
+Validation goes through cached ``TypeAdapter``s, with one shortcut: the
+generated unions (e.g. ``TaskMessageUpdate``) are tagged with a
+``PropertyInfo(discriminator=...)`` that pydantic does not see, and since the
+tag fields are optional pydantic cannot discriminate them itself. A plain
+validation therefore tries every variant, and every variant of every nested
+union, for each line. ``_tagged_validator`` resolves those unions by their tag
+first and validates only the matching variant. A line the shortcut rejects is
+validated again the plain way, so results and errors are unchanged.
+
+Lines that are not JSON are skipped and counted in ``StreamFrameStats``
+rather than dropped silently. Lines that are JSON but do not match the
+response type raise ``ValueError``, unless the decoder is ``lenient``: then
+they are built without validation (``construct_type``), so a peer on a newer
+schema does not break the stream, and counted as ``unvalidated``.
+"""
+
+from __future__ import annotations
+
+import json
+import inspect
+import logging
+from typing import Any, Generic, TypeVar, Callable, Iterator, Optional, AsyncIterator, cast
+from dataclasses import dataclass
+
+import pydantic
+
+from ._utils import is_dict, is_list, get_args, is_union, get_origin, is_list_type, is_annotated_type
+from ._compat import PYDANTIC_V1
+from ._models import validate_type, construct_type, _build_discriminated_union_meta
+
+if not PYDANTIC_V1:
+    from ._models import TypeAdapter
+
+_T = TypeVar("_T")
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamFrameStats:
+    """Frame counts for one streamed response, filled in as it is consumed."""
+
+    frames: int = 0
+    """Non-empty lines received."""
+
+    malformed: int = 0
+    """Lines that were not valid JSON; skipped."""
+
+    unvalidated: int = 0
+    """Lines that did not match the response type and were built unvalidated (lenient mode only)."""
+
+    invalid: int = 0
+    """Lines that did not match the response type (strict mode)."""
+
+    last_error: Optional[str] = None
+
+
+class NDJSONDecoder(Generic[_T]):
+    """Decodes the lines of a newline-delimited JSON stream into ``type_``."""
+
+    def __init__(self, type_: type[_T], *, lenient: bool = False, stats: StreamFrameStats | None = None) -> None:
+        self._type = type_
+        self._lenient = lenient
+        self.stats = stats if stats is not None else StreamFrameStats()
+        if not PYDANTIC_V1:
+            self._adapter = TypeAdapter(type_)
+            self._tagged = _tagged_validator(type_)
+
+    def decode(self, line: str) -> _T | None:
+        """Decode one line; returns ``None`` for blank and malformed lines."""
+        payload = line.strip()
+        if payload.startswith("data:"):
+            payload = payload[5:].lstrip()
+        if not payload:
+            return None
+        stats = self.stats
+        stats.frames += 1
+
+        try:
+            return self._validate_json(payload)
+        except ValueError as e:  # pydantic.ValidationError and json.JSONDecodeError are ValueErrors
+            if _is_json_error(e):
+                stats.malformed += 1
+                stats.last_error = f"Malformed frame: {payload[:200]!r}"
+                if stats.malformed == 1:
+                    log.warning("Skipping malformed frame in %s stream: %r", self._type.__name__, payload[:200])
+                return None
+            if not self._lenient:
+                stats.invalid += 1
+                stats.last_error = f"Invalid {self._type.__name__} frame: {payload[:200]!r}"
+                raise ValueError(f"Invalid {self._type.__name__} returned: {payload}") from e
+
+        stats.unvalidated += 1
+        return cast(_T, construct_type(value=json.loads(payload), type_=self._type))
+
+    def iter_lines(self, lines: Iterator[str]) -> Iterator[_T]:
+        for line in lines:
+            item = self.decode(line)
+            if item is not None:
+                yield item
+
+    async def aiter_lines(self, lines: AsyncIterator[str]) -> AsyncIterator[_T]:
+        async for line in lines:
+            item = self.decode(line)
+            if item is not None:
+                yield item
+
+    if PYDANTIC_V1:
+
+        def _validate_json(self, payload: str) -> _T:
+            return validate_type(type_=self._type, value=json.loads(payload))
+
+    else:
+
+        def _validate_json(self, payload: str) -> _T:
+            if self._tagged is None:
+                return cast(_T, self._adapter.validate_json(payload))
+            value = json.loads(payload)
+            try:
+                return cast(_T, self._tagged(value))
+            except pydantic.ValidationError:
+                return cast(_T, self._adapter.validate_python(value))
+
+
+def _is_json_error(error: ValueError) -> bool:
+    if isinstance(error, json.JSONDecodeError):
+        return True
+    if isinstance(error, pydantic.ValidationError) and not PYDANTIC_V1:
+        return any(detail["type"] == "json_invalid" for detail in error.errors())
+    return False
+
+
+_Validator = Callable[[Any], Any]
+
+# type -> validator, or None for types without tagged unions (left to pydantic);
+# a type maps to None while its validator is being built, so recursive models stop there
+_tagged_validators: dict[Any, Optional[_Validator]] = {}
+
+
+def _tagged_validator(type_: Any, metadata: tuple[Any, ...] = ()) -> Optional[_Validator]:
+    """A validator for ``type_`` that picks tagged-union variants by their tag, or ``None`` if it has no tagged unions."""
+    key = (type_, metadata)
+    try:
+        return _tagged_validators[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable metadata
+        return None
+    _tagged_validators[key] = None
+    validator = _build_tagged_validator(type_, metadata)
+    _tagged_validators[key] = validator
+    return validator
+
+
+def _build_tagged_validator(type_: Any, metadata: tuple[Any, ...]) -> Optional[_Validator]:
+    if is_annotated_type(type_):
+        metadata = (*get_args(type_)[1:], *metadata)
+        type_ = get_args(type_)[0]
+    origin = get_origin(type_) or type_
+    args = get_args(type_)
+
+    if is_union(origin):
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            inner = _tagged_validator(members[0], metadata)
+            if inner is None:
+                return None
+            optional_inner = inner
+            return lambda value: None if value is None else optional_inner(value)
+
+        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=metadata)
+        if discriminator is None:
+            return None
+        tag_field = discriminator.field_alias_from or discriminator.field_name
+        variants: dict[str, _Validator] = {
+            tag: _tagged_validator(variant) or TypeAdapter(variant).validate_python
+            for tag, variant in discriminator.mapping.items()
+        }
+        untagged = TypeAdapter(type_).validate_python
+
+        def validate_union(value: Any) -> Any:
+            tag = value.get(tag_field) if is_dict(value) else None
+            if isinstance(tag, str) and tag in variants:
+                return variants[tag](value)
+            return untagged(value)
+
+        return validate_union
+
+    if is_list_type(origin) and args:
+        item = _tagged_validator(args[0])
+        if item is None:
+            return None
+        list_item = item
+        return lambda value: [list_item(entry) for entry in value] if is_list(value) else value
+
+    if inspect.isclass(origin) and issubclass(origin, pydantic.BaseModel):
+        model = cast("type[pydantic.BaseModel]", origin)
+        fields: list[tuple[str, _Validator]] = []
+        for name, field in model.model_fields.items():
+            if field.annotation is None:
+                continue
+            field_validator = _tagged_validator(field.annotation, tuple(field.metadata))
+            if field_validator is not None:
+                fields.append((field.alias or name, field_validator))
+        if not fields:
+            return None
+
+        def validate_model(value: Any) -> Any:
+            if is_dict(value):
+                value = dict(value)
+                for key, field_validator in fields:
+                    if key in value:
+                        value[key] = field_validator(value[key])
+            return model.model_validate(value)
+
+        return validate_model
+
+    return None
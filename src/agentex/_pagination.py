@@ -0,0 +1,93 @@
+"""Prefetching auto-pagination for the list endpoints.
+
+``tasks.list``, ``messages.list`` and ``spans.list`` page by ``page_number``
+and ``messages.list_paginated`` by ``next_cursor``; each call returns a single
+page. ``auto_paginate`` walks every page and yields the items, fetching the
+next page in the background while the caller consumes the current one, so
+only the first request is waited out in full.
+
+Pages are fetched one at a time and in order, and at most ``prefetch`` pages
+are fetched ahead of the one being consumed. Closing the iterator early
+(``break`` inside ``async with contextlib.aclosing(...)``, or the iterator
+being garbage collected) cancels the request in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Tuple, Union, TypeVar, Callable, Optional, Awaitable, AsyncIterator
+
+_T = TypeVar("_T")
+_CursorT = TypeVar("_CursorT")
+
+DEFAULT_PREFETCH = 1
+
+FetchPage = Callable[[_CursorT], Awaitable[Tuple[List[_T], Optional[_CursorT]]]]
+"""Fetches the page at a cursor; returns its items and the next page's cursor, or ``None`` after the last page."""
+
+
+class _Failed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_DONE: Any = object()
+
+
+async def auto_paginate(
+    fetch_page: FetchPage[_CursorT, _T],
+    start: _CursorT,
+    *,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[_T]:
+    """Yield the items of every page, starting at ``start``, prefetching up to ``prefetch`` pages ahead."""
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+
+    pages: asyncio.Queue[Union[List[_T], _Failed]] = asyncio.Queue()
+    # one slot per page fetched but not yet handed to the consumer
+    slots = asyncio.Semaphore(prefetch)
+
+    async def produce() -> None:
+        cursor: Optional[_CursorT] = start
+        try:
+            while cursor is not None:
+                await slots.acquire()
+                items, cursor = await fetch_page(cursor)
+                pages.put_nowait(items)
+            pages.put_nowait(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            pages.put_nowait(_Failed(e))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            page = await pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, _Failed):
+                raise page.error
+            slots.release()
+            for item in page:
+                yield item
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+
+def page_number_fetcher(
+    list_page: Callable[[int], Awaitable[List[_T]]],
+) -> FetchPage[int, _T]:
+    """Adapt a ``page_number`` list call; the first empty page ends the listing."""
+
+    async def fetch_page(page_number: int) -> Tuple[List[_T], Optional[int]]:
+        items = await list_page(page_number)
+        return items, (page_number + 1 if items else None)
+
+    return fetch_page
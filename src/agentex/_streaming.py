@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 import inspect
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, Optional, AsyncIterator, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterable, Iterator, Optional, AsyncIterator, cast
 from typing_extensions import Self, Protocol, TypeGuard, override, get_origin, runtime_checkable
 
 import httpx
@@ -192,6 +192,18 @@ class ServerSentEvent:
 
 
 class SSEDecoder:
+    """Incremental SSE decoder.
+
+    Network chunks are appended to a byte buffer; each time a chunk completes
+    one or more lines, the complete region is decoded from UTF-8 once, split on
+    ``\\n`` (after normalizing ``\\r\\n`` and ``\\r``) and parsed in a single
+    pass, so each event comes out with its data lines already joined. When a
+    region holds only whole events, single-line ``data:`` events (the shape of
+    token deltas) are taken a block at a time instead of line by line. A
+    ``\\r\\n`` split across two chunks is handled by dropping a leading
+    ``\\n`` after a chunk that ended in ``\\r``.
+    """
+
     _data: list[str]
     _event: str | None
     _retry: int | None
@@ -202,50 +214,129 @@ class SSEDecoder:
         self._data = []
         self._last_event_id = None
         self._retry = None
+        # bytes received after the last line terminator
+        self._partial: list[bytes] = []
+        # the previous chunk ended in \r, which may be the first half of \r\n
+        self._skip_lf = False
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            yield from self._feed(chunk)
+        yield from self._flush()
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    async def _aiter_chunks(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in self._feed(chunk):
+                yield sse
+        for sse in self._flush():
+            yield sse
+
+    def _feed(self, chunk: bytes) -> Iterable[ServerSentEvent]:
+        """Buffer ``chunk`` and parse every line it completes."""
+        if not self._partial and not self._skip_lf and chunk[-2:] == b"\n\n":
+            # the common case: a chunk of whole events
+            complete = chunk
+        else:
+            if not chunk:
+                return []
+            if self._skip_lf:
+                self._skip_lf = False
+                if chunk[:1] == b"\n":
+                    chunk = chunk[1:]
+                    if not chunk:
+                        return []
+
+            end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r"))
+            if end < 0:
+                self._partial.append(chunk)
+                return []
+
+            if self._partial:
+                self._partial.append(chunk[: end + 1])
+                complete = b"".join(self._partial)
+            else:
+                complete = chunk[: end + 1]
+            rest = chunk[end + 1 :]
+            self._partial = [rest] if rest else []
+            self._skip_lf = not rest and chunk[-1:] == b"\r"
+
+        try:
+            text = complete.decode("utf-8")
+        except UnicodeDecodeError:
+            # decode line by line so events before the bad line are still emitted
+            return self._iter_lines_strict(complete.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        if text[-2:] == "\n\n" and not self._data and not self._event and self._retry is None:
+            # Whole events only: decode block by block, taking single-line
+            # `data: ...` events (token deltas) without going line by line.
+            if text.startswith("data: ") and text.find("\n") == len(text) - 2:
+                return [ServerSentEvent(data=text[6:-2], id=self._last_event_id)]
+            blocks = text.split("\n\n")
+            if not blocks[-1]:
+                blocks.pop()
+                events: list[ServerSentEvent] = []
+                for block in blocks:
+                    if block.startswith("data: ") and "\n" not in block:
+                        events.append(ServerSentEvent(data=block[6:], id=self._last_event_id))
+                    else:
+                        events.extend(self._decode_lines([*block.split("\n"), ""]))
+                return events
+
+        lines = text.split("\n")
+        lines.pop()  # the empty string after the final terminator
+        return self._decode_lines(lines)
+
+    def _flush(self) -> list[ServerSentEvent]:
+        """Parse an unterminated final line at the end of the stream."""
+        if not self._partial:
+            return []
+        line = b"".join(self._partial).decode("utf-8")
+        self._partial = []
+        return self._decode_lines([line])
+
+    def _iter_lines_strict(self, complete: bytes) -> Iterator[ServerSentEvent]:
+        for raw_line in complete.split(b"\n")[:-1]:
+            yield from self._decode_lines([raw_line.decode("utf-8")])
+
+    def _decode_lines(self, lines: list[str]) -> list[ServerSentEvent]:
+        """Same rules as ``decode``, applied to many lines with the state kept in locals."""
+        events: list[ServerSentEvent] = []
+        event, data, last_event_id, retry = self._event, self._data, self._last_event_id, self._retry
+        for line in lines:
+            if not line:
+                if not event and not data and not last_event_id and retry is None:
+                    continue
+                events.append(ServerSentEvent(event=event, data="\n".join(data), id=last_event_id, retry=retry))
+                # NOTE: as per the SSE spec, do not reset last_event_id.
+                event, data, retry = None, [], None
+                continue
+            if line.startswith("data: "):
+                data.append(line[6:])
+                continue
+            if line[0] == ":":
+                continue
+
+            fieldname, _, value = line.partition(":")
+            if value[:1] == " ":
+                value = value[1:]
+            if fieldname == "data":
+                data.append(value)
+            elif fieldname == "event":
+                event = value
+            elif fieldname == "id":
+                if "\0" not in value:
+                    last_event_id = value
+            elif fieldname == "retry":
+                try:
+                    retry = int(value)
+                except (TypeError, ValueError):
+                    pass
+        self._event, self._data, self._last_event_id, self._retry = event, data, last_event_id, retry
+        return events
 
     def decode(self, line: str) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -5,6 +5,7 @@
 from agentex.lib.adk._modules.acp import ACPModule
 from agentex.lib.adk._modules.agents import AgentsModule
 from agentex.lib.adk._modules.agent_task_tracker import AgentTaskTrackerModule
+from agentex.lib.adk._modules.batch import BatchModule
 from agentex.lib.adk._modules.checkpointer import create_checkpointer
 from agentex.lib.adk._modules._langgraph_turn import LangGraphTurn, stream_langgraph_events
 from agentex.lib.adk._modules._langgraph_sync import (
@@ -54,6 +55,13 @@ streaming = StreamingModule()
 tracing = TracingModule()
 events = EventsModule()
 agent_task_tracker = AgentTaskTrackerModule()
+batch = BatchModule(
+    messages=messages,
+    state=state,
+    tasks=tasks,
+    agent_task_tracker=agent_task_tracker,
+    events=events,
+)
 
 __all__ = [
     # Core
@@ -66,6 +74,7 @@ __all__ = [
     "tracing",
     "events",
     "agent_task_tracker",
+    "batch",
     "TurnSpan",
     # Checkpointing / LangGraph
     "create_checkpointer",
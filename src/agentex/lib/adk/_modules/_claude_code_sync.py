@@ -41,13 +41,15 @@ examples/ agent or CI live-matrix row for claude-code.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, Awaitable, AsyncIterator
+from typing import Any, Callable, Sequence, Awaitable, AsyncIterator
 
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 from agentex.types.text_content import TextContent
+from agentex.lib.core.harness.types import StreamTaskMessage
 from agentex.types.reasoning_content import ReasoningContent
 from agentex.types.task_message_delta import TextDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS
 from agentex.types.task_message_update import (
     StreamTaskMessageDone,
     StreamTaskMessageFull,
@@ -129,26 +131,7 @@ async def _convert_claude_code_impl(
     ``aclose``) as a backstop, so a cancellation mid-turn (e.g. an interrupt that
     cancels the consuming task) does not leak the CLI stdout handle / subprocess.
     """
-    next_index = 0
-    tool_call_count = 0
-
-    # Streaming state for content_block_start / content_block_delta /
-    # content_block_stop triples.
-    _thinking_open = False
-    _thinking_buf = ""
-    _thinking_index: int | None = None
-    _text_open = False
-    _text_buf = ""
-    _text_index: int | None = None
-    # Full text of each block already delivered via stream_event deltas, so the
-    # materialised assistant envelope does not re-emit it. Matched by CONTENT,
-    # not block index: a single streamed message can arrive as several assistant
-    # envelopes (e.g. a thinking block, then the text block), and the per-block
-    # numeric index does not survive that split while the text does. Each match
-    # is consumed (one entry removed) so a genuinely repeated later block — a new
-    # turn that happens to emit identical text — is still delivered.
-    _streamed_texts: list[str] = []
-    _streamed_thinkings: list[str] = []
+    processor = _ClaudeCodeStreamProcessor()
 
     async for raw in lines:
         if not raw:
@@ -161,237 +144,17 @@ async def _convert_claude_code_impl(
             if not line:
                 continue
             try:
-                evt = json.loads(line)
-            except json.JSONDecodeError:
+                evt = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
                 logger.debug("claude-code: skipping non-JSON line: %r", line[:120])
                 continue
 
         evt_type = evt.get("type", "")
 
-        # -----------------------------------------------------------------------
-        # assistant / user — materialised content blocks
-        # -----------------------------------------------------------------------
-        if evt_type in ("assistant", "user"):
-            msg = evt.get("message", {})
-            blocks = msg.get("content", [])
-            if not isinstance(blocks, list):
-                blocks = [blocks]
-
-            for block in blocks:
-                if not isinstance(block, dict):
-                    continue
-                block_type = block.get("type", "")
-
-                if block_type == "text":
-                    text = block.get("text", "")
-                    if not text:
-                        continue
-                    # Skip blocks already delivered via stream_event deltas. Two
-                    # cases: (1) the streamed block already finished — its full
-                    # text is recorded in _streamed_texts; (2) the materialised
-                    # envelope arrives INTERLEAVED, mid-stream, before the streamed
-                    # block's content_block_stop records its buffer — the still-open
-                    # block's partial buffer is a prefix of this full text.
-                    if text in _streamed_texts:
-                        _streamed_texts.remove(text)
-                        continue
-                    if _text_open and _text_buf and text.startswith(_text_buf):
-                        continue
-                    msg_index = next_index
-                    next_index += 1
-                    yield StreamTaskMessageStart(
-                        type="start",
-                        index=msg_index,
-                        content=TextContent(
-                            type="text",
-                            author="agent",
-                            content="",
-                        ),
-                    )
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=msg_index,
-                        delta=TextDelta(type="text", text_delta=text),
-                    )
-                    yield StreamTaskMessageDone(type="done", index=msg_index)
-
-                elif block_type == "thinking":
-                    thinking_text = block.get("thinking", "")
-                    if thinking_text:
-                        # Skip blocks already delivered via stream_event deltas.
-                        # Same two cases as text above: finished streamed block
-                        # (recorded), or an interleaved materialised envelope whose
-                        # text the still-open streamed buffer is a prefix of.
-                        if thinking_text in _streamed_thinkings:
-                            _streamed_thinkings.remove(thinking_text)
-                            continue
-                        if _thinking_open and _thinking_buf and thinking_text.startswith(_thinking_buf):
-                            continue
-                        summary = _extract_summary(thinking_text)
-                        msg_index = next_index
-                        next_index += 1
-                        yield StreamTaskMessageStart(
-                            type="start",
-                            index=msg_index,
-                            content=ReasoningContent(
-                                type="reasoning",
-                                author="agent",
-                                summary=[summary],
-                                content=[],
-                                style="active",
-                            ),
-                        )
-                        yield StreamTaskMessageDelta(
-                            type="delta",
-                            index=msg_index,
-                            delta=ReasoningContentDelta(
-                                type="reasoning_content",
-                                content_index=0,
-                                content_delta=thinking_text,
-                            ),
-                        )
-                        yield StreamTaskMessageDone(type="done", index=msg_index)
-
-                elif block_type == "tool_use":
-                    tool_call_count += 1
-                    tool_id = block.get("id", f"tool_{tool_call_count}")
-                    name = block.get("name", "unknown")
-                    arguments = block.get("input", {})
-                    if not isinstance(arguments, dict):
-                        arguments = {}
-                    msg_index = next_index
-                    next_index += 1
-                    yield StreamTaskMessageStart(
-                        type="start",
-                        index=msg_index,
-                        content=ToolRequestContent(
-                            type="tool_request",
-                            author="agent",
-                            tool_call_id=tool_id,
-                            name=name,
-                            arguments=arguments,
-                        ),
-                    )
-                    yield StreamTaskMessageDone(type="done", index=msg_index)
-
-                elif block_type == "tool_result":
-                    tool_id = block.get("tool_use_id", "")
-                    content = block.get("content", "")
-                    is_error = block.get("is_error", False)
-                    if isinstance(content, list):
-                        content = "\n".join(b.get("text", str(b)) if isinstance(b, dict) else str(b) for b in content)
-                    result_str = _truncate(str(content))
-                    msg_index = next_index
-                    next_index += 1
-                    yield StreamTaskMessageFull(
-                        type="full",
-                        index=msg_index,
-                        content=ToolResponseContent(
-                            type="tool_response",
-                            author="agent",
-                            tool_call_id=tool_id,
-                            name="",
-                            content={"result": result_str, **({"is_error": True} if is_error else {})},
-                        ),
-                    )
-
-        # -----------------------------------------------------------------------
-        # stream_event — incremental streaming deltas
-        # -----------------------------------------------------------------------
-        elif evt_type == "stream_event":
-            se = evt.get("event") or {}
-            se_type = se.get("type", "")
-
-            if se_type == "content_block_start":
-                block = se.get("content_block") or {}
-                btype = block.get("type")
-
-                if btype == "thinking":
-                    _thinking_open = True
-                    _thinking_buf = ""
-                    msg_index = next_index
-                    next_index += 1
-                    _thinking_index = msg_index
-                    yield StreamTaskMessageStart(
-                        type="start",
-                        index=msg_index,
-                        content=ReasoningContent(
-                            type="reasoning",
-                            author="agent",
-                            summary=[],
-                            content=[],
-                            style="active",
-                        ),
-                    )
-
-                elif btype == "text":
-                    _text_open = True
-                    _text_buf = ""
-                    msg_index = next_index
-                    next_index += 1
-                    _text_index = msg_index
-                    yield StreamTaskMessageStart(
-                        type="start",
-                        index=msg_index,
-                        content=TextContent(
-                            type="text",
-                            author="agent",
-                            content="",
-                        ),
-                    )
-
-            elif se_type == "content_block_delta":
-                delta = se.get("delta") or {}
-                dtype = delta.get("type")
-
-                if dtype == "thinking_delta":
-                    chunk = delta.get("thinking", "")
-                    if chunk and _thinking_open:
-                        _thinking_buf += chunk
-                        if _thinking_index is not None:
-                            yield StreamTaskMessageDelta(
-                                type="delta",
-                                index=_thinking_index,
-                                delta=ReasoningContentDelta(
-                                    type="reasoning_content",
-                                    content_index=0,
-                                    content_delta=chunk,
-                                ),
-                            )
-
-                elif dtype == "text_delta":
-                    chunk = delta.get("text", "")
-                    if chunk and _text_open:
-                        _text_buf += chunk
-                        if _text_index is not None:
-                            yield StreamTaskMessageDelta(
-                                type="delta",
-                                index=_text_index,
-                                delta=TextDelta(type="text", text_delta=chunk),
-                            )
-
-            elif se_type == "content_block_stop":
-                if _thinking_open:
-                    _thinking_open = False
-                    # Record the streamed thinking so the materialised assistant
-                    # envelope doesn't re-emit it. Skip empties: a block_start with
-                    # no deltas leaves the assistant envelope free to fill the text.
-                    if _thinking_buf:
-                        _streamed_thinkings.append(_thinking_buf)
-                    _thinking_buf = ""
-                    if _thinking_index is not None:
-                        yield StreamTaskMessageDone(type="done", index=_thinking_index)
-                    _thinking_index = None
-                elif _text_open:
-                    _text_open = False
-                    # Record the streamed text for content-based dedup against the
-                    # materialised assistant envelope (see _streamed_texts).
-                    if _text_buf:
-                        _streamed_texts.append(_text_buf)
-                    _text_buf = ""
-                    if _text_index is not None:
-                        yield StreamTaskMessageDone(type="done", index=_text_index)
-                    _text_index = None
+        handler = _ENVELOPE_HANDLERS.get(evt_type)
+        if handler is not None:
+            for message in handler(processor, evt):
+                yield message
 
         # -----------------------------------------------------------------------
         # system / init — session metadata (ignored at this layer)
@@ -415,3 +178,319 @@ async def _convert_claude_code_impl(
 
         else:
             logger.debug("claude-code: unhandled envelope type %r", evt_type)
+
+
+class _ClaudeCodeStreamProcessor:
+    """Stateful converter: one claude-code envelope in, its Agentex events out.
+
+    Handles the ``assistant``/``user`` and ``stream_event`` envelopes; the
+    ``system`` and ``result`` envelopes drive the (async) callbacks instead and
+    stay in :func:`_convert_claude_code_impl`.
+
+    Streamed blocks collect their deltas in a list and join them when the block
+    stops (or when a materialised envelope needs the text so far), so a long
+    block is not re-copied on every delta.
+    """
+
+    def __init__(self) -> None:
+        self.next_index = 0
+        self.tool_call_count = 0
+
+        # Streaming state for content_block_start / content_block_delta /
+        # content_block_stop triples.
+        self.thinking_open = False
+        self.thinking_parts: list[str] = []
+        self.thinking_index: int | None = None
+        self.text_open = False
+        self.text_parts: list[str] = []
+        self.text_index: int | None = None
+        # Full text of each block already delivered via stream_event deltas, so the
+        # materialised assistant envelope does not re-emit it. Matched by CONTENT,
+        # not block index: a single streamed message can arrive as several assistant
+        # envelopes (e.g. a thinking block, then the text block), and the per-block
+        # numeric index does not survive that split while the text does. Each match
+        # is consumed (one entry removed) so a genuinely repeated later block — a new
+        # turn that happens to emit identical text — is still delivered.
+        self.streamed_texts: list[str] = []
+        self.streamed_thinkings: list[str] = []
+
+    def _alloc(self) -> int:
+        index = self.next_index
+        self.next_index += 1
+        return index
+
+    # -----------------------------------------------------------------------
+    # assistant / user — materialised content blocks
+    # -----------------------------------------------------------------------
+
+    def _on_message(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        msg = evt.get("message") or _EMPTY
+        blocks = msg.get("content")
+        if blocks is None:
+            return NO_EVENTS
+        if not isinstance(blocks, list):
+            blocks = [blocks]
+
+        events: list[StreamTaskMessage] = []
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            handler = _BLOCK_HANDLERS.get(block.get("type", ""))
+            if handler is not None:
+                events.extend(handler(self, block))
+        return events
+
+    def _on_text_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        text = block.get("text", "")
+        if not text:
+            return NO_EVENTS
+        # Skip blocks already delivered via stream_event deltas. Two
+        # cases: (1) the streamed block already finished — its full
+        # text is recorded in streamed_texts; (2) the materialised
+        # envelope arrives INTERLEAVED, mid-stream, before the streamed
+        # block's content_block_stop records its buffer — the still-open
+        # block's partial buffer is a prefix of this full text.
+        if text in self.streamed_texts:
+            self.streamed_texts.remove(text)
+            return NO_EVENTS
+        if self.text_open and self.text_parts and text.startswith("".join(self.text_parts)):
+            return NO_EVENTS
+        msg_index = self._alloc()
+        return (
+            StreamTaskMessageStart(
+                type="start",
+                index=msg_index,
+                content=TextContent(
+                    type="text",
+                    author="agent",
+                    content="",
+                ),
+            ),
+            StreamTaskMessageDelta(
+                type="delta",
+                index=msg_index,
+                delta=TextDelta(type="text", text_delta=text),
+            ),
+            StreamTaskMessageDone(type="done", index=msg_index),
+        )
+
+    def _on_thinking_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        thinking_text = block.get("thinking", "")
+        if not thinking_text:
+            return NO_EVENTS
+        # Skip blocks already delivered via stream_event deltas.
+        # Same two cases as text above: finished streamed block
+        # (recorded), or an interleaved materialised envelope whose
+        # text the still-open streamed buffer is a prefix of.
+        if thinking_text in self.streamed_thinkings:
+            self.streamed_thinkings.remove(thinking_text)
+            return NO_EVENTS
+        if self.thinking_open and self.thinking_parts and thinking_text.startswith("".join(self.thinking_parts)):
+            return NO_EVENTS
+        summary = _extract_summary(thinking_text)
+        msg_index = self._alloc()
+        return (
+            StreamTaskMessageStart(
+                type="start",
+                index=msg_index,
+                content=ReasoningContent(
+                    type="reasoning",
+                    author="agent",
+                    summary=[summary],
+                    content=[],
+                    style="active",
+                ),
+            ),
+            StreamTaskMessageDelta(
+                type="delta",
+                index=msg_index,
+                delta=ReasoningContentDelta(
+                    type="reasoning_content",
+                    content_index=0,
+                    content_delta=thinking_text,
+                ),
+            ),
+            StreamTaskMessageDone(type="done", index=msg_index),
+        )
+
+    def _on_tool_use_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        self.tool_call_count += 1
+        tool_id = block.get("id", f"tool_{self.tool_call_count}")
+        name = block.get("name", "unknown")
+        arguments = block.get("input")
+        if not isinstance(arguments, dict):
+            arguments = {}
+        msg_index = self._alloc()
+        return (
+            StreamTaskMessageStart(
+                type="start",
+                index=msg_index,
+                content=ToolRequestContent(
+                    type="tool_request",
+                    author="agent",
+                    tool_call_id=tool_id,
+                    name=name,
+                    arguments=arguments,
+                ),
+            ),
+            StreamTaskMessageDone(type="done", index=msg_index),
+        )
+
+    def _on_tool_result_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        tool_id = block.get("tool_use_id", "")
+        content = block.get("content", "")
+        is_error = block.get("is_error", False)
+        if isinstance(content, list):
+            content = "\n".join(b.get("text", str(b)) if isinstance(b, dict) else str(b) for b in content)
+        result_str = _truncate(str(content))
+        return (
+            StreamTaskMessageFull(
+                type="full",
+                index=self._alloc(),
+                content=ToolResponseContent(
+                    type="tool_response",
+                    author="agent",
+                    tool_call_id=tool_id,
+                    name="",
+                    content={"result": result_str, **({"is_error": True} if is_error else {})},
+                ),
+            ),
+        )
+
+    # -----------------------------------------------------------------------
+    # stream_event — incremental streaming deltas
+    # -----------------------------------------------------------------------
+
+    def _on_stream_event(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        se = evt.get("event") or _EMPTY
+        handler = _STREAM_EVENT_HANDLERS.get(se.get("type", ""))
+        return handler(self, se) if handler is not None else NO_EVENTS
+
+    def _on_content_block_start(self, se: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        block = se.get("content_block") or _EMPTY
+        btype = block.get("type")
+
+        if btype == "thinking":
+            self.thinking_open = True
+            self.thinking_parts = []
+            msg_index = self.thinking_index = self._alloc()
+            return (
+                StreamTaskMessageStart(
+                    type="start",
+                    index=msg_index,
+                    content=ReasoningContent(
+                        type="reasoning",
+                        author="agent",
+                        summary=[],
+                        content=[],
+                        style="active",
+                    ),
+                ),
+            )
+
+        if btype == "text":
+            self.text_open = True
+            self.text_parts = []
+            msg_index = self.text_index = self._alloc()
+            return (
+                StreamTaskMessageStart(
+                    type="start",
+                    index=msg_index,
+                    content=TextContent(
+                        type="text",
+                        author="agent",
+                        content="",
+                    ),
+                ),
+            )
+
+        return NO_EVENTS
+
+    def _on_content_block_delta(self, se: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        delta = se.get("delta") or _EMPTY
+        dtype = delta.get("type")
+
+        if dtype == "text_delta":
+            chunk = delta.get("text", "")
+            if not (chunk and self.text_open):
+                return NO_EVENTS
+            self.text_parts.append(chunk)
+            if self.text_index is None:
+                return NO_EVENTS
+            return (
+                StreamTaskMessageDelta(
+                    type="delta",
+                    index=self.text_index,
+                    delta=TextDelta(type="text", text_delta=chunk),
+                ),
+            )
+
+        if dtype == "thinking_delta":
+            chunk = delta.get("thinking", "")
+            if not (chunk and self.thinking_open):
+                return NO_EVENTS
+            self.thinking_parts.append(chunk)
+            if self.thinking_index is None:
+                return NO_EVENTS
+            return (
+                StreamTaskMessageDelta(
+                    type="delta",
+                    index=self.thinking_index,
+                    delta=ReasoningContentDelta(
+                        type="reasoning_content",
+                        content_index=0,
+                        content_delta=chunk,
+                    ),
+                ),
+            )
+
+        return NO_EVENTS
+
+    def _on_content_block_stop(self, _se: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        if self.thinking_open:
+            self.thinking_open = False
+            # Record the streamed thinking so the materialised assistant
+            # envelope doesn't re-emit it. Skip empties: a block_start with
+            # no deltas leaves the assistant envelope free to fill the text.
+            if self.thinking_parts:
+                self.streamed_thinkings.append("".join(self.thinking_parts))
+            self.thinking_parts = []
+            msg_index, self.thinking_index = self.thinking_index, None
+        elif self.text_open:
+            self.text_open = False
+            # Record the streamed text for content-based dedup against the
+            # materialised assistant envelope (see streamed_texts).
+            if self.text_parts:
+                self.streamed_texts.append("".join(self.text_parts))
+            self.text_parts = []
+            msg_index, self.text_index = self.text_index, None
+        else:
+            return NO_EVENTS
+        if msg_index is None:
+            return NO_EVENTS
+        return (StreamTaskMessageDone(type="done", index=msg_index),)
+
+
+_EMPTY: dict[str, Any] = {}
+"""Shared stand-in for a missing sub-object; only ever read."""
+
+_Handler = Callable[[_ClaudeCodeStreamProcessor, "dict[str, Any]"], Sequence[StreamTaskMessage]]
+
+_ENVELOPE_HANDLERS: dict[str, _Handler] = {
+    "assistant": _ClaudeCodeStreamProcessor._on_message,
+    "user": _ClaudeCodeStreamProcessor._on_message,
+    "stream_event": _ClaudeCodeStreamProcessor._on_stream_event,
+}
+
+_BLOCK_HANDLERS: dict[str, _Handler] = {
+    "text": _ClaudeCodeStreamProcessor._on_text_block,
+    "thinking": _ClaudeCodeStreamProcessor._on_thinking_block,
+    "tool_use": _ClaudeCodeStreamProcessor._on_tool_use_block,
+    "tool_result": _ClaudeCodeStreamProcessor._on_tool_result_block,
+}
+
+_STREAM_EVENT_HANDLERS: dict[str, _Handler] = {
+    "content_block_start": _ClaudeCodeStreamProcessor._on_content_block_start,
+    "content_block_delta": _ClaudeCodeStreamProcessor._on_content_block_delta,
+    "content_block_stop": _ClaudeCodeStreamProcessor._on_content_block_stop,
+}
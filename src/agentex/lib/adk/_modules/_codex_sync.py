@@ -90,11 +90,13 @@ UNMAPPED / PARTIALLY MAPPED EVENTS
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, AsyncIterator
+from typing import Any, Callable, Sequence, AsyncIterator
 
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 from agentex.types.reasoning_content import ReasoningContent
 from agentex.types.task_message_delta import TextDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS
 from agentex.types.task_message_update import (
     StreamTaskMessageDone,
     StreamTaskMessageFull,
@@ -216,6 +218,9 @@ class _CodexStreamProcessor:
     Ported from the golden agent's ``_CodexEventProcessor`` in
     ``project/harness/providers/codex.py``, adapted to yield
     ``StreamTaskMessage*`` directly instead of ``HarnessEvent`` objects.
+    Events are routed through ``_EVENT_HANDLERS`` (by event type) and
+    ``_ITEM_HANDLERS`` (by item type); events that emit nothing return the
+    shared ``NO_EVENTS``.
 
     State tracked:
     - ``_next_index``: monotonically increasing message index.
@@ -257,314 +262,301 @@ class _CodexStreamProcessor:
         self._next_index += 1
         return idx
 
-    def process(self, evt: dict[str, Any]) -> list[StreamTaskMessage]:
+    def process(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
         evt_type = evt.get("type", "")
+        handler = _EVENT_HANDLERS.get(evt_type)
+        if handler is None:
+            logger.debug("[codex] unhandled event type=%s", evt_type)
+            return NO_EVENTS
+        return handler(self, evt)
+
+    # -- top-level events ----------------------------------------------------
+
+    def _on_thread_started(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        sid = evt.get("thread_id") or ""
+        if sid:
+            self.session_id = sid
+        return NO_EVENTS
+
+    def _on_turn_boundary(self, _evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        # turn.started: the activity layer owns turn lifecycle; nothing to emit.
+        # turn.completed: usage is forwarded via on_result (not a StreamTaskMessage).
+        return NO_EVENTS
+
+    def _on_turn_failed(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        err = evt.get("error") or {}
+        msg = err.get("message", "codex turn failed") if isinstance(err, dict) else str(err)
+        return (_error_full(f"Codex turn failed: {msg}", self._alloc()),)
+
+    def _on_error(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        return (_error_full(evt.get("message", "codex error"), self._alloc()),)
+
+    def _on_item(self, evt: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        evt_type = evt["type"]
+        item = evt.get("item") or {}
+        item_type = item.get("type") or ""
+        handler = _ITEM_HANDLERS.get(item_type)
+        if handler is None:
+            logger.debug("[codex] unhandled item type=%s evt=%s", item_type, evt_type)
+            return NO_EVENTS
+        return handler(self, evt_type, item_type, item.get("id") or "", item)
 
-        if evt_type == "thread.started":
-            sid = evt.get("thread_id") or ""
-            if sid:
-                self.session_id = sid
-            return []
-
-        if evt_type == "turn.started":
-            # The activity layer owns turn lifecycle; nothing to emit.
-            return []
-
-        if evt_type == "turn.completed":
-            # Usage forwarded via on_result callback (not a StreamTaskMessage).
-            return []
-
-        if evt_type == "turn.failed":
-            err = evt.get("error") or {}
-            msg = err.get("message", "codex turn failed") if isinstance(err, dict) else str(err)
-            return [_error_full(f"Codex turn failed: {msg}", self._alloc())]
-
-        if evt_type == "error":
-            return [_error_full(evt.get("message", "codex error"), self._alloc())]
-
-        if evt_type in ("item.started", "item.updated", "item.completed"):
-            item = evt.get("item") or {}
-            return self._handle_item(evt_type, item)
+    # -- items ---------------------------------------------------------------
 
-        logger.debug("[codex] unhandled event type=%s", evt_type)
-        return []
+    def _on_agent_message(
+        self, evt_type: str, _item_type: str, item_id: str, item: dict[str, Any]
+    ) -> Sequence[StreamTaskMessage]:
+        current = item.get("text") or ""
+        previous = self._text_accumulated.get(item_id, "")
+        self._text_accumulated[item_id] = current
 
-    def _handle_item(self, evt_type: str, item: dict[str, Any]) -> list[StreamTaskMessage]:
-        item_id = item.get("id") or ""
-        item_type = item.get("type") or ""
         out: list[StreamTaskMessage] = []
-
-        if item_type == "agent_message":
-            current = item.get("text") or ""
-            previous = self._text_accumulated.get(item_id, "")
-
-            if evt_type in ("item.started", "item.updated"):
-                if item_id not in self._text_index:
-                    idx = self._alloc()
-                    self._text_index[item_id] = idx
-                    out.append(
-                        StreamTaskMessageStart(
-                            type="start",
-                            index=idx,
-                            content=TextContent(
-                                type="text",
-                                author="agent",
-                                content="",
-                            ),
-                        )
-                    )
-                idx = self._text_index[item_id]
-                delta = ""
-                if current.startswith(previous) and len(current) > len(previous):
-                    delta = current[len(previous) :]
-                elif current and current != previous:
-                    delta = current
-                if delta:
-                    out.append(
-                        StreamTaskMessageDelta(
-                            type="delta",
-                            index=idx,
-                            delta=TextDelta(type="text", text_delta=delta),
-                        )
-                    )
-                self._text_accumulated[item_id] = current
-
-            elif evt_type == "item.completed":
-                if item_id not in self._text_index:
-                    idx = self._alloc()
-                    self._text_index[item_id] = idx
-                    out.append(
-                        StreamTaskMessageStart(
-                            type="start",
-                            index=idx,
-                            content=TextContent(
-                                type="text",
-                                author="agent",
-                                content="",
-                            ),
-                        )
-                    )
-                idx = self._text_index[item_id]
-                delta = ""
-                if current.startswith(previous) and len(current) > len(previous):
-                    delta = current[len(previous) :]
-                elif current and current != previous:
-                    delta = current
-                if delta:
-                    out.append(
-                        StreamTaskMessageDelta(
-                            type="delta",
-                            index=idx,
-                            delta=TextDelta(type="text", text_delta=delta),
-                        )
-                    )
-                out.append(StreamTaskMessageDone(type="done", index=idx))
-                self._text_accumulated[item_id] = current
-
-        elif item_type == "reasoning":
-            current = item.get("text") or ""
-
-            if evt_type == "item.started":
-                idx = self._alloc()
-                self._reasoning_index[item_id] = idx
-                self._reasoning_text[item_id] = current
-                out.append(
-                    StreamTaskMessageStart(
-                        type="start",
-                        index=idx,
-                        content=ReasoningContent(
-                            type="reasoning",
-                            author="agent",
-                            summary=[],
-                            content=[],
-                            style="active",
-                        ),
-                    )
+        idx = self._text_index.get(item_id)
+        if idx is None:
+            idx = self._text_index[item_id] = self._alloc()
+            out.append(
+                StreamTaskMessageStart(
+                    type="start",
+                    index=idx,
+                    content=TextContent(
+                        type="text",
+                        author="agent",
+                        content="",
+                    ),
                 )
-
-            elif evt_type == "item.updated":
-                # Accumulate silently; final text arrives on item.completed.
-                self._reasoning_text[item_id] = current
-
-            elif evt_type == "item.completed":
-                text = current or self._reasoning_text.get(item_id, "")
-                idx = self._reasoning_index.get(item_id)
-                if text:
-                    self.reasoning_count += 1
-                    summary = text.strip().split("\n", 1)[0][:300]
-                    if idx is None:
-                        # No started event was seen; open the message now.
-                        idx = self._alloc()
-                        out.append(
-                            StreamTaskMessageStart(
-                                type="start",
-                                index=idx,
-                                content=ReasoningContent(
-                                    type="reasoning",
-                                    author="agent",
-                                    summary=[],
-                                    content=[],
-                                    style="active",
-                                ),
-                            )
-                        )
-                    # Deliver the reasoning as deltas, then close with a Done.
-                    # Emitting a Full here instead would leave the open Start
-                    # context dangling: auto_send routes Full into its own
-                    # throwaway streaming context (ignoring the index), so the
-                    # Start context survives until end-of-turn teardown and
-                    # persists a second, near-empty reasoning message. Streaming
-                    # the content as deltas lets the open context accumulate the
-                    # final ReasoningContent and close cleanly as one message.
-                    out.append(
-                        StreamTaskMessageDelta(
-                            type="delta",
-                            index=idx,
-                            delta=ReasoningSummaryDelta(
-                                type="reasoning_summary",
-                                summary_index=0,
-                                summary_delta=summary,
-                            ),
-                        )
-                    )
-                    out.append(
-                        StreamTaskMessageDelta(
-                            type="delta",
-                            index=idx,
-                            delta=ReasoningContentDelta(
-                                type="reasoning_content",
-                                content_index=0,
-                                content_delta=text,
-                            ),
-                        )
-                    )
-                    out.append(StreamTaskMessageDone(type="done", index=idx))
-                elif idx is not None:
-                    # Empty reasoning block — still need to close with a Done.
-                    out.append(StreamTaskMessageDone(type="done", index=idx))
-
-        elif item_type in (
-            "command_execution",
-            "file_change",
-            "mcp_tool_call",
-            "web_search",
-            "todo_list",
-            "collab_tool_call",
-        ):
-            # Resolve a stable id once per item; reuse it for both halves.
-            tool_call_id = self._tool_call_ids.get(item_id)
-            if tool_call_id is None:
-                tool_call_id = item_id or f"codex_tool_{self.tool_call_count + 1}"
-                self._tool_call_ids[item_id] = tool_call_id
-
-            if evt_type == "item.started":
-                self.tool_call_count += 1
-                self._tool_open.add(item_id)
-                self._tool_item_types[item_id] = item_type
-                name = _tool_name_for(item_type, item)
-                args = _tool_args_for(item_type, item)
-                req_idx = self._alloc()
-                out.append(
-                    StreamTaskMessageStart(
-                        type="start",
-                        index=req_idx,
-                        content=ToolRequestContent(
-                            type="tool_request",
-                            author="agent",
-                            tool_call_id=tool_call_id,
-                            name=name,
-                            arguments=args,
-                        ),
-                    )
+            )
+
+        delta = ""
+        if current.startswith(previous) and len(current) > len(previous):
+            delta = current[len(previous) :]
+        elif current and current != previous:
+            delta = current
+        if delta:
+            out.append(
+                StreamTaskMessageDelta(
+                    type="delta",
+                    index=idx,
+                    delta=TextDelta(type="text", text_delta=delta),
                 )
-                out.append(StreamTaskMessageDone(type="done", index=req_idx))
-
-            elif evt_type == "item.updated" and item_type in _PROGRESSIVE_TOOL_ITEMS:
-                # Codex revises its plan in place: one todo_list item is opened
-                # at the start of the turn and ticked off through item.updated,
-                # with item.completed only arriving at the very end. Forwarding
-                # each revision as a response for the SAME tool_call_id lets a
-                # consumer show the checklist filling in as the turn runs; the
-                # last response received is the current state.
-                if item_id in self._tool_open:
-                    actual_type = self._tool_item_types.get(item_id, item_type)
-                    result_text, is_error = _tool_output_for(actual_type, item)
-                    resp_content: dict[str, Any] = {"result": result_text}
-                    if is_error:
-                        resp_content["is_error"] = True
-                    out.append(
-                        StreamTaskMessageFull(
-                            type="full",
-                            index=self._alloc(),
-                            content=ToolResponseContent(
-                                type="tool_response",
-                                author="agent",
-                                tool_call_id=tool_call_id,
-                                name=_tool_name_for(actual_type, item),
-                                content=resp_content,
-                            ),
-                        )
-                    )
-
-            elif evt_type == "item.completed":
-                # file_change items may only emit item.completed (no started).
-                if item_id not in self._tool_open:
-                    self.tool_call_count += 1
-                    self._tool_open.add(item_id)
-                    self._tool_item_types[item_id] = item_type
-                    name = _tool_name_for(item_type, item)
-                    args = _tool_args_for(item_type, item)
-                    req_idx = self._alloc()
-                    out.append(
-                        StreamTaskMessageFull(
-                            type="full",
-                            index=req_idx,
-                            content=ToolRequestContent(
-                                type="tool_request",
-                                author="agent",
-                                tool_call_id=tool_call_id,
-                                name=name,
-                                arguments=args,
-                            ),
-                        )
-                    )
-
-                actual_type = self._tool_item_types.get(item_id, item_type)
-                result_text, is_error = _tool_output_for(actual_type, item)
-                name = _tool_name_for(actual_type, item)
-                resp_content: dict[str, Any] = {"result": result_text}
-                if is_error:
-                    resp_content["is_error"] = True
-                out.append(
-                    StreamTaskMessageFull(
-                        type="full",
-                        index=self._alloc(),
-                        content=ToolResponseContent(
-                            type="tool_response",
-                            author="agent",
-                            tool_call_id=tool_call_id,
-                            name=name,
-                            content=resp_content,
-                        ),
-                    )
+            )
+        if evt_type == "item.completed":
+            out.append(StreamTaskMessageDone(type="done", index=idx))
+        return out or NO_EVENTS
+
+    def _on_reasoning(
+        self, evt_type: str, _item_type: str, item_id: str, item: dict[str, Any]
+    ) -> Sequence[StreamTaskMessage]:
+        current = item.get("text") or ""
+
+        if evt_type == "item.started":
+            idx = self._alloc()
+            self._reasoning_index[item_id] = idx
+            self._reasoning_text[item_id] = current
+            return (
+                StreamTaskMessageStart(
+                    type="start",
+                    index=idx,
+                    content=ReasoningContent(
+                        type="reasoning",
+                        author="agent",
+                        summary=[],
+                        content=[],
+                        style="active",
+                    ),
+                ),
+            )
+
+        if evt_type == "item.updated":
+            # Accumulate silently; final text arrives on item.completed.
+            self._reasoning_text[item_id] = current
+            return NO_EVENTS
+
+        text = current or self._reasoning_text.get(item_id, "")
+        idx = self._reasoning_index.get(item_id)
+        if not text:
+            # Empty reasoning block — still need to close with a Done.
+            return (StreamTaskMessageDone(type="done", index=idx),) if idx is not None else NO_EVENTS
+
+        out: list[StreamTaskMessage] = []
+        self.reasoning_count += 1
+        summary = text.strip().split("\n", 1)[0][:300]
+        if idx is None:
+            # No started event was seen; open the message now.
+            idx = self._alloc()
+            out.append(
+                StreamTaskMessageStart(
+                    type="start",
+                    index=idx,
+                    content=ReasoningContent(
+                        type="reasoning",
+                        author="agent",
+                        summary=[],
+                        content=[],
+                        style="active",
+                    ),
                 )
-                self._tool_open.discard(item_id)
-                # Free the id mapping so a later item reusing an empty id gets a
-                # fresh fallback rather than colliding with this one.
-                self._tool_call_ids.pop(item_id, None)
+            )
+        # Deliver the reasoning as deltas, then close with a Done.
+        # Emitting a Full here instead would leave the open Start
+        # context dangling: auto_send routes Full into its own
+        # throwaway streaming context (ignoring the index), so the
+        # Start context survives until end-of-turn teardown and
+        # persists a second, near-empty reasoning message. Streaming
+        # the content as deltas lets the open context accumulate the
+        # final ReasoningContent and close cleanly as one message.
+        out.append(
+            StreamTaskMessageDelta(
+                type="delta",
+                index=idx,
+                delta=ReasoningSummaryDelta(
+                    type="reasoning_summary",
+                    summary_index=0,
+                    summary_delta=summary,
+                ),
+            )
+        )
+        out.append(
+            StreamTaskMessageDelta(
+                type="delta",
+                index=idx,
+                delta=ReasoningContentDelta(
+                    type="reasoning_content",
+                    content_index=0,
+                    content_delta=text,
+                ),
+            )
+        )
+        out.append(StreamTaskMessageDone(type="done", index=idx))
+        return out
 
-        elif item_type == "error":
-            if evt_type == "item.completed":
-                out.append(_error_full(item.get("message", "codex item error"), self._alloc()))
+    def _on_tool_item(
+        self, evt_type: str, item_type: str, item_id: str, item: dict[str, Any]
+    ) -> Sequence[StreamTaskMessage]:
+        # Resolve a stable id once per item; reuse it for both halves.
+        tool_call_id = self._tool_call_ids.get(item_id)
+        if tool_call_id is None:
+            tool_call_id = item_id or f"codex_tool_{self.tool_call_count + 1}"
+            self._tool_call_ids[item_id] = tool_call_id
+
+        if evt_type == "item.started":
+            self.tool_call_count += 1
+            self._tool_open.add(item_id)
+            self._tool_item_types[item_id] = item_type
+            name = _tool_name_for(item_type, item)
+            args = _tool_args_for(item_type, item)
+            req_idx = self._alloc()
+            return (
+                StreamTaskMessageStart(
+                    type="start",
+                    index=req_idx,
+                    content=ToolRequestContent(
+                        type="tool_request",
+                        author="agent",
+                        tool_call_id=tool_call_id,
+                        name=name,
+                        arguments=args,
+                    ),
+                ),
+                StreamTaskMessageDone(type="done", index=req_idx),
+            )
+
+        if evt_type == "item.updated":
+            # Codex revises its plan in place: one todo_list item is opened
+            # at the start of the turn and ticked off through item.updated,
+            # with item.completed only arriving at the very end. Forwarding
+            # each revision as a response for the SAME tool_call_id lets a
+            # consumer show the checklist filling in as the turn runs; the
+            # last response received is the current state.
+            if item_type not in _PROGRESSIVE_TOOL_ITEMS or item_id not in self._tool_open:
+                return NO_EVENTS
+            return (self._tool_response(tool_call_id, item_id, item_type, item),)
 
-        else:
-            logger.debug("[codex] unhandled item type=%s evt=%s", item_type, evt_type)
+        out: list[StreamTaskMessage] = []
+        # file_change items may only emit item.completed (no started).
+        if item_id not in self._tool_open:
+            self.tool_call_count += 1
+            self._tool_open.add(item_id)
+            self._tool_item_types[item_id] = item_type
+            name = _tool_name_for(item_type, item)
+            args = _tool_args_for(item_type, item)
+            req_idx = self._alloc()
+            out.append(
+                StreamTaskMessageFull(
+                    type="full",
+                    index=req_idx,
+                    content=ToolRequestContent(
+                        type="tool_request",
+                        author="agent",
+                        tool_call_id=tool_call_id,
+                        name=name,
+                        arguments=args,
+                    ),
+                )
+            )
 
+        out.append(self._tool_response(tool_call_id, item_id, item_type, item))
+        self._tool_open.discard(item_id)
+        # Free the id mapping so a later item reusing an empty id gets a
+        # fresh fallback rather than colliding with this one.
+        self._tool_call_ids.pop(item_id, None)
         return out
 
+    def _tool_response(
+        self, tool_call_id: str, item_id: str, item_type: str, item: dict[str, Any]
+    ) -> StreamTaskMessageFull:
+        actual_type = self._tool_item_types.get(item_id, item_type)
+        result_text, is_error = _tool_output_for(actual_type, item)
+        resp_content: dict[str, Any] = {"result": result_text}
+        if is_error:
+            resp_content["is_error"] = True
+        return StreamTaskMessageFull(
+            type="full",
+            index=self._alloc(),
+            content=ToolResponseContent(
+                type="tool_response",
+                author="agent",
+                tool_call_id=tool_call_id,
+                name=_tool_name_for(actual_type, item),
+                content=resp_content,
+            ),
+        )
+
+    def _on_error_item(
+        self, evt_type: str, _item_type: str, _item_id: str, item: dict[str, Any]
+    ) -> Sequence[StreamTaskMessage]:
+        if evt_type != "item.completed":
+            return NO_EVENTS
+        return (_error_full(item.get("message", "codex item error"), self._alloc()),)
+
+
+_EVENT_HANDLERS: dict[str, Callable[[_CodexStreamProcessor, dict[str, Any]], Sequence[StreamTaskMessage]]] = {
+    "thread.started": _CodexStreamProcessor._on_thread_started,
+    "turn.started": _CodexStreamProcessor._on_turn_boundary,
+    "turn.completed": _CodexStreamProcessor._on_turn_boundary,
+    "turn.failed": _CodexStreamProcessor._on_turn_failed,
+    "error": _CodexStreamProcessor._on_error,
+    "item.started": _CodexStreamProcessor._on_item,
+    "item.updated": _CodexStreamProcessor._on_item,
+    "item.completed": _CodexStreamProcessor._on_item,
+}
+
+_ITEM_HANDLERS: dict[
+    str, Callable[[_CodexStreamProcessor, str, str, str, dict[str, Any]], Sequence[StreamTaskMessage]]
+] = {
+    "agent_message": _CodexStreamProcessor._on_agent_message,
+    "reasoning": _CodexStreamProcessor._on_reasoning,
+    "command_execution": _CodexStreamProcessor._on_tool_item,
+    "file_change": _CodexStreamProcessor._on_tool_item,
+    "mcp_tool_call": _CodexStreamProcessor._on_tool_item,
+    "web_search": _CodexStreamProcessor._on_tool_item,
+    "todo_list": _CodexStreamProcessor._on_tool_item,
+    "collab_tool_call": _CodexStreamProcessor._on_tool_item,
+    "error": _CodexStreamProcessor._on_error_item,
+}
+
 
 async def convert_codex_to_agentex_events(
-    events: AsyncIterator[str | dict[str, Any]],
+    events: AsyncIterator[str | bytes | dict[str, Any]],
     on_result: Callable[[dict[str, Any]], None] | None = None,
     on_init: Callable[[dict[str, Any]], None] | None = None,
 ) -> AsyncIterator[StreamTaskMessage]:
@@ -591,20 +583,20 @@ async def convert_codex_to_agentex_events(
 
 
 async def _convert_codex_impl(
-    events: AsyncIterator[str | dict[str, Any]],
+    events: AsyncIterator[str | bytes | dict[str, Any]],
     on_result: Callable[[dict[str, Any]], None] | None = None,
     on_init: Callable[[dict[str, Any]], None] | None = None,
 ) -> AsyncIterator[StreamTaskMessage]:
     """Convert a ``codex exec --json`` event stream into Agentex stream events.
 
     This is a pure parser tap. The caller must supply ``events`` as an async
-    iterator of either raw newline-delimited JSON strings or pre-decoded dicts.
-    No subprocess or sandbox management is done here.
+    iterator of either raw newline-delimited JSON lines (``str`` or ``bytes``)
+    or pre-decoded dicts. No subprocess or sandbox management is done here.
 
     Args:
-        events: Async iterator of ``str`` (newline-delimited JSON lines) or
-            ``dict`` (pre-decoded event objects) as produced by the codex CLI's
-            ``--json`` flag via sandbox stdout.
+        events: Async iterator of ``str``/``bytes`` (newline-delimited JSON
+            lines) or ``dict`` (pre-decoded event objects) as produced by the
+            codex CLI's ``--json`` flag via sandbox stdout.
         on_result: Optional callback invoked once when a ``turn.completed``
             event is seen. Receives a dict with keys:
                 ``usage``           — the raw codex usage dict (or None)
@@ -645,12 +637,12 @@ async def _convert_codex_impl(
         if isinstance(raw, dict):
             evt = raw
         else:
-            line = raw.strip() if isinstance(raw, str) else ""
+            line = raw.strip() if isinstance(raw, (str, bytes)) else ""
             if not line:
                 continue
             try:
-                evt = json.loads(line)
-            except json.JSONDecodeError:
+                evt = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
                 logger.debug("[codex] non-JSON line: %s", line[:100])
                 continue
 
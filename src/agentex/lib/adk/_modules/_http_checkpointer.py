@@ -3,15 +3,43 @@
 Proxies all checkpoint operations through the agentex backend API
 instead of connecting directly to PostgreSQL. The backend handles DB
 operations through its own connection pool.
+
+Two opt-in optimizations cut the number of round trips per graph step:
+
+- ``cache_size`` keeps the latest checkpoint of recently used threads in a
+  local LRU. Our own ``aput``/``aput_writes`` refresh the entry, so the next
+  ``aget_tuple`` for the thread is served without a request. Entries hold
+  serialized blobs and are deserialized on every read, so callers never share
+  mutable channel values with the cache. Only enable this when a single
+  process owns each thread; writes made by other processes are not observed.
+- ``coalesce_writes`` buffers ``aput_writes`` batches of a superstep and sends
+  them in one ``/put-writes`` request before the next checkpoint is stored.
+  Writes to special channels (errors, interrupts, resumes) are flushed
+  immediately since they can end a run without another ``aput``.
+
+``binary_transport`` sends request bodies as msgpack with the raw
+``serde.dumps_typed`` bytes instead of base64 strings inside JSON, and asks
+for msgpack responses. ``/list`` responses may be streamed as length-prefixed
+msgpack frames and are decoded as they arrive. If the backend rejects msgpack
+bodies (HTTP 415/422) before accepting one, the saver falls back to JSON for
+the rest of its lifetime; JSON responses are always understood. Bodies above
+``compression_threshold`` bytes can be gzip- or zstd-compressed.
 """
 
 from __future__ import annotations
 
+import gzip
 import base64
 import random
-from typing import Any, cast, override
+import struct
+from copy import deepcopy
+from typing import Any, Literal, cast, override
+from contextlib import asynccontextmanager
+from collections import OrderedDict
 from collections.abc import Iterator, Sequence, AsyncIterator
 
+import httpx
+import ormsgpack
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
@@ -26,10 +54,20 @@ from langgraph.checkpoint.base import (
 from langgraph.checkpoint.serde.types import TASKS
 
 from agentex import AsyncAgentex
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 
 logger = make_logger(__name__)
 
+_JSON = "application/json"
+_MSGPACK = "application/msgpack"
+# Concatenated frames, each a 4-byte big-endian length followed by one msgpack object.
+_MSGPACK_SEQ = "application/msgpack-seq"
+# Statuses with which a backend without msgpack support rejects a binary body.
+_BINARY_REJECTED = (415, 422)
+
+Compression = Literal["gzip", "zstd"]
+
 
 def _bytes_to_b64(data: bytes | None) -> str | None:
     if data is None:
@@ -37,30 +75,144 @@ def _bytes_to_b64(data: bytes | None) -> str | None:
     return base64.b64encode(data).decode("ascii")
 
 
-def _b64_to_bytes(data: str | None) -> bytes | None:
-    if data is None:
-        return None
+def _b64_to_bytes(data: str | bytes | None) -> bytes | None:
+    # Binary transport responses already carry raw bytes.
+    if data is None or isinstance(data, bytes):
+        return data
     return base64.b64decode(data)
 
 
-class HttpCheckpointSaver(BaseCheckpointSaver[str]):
-    """Checkpoint saver that proxies operations through the agentex HTTP API."""
+def _json_default(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return _bytes_to_b64(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compress(data: bytes, compression: Compression) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    import zstandard
+
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _decode_body(content_type: str, content: bytes) -> Any:
+    media_type = content_type.split(";")[0].strip()
+    if media_type == _MSGPACK:
+        return ormsgpack.unpackb(content)
+    if media_type == _MSGPACK_SEQ:
+        return list(_iter_frames(bytearray(content)))
+    return json_codec.loads(content)
 
-    def __init__(self, client: AsyncAgentex) -> None:
+
+def _iter_frames(buffer: bytearray) -> Iterator[Any]:
+    """Pop every complete length-prefixed msgpack frame off the front of ``buffer``."""
+    offset = 0
+    while len(buffer) - offset >= 4:
+        (size,) = struct.unpack_from(">I", buffer, offset)
+        if len(buffer) - offset - 4 < size:
+            break
+        yield ormsgpack.unpackb(bytes(buffer[offset + 4 : offset + 4 + size]))
+        offset += 4 + size
+    del buffer[:offset]
+
+
+def _decode_record(data: dict[str, Any]) -> dict[str, Any]:
+    """Turn a get-tuple response into a record whose blobs are raw bytes."""
+    return {
+        **data,
+        "blobs": [{**b, "blob": _b64_to_bytes(b.get("blob"))} for b in data.get("blobs") or []],
+        "pending_writes": [{**w, "blob": _b64_to_bytes(w.get("blob"))} for w in data.get("pending_writes") or []],
+    }
+
+
+class HttpCheckpointSaver(BaseCheckpointSaver[str]):
+    """Checkpoint saver that proxies operations through the agentex HTTP API.
+
+    Args:
+        client: Agentex client whose HTTP connection pool is reused.
+        cache_size: Number of threads whose latest checkpoint is kept in a
+            local LRU cache. ``0`` (the default) disables caching.
+        coalesce_writes: Buffer pending writes within a superstep and send
+            them in a single request. Disabled by default.
+        binary_transport: Exchange msgpack bodies carrying raw blob bytes,
+            falling back to JSON if the backend does not accept them.
+        compression: Compress request bodies larger than
+            ``compression_threshold`` bytes. ``"zstd"`` requires the
+            ``zstandard`` package.
+        compression_threshold: Minimum encoded body size, in bytes, to compress.
+    """
+
+    def __init__(
+        self,
+        client: AsyncAgentex,
+        *,
+        cache_size: int = 0,
+        coalesce_writes: bool = False,
+        binary_transport: bool = False,
+        compression: Compression | None = None,
+        compression_threshold: int = 64 * 1024,
+    ) -> None:
         super().__init__()
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ValueError("compression='zstd' requires the 'zstandard' package") from e
         self._http = client._client  # noqa: SLF001  # raw httpx.AsyncClient for direct HTTP calls
+        self._cache_size = cache_size
+        self._coalesce_writes = coalesce_writes
+        self._binary = binary_transport
+        # Set once the backend has accepted a binary body; no fallback after that.
+        self._binary_accepted = False
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        # (thread_id, checkpoint_ns) -> latest checkpoint record, with raw-byte blobs
+        self._cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        # (thread_id, checkpoint_ns, checkpoint_id) -> serialized writes awaiting flush
+        self._write_buffer: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+
+    def _encode_body(self, body: dict[str, Any]) -> tuple[bytes, dict[str, str]]:
+        """Encode a request body whose blob fields hold raw bytes."""
+        if self._binary:
+            content = ormsgpack.packb(body)
+            headers = {"Content-Type": _MSGPACK, "Accept": f"{_MSGPACK_SEQ}, {_MSGPACK}, {_JSON};q=0.5"}
+        else:
+            content = json_codec.dumps(body, default=_json_default)
+            headers = {"Content-Type": _JSON}
+        if self._compression is not None and len(content) >= self._compression_threshold:
+            content = _compress(content, self._compression)
+            headers["Content-Encoding"] = self._compression
+        return content, headers
+
+    @asynccontextmanager
+    async def _stream(self, path: str, body: dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """POST ``body`` and yield the (unread) response, negotiating the transport."""
+        content, headers = self._encode_body(body)
+        async with self._http.stream("POST", f"/checkpoints{path}", content=content, headers=headers) as response:
+            if not (self._binary and not self._binary_accepted and response.status_code in _BINARY_REJECTED):
+                response.raise_for_status()
+                self._binary_accepted = self._binary
+                yield response
+                return
+
+        logger.info(
+            f"Checkpoint backend rejected binary transport (HTTP {response.status_code}); falling back to JSON"
+        )
+        self._binary = False
+        content, headers = self._encode_body(body)
+        async with self._http.stream("POST", f"/checkpoints{path}", content=content, headers=headers) as response:
+            response.raise_for_status()
+            yield response
 
     async def _post(self, path: str, body: dict[str, Any]) -> Any:
-        """POST JSON to the backend and return parsed response."""
-        response = await self._http.post(
-            f"/checkpoints{path}",
-            json=body,
-        )
-        response.raise_for_status()
-        # put-writes and delete-thread return 204 No Content (no JSON body)
-        if response.status_code == 204:
-            return None
-        return response.json()
+        """POST to the backend and return parsed response."""
+        async with self._stream(path, body) as response:
+            # put-writes and delete-thread return 204 No Content (no body)
+            if response.status_code == 204:
+                return None
+            content = await response.aread()
+            return _decode_body(response.headers.get("content-type", _JSON), content)
 
     # ── get_next_version (same as BasePostgresSaver) ──
 
@@ -76,6 +228,95 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
         next_h = random.random()  # noqa: S311
         return f"{next_v:032}.{next_h:016}"
 
+    # ── local cache ──
+
+    def _cache_get(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str | None) -> dict[str, Any] | None:
+        if not self._cache_size:
+            return None
+        key = (thread_id, checkpoint_ns)
+        record = self._cache.get(key)
+        if record is None or (checkpoint_id is not None and record["checkpoint_id"] != checkpoint_id):
+            return None
+        self._cache.move_to_end(key)
+        return record
+
+    def _cache_set(self, record: dict[str, Any]) -> None:
+        if not self._cache_size:
+            return
+        key = (record["thread_id"], record["checkpoint_ns"])
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _cache_add_writes(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        writes: list[dict[str, Any]],
+        upsert: bool,
+    ) -> None:
+        """Mirror the backend's insert-or-ignore / upsert semantics on the cached record.
+
+        ``writes`` carry raw bytes in ``blob``.
+        """
+        record = self._cache_get(thread_id, checkpoint_ns, checkpoint_id)
+        if record is None:
+            return
+        existing = {(w["task_id"], w["idx"]): i for i, w in enumerate(record["pending_writes"])}
+        for w in writes:
+            pos = existing.get((w["task_id"], w["idx"]))
+            if pos is None:
+                existing[(w["task_id"], w["idx"])] = len(record["pending_writes"])
+                record["pending_writes"].append(w)
+            elif upsert:
+                record["pending_writes"][pos] = w
+
+    # ── write coalescing ──
+
+    async def _send_writes(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        writes: list[dict[str, Any]],
+        upsert: bool,
+    ) -> None:
+        await self._post(
+            "/put-writes",
+            {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+                "writes": writes,
+                "upsert": upsert,
+            },
+        )
+
+    async def _flush_writes(self, thread_id: str | None = None) -> None:
+        """Send buffered writes, optionally only those of ``thread_id``."""
+        keys = [k for k in self._write_buffer if thread_id is None or k[0] == thread_id]
+        for key in keys:
+            writes = self._write_buffer.pop(key, None)
+            if not writes:
+                continue
+            try:
+                await self._send_writes(*key, writes, upsert=False)
+            except Exception:
+                # The cached record already reflects these writes; drop it so
+                # the next read goes back to the backend.
+                self._cache.pop((key[0], key[1]), None)
+                raise
+
+    async def aflush(self) -> None:
+        """Send all pending writes buffered by ``coalesce_writes``.
+
+        Runs that end with an ``aput`` flush automatically; call this before
+        shutting down if a run may have been cancelled mid-superstep.
+        """
+        await self._flush_writes()
+
     # ── async interface ──
 
     @override
@@ -85,20 +326,32 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
         checkpoint_ns = configurable.get("checkpoint_ns", "")
         checkpoint_id = get_checkpoint_id(config)
 
-        data = await self._post(
-            "/get-tuple",
-            {
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns,
-                "checkpoint_id": checkpoint_id,
-            },
-        )
+        record = self._cache_get(thread_id, checkpoint_ns, checkpoint_id)
+        if record is None:
+            await self._flush_writes(thread_id)
+            data = await self._post(
+                "/get-tuple",
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                },
+            )
 
-        if data is None:
-            return None
+            if data is None:
+                return None
+
+            record = _decode_record(data)
+            # Only the latest checkpoint is cached; an explicit id may point at history.
+            if checkpoint_id is None:
+                self._cache_set(record)
 
-        # Reconstruct channel_values from blobs + inline values
-        checkpoint = data["checkpoint"]
+        return self._load_tuple(record)
+
+    def _load_tuple(self, record: dict[str, Any]) -> CheckpointTuple:
+        """Deserialize a checkpoint record (backend response with raw-byte blobs)."""
+        # The record may be cached, and LangGraph mutates the checkpoint it loads.
+        checkpoint = deepcopy(record["checkpoint"])
         channel_values: dict[str, Any] = {}
 
         # Inline primitive values already in the checkpoint
@@ -106,25 +359,20 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
             channel_values.update(checkpoint["channel_values"])
 
         # Deserialize blobs
-        for blob in data.get("blobs", []):
+        for blob in record["blobs"]:
             blob_type = blob["type"]
             if blob_type == "empty":
                 continue
-            blob_bytes = _b64_to_bytes(blob.get("blob"))
-            channel_values[blob["channel"]] = self.serde.loads_typed((blob_type, blob_bytes))
+            channel_values[blob["channel"]] = self.serde.loads_typed((blob_type, blob.get("blob")))
 
         checkpoint["channel_values"] = channel_values
 
         # Handle pending_sends migration for v < 4
-        if checkpoint.get("v", 0) < 4 and data.get("parent_checkpoint_id"):
+        if checkpoint.get("v", 0) < 4 and record.get("parent_checkpoint_id"):
             # The backend already returns all writes; filter for TASKS channel sends
-            pending_sends_raw = [w for w in data.get("pending_writes", []) if w["channel"] == TASKS]
+            pending_sends_raw = [w for w in record["pending_writes"] if w["channel"] == TASKS]
             if pending_sends_raw:
-                sends = [
-                    self.serde.loads_typed((w["type"], _b64_to_bytes(w["blob"])))
-                    for w in pending_sends_raw
-                    if w.get("type")
-                ]
+                sends = [self.serde.loads_typed((w["type"], w["blob"])) for w in pending_sends_raw if w.get("type")]
                 if sends:
                     enc, blob_data = self.serde.dumps_typed(sends)
                     channel_values[TASKS] = self.serde.loads_typed((enc, blob_data))
@@ -138,9 +386,9 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
 
         # Reconstruct pending writes
         pending_writes: list[tuple[str, str, Any]] = []
-        for w in data.get("pending_writes", []):
+        for w in record["pending_writes"]:
             w_type = w.get("type")
-            w_bytes = _b64_to_bytes(w.get("blob"))
+            w_bytes = w.get("blob")
             pending_writes.append(
                 (
                     w["task_id"],
@@ -150,25 +398,25 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
             )
 
         parent_config: RunnableConfig | None = None
-        if data.get("parent_checkpoint_id"):
+        if record.get("parent_checkpoint_id"):
             parent_config = {
                 "configurable": {
-                    "thread_id": data["thread_id"],
-                    "checkpoint_ns": data["checkpoint_ns"],
-                    "checkpoint_id": data["parent_checkpoint_id"],
+                    "thread_id": record["thread_id"],
+                    "checkpoint_ns": record["checkpoint_ns"],
+                    "checkpoint_id": record["parent_checkpoint_id"],
                 }
             }
 
         return CheckpointTuple(
             config={
                 "configurable": {
-                    "thread_id": data["thread_id"],
-                    "checkpoint_ns": data["checkpoint_ns"],
-                    "checkpoint_id": data["checkpoint_id"],
+                    "thread_id": record["thread_id"],
+                    "checkpoint_ns": record["checkpoint_ns"],
+                    "checkpoint_id": record["checkpoint_id"],
                 }
             },
             checkpoint=checkpoint,
-            metadata=data["metadata"],
+            metadata=deepcopy(record["metadata"]),
             parent_config=parent_config,
             pending_writes=pending_writes,
         )
@@ -196,8 +444,9 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
             else:
                 blob_values[k] = copy["channel_values"].pop(k)
 
-        # Serialize blob values
+        # Serialize blob values (raw bytes; base64-encoded only on the JSON transport)
         blobs: list[dict[str, Any]] = []
+        raw_blobs: dict[str, dict[str, Any]] = {}
         for k, ver in new_versions.items():
             if k in blob_values:
                 enc, data = self.serde.dumps_typed(blob_values[k])
@@ -206,9 +455,10 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
                         "channel": k,
                         "version": cast(str, ver),
                         "type": enc,
-                        "blob": _bytes_to_b64(data),
+                        "blob": data,
                     }
                 )
+                raw_blobs[k] = blobs[-1]
             else:
                 blobs.append(
                     {
@@ -219,6 +469,10 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
                     }
                 )
 
+        # Writes recorded against the parent checkpoint must land before the child.
+        await self._flush_writes(thread_id)
+
+        serializable_metadata = get_serializable_checkpoint_metadata(config, metadata)
         await self._post(
             "/put",
             {
@@ -227,11 +481,39 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
                 "checkpoint_id": checkpoint["id"],
                 "parent_checkpoint_id": checkpoint_id,
                 "checkpoint": copy,
-                "metadata": get_serializable_checkpoint_metadata(config, metadata),
+                "metadata": serializable_metadata,
                 "blobs": blobs,
             },
         )
 
+        if self._cache_size:
+            # Unchanged channels are not re-sent; reuse their bytes from the
+            # previous cached checkpoint, or serialize them if it is gone.
+            previous = self._cache_get(thread_id, checkpoint_ns, checkpoint_id)
+            previous_blobs = {b["channel"]: b for b in previous["blobs"]} if previous else {}
+            channel_versions = checkpoint["channel_versions"]
+            for k, v in blob_values.items():
+                if k in raw_blobs:
+                    continue
+                prior = previous_blobs.get(k)
+                if prior is not None and prior["version"] == channel_versions.get(k):
+                    raw_blobs[k] = prior
+                else:
+                    enc, data = self.serde.dumps_typed(v)
+                    raw_blobs[k] = {"channel": k, "version": channel_versions.get(k), "type": enc, "blob": data}
+            self._cache_set(
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint["id"],
+                    "parent_checkpoint_id": checkpoint_id,
+                    "checkpoint": deepcopy(copy),
+                    "metadata": deepcopy(serializable_metadata),
+                    "blobs": list(raw_blobs.values()),
+                    "pending_writes": [],
+                }
+            )
+
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -264,21 +546,19 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
                     "idx": WRITES_IDX_MAP.get(channel, idx),
                     "channel": channel,
                     "type": enc,
-                    "blob": _bytes_to_b64(data),
+                    "blob": data,
                     "task_path": task_path,
                 }
             )
 
-        await self._post(
-            "/put-writes",
-            {
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns,
-                "checkpoint_id": checkpoint_id,
-                "writes": serialized_writes,
-                "upsert": upsert,
-            },
-        )
+        if self._coalesce_writes and not upsert:
+            self._write_buffer.setdefault((thread_id, checkpoint_ns, checkpoint_id), []).extend(serialized_writes)
+            self._cache_add_writes(thread_id, checkpoint_ns, checkpoint_id, serialized_writes, upsert)
+            return
+
+        await self._flush_writes(thread_id)
+        await self._send_writes(thread_id, checkpoint_ns, checkpoint_id, serialized_writes, upsert)
+        self._cache_add_writes(thread_id, checkpoint_ns, checkpoint_id, serialized_writes, upsert)
 
     @override
     async def alist(
@@ -303,37 +583,55 @@ class HttpCheckpointSaver(BaseCheckpointSaver[str]):
         if limit is not None:
             body["limit"] = limit
 
-        results = await self._post("/list", body)
+        await self._flush_writes(body.get("thread_id"))
+        async with self._stream("/list", body) as response:
+            content_type = response.headers.get("content-type", _JSON)
+            if content_type.split(";")[0].strip() == _MSGPACK_SEQ:
+                # Decode frames as they arrive instead of buffering the whole list.
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer += chunk
+                    for item in _iter_frames(buffer):
+                        yield self._list_item_tuple(item)
+                if buffer:
+                    raise ValueError(f"Truncated checkpoint list stream ({len(buffer)} trailing bytes)")
+                return
+            results = _decode_body(content_type, await response.aread())
 
         for item in results or []:
-            # For each listed checkpoint, reconstruct a CheckpointTuple
-            # with inline channel_values only (blobs not included in list)
-            checkpoint = item["checkpoint"]
-            parent_config: RunnableConfig | None = None
-            if item.get("parent_checkpoint_id"):
-                parent_config = {
-                    "configurable": {
-                        "thread_id": item["thread_id"],
-                        "checkpoint_ns": item["checkpoint_ns"],
-                        "checkpoint_id": item["parent_checkpoint_id"],
-                    }
+            yield self._list_item_tuple(item)
+
+    def _list_item_tuple(self, item: dict[str, Any]) -> CheckpointTuple:
+        """Reconstruct a CheckpointTuple with inline channel_values only (blobs not included in list)."""
+        parent_config: RunnableConfig | None = None
+        if item.get("parent_checkpoint_id"):
+            parent_config = {
+                "configurable": {
+                    "thread_id": item["thread_id"],
+                    "checkpoint_ns": item["checkpoint_ns"],
+                    "checkpoint_id": item["parent_checkpoint_id"],
                 }
-            yield CheckpointTuple(
-                config={
-                    "configurable": {
-                        "thread_id": item["thread_id"],
-                        "checkpoint_ns": item["checkpoint_ns"],
-                        "checkpoint_id": item["checkpoint_id"],
-                    }
-                },
-                checkpoint=checkpoint,
-                metadata=item["metadata"],
-                parent_config=parent_config,
-                pending_writes=None,
-            )
+            }
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": item["thread_id"],
+                    "checkpoint_ns": item["checkpoint_ns"],
+                    "checkpoint_id": item["checkpoint_id"],
+                }
+            },
+            checkpoint=item["checkpoint"],
+            metadata=item["metadata"],
+            parent_config=parent_config,
+            pending_writes=None,
+        )
 
     @override
     async def adelete_thread(self, thread_id: str) -> None:
+        for key in [k for k in self._write_buffer if k[0] == thread_id]:
+            del self._write_buffer[key]
+        for key in [k for k in self._cache if k[0] == thread_id]:
+            del self._cache[key]
         await self._post("/delete-thread", {"thread_id": thread_id})
 
     # ── sync stubs (required by BaseCheckpointSaver) ──
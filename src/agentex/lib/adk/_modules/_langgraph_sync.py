@@ -25,9 +25,47 @@ harness envelope).
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 from collections.abc import AsyncGenerator
 
+from temporalio.exceptions import ApplicationError
+
+from agentex.lib.utils.logging import make_logger
+from agentex.types.text_content import TextContent
+from agentex.lib.core.harness.types import StreamTaskMessage
+from agentex.types.reasoning_content import ReasoningContent
+from agentex.types.task_message_delta import TextDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS
+from agentex.types.task_message_update import (
+    StreamTaskMessageDone,
+    StreamTaskMessageFull,
+    StreamTaskMessageDelta,
+    StreamTaskMessageStart,
+)
+from agentex.types.tool_request_content import ToolRequestContent
+from agentex.types.tool_response_content import ToolResponseContent
+from agentex.types.reasoning_content_delta import ReasoningContentDelta
+from agentex.types.reasoning_summary_delta import ReasoningSummaryDelta
+
+logger = make_logger(__name__)
+
+# Batch failures that mean the backend rejected the request itself (no batch
+# endpoint, or an invalid message), so nothing was written and per-message
+# calls can be made safely. Timeouts and 5xx may have persisted the batch.
+_BATCH_REJECTED_STATUS_CODES = frozenset({404, 405, 422})
+# The same, as reported by an activity failure inside a workflow.
+_BATCH_REJECTED_ERROR_TYPES = frozenset({"NotFoundError", "UnprocessableEntityError"})
+
+
+def _batch_rejected(exc: BaseException | None) -> bool:
+    while exc is not None:
+        if getattr(exc, "status_code", None) in _BATCH_REJECTED_STATUS_CODES:
+            return True
+        if isinstance(exc, ApplicationError) and exc.type in _BATCH_REJECTED_ERROR_TYPES:
+            return True
+        exc = exc.__cause__
+    return False
+
 
 async def convert_langgraph_to_agentex_events(
     stream: Any,
@@ -84,214 +122,280 @@ async def _convert_langgraph_impl(
     Yields:
         TaskMessageUpdate events (Start, Delta, Done, Full)
     """
-    # Lazy imports so langgraph/langchain aren't required at module load time
-    from langchain_core.messages import ToolMessage, AIMessageChunk
+    processor = _LangGraphStreamProcessor(capture_final_ai_messages=on_final_ai_message is not None)
+    async for event_type, event_data in stream:
+        handler = _EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            continue
+        for message in handler(processor, event_data):
+            yield message
+        if on_final_ai_message is not None and processor.final_ai_messages:
+            for final_message in processor.drain_final_ai_messages():
+                on_final_ai_message(final_message)
 
-    from agentex.types.text_content import TextContent
-    from agentex.types.reasoning_content import ReasoningContent
-    from agentex.types.task_message_delta import TextDelta
-    from agentex.types.task_message_update import (
-        StreamTaskMessageDone,
-        StreamTaskMessageFull,
-        StreamTaskMessageDelta,
-        StreamTaskMessageStart,
-    )
-    from agentex.types.tool_request_content import ToolRequestContent
-    from agentex.types.tool_response_content import ToolResponseContent
-    from agentex.types.reasoning_content_delta import ReasoningContentDelta
-    from agentex.types.reasoning_summary_delta import ReasoningSummaryDelta
+    # Close any remaining open streams
+    for message in processor.close():
+        yield message
 
-    message_index = 0
-    text_streaming = False
-    reasoning_streaming = False
-    reasoning_content_index = 0
 
-    async for event_type, event_data in stream:
-        if event_type == "messages":
-            chunk, metadata = event_data
+class _LangGraphStreamProcessor:
+    """Stateful converter: one LangGraph ``astream`` event in, its Agentex events out.
 
-            if not isinstance(chunk, AIMessageChunk) or not chunk.content:
-                continue
+    State tracked:
+    - ``message_index``: index of the message currently open (or next to open).
+    - ``text_streaming`` / ``reasoning_streaming``: which kind of message is open.
+    - ``reasoning_content_index``: content index for reasoning deltas.
+    """
 
-            # ----------------------------------------------------------
+    def __init__(self, *, capture_final_ai_messages: bool = False) -> None:
+        # Lazy imports so langgraph/langchain aren't required at module load time
+        from langchain_core.messages import AIMessage, ToolMessage, AIMessageChunk
+
+        self._ai_message_cls = AIMessage
+        self._ai_message_chunk_cls = AIMessageChunk
+        self._tool_message_cls = ToolMessage
+        self._capture_final_ai_messages = capture_final_ai_messages
+        self.final_ai_messages: list[Any] = []
+        self.message_index = 0
+        self.text_streaming = False
+        self.reasoning_streaming = False
+        self.reasoning_content_index = 0
+
+    # -- "messages" events ---------------------------------------------------
+
+    def _on_messages(self, event_data: Any) -> Sequence[StreamTaskMessage]:
+        chunk, _metadata = event_data
+        if not isinstance(chunk, self._ai_message_chunk_cls) or not chunk.content:
+            return NO_EVENTS
+
+        content = chunk.content
+        if isinstance(content, str):
             # Case 1: content is a plain string (regular models)
-            # ----------------------------------------------------------
-            if isinstance(chunk.content, str):
-                # Close reasoning stream if we're transitioning to text
-                if reasoning_streaming:
-                    yield StreamTaskMessageDone(type="done", index=message_index)
-                    reasoning_streaming = False
-                    message_index += 1
-
-                if not text_streaming:
-                    yield StreamTaskMessageStart(
-                        type="start",
-                        index=message_index,
-                        content=TextContent(type="text", author="agent", content=""),
-                    )
-                    text_streaming = True
-
-                yield StreamTaskMessageDelta(
-                    type="delta",
-                    index=message_index,
-                    delta=TextDelta(type="text", text_delta=chunk.content),
+            if self.text_streaming and not self.reasoning_streaming and not chunk.additional_kwargs:
+                # Steady state: one more token on the open text message.
+                return (
+                    StreamTaskMessageDelta(
+                        type="delta",
+                        index=self.message_index,
+                        delta=TextDelta(type="text", text_delta=content),
+                    ),
                 )
-
-            # ----------------------------------------------------------
+            events = self._text_delta(content, bump_reasoning_content_index=False)
+        elif isinstance(content, list):
             # Case 2: content is a list of typed blocks (reasoning models)
             # Responses API (responses/v1) format:
             #   {"type": "reasoning", "summary": [{"type": "summary_text", "text": "..."}]}
             #   {"type": "text", "text": "..."}
-            # ----------------------------------------------------------
-            elif isinstance(chunk.content, list):
-                for block in chunk.content:
-                    if not isinstance(block, dict):
-                        continue
-
-                    block_type = block.get("type")
-
-                    if block_type == "reasoning":
-                        # Responses API: reasoning text is inside summary list
-                        reasoning_text = ""
-                        summaries = block.get("summary", [])
-                        for s in summaries:
-                            if isinstance(s, dict) and s.get("type") == "summary_text":
-                                reasoning_text += s.get("text", "")
-                        if not reasoning_text:
-                            continue
-
-                        # Close text stream if transitioning to reasoning
-                        if text_streaming:
-                            yield StreamTaskMessageDone(type="done", index=message_index)
-                            text_streaming = False
-                            message_index += 1
-
-                        if not reasoning_streaming:
-                            yield StreamTaskMessageStart(
-                                type="start",
-                                index=message_index,
-                                content=ReasoningContent(
-                                    type="reasoning", author="agent", summary=[], content=[], style="active"
-                                ),
-                            )
-                            reasoning_streaming = True
-                            reasoning_content_index = 0
-
-                        yield StreamTaskMessageDelta(
-                            type="delta",
-                            index=message_index,
-                            delta=ReasoningContentDelta(
-                                type="reasoning_content",
-                                content_index=reasoning_content_index,
-                                content_delta=reasoning_text,
-                            ),
-                        )
-
-                    elif block_type == "text":
-                        text_delta = block.get("text", "")
-                        if not text_delta:
-                            continue
-
-                        # Close reasoning stream if transitioning to text
-                        if reasoning_streaming:
-                            yield StreamTaskMessageDone(type="done", index=message_index)
-                            reasoning_streaming = False
-                            reasoning_content_index += 1
-                            message_index += 1
-
-                        if not text_streaming:
-                            yield StreamTaskMessageStart(
-                                type="start",
-                                index=message_index,
-                                content=TextContent(type="text", author="agent", content=""),
-                            )
-                            text_streaming = True
-
-                        yield StreamTaskMessageDelta(
-                            type="delta",
-                            index=message_index,
-                            delta=TextDelta(type="text", text_delta=text_delta),
-                        )
+            collected: list[StreamTaskMessage] = []
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                handler = _BLOCK_HANDLERS.get(block.get("type"))
+                if handler is not None:
+                    collected.extend(handler(self, block))
+            events = collected
+        else:
+            events = NO_EVENTS
+
+        # Reasoning summaries via additional_kwargs (OpenAI v0.3 format)
+        additional_kwargs = getattr(chunk, "additional_kwargs", None)
+        reasoning_kw = additional_kwargs.get("reasoning") if additional_kwargs else None
+        if not isinstance(reasoning_kw, dict):
+            return events
+        summary_events = [
+            StreamTaskMessageDelta(
+                type="delta",
+                index=self.message_index,
+                delta=ReasoningSummaryDelta(
+                    type="reasoning_summary",
+                    summary_index=si,
+                    summary_delta=summary_item["text"],
+                ),
+            )
+            for si, summary_item in enumerate(reasoning_kw.get("summary") or ())
+            if isinstance(summary_item, dict)
+            and summary_item.get("type") == "summary_text"
+            and summary_item.get("text")
+        ]
+        return [*events, *summary_events] if summary_events else events
+
+    def _on_reasoning_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        # Responses API: reasoning text is inside summary list
+        reasoning_text = "".join(
+            s.get("text", "")
+            for s in block.get("summary") or ()
+            if isinstance(s, dict) and s.get("type") == "summary_text"
+        )
+        if not reasoning_text:
+            return NO_EVENTS
+
+        events: list[StreamTaskMessage] = []
+        # Close text stream if transitioning to reasoning
+        if self.text_streaming:
+            events.append(StreamTaskMessageDone(type="done", index=self.message_index))
+            self.text_streaming = False
+            self.message_index += 1
+
+        if not self.reasoning_streaming:
+            events.append(
+                StreamTaskMessageStart(
+                    type="start",
+                    index=self.message_index,
+                    content=ReasoningContent(type="reasoning", author="agent", summary=[], content=[], style="active"),
+                )
+            )
+            self.reasoning_streaming = True
+            self.reasoning_content_index = 0
+
+        delta = StreamTaskMessageDelta(
+            type="delta",
+            index=self.message_index,
+            delta=ReasoningContentDelta(
+                type="reasoning_content",
+                content_index=self.reasoning_content_index,
+                content_delta=reasoning_text,
+            ),
+        )
+        if not events:
+            return (delta,)
+        events.append(delta)
+        return events
+
+    def _on_text_block(self, block: dict[str, Any]) -> Sequence[StreamTaskMessage]:
+        text_delta = block.get("text", "")
+        if not text_delta:
+            return NO_EVENTS
+        return self._text_delta(text_delta, bump_reasoning_content_index=True)
+
+    def _text_delta(self, text: str, *, bump_reasoning_content_index: bool) -> Sequence[StreamTaskMessage]:
+        """A text delta, opening a text message (and closing reasoning) first if needed."""
+        if self.text_streaming and not self.reasoning_streaming:
+            # Steady state: one more token on the open text message.
+            return (
+                StreamTaskMessageDelta(
+                    type="delta",
+                    index=self.message_index,
+                    delta=TextDelta(type="text", text_delta=text),
+                ),
+            )
 
-            # ----------------------------------------------------------
-            # Reasoning summaries via additional_kwargs (OpenAI v0.3 format)
-            # ----------------------------------------------------------
-            additional_kwargs = getattr(chunk, "additional_kwargs", {})
-            reasoning_kw = additional_kwargs.get("reasoning")
-            if isinstance(reasoning_kw, dict):
-                summaries = reasoning_kw.get("summary", [])
-                for si, summary_item in enumerate(summaries):
-                    if isinstance(summary_item, dict) and summary_item.get("type") == "summary_text":
-                        summary_text = summary_item.get("text", "")
-                        if summary_text:
-                            yield StreamTaskMessageDelta(
-                                type="delta",
-                                index=message_index,
-                                delta=ReasoningSummaryDelta(
-                                    type="reasoning_summary",
-                                    summary_index=si,
-                                    summary_delta=summary_text,
-                                ),
-                            )
-
-        elif event_type == "updates":
-            for node_name, state_update in event_data.items():
-                if node_name == "agent":
-                    messages = state_update.get("messages", [])
-                    for msg in messages:
-                        # Close any open streams
-                        if text_streaming:
-                            yield StreamTaskMessageDone(type="done", index=message_index)
-                            text_streaming = False
-                            message_index += 1
-                        if reasoning_streaming:
-                            yield StreamTaskMessageDone(type="done", index=message_index)
-                            reasoning_streaming = False
-                            message_index += 1
-
-                        # Emit tool requests if the agent decided to call tools
-                        if hasattr(msg, "tool_calls") and msg.tool_calls:
-                            for tc in msg.tool_calls:
-                                yield StreamTaskMessageFull(
-                                    type="full",
-                                    index=message_index,
-                                    content=ToolRequestContent(
-                                        tool_call_id=tc["id"],
-                                        name=tc["name"],
-                                        arguments=tc["args"],
-                                        author="agent",
-                                    ),
-                                )
-                                message_index += 1
-
-                        # Notify caller of the final AIMessage (e.g. for usage capture)
-                        if on_final_ai_message is not None:
-                            from langchain_core.messages import AIMessage as _AIMessage
-
-                            if isinstance(msg, _AIMessage):
-                                on_final_ai_message(msg)
-
-                elif node_name == "tools":
-                    messages = state_update.get("messages", [])
-                    for msg in messages:
-                        if isinstance(msg, ToolMessage):
-                            yield StreamTaskMessageFull(
-                                type="full",
-                                index=message_index,
-                                content=ToolResponseContent(
-                                    tool_call_id=msg.tool_call_id,
-                                    name=msg.name or "unknown",
-                                    content=msg.content if isinstance(msg.content, str) else str(msg.content),
-                                    author="agent",
-                                ),
-                            )
-                            message_index += 1
+        events: list[StreamTaskMessage] = []
+        # Close reasoning stream if transitioning to text
+        if self.reasoning_streaming:
+            events.append(StreamTaskMessageDone(type="done", index=self.message_index))
+            self.reasoning_streaming = False
+            if bump_reasoning_content_index:
+                self.reasoning_content_index += 1
+            self.message_index += 1
+
+        if not self.text_streaming:
+            events.append(
+                StreamTaskMessageStart(
+                    type="start",
+                    index=self.message_index,
+                    content=TextContent(type="text", author="agent", content=""),
+                )
+            )
+            self.text_streaming = True
 
-    # Close any remaining open streams
-    if text_streaming:
-        yield StreamTaskMessageDone(type="done", index=message_index)
-    if reasoning_streaming:
-        yield StreamTaskMessageDone(type="done", index=message_index)
+        events.append(
+            StreamTaskMessageDelta(
+                type="delta",
+                index=self.message_index,
+                delta=TextDelta(type="text", text_delta=text),
+            )
+        )
+        return events
+
+    # -- "updates" events ----------------------------------------------------
+
+    def _on_updates(self, event_data: Any) -> Sequence[StreamTaskMessage]:
+        events: list[StreamTaskMessage] = []
+        for node_name, state_update in event_data.items():
+            handler = _NODE_HANDLERS.get(node_name)
+            if handler is not None:
+                handler(self, state_update, events)
+        return events
+
+    def _on_agent_update(self, state_update: Any, events: list[StreamTaskMessage]) -> None:
+        for msg in state_update.get("messages") or ():
+            # Close any open streams
+            events.extend(self.close())
+
+            # Emit tool requests if the agent decided to call tools
+            if hasattr(msg, "tool_calls") and msg.tool_calls:
+                for tc in msg.tool_calls:
+                    events.append(
+                        StreamTaskMessageFull(
+                            type="full",
+                            index=self.message_index,
+                            content=ToolRequestContent(
+                                tool_call_id=tc["id"],
+                                name=tc["name"],
+                                arguments=tc["args"],
+                                author="agent",
+                            ),
+                        )
+                    )
+                    self.message_index += 1
+
+            # Notify caller of the final AIMessage (e.g. for usage capture)
+            # once its events have been yielded.
+            if self._capture_final_ai_messages and isinstance(msg, self._ai_message_cls):
+                self.final_ai_messages.append(msg)
+
+    def _on_tools_update(self, state_update: Any, events: list[StreamTaskMessage]) -> None:
+        for msg in state_update.get("messages") or ():
+            if isinstance(msg, self._tool_message_cls):
+                events.append(
+                    StreamTaskMessageFull(
+                        type="full",
+                        index=self.message_index,
+                        content=ToolResponseContent(
+                            tool_call_id=msg.tool_call_id,
+                            name=msg.name or "unknown",
+                            content=msg.content if isinstance(msg.content, str) else str(msg.content),
+                            author="agent",
+                        ),
+                    )
+                )
+                self.message_index += 1
+
+    def drain_final_ai_messages(self) -> Sequence[Any]:
+        """The AIMessages seen since the last call, for ``on_final_ai_message``."""
+        messages, self.final_ai_messages = self.final_ai_messages, []
+        return messages
+
+    def close(self) -> Sequence[StreamTaskMessage]:
+        """Done events for the open text/reasoning message, if any."""
+        if not (self.text_streaming or self.reasoning_streaming):
+            return NO_EVENTS
+        events: list[StreamTaskMessage] = []
+        if self.text_streaming:
+            events.append(StreamTaskMessageDone(type="done", index=self.message_index))
+            self.text_streaming = False
+            self.message_index += 1
+        if self.reasoning_streaming:
+            events.append(StreamTaskMessageDone(type="done", index=self.message_index))
+            self.reasoning_streaming = False
+            self.message_index += 1
+        return events
+
+
+_EVENT_HANDLERS: dict[str, Callable[[_LangGraphStreamProcessor, Any], Sequence[StreamTaskMessage]]] = {
+    "messages": _LangGraphStreamProcessor._on_messages,
+    "updates": _LangGraphStreamProcessor._on_updates,
+}
+
+_BLOCK_HANDLERS: dict[Any, Callable[[_LangGraphStreamProcessor, dict[str, Any]], Sequence[StreamTaskMessage]]] = {
+    "reasoning": _LangGraphStreamProcessor._on_reasoning_block,
+    "text": _LangGraphStreamProcessor._on_text_block,
+}
+
+_NODE_HANDLERS: dict[str, Callable[[_LangGraphStreamProcessor, Any, list[StreamTaskMessage]], None]] = {
+    "agent": _LangGraphStreamProcessor._on_agent_update,
+    "tools": _LangGraphStreamProcessor._on_tools_update,
+}
 
 
 async def emit_langgraph_messages(messages: list[Any], task_id: str) -> str:
@@ -311,6 +415,12 @@ async def emit_langgraph_messages(messages: list[Any], task_id: str) -> str:
     Pass only the messages produced this turn (e.g. ``messages[already_emitted:]``)
     so each message is surfaced exactly once across a multi-turn conversation.
 
+    The messages are persisted in order with a single ``adk.messages.create_batch``
+    call. If the backend rejects the batch (404, 405 or 422), they are retried
+    one by one, so the error raised is the one for the specific message the
+    backend rejected. Other failures are raised as is, since the batch may have
+    been written.
+
     Args:
         messages: LangGraph/LangChain message objects to surface — typically
             the new messages a turn produced.
@@ -324,21 +434,22 @@ async def emit_langgraph_messages(messages: list[Any], task_id: str) -> str:
 
     from agentex.lib import adk
     from agentex.types.text_content import TextContent
+    from agentex.types.task_message_content import TaskMessageContent
     from agentex.types.tool_request_content import ToolRequestContent
     from agentex.types.tool_response_content import ToolResponseContent
 
+    contents: list[TaskMessageContent] = []
     final_text = ""
     for message in messages:
         if isinstance(message, AIMessage):
             for tool_call in message.tool_calls or []:
-                await adk.messages.create(
-                    task_id=task_id,
-                    content=ToolRequestContent(
+                contents.append(
+                    ToolRequestContent(
                         author="agent",
                         tool_call_id=tool_call["id"],
                         name=tool_call["name"],
                         arguments=tool_call["args"],
-                    ),
+                    )
                 )
             # ``content`` may be a plain string (OpenAI) or a list of content
             # blocks (Anthropic/Claude via LangChain, e.g.
@@ -354,20 +465,48 @@ async def emit_langgraph_messages(messages: list[Any], task_id: str) -> str:
                 )
             if text:
                 final_text = text
-                await adk.messages.create(
-                    task_id=task_id,
-                    content=TextContent(author="agent", content=text, format="markdown"),
-                )
+                contents.append(TextContent(author="agent", content=text, format="markdown"))
         elif isinstance(message, ToolMessage):
-            await adk.messages.create(
-                task_id=task_id,
-                content=ToolResponseContent(
+            contents.append(
+                ToolResponseContent(
                     author="agent",
                     tool_call_id=message.tool_call_id,
                     name=message.name or "unknown",
                     content=message.content
                     if isinstance(message.content, str)
                     else str(message.content),
-                ),
+                )
             )
+
+    if not contents:
+        return final_text
+    try:
+        # The server stamps batch items base + i ms apart, so order is kept.
+        await adk.messages.create_batch(task_id=task_id, contents=contents)
+    except Exception as e:
+        # Only a rejected batch is known to have written nothing; after a
+        # timeout or server error it may have been persisted, and re-sending
+        # the messages one by one would duplicate them.
+        if not _batch_rejected(e):
+            raise
+        # Fall back to one call per message: the messages before the bad one
+        # are still persisted in order, and the bad one raises its own error.
+        logger.warning(
+            "Batched emission of %d LangGraph messages on task %s failed; retrying one at a time",
+            len(contents),
+            task_id,
+            exc_info=True,
+        )
+        for index, content in enumerate(contents):
+            try:
+                await adk.messages.create(task_id=task_id, content=content)
+            except Exception:
+                logger.error(
+                    "Failed to emit LangGraph message %d/%d (%s) on task %s",
+                    index + 1,
+                    len(contents),
+                    content.type,
+                    task_id,
+                )
+                raise
     return final_text
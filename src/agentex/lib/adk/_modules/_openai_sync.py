@@ -13,31 +13,29 @@ through ``UnifiedEmitter``.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Callable, Sequence
 
 from openai.types.responses import (
     ResponseTextDeltaEvent,
     ResponseFunctionToolCall,
     ResponseFunctionWebSearch,
     ResponseOutputItemDoneEvent,
-    ResponseOutputItemAddedEvent,
     ResponseCodeInterpreterToolCall,
-    ResponseReasoningSummaryPartAddedEvent,
     ResponseReasoningSummaryTextDeltaEvent,
 )
-from openai.types.responses.response_reasoning_text_done_event import ResponseReasoningTextDoneEvent
 from openai.types.responses.response_reasoning_text_delta_event import ResponseReasoningTextDeltaEvent
-from openai.types.responses.response_reasoning_summary_text_done_event import ResponseReasoningSummaryTextDoneEvent
 
+from agentex.lib.core.harness.types import StreamTaskMessage
 from agentex.types.reasoning_content import ReasoningContent
-from agentex.types.task_message_delta import TextDelta
+from agentex.types.task_message_delta import TextDelta, TaskMessageDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS, TypeDispatch
 from agentex.types.task_message_update import (
     StreamTaskMessageDone,
     StreamTaskMessageFull,
     StreamTaskMessageDelta,
     StreamTaskMessageStart,
 )
-from agentex.types.task_message_content import TextContent
+from agentex.types.task_message_content import TextContent, TaskMessageContent
 from agentex.types.tool_request_content import ToolRequestContent
 from agentex.types.tool_response_content import ToolResponseContent
 from agentex.types.reasoning_content_delta import ReasoningContentDelta
@@ -163,6 +161,196 @@ async def convert_openai_to_agentex_events(stream_response):
                 await _aclose()
 
 
+def _reasoning_start_content() -> ReasoningContent:
+    # The start content must be ReasoningContent (not TextContent) so consumers
+    # that branch on the start event's content type render a reasoning/thinking
+    # indicator; the final persisted content is rebuilt from the reasoning
+    # deltas regardless.
+    return ReasoningContent(type="reasoning", author="agent", summary=[], content=[], style="active")
+
+
+def _text_start_content() -> TextContent:
+    # Start with empty content, deltas will fill it
+    return TextContent(type="text", author="agent", content="")
+
+
+class _OpenAIStreamProcessor:
+    """Stateful converter: one OpenAI Agents SDK stream event in, its Agentex events out.
+
+    State tracked:
+    - ``message_index``: index of the most recently opened message.
+    - ``item_id_to_index``: message index per streamed output item.
+    - ``item_id_to_type``: content type per item (text, reasoning_content, reasoning_summary).
+    - ``tool_map``: tool name per call_id, for naming tool responses.
+    """
+
+    def __init__(self) -> None:
+        self.tool_map: dict[str, str] = {}
+        self.message_index = 0
+        self.item_id_to_index: dict[str, int] = {}
+        self.item_id_to_type: dict[str, str] = {}
+
+    def process(self, event: Any) -> Sequence[StreamTaskMessage]:
+        handler = _EVENT_HANDLERS.get(getattr(event, "type", None))
+        return handler(self, event) if handler is not None else NO_EVENTS
+
+    # -- stream events -------------------------------------------------------
+
+    def _on_raw_response_event(self, event: Any) -> Sequence[StreamTaskMessage]:
+        # Raw response events carry the actual OpenAI streaming events
+        raw_event = getattr(event, "data", None)
+        if raw_event is None:
+            return NO_EVENTS
+        handler = _RAW_EVENT_HANDLERS[raw_event.__class__]
+        return handler(self, raw_event) if handler is not None else NO_EVENTS
+
+    def _on_run_item_stream_event(self, event: Any) -> Sequence[StreamTaskMessage]:
+        item = getattr(event, "item", None)
+        if item is None:
+            return NO_EVENTS
+        # reasoning_item events are handled via raw_response_event instead
+        handler = _RUN_ITEM_HANDLERS.get(item.type)
+        return handler(self, item) if handler is not None else NO_EVENTS
+
+    # -- raw response events -------------------------------------------------
+
+    def _open_or_continue(
+        self,
+        item_id: str | None,
+        content_type: str,
+        start_content: Callable[[], TaskMessageContent],
+        delta: TaskMessageDelta,
+    ) -> Sequence[StreamTaskMessage]:
+        """Delta for ``item_id``, preceded by a Start when the item is new.
+
+        Every new item_id reserves a fresh index (increment-then-use, like the
+        tool paths). Reusing the current index let a final answer collide with
+        the preceding reasoning message on reasoning-model streams.
+        """
+        index = self.item_id_to_index.get(item_id) if item_id else None
+        if index is not None or not item_id:
+            if index is None:
+                index = self.message_index
+            return (StreamTaskMessageDelta(type="delta", index=index, delta=delta),)
+
+        self.message_index += 1
+        index = self.item_id_to_index[item_id] = self.message_index
+        self.item_id_to_type[item_id] = content_type
+        return (
+            StreamTaskMessageStart(type="start", index=index, content=start_content()),
+            StreamTaskMessageDelta(type="delta", index=index, delta=delta),
+        )
+
+    def _on_output_item_done(self, raw_event: ResponseOutputItemDoneEvent) -> Sequence[StreamTaskMessage]:
+        index = self.item_id_to_index.get(raw_event.item.id)  # type: ignore[arg-type]
+        if index is None:
+            return NO_EVENTS
+        # Close every streamed message — text AND reasoning — with a matching
+        # Done. UnifiedEmitter.auto_send only releases a context on
+        # StreamTaskMessageDone; skipping it for reasoning left those messages
+        # hanging and their spans incomplete. The accumulator rebuilds
+        # ReasoningContent from the deltas, so the Done carries no payload.
+        return (StreamTaskMessageDone(type="done", index=index),)
+
+    def _on_reasoning_summary_text_delta(
+        self, raw_event: ResponseReasoningSummaryTextDeltaEvent
+    ) -> Sequence[StreamTaskMessage]:
+        return self._open_or_continue(
+            raw_event.item_id,
+            "reasoning_summary",
+            _reasoning_start_content,
+            ReasoningSummaryDelta(
+                type="reasoning_summary",
+                summary_index=raw_event.summary_index,
+                summary_delta=raw_event.delta,
+            ),
+        )
+
+    def _on_reasoning_text_delta(self, raw_event: ResponseReasoningTextDeltaEvent) -> Sequence[StreamTaskMessage]:
+        return self._open_or_continue(
+            raw_event.item_id,
+            "reasoning_content",
+            _reasoning_start_content,
+            ReasoningContentDelta(
+                type="reasoning_content",
+                content_index=raw_event.content_index,
+                content_delta=raw_event.delta,
+            ),
+        )
+
+    def _on_text_delta(self, raw_event: ResponseTextDeltaEvent) -> Sequence[StreamTaskMessage]:
+        return self._open_or_continue(
+            getattr(raw_event, "item_id", None),
+            "text",
+            _text_start_content,
+            TextDelta(type="text", text_delta=raw_event.delta),
+        )
+
+    # -- run items -----------------------------------------------------------
+
+    def _on_tool_call_item(self, item: Any) -> Sequence[StreamTaskMessage]:
+        # A tool is being called
+        call_id, tool_name, tool_arguments = _extract_tool_call_info(item.raw_item)
+        self.tool_map[call_id] = tool_name
+        self.message_index += 1  # Increment for new message
+        return (
+            StreamTaskMessageFull(
+                index=self.message_index,
+                type="full",
+                content=ToolRequestContent(
+                    tool_call_id=call_id,
+                    name=tool_name,
+                    arguments=tool_arguments,
+                    author="agent",
+                ),
+            ),
+        )
+
+    def _on_tool_call_output_item(self, item: Any) -> Sequence[StreamTaskMessage]:
+        # A tool returned its output
+        call_id, tool_name, content = _extract_tool_response_info(self.tool_map, item.raw_item)
+        self.message_index += 1  # Increment for new message
+        return (
+            StreamTaskMessageFull(
+                type="full",
+                index=self.message_index,
+                content=ToolResponseContent(
+                    tool_call_id=call_id,
+                    name=tool_name,
+                    content=content,
+                    author="agent",
+                ),
+            ),
+        )
+
+
+_Handler = Callable[[_OpenAIStreamProcessor, Any], Sequence[StreamTaskMessage]]
+
+_EVENT_HANDLERS: dict[Any, _Handler] = {
+    "raw_response_event": _OpenAIStreamProcessor._on_raw_response_event,
+    "run_item_stream_event": _OpenAIStreamProcessor._on_run_item_stream_event,
+}
+
+# Raw events not listed emit nothing. That includes ResponseOutputItemAddedEvent
+# (a new message is opened on its first delta instead), the reasoning summary
+# "part added" events (handled on delta), and the reasoning summary / content
+# "text done" events: there can be several of those per item, so the message is
+# only closed by the item's ResponseOutputItemDoneEvent.
+_RAW_EVENT_HANDLERS: TypeDispatch[_Handler] = TypeDispatch(
+    {
+        ResponseOutputItemDoneEvent: _OpenAIStreamProcessor._on_output_item_done,
+        ResponseReasoningSummaryTextDeltaEvent: _OpenAIStreamProcessor._on_reasoning_summary_text_delta,
+        ResponseReasoningTextDeltaEvent: _OpenAIStreamProcessor._on_reasoning_text_delta,
+        ResponseTextDeltaEvent: _OpenAIStreamProcessor._on_text_delta,
+    }
+)
+
+_RUN_ITEM_HANDLERS: dict[Any, _Handler] = {
+    "tool_call_item": _OpenAIStreamProcessor._on_tool_call_item,
+    "tool_call_output_item": _OpenAIStreamProcessor._on_tool_call_output_item,
+}
+
+
 async def _convert_openai_impl(stream_response):
     """Convert OpenAI streaming events to AgentEx TaskMessageUpdate events with reasoning support.
 
@@ -175,221 +363,7 @@ async def _convert_openai_impl(stream_response):
     Yields:
         TaskMessageUpdate: AgentEx streaming events (StreamTaskMessageDelta, StreamTaskMessageFull, or StreamTaskMessageDone)
     """
-
-    tool_map = {}
-    event_count = 0
-    message_index = 0  # Track message index for proper sequencing
-    item_id_to_index = {}  # Map item_id to message index
-    item_id_to_type = {}  # Map item_id to content type (text, reasoning_content, reasoning_summary)
-
+    processor = _OpenAIStreamProcessor()
     async for event in stream_response:
-        event_count += 1
-
-        # Check for raw response events which contain the actual OpenAI streaming events
-        if hasattr(event, "type") and event.type == "raw_response_event":
-            if hasattr(event, "data"):
-                raw_event = event.data
-
-                # Check for ResponseOutputItemAddedEvent which signals a new message starting
-                if isinstance(raw_event, ResponseOutputItemAddedEvent):
-                    # Don't increment here - we'll increment when we see the actual text delta
-                    # This is just a signal that a new message is starting
-                    pass
-
-                # Handle item completion - send done event to close the message
-                elif isinstance(raw_event, ResponseOutputItemDoneEvent):
-                    item_id = raw_event.item.id
-                    if item_id in item_id_to_index:
-                        # Close every streamed message — text AND reasoning — with a
-                        # matching Done. UnifiedEmitter.auto_send only releases a
-                        # context on StreamTaskMessageDone; skipping it for reasoning
-                        # left those messages hanging and their spans incomplete. The
-                        # accumulator rebuilds ReasoningContent from the deltas, so the
-                        # Done carries no payload.
-                        yield StreamTaskMessageDone(
-                            type="done",
-                            index=item_id_to_index[item_id],
-                        )
-
-                # Skip reasoning summary part added events - we handle them on delta
-                elif isinstance(raw_event, ResponseReasoningSummaryPartAddedEvent):
-                    pass
-
-                # Handle reasoning summary text delta events
-                elif isinstance(raw_event, ResponseReasoningSummaryTextDeltaEvent):
-                    item_id = raw_event.item_id
-                    summary_index = raw_event.summary_index
-
-                    # If this is a new item_id we haven't seen, create a new message
-                    if item_id and item_id not in item_id_to_index:
-                        message_index += 1
-                        item_id_to_index[item_id] = message_index
-                        item_id_to_type[item_id] = "reasoning_summary"
-
-                        # Send a start event for this new reasoning summary message.
-                        # The start content must be ReasoningContent (not TextContent)
-                        # so consumers that branch on the start event's content type
-                        # render a reasoning/thinking indicator; the final persisted
-                        # content is rebuilt from the reasoning deltas regardless.
-                        yield StreamTaskMessageStart(
-                            type="start",
-                            index=item_id_to_index[item_id],
-                            content=ReasoningContent(
-                                type="reasoning",
-                                author="agent",
-                                summary=[],
-                                content=[],
-                                style="active",
-                            ),
-                        )
-
-                    # Use the index for this item_id
-                    current_index = item_id_to_index.get(item_id, message_index)
-
-                    # Yield reasoning summary delta
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=current_index,
-                        delta=ReasoningSummaryDelta(
-                            type="reasoning_summary",
-                            summary_index=summary_index,
-                            summary_delta=raw_event.delta,
-                        ),
-                    )
-
-                # Handle reasoning summary text done events
-                elif isinstance(raw_event, ResponseReasoningSummaryTextDoneEvent):
-                    # We do NOT close the streaming context here
-                    # as there can be multiple reasoning summaries.
-                    # The context will be closed when the entire
-                    # output item is done (ResponseOutputItemDoneEvent)
-                    pass
-
-                # Handle reasoning content text delta events
-                elif isinstance(raw_event, ResponseReasoningTextDeltaEvent):
-                    item_id = raw_event.item_id
-                    content_index = raw_event.content_index
-
-                    # If this is a new item_id we haven't seen, create a new message
-                    if item_id and item_id not in item_id_to_index:
-                        message_index += 1
-                        item_id_to_index[item_id] = message_index
-                        item_id_to_type[item_id] = "reasoning_content"
-
-                        # Send a start event for this new reasoning content message.
-                        # The start content must be ReasoningContent (not TextContent)
-                        # so consumers that branch on the start event's content type
-                        # render a reasoning/thinking indicator; the final persisted
-                        # content is rebuilt from the reasoning deltas regardless.
-                        yield StreamTaskMessageStart(
-                            type="start",
-                            index=item_id_to_index[item_id],
-                            content=ReasoningContent(
-                                type="reasoning",
-                                author="agent",
-                                summary=[],
-                                content=[],
-                                style="active",
-                            ),
-                        )
-
-                    # Use the index for this item_id
-                    current_index = item_id_to_index.get(item_id, message_index)
-
-                    # Yield reasoning content delta
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=current_index,
-                        delta=ReasoningContentDelta(
-                            type="reasoning_content",
-                            content_index=content_index,
-                            content_delta=raw_event.delta,
-                        ),
-                    )
-
-                # Handle reasoning content text done events
-                elif isinstance(raw_event, ResponseReasoningTextDoneEvent):
-                    # We do NOT close the streaming context here
-                    # as there can be multiple reasoning content texts.
-                    # The context will be closed when the entire
-                    # output item is done (ResponseOutputItemDoneEvent)
-                    pass
-
-                # Check if this is a text delta event from OpenAI
-                elif isinstance(raw_event, ResponseTextDeltaEvent):
-                    # Check if this event has an item_id
-                    item_id = getattr(raw_event, "item_id", None)
-
-                    # If this is a new item_id we haven't seen, it's a new message.
-                    # Reserve a fresh index for every text item_id (matching the
-                    # increment-then-use convention of the reasoning/tool paths).
-                    # Reusing the current index let a final answer collide with the
-                    # preceding reasoning message on reasoning-model streams.
-                    if item_id and item_id not in item_id_to_index:
-                        message_index += 1
-                        item_id_to_index[item_id] = message_index
-                        item_id_to_type[item_id] = "text"
-
-                        # Send a start event with empty content for this new text message
-                        yield StreamTaskMessageStart(
-                            type="start",
-                            index=item_id_to_index[item_id],
-                            content=TextContent(
-                                type="text",
-                                author="agent",
-                                content="",  # Start with empty content, deltas will fill it
-                            ),
-                        )
-
-                    # Use the index for this item_id
-                    current_index = item_id_to_index.get(item_id, message_index)
-
-                    delta_message = StreamTaskMessageDelta(
-                        type="delta",
-                        index=current_index,
-                        delta=TextDelta(
-                            type="text",
-                            text_delta=raw_event.delta,
-                        ),
-                    )
-                    yield delta_message
-
-        elif hasattr(event, "type") and event.type == "run_item_stream_event":
-            # Skip reasoning_item events - they're handled via raw_response_event above
-            if hasattr(event, "item") and event.item.type == "reasoning_item":
-                continue
-
-            # Check for tool_call_item type (this is when a tool is being called)
-            elif hasattr(event, "item") and event.item.type == "tool_call_item":
-                # Extract tool call information using the helper method
-                call_id, tool_name, tool_arguments = _extract_tool_call_info(event.item.raw_item)
-                tool_map[call_id] = tool_name
-                tool_request_content = ToolRequestContent(
-                    tool_call_id=call_id,
-                    name=tool_name,
-                    arguments=tool_arguments,
-                    author="agent",
-                )
-                message_index += 1  # Increment for new message
-                yield StreamTaskMessageFull(
-                    index=message_index,
-                    type="full",
-                    content=tool_request_content,
-                )
-
-            # Check for tool_call_output_item type (this is when a tool returns output)
-            elif hasattr(event, "item") and event.item.type == "tool_call_output_item":
-                # Extract tool response information using the helper method
-                call_id, tool_name, content = _extract_tool_response_info(tool_map, event.item.raw_item)
-                tool_response_content = ToolResponseContent(
-                    tool_call_id=call_id,
-                    name=tool_name,
-                    content=content,
-                    author="agent",
-                )
-                message_index += 1  # Increment for new message
-                yield StreamTaskMessageFull(
-                    type="full",
-                    index=message_index,
-                    content=tool_response_content,
-                )
+        for message in processor.process(event):
+            yield message
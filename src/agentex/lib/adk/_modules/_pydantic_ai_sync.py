@@ -41,7 +41,7 @@ from __future__ import annotations
 
 import json
 import inspect
-from typing import Any, Callable, AsyncIterator
+from typing import Any, Callable, Sequence, AsyncIterator
 
 from pydantic_ai.run import AgentRunResultEvent
 from pydantic_ai.messages import (
@@ -61,9 +61,11 @@ from pydantic_ai.messages import (
 )
 
 from agentex.lib.utils.logging import make_logger
+from agentex.lib.core.harness.types import StreamTaskMessage
 from agentex.types.reasoning_content import ReasoningContent
 from agentex.types.task_message_delta import TextDelta
 from agentex.types.tool_request_delta import ToolRequestDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS, TypeDispatch
 from agentex.types.task_message_update import (
     StreamTaskMessageDone,
     StreamTaskMessageFull,
@@ -138,6 +140,254 @@ async def convert_pydantic_ai_to_agentex_events(
                 await _aclose()
 
 
+class _PydanticAIStreamProcessor:
+    """Stateful converter: one Pydantic AI agent stream event in, its Agentex events out.
+
+    State tracked:
+    - ``next_message_index``: the index the next message gets.
+    - ``part_to_message_index``: our absolute message index per Pydantic AI
+      part index. Part indices restart at 0 on each new model response in a
+      multi-step run, so the entry is always overwritten on PartStartEvent.
+    - ``tool_call_meta``: (tool_call_id, tool_name) per part index, so deltas
+      can surface the tool_call_id even when ToolCallPartDelta.tool_call_id is
+      None.
+    """
+
+    def __init__(self) -> None:
+        self.next_message_index = 0
+        self.part_to_message_index: dict[int, int] = {}
+        self.tool_call_meta: dict[int, tuple[str, str]] = {}
+
+    def process(self, event: Any) -> Sequence[StreamTaskMessage]:
+        handler = _EVENT_HANDLERS[event.__class__]
+        if handler is None:
+            logger.debug("Unhandled Pydantic AI event type: %r", type(event).__name__)
+            return NO_EVENTS
+        return handler(self, event)
+
+    def _alloc(self) -> int:
+        index = self.next_message_index
+        self.next_message_index += 1
+        return index
+
+    # -- events --------------------------------------------------------------
+
+    def _on_part_start(self, event: PartStartEvent) -> Sequence[StreamTaskMessage]:
+        message_index = self._alloc()
+        self.part_to_message_index[event.index] = message_index
+        handler = _PART_START_HANDLERS[event.part.__class__]
+        if handler is None:
+            logger.debug("Unhandled PartStartEvent part type: %r", type(event.part).__name__)
+            return NO_EVENTS
+        return handler(self, event.index, event.part, message_index)
+
+    def _on_part_delta(self, event: PartDeltaEvent) -> Sequence[StreamTaskMessage]:
+        message_index = self.part_to_message_index.get(event.index)
+        if message_index is None:
+            logger.debug("PartDeltaEvent for unknown part index %s; skipping", event.index)
+            return NO_EVENTS
+        handler = _PART_DELTA_HANDLERS[event.delta.__class__]
+        if handler is None:
+            logger.debug("Unhandled PartDeltaEvent delta type: %r", type(event.delta).__name__)
+            return NO_EVENTS
+        return handler(self, event.index, event.delta, message_index)
+
+    def _on_part_end(self, event: PartEndEvent) -> Sequence[StreamTaskMessage]:
+        message_index = self.part_to_message_index.get(event.index)
+        if message_index is None:
+            return NO_EVENTS
+        return (StreamTaskMessageDone(type="done", index=message_index),)
+
+    def _on_function_tool_result(self, event: FunctionToolResultEvent) -> Sequence[StreamTaskMessage]:
+        result = event.part
+        return (
+            StreamTaskMessageFull(
+                type="full",
+                index=self._alloc(),
+                content=ToolResponseContent(
+                    type="tool_response",
+                    author="agent",
+                    tool_call_id=result.tool_call_id,
+                    name=getattr(result, "tool_name", "") or "",
+                    content=_tool_return_content(result),
+                ),
+            ),
+        )
+
+    def _ignore(self, _event: Any) -> Sequence[StreamTaskMessage]:
+        # Already covered by PartStart/PartDelta/PartEnd events, or informational
+        # only (FinalResultEvent / AgentRunResultEvent signal run-level state,
+        # not new content to surface).
+        return NO_EVENTS
+
+    # -- part starts ---------------------------------------------------------
+
+    def _start_text(self, _part_index: int, part: TextPart, message_index: int) -> Sequence[StreamTaskMessage]:
+        start = StreamTaskMessageStart(
+            type="start",
+            index=message_index,
+            content=TextContent(type="text", author="agent", content=""),
+        )
+        if not part.content:
+            return (start,)
+        return (
+            start,
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=TextDelta(type="text", text_delta=part.content),
+            ),
+        )
+
+    def _start_thinking(self, _part_index: int, part: ThinkingPart, message_index: int) -> Sequence[StreamTaskMessage]:
+        start = StreamTaskMessageStart(
+            type="start",
+            index=message_index,
+            content=ReasoningContent(
+                type="reasoning",
+                author="agent",
+                summary=[],
+                content=[],
+                style="active",
+            ),
+        )
+        if not part.content:
+            return (start,)
+        return (
+            start,
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=ReasoningContentDelta(
+                    type="reasoning_content",
+                    content_index=0,
+                    content_delta=part.content,
+                ),
+            ),
+        )
+
+    def _start_tool_call(self, part_index: int, part: ToolCallPart, message_index: int) -> Sequence[StreamTaskMessage]:
+        self.tool_call_meta[part_index] = (part.tool_call_id, part.tool_name)
+        # Pydantic AI may already have a fully-formed args dict at start when
+        # the provider returns the tool call in one shot; surface it directly
+        # so clients see the complete arguments without waiting for deltas.
+        initial_args: dict[str, Any] = {}
+        if isinstance(part.args, dict):
+            # dict(...) materializes a fresh dict[str, Any]; pydantic-ai's
+            # ToolCallPart.args includes TypedDict-style variants that
+            # pyright doesn't narrow to plain dict[str, Any] via isinstance.
+            initial_args = dict(part.args)
+        start = StreamTaskMessageStart(
+            type="start",
+            index=message_index,
+            content=ToolRequestContent(
+                type="tool_request",
+                author="agent",
+                tool_call_id=part.tool_call_id,
+                name=part.tool_name,
+                arguments=initial_args,
+            ),
+        )
+        if not (isinstance(part.args, str) and part.args):
+            return (start,)
+        return (
+            start,
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=ToolRequestDelta(
+                    type="tool_request",
+                    tool_call_id=part.tool_call_id,
+                    name=part.tool_name,
+                    arguments_delta=part.args,
+                ),
+            ),
+        )
+
+    # -- part deltas ---------------------------------------------------------
+
+    def _text_delta(self, _part_index: int, delta: TextPartDelta, message_index: int) -> Sequence[StreamTaskMessage]:
+        return (
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=TextDelta(type="text", text_delta=delta.content_delta),
+            ),
+        )
+
+    def _thinking_delta(
+        self, _part_index: int, delta: ThinkingPartDelta, message_index: int
+    ) -> Sequence[StreamTaskMessage]:
+        if not delta.content_delta:
+            return NO_EVENTS
+        return (
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=ReasoningContentDelta(
+                    type="reasoning_content",
+                    content_index=0,
+                    content_delta=delta.content_delta,
+                ),
+            ),
+        )
+
+    def _tool_call_delta(
+        self, part_index: int, delta: ToolCallPartDelta, message_index: int
+    ) -> Sequence[StreamTaskMessage]:
+        meta = self.tool_call_meta.get(part_index)
+        if meta is None:
+            # First time we've seen this part; the provider didn't emit a
+            # PartStartEvent first. Synthesize one from the delta if we have
+            # enough information.
+            meta = self.tool_call_meta[part_index] = (delta.tool_call_id or "", delta.tool_name_delta or "")
+        tool_call_id, tool_name = meta
+        return (
+            StreamTaskMessageDelta(
+                type="delta",
+                index=message_index,
+                delta=ToolRequestDelta(
+                    type="tool_request",
+                    tool_call_id=tool_call_id,
+                    name=tool_name,
+                    arguments_delta=_args_delta_to_str(delta.args_delta),
+                ),
+            ),
+        )
+
+
+_Handler = Callable[[_PydanticAIStreamProcessor, Any], Sequence[StreamTaskMessage]]
+_PartHandler = Callable[[_PydanticAIStreamProcessor, int, Any, int], Sequence[StreamTaskMessage]]
+
+_EVENT_HANDLERS: TypeDispatch[_Handler] = TypeDispatch(
+    {
+        PartStartEvent: _PydanticAIStreamProcessor._on_part_start,
+        PartDeltaEvent: _PydanticAIStreamProcessor._on_part_delta,
+        PartEndEvent: _PydanticAIStreamProcessor._on_part_end,
+        FunctionToolResultEvent: _PydanticAIStreamProcessor._on_function_tool_result,
+        FunctionToolCallEvent: _PydanticAIStreamProcessor._ignore,
+        FinalResultEvent: _PydanticAIStreamProcessor._ignore,
+        AgentRunResultEvent: _PydanticAIStreamProcessor._ignore,
+    }
+)
+
+_PART_START_HANDLERS: TypeDispatch[_PartHandler] = TypeDispatch(
+    {
+        TextPart: _PydanticAIStreamProcessor._start_text,
+        ThinkingPart: _PydanticAIStreamProcessor._start_thinking,
+        ToolCallPart: _PydanticAIStreamProcessor._start_tool_call,
+    }
+)
+
+_PART_DELTA_HANDLERS: TypeDispatch[_PartHandler] = TypeDispatch(
+    {
+        TextPartDelta: _PydanticAIStreamProcessor._text_delta,
+        ThinkingPartDelta: _PydanticAIStreamProcessor._thinking_delta,
+        ToolCallPartDelta: _PydanticAIStreamProcessor._tool_call_delta,
+    }
+)
+
+
 async def _convert_pydantic_ai_impl(
     stream_response: AsyncIterator[Any],
     on_result: Callable[[AgentRunResultEvent], Any] | None = None,
@@ -174,177 +424,11 @@ async def _convert_pydantic_ai_impl(
         Agentex ``StreamTaskMessage*`` events suitable for forwarding back over
         the ACP streaming response.
     """
-    next_message_index = 0
-    # Maps Pydantic AI's per-response part index to our absolute message index.
-    # Part indices restart at 0 on each new model response in a multi-step run,
-    # so we always overwrite the entry on PartStartEvent.
-    part_to_message_index: dict[int, int] = {}
-    # Tool-call metadata indexed by Pydantic AI part index (so deltas can
-    # surface the tool_call_id even when ToolCallPartDelta.tool_call_id is None).
-    tool_call_meta: dict[int, tuple[str, str]] = {}
-
+    processor = _PydanticAIStreamProcessor()
     async for event in stream_response:
-        if isinstance(event, PartStartEvent):
-            message_index = next_message_index
-            next_message_index += 1
-            part_to_message_index[event.index] = message_index
-
-            if isinstance(event.part, TextPart):
-                yield StreamTaskMessageStart(
-                    type="start",
-                    index=message_index,
-                    content=TextContent(
-                        type="text",
-                        author="agent",
-                        content="",
-                    ),
-                )
-                if event.part.content:
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=message_index,
-                        delta=TextDelta(type="text", text_delta=event.part.content),
-                    )
-            elif isinstance(event.part, ThinkingPart):
-                yield StreamTaskMessageStart(
-                    type="start",
-                    index=message_index,
-                    content=ReasoningContent(
-                        type="reasoning",
-                        author="agent",
-                        summary=[],
-                        content=[],
-                        style="active",
-                    ),
-                )
-                if event.part.content:
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=message_index,
-                        delta=ReasoningContentDelta(
-                            type="reasoning_content",
-                            content_index=0,
-                            content_delta=event.part.content,
-                        ),
-                    )
-            elif isinstance(event.part, ToolCallPart):
-                tool_call_meta[event.index] = (event.part.tool_call_id, event.part.tool_name)
-                # Pydantic AI may already have a fully-formed args dict at start
-                # when the provider returns the tool call in one shot; surface it
-                # directly so clients see the complete arguments without waiting
-                # for deltas.
-                initial_args: dict[str, Any] = {}
-                if isinstance(event.part.args, dict):
-                    # dict(...) materializes a fresh dict[str, Any]; pydantic-ai's
-                    # ToolCallPart.args includes TypedDict-style variants that
-                    # pyright doesn't narrow to plain dict[str, Any] via isinstance.
-                    initial_args = dict(event.part.args)
-                yield StreamTaskMessageStart(
-                    type="start",
-                    index=message_index,
-                    content=ToolRequestContent(
-                        type="tool_request",
-                        author="agent",
-                        tool_call_id=event.part.tool_call_id,
-                        name=event.part.tool_name,
-                        arguments=initial_args,
-                    ),
-                )
-                if isinstance(event.part.args, str) and event.part.args:
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=message_index,
-                        delta=ToolRequestDelta(
-                            type="tool_request",
-                            tool_call_id=event.part.tool_call_id,
-                            name=event.part.tool_name,
-                            arguments_delta=event.part.args,
-                        ),
-                    )
-            else:
-                logger.debug("Unhandled PartStartEvent part type: %r", type(event.part).__name__)
-
-        elif isinstance(event, PartDeltaEvent):
-            message_index = part_to_message_index.get(event.index)
-            if message_index is None:
-                logger.debug("PartDeltaEvent for unknown part index %s; skipping", event.index)
-                continue
-
-            if isinstance(event.delta, TextPartDelta):
-                yield StreamTaskMessageDelta(
-                    type="delta",
-                    index=message_index,
-                    delta=TextDelta(type="text", text_delta=event.delta.content_delta),
-                )
-            elif isinstance(event.delta, ThinkingPartDelta):
-                if event.delta.content_delta:
-                    yield StreamTaskMessageDelta(
-                        type="delta",
-                        index=message_index,
-                        delta=ReasoningContentDelta(
-                            type="reasoning_content",
-                            content_index=0,
-                            content_delta=event.delta.content_delta,
-                        ),
-                    )
-            elif isinstance(event.delta, ToolCallPartDelta):
-                meta = tool_call_meta.get(event.index)
-                if meta is None:
-                    # First time we've seen this part; the provider didn't emit
-                    # a PartStartEvent first. Synthesize one from the delta if
-                    # we have enough information.
-                    tool_call_id = event.delta.tool_call_id or ""
-                    tool_name = event.delta.tool_name_delta or ""
-                    tool_call_meta[event.index] = (tool_call_id, tool_name)
-                else:
-                    tool_call_id, tool_name = meta
-                yield StreamTaskMessageDelta(
-                    type="delta",
-                    index=message_index,
-                    delta=ToolRequestDelta(
-                        type="tool_request",
-                        tool_call_id=tool_call_id,
-                        name=tool_name,
-                        arguments_delta=_args_delta_to_str(event.delta.args_delta),
-                    ),
-                )
-            else:
-                logger.debug("Unhandled PartDeltaEvent delta type: %r", type(event.delta).__name__)
-
-        elif isinstance(event, PartEndEvent):
-            message_index = part_to_message_index.get(event.index)
-            if message_index is None:
-                continue
-            yield StreamTaskMessageDone(type="done", index=message_index)
-
-        elif isinstance(event, FunctionToolResultEvent):
-            result = event.part
-            tool_call_id = result.tool_call_id
-            tool_name = getattr(result, "tool_name", "") or ""
-            message_index = next_message_index
-            next_message_index += 1
-            content_payload = _tool_return_content(result)
-            yield StreamTaskMessageFull(
-                type="full",
-                index=message_index,
-                content=ToolResponseContent(
-                    type="tool_response",
-                    author="agent",
-                    tool_call_id=tool_call_id,
-                    name=tool_name,
-                    content=content_payload,
-                ),
-            )
-
-        elif isinstance(event, (FunctionToolCallEvent, FinalResultEvent, AgentRunResultEvent)):
-            # Already covered by PartStart/PartDelta/PartEnd events above, or
-            # informational only (FinalResultEvent / AgentRunResultEvent signal
-            # run-level state, not new content to surface).
-            if isinstance(event, AgentRunResultEvent) and on_result is not None:
-                ret = on_result(event)
-                if inspect.iscoroutine(ret):
-                    await ret
-            continue
-
-        else:
-            logger.debug("Unhandled Pydantic AI event type: %r", type(event).__name__)
+        for message in processor.process(event):
+            yield message
+        if on_result is not None and isinstance(event, AgentRunResultEvent):
+            ret = on_result(event)
+            if inspect.iscoroutine(ret):
+                await ret
@@ -3,6 +3,7 @@
 from __future__ import annotations
 from datetime import timedelta
 from typing import Any, List
+from collections.abc import AsyncGenerator
 
 from agentex.types import Event
 from temporalio.common import RetryPolicy
@@ -10,11 +11,14 @@ from temporalio.common import RetryPolicy
 from agentex import AsyncAgentex  # noqa: F401
 from agentex.lib.adk.utils._modules.client import create_async_agentex_client
 from agentex.lib.core.services.adk.acp.acp import ACPService
+from agentex.lib.core.services.adk.streaming import StreamingService
+from agentex.lib.core.adapters.streams.adapter_redis import RedisStreamRepository
 from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
 from agentex.lib.core.temporal.activities.adk.acp.acp_activities import (
     ACPActivityName,
     EventSendParams,
     MessageSendParams,
+    MessageSendStreamAutoSendParams,
     TaskCancelParams,
     TaskCreateParams,
 )
@@ -24,6 +28,7 @@ from agentex.types.task import Task
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.temporal import in_temporal_workflow
 from agentex.types.task_message_content import TaskMessageContent
+from agentex.types.task_message_update import TaskMessageUpdate
 
 logger = make_logger(__name__)
 
@@ -47,7 +52,15 @@ class ACPModule:
         if acp_service is None:
             agentex_client = create_async_agentex_client()
             tracer = AsyncTracer(agentex_client)
-            self._acp_service = ACPService(agentex_client=agentex_client, tracer=tracer)
+            streaming_service = StreamingService(
+                agentex_client=agentex_client,
+                stream_repository=RedisStreamRepository(),
+            )
+            self._acp_service = ACPService(
+                agentex_client=agentex_client,
+                tracer=tracer,
+                streaming_service=streaming_service,
+            )
         else:
             self._acp_service = acp_service
 
@@ -230,6 +243,127 @@ class ACPModule:
                 request=request,
             )
 
+    async def send_message_stream(
+        self,
+        content: TaskMessageContent,
+        task_id: str | None = None,
+        agent_id: str | None = None,
+        agent_name: str | None = None,
+        task_name: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        request: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[TaskMessageUpdate, None]:
+        """
+        Send a message to a task and yield the agent's updates as they arrive.
+
+        NOTE: This method does NOT work in Temporal workflows!
+        Temporal activities cannot return generators. Use send_message_stream_auto_send() instead.
+
+        Args:
+            content: The task message content to send to the task.
+            task_id: The ID of the task to send the message to.
+            agent_id: The ID of the agent to send the message to.
+            agent_name: The name of the agent to send the message to.
+            task_name: The name of the task to send the message to.
+            trace_id: The trace ID for the message.
+            parent_span_id: The parent span ID for the message.
+            request: Additional request context including headers to forward to the agent.
+
+        Returns:
+            AsyncGenerator[TaskMessageUpdate, None]: Generator yielding the agent's start, delta, full and done updates
+
+        Raises:
+            ValueError: If called from within a Temporal workflow
+        """
+        if in_temporal_workflow():
+            raise ValueError("send_message_stream() cannot be used in a Temporal workflow, use send_message_stream_auto_send()")
+        async for update in self._acp_service.message_send_stream(
+            agent_id=agent_id,
+            agent_name=agent_name,
+            task_id=task_id,
+            task_name=task_name,
+            content=content,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            request=request,
+        ):
+            yield update
+
+    async def send_message_stream_auto_send(
+        self,
+        parent_task_id: str,
+        content: TaskMessageContent,
+        task_id: str | None = None,
+        agent_id: str | None = None,
+        agent_name: str | None = None,
+        task_name: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        start_to_close_timeout: timedelta = timedelta(seconds=600),
+        heartbeat_timeout: timedelta = timedelta(seconds=30),
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        request: dict[str, Any] | None = None,
+    ) -> List[TaskMessage]:
+        """
+        Send a message to another agent's task and stream its reply into a parent task.
+
+        Each message the agent streams back is created on ``parent_task_id``
+        and its deltas are forwarded to the parent task's stream as they
+        arrive, so an orchestrator's clients see a sub-agent's reply token by
+        token instead of after it finishes. In a workflow this runs as an
+        activity that heartbeats on every update, so ``heartbeat_timeout``
+        bounds the gap between updates rather than the whole reply.
+
+        Args:
+            parent_task_id: The ID of the task whose stream the reply is forwarded to.
+            content: The task message content to send to the task.
+            task_id: The ID of the task to send the message to.
+            agent_id: The ID of the agent to send the message to.
+            agent_name: The name of the agent to send the message to.
+            task_name: The name of the task to send the message to.
+            trace_id: The trace ID for the message.
+            parent_span_id: The parent span ID for the message.
+            start_to_close_timeout: The start to close timeout for the whole reply.
+            heartbeat_timeout: The heartbeat timeout between updates.
+            retry_policy: The retry policy for the message.
+            request: Additional request context including headers to forward to the agent.
+
+        Returns:
+            The messages created on the parent task.
+        """
+        if in_temporal_workflow():
+            return await ActivityHelpers.execute_activity(
+                activity_name=ACPActivityName.MESSAGE_SEND_STREAM_AUTO_SEND,
+                request=MessageSendStreamAutoSendParams(
+                    parent_task_id=parent_task_id,
+                    agent_id=agent_id,
+                    agent_name=agent_name,
+                    task_id=task_id,
+                    task_name=task_name,
+                    content=content,
+                    trace_id=trace_id,
+                    parent_span_id=parent_span_id,
+                    request=request,
+                ),
+                response_type=List[TaskMessage],
+                start_to_close_timeout=start_to_close_timeout,
+                retry_policy=retry_policy,
+                heartbeat_timeout=heartbeat_timeout,
+            )
+        else:
+            return await self._acp_service.message_send_stream_auto_send(
+                parent_task_id=parent_task_id,
+                agent_id=agent_id,
+                agent_name=agent_name,
+                task_id=task_id,
+                task_name=task_name,
+                content=content,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+                request=request,
+            )
+
     async def cancel_task(
         self,
         task_id: str | None = None,
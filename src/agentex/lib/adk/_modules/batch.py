@@ -0,0 +1,453 @@
+# ruff: noqa: I001
+# Import order matters - module imports must come after client import to avoid circular imports
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Any, Generic, TypeVar, Callable, Awaitable
+
+from pydantic import BaseModel, TypeAdapter
+from temporalio.common import RetryPolicy
+
+from agentex import AsyncAgentex  # noqa: F401
+from agentex.lib.adk._modules.events import EventsModule
+from agentex.lib.adk._modules.messages import MessagesModule
+from agentex.lib.adk._modules.state import StateModule
+from agentex.lib.adk._modules.tasks import TasksModule
+from agentex.lib.adk._modules.agent_task_tracker import AgentTaskTrackerModule
+from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
+from agentex.lib.core.temporal.activities.adk.agent_task_tracker_activities import (
+    AgentTaskTrackerActivityName,
+    UpdateAgentTaskTrackerParams,
+)
+from agentex.lib.core.temporal.activities.adk.batch_activities import (
+    BatchActivityName,
+    BatchOperationParams,
+    BatchOperationResult,
+    ExecuteBatchParams,
+)
+from agentex.lib.core.temporal.activities.adk.events_activities import EventsActivityName, ListEventsParams
+from agentex.lib.core.temporal.activities.adk.messages_activities import CreateMessageParams, MessagesActivityName
+from agentex.lib.core.temporal.activities.adk.state_activities import StateActivityName, UpdateStateParams
+from agentex.lib.core.temporal.activities.adk.tasks_activities import TasksActivityName, UpdateTaskParams
+from agentex.types.event import Event
+from agentex.types.state import State
+from agentex.types.task import Task
+from agentex.types.agent_task_tracker import AgentTaskTracker
+from agentex.types.task_message import TaskMessage, TaskMessageContent
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.utils.temporal import in_temporal_workflow, workflow_now_if_in_workflow
+
+logger = make_logger(__name__)
+
+# The batch runs as a single attempt by default, like the operations it
+# bundles: they are not all idempotent, and each one's error is reported on
+# its own rather than failing (and retrying) the batch.
+DEFAULT_RETRY_POLICY = RetryPolicy(maximum_attempts=1)
+
+T = TypeVar("T")
+
+
+class BatchOperationError(Exception):
+    """An operation in a batch failed; raised by ``BatchOperation.result()``."""
+
+    def __init__(self, activity_name: str, error_type: str, message: str):
+        super().__init__(f"{activity_name} failed with {error_type}: {message}")
+        self.activity_name = activity_name
+        self.error_type = error_type
+
+
+class BatchOperation(Generic[T]):
+    """The pending result of one operation recorded on an ``ADKBatch``."""
+
+    def __init__(
+        self,
+        activity_name: str,
+        params: BaseModel,
+        response_type: Any,
+        run_local: Callable[[], Awaitable[T]],
+    ):
+        self.activity_name: str = getattr(activity_name, "value", activity_name)
+        self.params = params
+        self._response_type = response_type
+        self._run_local = run_local
+        self._done = False
+        self._value: T | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> T:
+        """The operation's result; raises its error if it failed."""
+        if not self._done:
+            raise RuntimeError("The batch has not been executed yet")
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+    def exception(self) -> BaseException | None:
+        """The operation's error, or ``None`` if it succeeded."""
+        if not self._done:
+            raise RuntimeError("The batch has not been executed yet")
+        return self._error
+
+    def _set_result(self, value: T) -> None:
+        self._value, self._done = value, True
+
+    def _set_exception(self, error: BaseException) -> None:
+        self._error, self._done = error, True
+
+    def _resolve(self, result: BatchOperationResult) -> None:
+        if result.skipped:
+            self._set_exception(
+                BatchOperationError(self.activity_name, "Skipped", "an earlier operation in the batch failed")
+            )
+        elif result.error_type is not None:
+            self._set_exception(BatchOperationError(self.activity_name, result.error_type, result.error or ""))
+        else:
+            self._set_result(TypeAdapter(self._response_type).validate_python(result.value))
+
+
+class ADKBatch:
+    """
+    Records ADK operations and executes them together.
+
+    In a workflow, ``execute()`` runs every recorded operation, in order, in a
+    single activity instead of one activity each. Outside a workflow the
+    operations are simply called in order. Either way each operation's result
+    or error is available from the ``BatchOperation`` its call returned::
+
+        batch = adk.batch.new()
+        message = batch.messages.create(task_id=task_id, content=content)
+        batch.state.update(state_id=state_id, task_id=task_id, agent_id=agent_id, state=state)
+        batch.agent_task_tracker.update(tracker_id=tracker_id, last_processed_event_id=event_id)
+        await batch.execute()
+        message.result()
+
+    ``async with adk.batch.new() as batch:`` executes the batch when the block
+    exits without an exception.
+    """
+
+    def __init__(
+        self,
+        messages: MessagesModule,
+        state: StateModule,
+        tasks: TasksModule,
+        agent_task_tracker: AgentTaskTrackerModule,
+        events: EventsModule,
+    ):
+        self.operations: list[BatchOperation[Any]] = []
+        self._executed = False
+        self.messages = _BatchMessages(self, messages)
+        self.state = _BatchState(self, state)
+        self.tasks = _BatchTasks(self, tasks)
+        self.agent_task_tracker = _BatchAgentTaskTracker(self, agent_task_tracker)
+        self.events = _BatchEvents(self, events)
+
+    def _add(
+        self,
+        activity_name: str,
+        params: BaseModel,
+        response_type: Any,
+        run_local: Callable[[], Awaitable[T]],
+    ) -> BatchOperation[T]:
+        if self._executed:
+            raise RuntimeError("Cannot add operations to a batch that has already been executed")
+        operation: BatchOperation[T] = BatchOperation(activity_name, params, response_type, run_local)
+        self.operations.append(operation)
+        return operation
+
+    async def execute(
+        self,
+        stop_on_error: bool = False,
+        start_to_close_timeout: timedelta = timedelta(seconds=30),
+        heartbeat_timeout: timedelta = timedelta(seconds=10),
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ) -> list[BatchOperation[Any]]:
+        """
+        Execute the recorded operations in order.
+
+        Args:
+            stop_on_error (bool): Skip the operations after the first one that fails.
+            start_to_close_timeout (timedelta): The start to close timeout for the whole batch.
+            heartbeat_timeout (timedelta): The heartbeat timeout; the batch heartbeats between operations.
+            retry_policy (RetryPolicy): The retry policy for the whole batch.
+
+        Returns:
+            List[BatchOperation]: The operations, in the order they were recorded.
+        """
+        if self._executed:
+            raise RuntimeError("The batch has already been executed")
+        self._executed = True
+        if not self.operations:
+            return []
+
+        if in_temporal_workflow():
+            results: list[BatchOperationResult] = await ActivityHelpers.execute_activity(
+                activity_name=BatchActivityName.EXECUTE_BATCH,
+                request=ExecuteBatchParams(
+                    operations=[
+                        BatchOperationParams(
+                            activity_name=operation.activity_name,
+                            params=operation.params.model_dump(mode="json"),
+                        )
+                        for operation in self.operations
+                    ],
+                    stop_on_error=stop_on_error,
+                ),
+                response_type=list[BatchOperationResult],
+                start_to_close_timeout=start_to_close_timeout,
+                retry_policy=retry_policy,
+                heartbeat_timeout=heartbeat_timeout,
+            )
+            for operation, result in zip(self.operations, results, strict=True):
+                operation._resolve(result)
+        else:
+            failed = False
+            for operation in self.operations:
+                if failed and stop_on_error:
+                    operation._resolve(BatchOperationResult(skipped=True))
+                    continue
+                try:
+                    operation._set_result(await operation._run_local())
+                except Exception as e:
+                    failed = True
+                    operation._set_exception(e)
+        return self.operations
+
+    async def __aenter__(self) -> ADKBatch:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.execute()
+
+
+class _BatchMessages:
+    def __init__(self, batch: ADKBatch, module: MessagesModule):
+        self._batch = batch
+        self._module = module
+        self._created = 0
+
+    def create(
+        self,
+        task_id: str,
+        content: TaskMessageContent,
+        emit_updates: bool = True,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        created_at: datetime | None = None,
+    ) -> BatchOperation[TaskMessage]:
+        """Record ``adk.messages.create``."""
+        if created_at is None:
+            # Messages created in one batch share workflow.now(); offset them
+            # so they stay ordered at the server.
+            now = workflow_now_if_in_workflow()
+            if now is not None:
+                created_at = now + timedelta(microseconds=self._created)
+        self._created += 1
+        params = CreateMessageParams(
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            task_id=task_id,
+            content=content,
+            emit_updates=emit_updates,
+            created_at=created_at,
+        )
+        return self._batch._add(
+            MessagesActivityName.CREATE_MESSAGE,
+            params,
+            TaskMessage,
+            lambda: self._module.create(
+                task_id=task_id,
+                content=content,
+                emit_updates=emit_updates,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+                created_at=created_at,
+            ),
+        )
+
+
+class _BatchState:
+    def __init__(self, batch: ADKBatch, module: StateModule):
+        self._batch = batch
+        self._module = module
+
+    def update(
+        self,
+        state_id: str,
+        task_id: str,
+        agent_id: str,
+        state: dict[str, Any] | BaseModel,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> BatchOperation[State]:
+        """Record ``adk.state.update``."""
+        state_dict = state.model_dump() if isinstance(state, BaseModel) else state
+        params = UpdateStateParams(
+            state_id=state_id,
+            task_id=task_id,
+            agent_id=agent_id,
+            state=state_dict,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        )
+        return self._batch._add(
+            StateActivityName.UPDATE_STATE,
+            params,
+            State,
+            lambda: self._module.update(
+                state_id=state_id,
+                task_id=task_id,
+                agent_id=agent_id,
+                state=state_dict,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ),
+        )
+
+
+class _BatchTasks:
+    def __init__(self, batch: ADKBatch, module: TasksModule):
+        self._batch = batch
+        self._module = module
+
+    def update(
+        self,
+        *,
+        task_id: str | None = None,
+        task_name: str | None = None,
+        task_metadata: dict[str, object] | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> BatchOperation[Task]:
+        """Record ``adk.tasks.update``."""
+        params = UpdateTaskParams(
+            task_id=task_id,
+            task_name=task_name,
+            task_metadata=task_metadata,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        )
+        return self._batch._add(
+            TasksActivityName.UPDATE_TASK,
+            params,
+            Task,
+            lambda: self._module.update(
+                task_id=task_id,
+                task_name=task_name,
+                task_metadata=task_metadata,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ),
+        )
+
+
+class _BatchAgentTaskTracker:
+    def __init__(self, batch: ADKBatch, module: AgentTaskTrackerModule):
+        self._batch = batch
+        self._module = module
+
+    def update(
+        self,
+        tracker_id: str,
+        last_processed_event_id: str | None = None,
+        status: str | None = None,
+        status_reason: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> BatchOperation[AgentTaskTracker]:
+        """Record ``adk.agent_task_tracker.update``."""
+        params = UpdateAgentTaskTrackerParams(
+            tracker_id=tracker_id,
+            last_processed_event_id=last_processed_event_id,
+            status=status,
+            status_reason=status_reason,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        )
+        return self._batch._add(
+            AgentTaskTrackerActivityName.UPDATE_AGENT_TASK_TRACKER,
+            params,
+            AgentTaskTracker,
+            lambda: self._module.update(
+                tracker_id=tracker_id,
+                last_processed_event_id=last_processed_event_id,
+                status=status,
+                status_reason=status_reason,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ),
+        )
+
+
+class _BatchEvents:
+    def __init__(self, batch: ADKBatch, module: EventsModule):
+        self._batch = batch
+        self._module = module
+
+    def list_events(
+        self,
+        task_id: str,
+        agent_id: str,
+        last_processed_event_id: str | None = None,
+        limit: int | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> BatchOperation[list[Event]]:
+        """Record ``adk.events.list_events``."""
+        params = ListEventsParams(
+            task_id=task_id,
+            agent_id=agent_id,
+            last_processed_event_id=last_processed_event_id,
+            limit=limit,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        )
+        return self._batch._add(
+            EventsActivityName.LIST_EVENTS,
+            params,
+            list[Event],
+            lambda: self._module.list_events(
+                task_id=task_id,
+                agent_id=agent_id,
+                last_processed_event_id=last_processed_event_id,
+                limit=limit,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ),
+        )
+
+
+class BatchModule:
+    """
+    Module for batching ADK operations made from workflows into one activity.
+
+    Supports ``messages.create``, ``state.update``, ``tasks.update``,
+    ``agent_task_tracker.update`` and ``events.list_events``.
+    """
+
+    def __init__(
+        self,
+        messages: MessagesModule | None = None,
+        state: StateModule | None = None,
+        tasks: TasksModule | None = None,
+        agent_task_tracker: AgentTaskTrackerModule | None = None,
+        events: EventsModule | None = None,
+    ):
+        self._messages = messages or MessagesModule()
+        self._state = state or StateModule()
+        self._tasks = tasks or TasksModule()
+        self._agent_task_tracker = agent_task_tracker or AgentTaskTrackerModule()
+        self._events = events or EventsModule()
+
+    def new(self) -> ADKBatch:
+        """Start a new batch."""
+        return ADKBatch(
+            messages=self._messages,
+            state=self._state,
+            tasks=self._tasks,
+            agent_task_tracker=self._agent_task_tracker,
+            events=self._events,
+        )
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
 from agentex.lib.adk.utils._modules.client import create_async_agentex_client
-from agentex.lib.adk._modules._http_checkpointer import HttpCheckpointSaver
+from agentex.lib.adk._modules._http_checkpointer import Compression, HttpCheckpointSaver
 
 
-async def create_checkpointer() -> HttpCheckpointSaver:
+async def create_checkpointer(
+    *,
+    cache_size: int = 0,
+    coalesce_writes: bool = False,
+    binary_transport: bool = False,
+    compression: Compression | None = None,
+) -> HttpCheckpointSaver:
     """Create an HTTP-proxy checkpointer for LangGraph.
 
     Checkpoint operations are proxied through the agentex backend API.
     No direct database connection needed — auth is handled via the
     agent API key (injected automatically by agentex).
 
+    Args:
+        cache_size: Keep the latest checkpoint of this many threads in a local
+            LRU so the next step skips the ``get-tuple`` round trip. Only safe
+            when this process is the sole writer of its threads.
+        coalesce_writes: Send the pending writes of a superstep in one request.
+        binary_transport: Send raw blob bytes as msgpack instead of base64 in
+            JSON. Falls back to JSON if the backend does not support it.
+        compression: Compress large request bodies with ``"gzip"`` or ``"zstd"``.
+
     Usage:
         checkpointer = await create_checkpointer()
         graph = builder.compile(checkpointer=checkpointer)
     """
     client = create_async_agentex_client()
-    return HttpCheckpointSaver(client=client)
+    return HttpCheckpointSaver(
+        client=client,
+        cache_size=cache_size,
+        coalesce_writes=coalesce_writes,
+        binary_transport=binary_transport,
+        compression=compression,
+    )
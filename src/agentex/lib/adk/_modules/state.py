@@ -1,25 +1,29 @@
 # ruff: noqa: I001
 # Import order matters - AsyncTracer must come after client import to avoid circular imports
 from __future__ import annotations
+from copy import deepcopy
 from datetime import timedelta
 from typing import Any
+from collections.abc import Iterator, MutableMapping
 
 from pydantic import BaseModel
 from temporalio.common import RetryPolicy
 
 from agentex import AsyncAgentex  # noqa: F401
 from agentex.lib.adk.utils._modules.client import create_async_agentex_client
-from agentex.lib.core.services.adk.state import StateService
+from agentex.lib.core.services.adk.state import StateService, state_version
 from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
 from agentex.lib.core.temporal.activities.adk.state_activities import (
     CreateStateParams,
     DeleteStateParams,
     GetStateParams,
+    PatchStateParams,
     StateActivityName,
     UpdateStateParams,
 )
 from agentex.lib.core.tracing.tracer import AsyncTracer
 from agentex.types.state import State
+from agentex.lib.utils.json_patch import JsonPatchOp, diff_json
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.temporal import in_temporal_workflow
 
@@ -29,6 +33,104 @@ logger = make_logger(__name__)
 DEFAULT_RETRY_POLICY = RetryPolicy(maximum_attempts=1)
 
 
+class StateHandle(MutableMapping[str, Any]):
+    """
+    A versioned, locally cached view of a task state.
+
+    Read and modify it like a dict; ``save()`` sends only the top-level fields
+    that changed since the state was loaded (or last saved) as a JSON Patch,
+    and fails with ``StateVersionConflictError`` if someone else wrote the
+    state in the meantime. Obtain one with ``adk.state.load(...)``.
+    """
+
+    def __init__(
+        self,
+        module: StateModule,
+        state: State,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ):
+        self._module = module
+        self.id = state.id
+        self.task_id = state.task_id
+        self.agent_id = state.agent_id
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self._data: dict[str, Any] = deepcopy(state.state)
+        self._saved: dict[str, Any] = deepcopy(state.state)
+        self._version = state_version(state)
+
+    @property
+    def version(self) -> str:
+        """Version of the state this handle was loaded or last saved at."""
+        return self._version
+
+    @property
+    def dirty_fields(self) -> set[str]:
+        """Top-level fields that differ from the last loaded or saved state."""
+        return {
+            key
+            for key in self._data.keys() | self._saved.keys()
+            if key not in self._data or key not in self._saved or self._data[key] != self._saved[key]
+        }
+
+    def diff(self) -> list[JsonPatchOp]:
+        """The JSON Patch ``save()`` would send."""
+        return diff_json(self._saved, self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return deepcopy(self._data)
+
+    async def save(
+        self,
+        start_to_close_timeout: timedelta = timedelta(seconds=5),
+        heartbeat_timeout: timedelta = timedelta(seconds=5),
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ) -> State | None:
+        """
+        Persist local changes as a partial update.
+
+        Returns:
+            Optional[State]: The stored state, or None if nothing changed.
+
+        Raises:
+            StateVersionConflictError: If the state was modified elsewhere since it was loaded.
+        """
+        patch = self.diff()
+        if not patch:
+            return None
+        stored = await self._module.patch(
+            state_id=self.id,
+            task_id=self.task_id,
+            agent_id=self.agent_id,
+            patch=patch,
+            expected_version=self._version,
+            trace_id=self.trace_id,
+            parent_span_id=self.parent_span_id,
+            start_to_close_timeout=start_to_close_timeout,
+            heartbeat_timeout=heartbeat_timeout,
+            retry_policy=retry_policy,
+        )
+        self._saved = deepcopy(self._data)
+        self._version = state_version(stored)
+        return stored
+
+
 class StateModule:
     """
     Module for managing task state in Agentex.
@@ -250,6 +352,106 @@ class StateModule:
                 parent_span_id=parent_span_id,
             )
 
+    async def patch(
+        self,
+        state_id: str,
+        task_id: str,
+        agent_id: str,
+        patch: list[JsonPatchOp],
+        expected_version: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        start_to_close_timeout: timedelta = timedelta(seconds=5),
+        heartbeat_timeout: timedelta = timedelta(seconds=5),
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ) -> State:
+        """
+        Partially update a state with JSON Patch operations.
+
+        Only the patch travels to the activity (and into workflow history), not the full state.
+
+        Args:
+            state_id (str): The ID of the state.
+            task_id (str): The ID of the task.
+            agent_id (str): The ID of the agent.
+            patch (List[Dict[str, Any]]): ``add``/``replace``/``remove`` JSON Patch operations.
+            expected_version (Optional[str]): Refuse the update if the state is no longer at this version.
+            trace_id (Optional[str]): The trace ID for tracing.
+            parent_span_id (Optional[str]): The parent span ID for tracing.
+            start_to_close_timeout (timedelta): The start to close timeout.
+            heartbeat_timeout (timedelta): The heartbeat timeout.
+            retry_policy (RetryPolicy): The retry policy.
+
+        Returns:
+            State: The updated state.
+        """
+        params = PatchStateParams(
+            state_id=state_id,
+            task_id=task_id,
+            agent_id=agent_id,
+            patch=patch,
+            expected_version=expected_version,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        )
+        if in_temporal_workflow():
+            return await ActivityHelpers.execute_activity(
+                activity_name=StateActivityName.PATCH_STATE,
+                request=params,
+                response_type=State,
+                start_to_close_timeout=start_to_close_timeout,
+                retry_policy=retry_policy,
+                heartbeat_timeout=heartbeat_timeout,
+            )
+        else:
+            return await self._state_service.patch_state(
+                state_id=state_id,
+                task_id=task_id,
+                agent_id=agent_id,
+                patch=patch,
+                expected_version=expected_version,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            )
+
+    async def load(
+        self,
+        task_id: str,
+        agent_id: str,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        start_to_close_timeout: timedelta = timedelta(seconds=5),
+        heartbeat_timeout: timedelta = timedelta(seconds=5),
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ) -> StateHandle | None:
+        """
+        Load the state of a task and agent into a ``StateHandle`` for partial updates.
+
+        Args:
+            task_id (str): The ID of the task.
+            agent_id (str): The ID of the agent.
+            trace_id (Optional[str]): The trace ID for tracing.
+            parent_span_id (Optional[str]): The parent span ID for tracing.
+            start_to_close_timeout (timedelta): The start to close timeout.
+            heartbeat_timeout (timedelta): The heartbeat timeout.
+            retry_policy (RetryPolicy): The retry policy.
+
+        Returns:
+            Optional[StateHandle]: The state handle if a state exists, None otherwise.
+        """
+        state = await self.get_by_task_and_agent(
+            task_id=task_id,
+            agent_id=agent_id,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            start_to_close_timeout=start_to_close_timeout,
+            heartbeat_timeout=heartbeat_timeout,
+            retry_policy=retry_policy,
+        )
+        if state is None:
+            return None
+        return StateHandle(self, state, trace_id=trace_id, parent_span_id=parent_span_id)
+
     async def delete(
         self,
         state_id: str,
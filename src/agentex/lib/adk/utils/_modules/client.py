@@ -1,8 +1,12 @@
+from __future__ import annotations
+
+import os
+import weakref
 from typing import override
 
 import httpx
 
-from agentex import AsyncAgentex
+from agentex import AsyncAgentex, DefaultAsyncHttpxClient
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.environment_variables import EnvironmentVariables
 
@@ -26,7 +30,29 @@ class EnvAuth(httpx.Auth):
         yield request
 
 
+# Clients using the SDK's default HTTP client, which a forked child re-creates
+_default_http_clients: weakref.WeakSet[AsyncAgentex] = weakref.WeakSet()
+# HTTP clients inherited from the parent; kept alive so they are never closed
+# in the child, which would shut down connections the parent is still using.
+_inherited_http_clients: list[httpx.AsyncClient] = []
+
+
 def create_async_agentex_client(**kwargs) -> AsyncAgentex:
     client = AsyncAgentex(**kwargs)
     client._client.auth = EnvAuth()
+    if "http_client" not in kwargs:
+        _default_http_clients.add(client)
     return client
+
+
+def _reopen_http_clients() -> None:
+    # After a fork, give every default client its own connection pool instead
+    # of the sockets the parent's pool has open. Clients given an http_client
+    # are left to whoever created it.
+    for client in list(_default_http_clients):
+        _inherited_http_clients.append(client._client)
+        client._client = DefaultAsyncHttpxClient(base_url=client.base_url, timeout=client.timeout, auth=EnvAuth())
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_http_clients)
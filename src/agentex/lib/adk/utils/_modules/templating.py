@@ -3,13 +3,18 @@ from __future__ import annotations
 from typing import Any
 from datetime import timedelta
 
+from jinja2 import TemplateError
 from temporalio.common import RetryPolicy
 
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.temporal import in_temporal_workflow
 from agentex.lib.core.tracing.tracer import AsyncTracer
 from agentex.lib.adk.utils._modules.client import create_async_agentex_client
-from agentex.lib.core.services.adk.utils.templating import TemplatingService
+from agentex.lib.core.services.adk.utils.templating import (
+    TemplatingService,
+    render_jinja_template,
+    is_deterministic_jinja,
+)
 from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
 from agentex.lib.core.temporal.activities.adk.utils.templating_activities import (
     JinjaActivityName,
@@ -56,10 +61,19 @@ class TemplatingModule:
         start_to_close_timeout: timedelta = timedelta(seconds=10),
         heartbeat_timeout: timedelta = timedelta(seconds=10),
         retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        render_in_workflow: bool = False,
     ) -> str:
         """
         Render a Jinja template.
 
+        Inside a Temporal workflow, rendering normally runs as an activity. With
+        ``render_in_workflow=True``, templates whose output depends only on
+        ``variables`` are rendered directly in workflow code instead, saving
+        the activity round trip (no ``render_jinja`` span is recorded for
+        them). Templates using ``datetime``, ``lipsum`` or the ``random``
+        filter, and templates that fail to compile or render, still go
+        through the activity.
+
         Args:
             trace_id (str): Unique identifier for tracing and correlation.
             template (str): The Jinja template string to render.
@@ -68,6 +82,7 @@ class TemplatingModule:
             start_to_close_timeout (timedelta): Maximum time allowed for the operation.
             heartbeat_timeout (timedelta): Maximum time between heartbeats.
             retry_policy (RetryPolicy): Policy for retrying failed operations.
+            render_in_workflow (bool): Render deterministic templates in the workflow without an activity.
 
         Returns:
             str: The rendered template as a string.
@@ -79,6 +94,15 @@ class TemplatingModule:
             variables=variables,
         )
         if in_temporal_workflow():
+            if render_in_workflow:
+                try:
+                    if is_deterministic_jinja(template):
+                        return render_jinja_template(template, variables)
+                except (TemplateError, ValueError):
+                    # An exception escaping workflow code fails the workflow task,
+                    # which Temporal retries forever. Let the activity render it
+                    # instead, so the error surfaces as a regular activity failure.
+                    pass
             return await ActivityHelpers.execute_activity(
                 activity_name=JinjaActivityName.RENDER_JINJA,
                 request=render_jinja_params,
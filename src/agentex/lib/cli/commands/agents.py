@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import builtins
+import tempfile
 from pathlib import Path
 
 import typer
@@ -35,7 +37,7 @@ from agentex.lib.cli.handlers.deploy_handlers import (
     InputDeployOverrides,
     deploy_agent,
 )
-from agentex.lib.cli.handlers.cleanup_handlers import cleanup_agent_workflows
+from agentex.lib.cli.handlers.cleanup_handlers import DEFAULT_CLEANUP_CONCURRENCY, cleanup_agent_workflows
 
 logger = make_logger(__name__)
 console = Console()
@@ -88,6 +90,12 @@ def cleanup_workflows(
     force: bool = typer.Option(
         False, help="Force cleanup using direct Temporal termination (bypasses development check)"
     ),
+    concurrency: int = typer.Option(
+        DEFAULT_CLEANUP_CONCURRENCY, help="Maximum number of tasks to clean up at once"
+    ),
+    batch: bool = typer.Option(
+        False, help="With --force, terminate workflows in Temporal batch operations"
+    ),
 ):
     """
     Clean up all running workflows for an agent.
@@ -99,7 +107,13 @@ def cleanup_workflows(
     try:
         console.print(f"[blue]Cleaning up workflows for agent '{agent_name}'...[/blue]")
 
-        cleanup_agent_workflows(agent_name=agent_name, force=force, development_only=True)
+        cleanup_agent_workflows(
+            agent_name=agent_name,
+            force=force,
+            development_only=True,
+            concurrency=concurrency,
+            batch_terminate=batch,
+        )
 
         console.print(f"[green]✓ Workflow cleanup completed for agent '{agent_name}'[/green]")
 
@@ -215,22 +229,31 @@ def package(
         raise typer.Exit(1)
 
     try:
-        # Prepare the build context (tag defaults from manifest if not provided)
-        build_context = prepare_cloud_build_context(
-            manifest_path=str(manifest_path),
-            tag=tag,
-            build_args=build_arg,
-        )
+        # Stream the archive to a temporary file in the working directory; it is
+        # renamed once the resolved agent name and tag are known.
+        fd, partial_name = tempfile.mkstemp(dir=Path.cwd(), prefix=".agentex-package-", suffix=".partial")
+        os.close(fd)
+        partial_path = Path(partial_name)
+        try:
+            # Prepare the build context (tag defaults from manifest if not provided)
+            build_context = prepare_cloud_build_context(
+                manifest_path=str(manifest_path),
+                tag=tag,
+                build_args=build_arg,
+                output_path=partial_path,
+            )
 
-        # Determine output filename using the resolved tag
-        if output:
-            output_filename = output
-        else:
-            output_filename = f"{build_context.agent_name}-{build_context.tag}.tar.gz"
+            # Determine output filename using the resolved tag
+            if output:
+                output_filename = output
+            else:
+                output_filename = f"{build_context.agent_name}-{build_context.tag}.tar.gz"
 
-        # Save tarball to current working directory
-        output_path = Path.cwd() / output_filename
-        output_path.write_bytes(build_context.archive_bytes)
+            # Save tarball to current working directory
+            output_path = Path.cwd() / output_filename
+            os.replace(partial_path, output_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
 
         typer.echo(f"\nTarball saved to: {output_path}")
         typer.echo(f"Size: {build_context.build_context_size_kb:.1f} KB")
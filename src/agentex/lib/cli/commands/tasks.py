@@ -6,7 +6,7 @@ from rich.console import Console
 
 from agentex import Agentex
 from agentex.lib.utils.logging import make_logger
-from agentex.lib.cli.handlers.cleanup_handlers import cleanup_agent_workflows
+from agentex.lib.cli.handlers.cleanup_handlers import DEFAULT_CLEANUP_CONCURRENCY, cleanup_agent_workflows
 
 logger = make_logger(__name__)
 console = Console()
@@ -99,6 +99,12 @@ def cleanup(
     force: bool = typer.Option(
         False, help="Force cleanup using direct Temporal termination (bypasses development check)"
     ),
+    concurrency: int = typer.Option(
+        DEFAULT_CLEANUP_CONCURRENCY, help="Maximum number of tasks to clean up at once"
+    ),
+    batch: bool = typer.Option(
+        False, help="With --force, terminate workflows in Temporal batch operations"
+    ),
 ):
     """
     Clean up all running tasks/workflows for an agent.
@@ -109,7 +115,13 @@ def cleanup(
     try:
         console.print(f"[blue]Starting cleanup for agent '{agent_name}'...[/blue]")
 
-        cleanup_agent_workflows(agent_name=agent_name, force=force, development_only=True)
+        cleanup_agent_workflows(
+            agent_name=agent_name,
+            force=force,
+            development_only=True,
+            concurrency=concurrency,
+            batch_terminate=batch,
+        )
 
         console.print(f"[green]✓ Cleanup completed for agent '{agent_name}'[/green]")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from typing import NamedTuple
 from pathlib import Path
 
@@ -28,6 +29,8 @@ class CloudBuildContext(NamedTuple):
     tag: str
     image_name: str
     build_context_size_kb: float
+    # Set when the archive was streamed to disk; archive_bytes is then empty.
+    archive_path: Path | None = None
 
 
 def build_agent(
@@ -199,6 +202,7 @@ def prepare_cloud_build_context(
     manifest_path: str,
     tag: str | None = None,
     build_args: list[str] | None = None,
+    output_path: Path | None = None,
 ) -> CloudBuildContext:
     """Prepare the build context for cloud-based container builds.
 
@@ -210,9 +214,11 @@ def prepare_cloud_build_context(
         manifest_path: Path to the agent manifest file
         tag: Image tag override (if None, reads from manifest's deployment.image.tag)
         build_args: List of build arguments in KEY=VALUE format
+        output_path: If given, stream the archive to this file instead of
+            holding it in memory
 
     Returns:
-        CloudBuildContext containing the archive bytes, dockerfile path, and metadata
+        CloudBuildContext containing the archive bytes (or path), dockerfile path, and metadata
     """
     agent_manifest = load_agent_manifest(file_path=manifest_path)
     build_context_root = (Path(manifest_path).parent / agent_manifest.build.context.root).resolve()
@@ -269,9 +275,16 @@ def prepare_cloud_build_context(
     with build_context_manager(agent_manifest, build_context_root) as build_context:
         # Compress the prepared context using the static zipped method
         with BuildContextManager.zipped(root_path=build_context.path) as archive_buffer:
-            archive_bytes = archive_buffer.read()
+            if output_path is None:
+                archive_bytes = archive_buffer.read()
+                archive_size = len(archive_bytes)
+            else:
+                with open(output_path, "wb") as output_file:
+                    shutil.copyfileobj(archive_buffer, output_file)
+                archive_bytes = b""
+                archive_size = output_path.stat().st_size
 
-        build_context_size_kb = len(archive_bytes) / 1024
+        build_context_size_kb = archive_size / 1024
         logger.info(f"Build context size: {build_context_size_kb:.1f} KB")
 
         return CloudBuildContext(
@@ -281,4 +294,5 @@ def prepare_cloud_build_context(
             tag=tag,
             image_name=image_name,
             build_context_size_kb=build_context_size_kb,
+            archive_path=output_path,
         )
@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 import os
+import uuid
 import asyncio
+from typing import Any, Callable, Awaitable, Coroutine
+from dataclasses import field, dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
+from rich.progress import Progress
 
-from agentex import Agentex
+from agentex import Agentex, AsyncAgentex
 from agentex.lib.utils.logging import make_logger
 
 # Import Temporal client for direct workflow termination
@@ -15,157 +22,397 @@ except ImportError:
 logger = make_logger(__name__)
 console = Console()
 
+DEFAULT_CLEANUP_CONCURRENCY = 16
+_DEFAULT_TEMPORAL_ADDRESS = "localhost:7233"
+# Workflow ids per batch-operation visibility query; keeps the query well
+# under the server's length limit.
+_BATCH_TERMINATE_MAX_IDS = 500
+_BATCH_POLL_INTERVAL_S = 1.0
+_MAX_REPORTED_FAILURES = 10
+_TERMINATE_REASON = "agentex cleanup"
+
+
+@dataclass
+class CleanupReport:
+    """Outcome of a bulk cleanup: how many tasks were attempted and which failed."""
+
+    total: int = 0
+    succeeded: int = 0
+    # task id -> error message
+    failures: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BatchTerminationResult:
+    """Final counts of a Temporal batch termination job."""
+
+    job_id: str
+    total: int
+    completed: int
+    failed: int
+
 
 def should_cleanup_on_restart() -> bool:
     """
     Check if cleanup should be performed on restart.
-    
+
     Returns True if:
     - ENVIRONMENT=development, OR
     - AUTO_CLEANUP_ON_RESTART=true
     """
     env = os.getenv("ENVIRONMENT", "").lower()
     auto_cleanup = os.getenv("AUTO_CLEANUP_ON_RESTART", "true").lower()
-    
+
     return env == "development" or auto_cleanup == "true"
 
 
 def cleanup_agent_workflows(
     agent_name: str,
     force: bool = False,
-    development_only: bool = True
-) -> None:
+    development_only: bool = True,
+    *,
+    concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+    batch_terminate: bool = False,
+    temporal_address: str | None = None,
+) -> CleanupReport | None:
     """
     Clean up all running workflows for an agent during development.
-    
+
     This cancels (graceful) all running tasks for the specified agent.
     When force=True, directly terminates workflows via Temporal client.
-    
+    Tasks are cleaned up concurrently; see :func:`cleanup_agent_workflows_async`.
+
     Args:
         agent_name: Name of the agent to cleanup workflows for
         force: If True, directly terminate workflows via Temporal client
         development_only: Only perform cleanup in development environment
+        concurrency: Maximum number of tasks cleaned up at once
+        batch_terminate: With force, terminate all workflows in Temporal batch
+            operations instead of one terminate call per workflow
+        temporal_address: Temporal server address (default: TEMPORAL_ADDRESS
+            env var, else localhost:7233)
+
+    Returns:
+        A CleanupReport, or None if cleanup was skipped
     """
-    
+
     # Safety check - only run in development mode by default
     if development_only and not force and not should_cleanup_on_restart():
         logger.warning("Cleanup skipped - not in development mode. Use --force to override.")
-        return
-    
+        return None
+
     method = "terminate (direct)" if force else "cancel (via agent)"
     console.print(f"[blue]Cleaning up workflows for agent '{agent_name}' using {method}...[/blue]")
-    
+
     try:
-        client = Agentex()
-        
-        # Get all running tasks
-        if agent_name:
-            all_tasks = client.tasks.list(agent_name=agent_name)
-        else:
-            all_tasks = client.tasks.list()
-        running_tasks = [task for task in all_tasks if hasattr(task, 'status') and task.status == "RUNNING"]
-        
-        if not running_tasks:
-            console.print("[yellow]No running tasks found[/yellow]")
-            return
-        
-        console.print(f"[blue]Cleaning up {len(running_tasks)} running task(s) for agent '{agent_name}'...[/blue]")
-        
-        successful_cleanups = 0
-        total_tasks = len(running_tasks)
-        
-        for task in running_tasks:
-            task_cleanup_success = False
-            
-            if force:
-                # Force mode: Do both graceful RPC cancellation AND direct Temporal termination
-                rpc_success = False
-                temporal_success = False
-                
-                try:
-                    # First: Graceful cancellation via agent RPC (handles database/agent cleanup)
-                    cleanup_single_task(client, agent_name, task.id)
-                    logger.debug(f"Completed RPC cancellation for task {task.id}")
-                    rpc_success = True
-                except Exception as e:
-                    logger.warning(f"RPC cancellation failed for task {task.id}: {e}")
-                
-                try:
-                    # Second: Direct Temporal termination (ensures workflow is forcefully stopped)
-                    asyncio.run(cleanup_single_task_direct(task.id))
-                    logger.debug(f"Completed Temporal termination for task {task.id}")
-                    temporal_success = True
-                except Exception as e:
-                    logger.warning(f"Temporal termination failed for task {task.id}: {e}")
-                
-                # Count as success if either operation succeeded
-                task_cleanup_success = rpc_success or temporal_success
-                
-            else:
-                # Normal mode: Only graceful cancellation via agent RPC
-                try:
-                    cleanup_single_task(client, agent_name, task.id)
-                    task_cleanup_success = True
-                except Exception as e:
-                    logger.error(f"Failed to cleanup task {task.id}: {e}")
-                    task_cleanup_success = False
-            
-            if task_cleanup_success:
-                successful_cleanups += 1
-                logger.debug(f"Successfully cleaned up task {task.id}")
-            else:
-                logger.error(f"Failed to cleanup task {task.id}")
-                # Don't increment successful_cleanups for actual failures
-        
-        if successful_cleanups == total_tasks:
-            console.print(f"[green]✓ Successfully cleaned up all {successful_cleanups} task(s) for agent '{agent_name}'[/green]")
-        elif successful_cleanups > 0:
-            console.print(f"[yellow]⚠ Successfully cleaned up {successful_cleanups}/{total_tasks} task(s) for agent '{agent_name}'[/yellow]")
-        else:
-            console.print(f"[red]✗ Failed to cleanup any tasks for agent '{agent_name}'[/red]")
-        
+        return _run_sync(
+            lambda: cleanup_agent_workflows_async(
+                agent_name,
+                force=force,
+                concurrency=concurrency,
+                batch_terminate=batch_terminate,
+                temporal_address=temporal_address,
+            )
+        )
     except Exception as e:
         console.print(f"[red]Agent workflow cleanup failed: {str(e)}[/red]")
         logger.exception("Agent workflow cleanup failed")
         raise
 
 
-async def cleanup_single_task_direct(task_id: str) -> None:
+async def cleanup_agent_workflows_async(
+    agent_name: str,
+    *,
+    force: bool = False,
+    concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+    batch_terminate: bool = False,
+    temporal_address: str | None = None,
+    agentex_client: AsyncAgentex | None = None,
+    temporal_client: Any = None,
+) -> CleanupReport:
+    """
+    Cancel (and with force, terminate) every running task of an agent.
+
+    Up to ``concurrency`` tasks are processed at once over one Agentex client
+    and one Temporal client, and progress is shown as a progress bar. A task
+    counts as cleaned up if its RPC cancellation or its Temporal termination
+    succeeded. Failures are collected in the returned report rather than
+    raised.
+    """
+    client = agentex_client or AsyncAgentex()
+
+    # Get all running tasks, across every page, before cancelling any of them
+    if agent_name:
+        all_tasks = client.tasks.list_auto_paging(agent_name=agent_name, status="RUNNING")
+    else:
+        all_tasks = client.tasks.list_auto_paging(status="RUNNING")
+    running_task_ids = [task.id async for task in all_tasks if getattr(task, "status", None) == "RUNNING"]
+
+    report = CleanupReport(total=len(running_task_ids))
+    if not running_task_ids:
+        console.print("[yellow]No running tasks found[/yellow]")
+        return report
+
+    console.print(f"[blue]Cleaning up {report.total} running task(s) for agent '{agent_name}'...[/blue]")
+
+    if force and temporal_client is None:
+        try:
+            temporal_client = await connect_temporal_client(temporal_address)
+        except Exception as e:
+            logger.warning(f"Could not connect to Temporal, falling back to RPC cancellation only: {e}")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def for_each_task(
+        description: str, task_ids: list[str], cleanup: Callable[[str], Awaitable[str | None]]
+    ) -> dict[str, str]:
+        """Run ``cleanup`` over ``task_ids`` concurrently; returns task id -> error message."""
+        errors: dict[str, str] = {}
+        with Progress(console=console, transient=True) as progress:
+            progress_task = progress.add_task(description, total=len(task_ids))
+
+            async def cleanup_one(task_id: str) -> None:
+                async with semaphore:
+                    error = await cleanup(task_id)
+                if error is not None:
+                    errors[task_id] = error
+                progress.advance(progress_task)
+
+            await asyncio.gather(*(cleanup_one(task_id) for task_id in task_ids))
+        return errors
+
+    if force and batch_terminate and temporal_client is not None:
+        # Cancel through the agent first, as the per-task path does, so its
+        # cancel handling and database cleanup run before anything is terminated.
+        cancel_errors = await for_each_task(
+            "Cancelling tasks", running_task_ids, lambda task_id: _cancel_task(client, agent_name, task_id)
+        )
+        for task_id, error in cancel_errors.items():
+            logger.warning(f"RPC cancellation failed for task {task_id}: {error}")
+        # The batch query only matches workflows still running after their cancellation.
+        terminated = await _batch_terminate_task_workflows(temporal_client, running_task_ids)
+        remaining = [task_id for task_id in running_task_ids if task_id not in terminated]
+        terminate_errors = await for_each_task(
+            "Terminating tasks", remaining, lambda task_id: _terminate_task(temporal_client, task_id)
+        )
+        for task_id in running_task_ids:
+            error = _force_cleanup_error(cancel_errors.get(task_id), terminate_errors.get(task_id))
+            if error is not None:
+                report.failures[task_id] = error
+    else:
+        report.failures = await for_each_task(
+            "Cleaning up tasks",
+            running_task_ids,
+            lambda task_id: _cleanup_task(client, agent_name, task_id, force=force, temporal_client=temporal_client),
+        )
+    report.succeeded = report.total - len(report.failures)
+    for task_id, error in report.failures.items():
+        logger.error(f"Failed to cleanup task {task_id}: {error}")
+
+    if report.succeeded == report.total:
+        console.print(f"[green]✓ Successfully cleaned up all {report.succeeded} task(s) for agent '{agent_name}'[/green]")
+    elif report.succeeded > 0:
+        console.print(f"[yellow]⚠ Successfully cleaned up {report.succeeded}/{report.total} task(s) for agent '{agent_name}'[/yellow]")
+    else:
+        console.print(f"[red]✗ Failed to cleanup any tasks for agent '{agent_name}'[/red]")
+    for task_id, error in list(report.failures.items())[:_MAX_REPORTED_FAILURES]:
+        console.print(f"[red]  {task_id}: {error}[/red]")
+    if len(report.failures) > _MAX_REPORTED_FAILURES:
+        console.print(f"[red]  ... and {len(report.failures) - _MAX_REPORTED_FAILURES} more[/red]")
+
+    return report
+
+
+async def _cleanup_task(
+    client: AsyncAgentex,
+    agent_name: str,
+    task_id: str,
+    *,
+    force: bool,
+    temporal_client: Any,
+) -> str | None:
+    """Clean up one task; returns None on success, else the error message."""
+    # Graceful cancellation via agent RPC (handles database/agent cleanup)
+    cancel_error = await _cancel_task(client, agent_name, task_id)
+    if not force:
+        return cancel_error
+    if cancel_error is not None:
+        logger.warning(f"RPC cancellation failed for task {task_id}: {cancel_error}")
+
+    # Force mode: direct Temporal termination ensures the workflow is stopped
+    if temporal_client is None:
+        terminate_error: str | None = "no Temporal client"
+    else:
+        terminate_error = await _terminate_task(temporal_client, task_id)
+    return _force_cleanup_error(cancel_error, terminate_error)
+
+
+async def _cancel_task(client: AsyncAgentex, agent_name: str, task_id: str) -> str | None:
+    """Cancel one task through the agent; returns None on success, else the error message."""
+    try:
+        await cleanup_single_task_async(client, agent_name, task_id)
+    except Exception as e:
+        return str(e)
+    logger.debug(f"Completed RPC cancellation for task {task_id}")
+    return None
+
+
+async def _terminate_task(temporal_client: Any, task_id: str) -> str | None:
+    """Terminate one task's workflow; returns None on success, else the error message."""
+    try:
+        await cleanup_single_task_direct(task_id, temporal_client=temporal_client)
+    except Exception as e:
+        logger.warning(f"Temporal termination failed for task {task_id}: {e}")
+        return str(e)
+    logger.debug(f"Completed Temporal termination for task {task_id}")
+    return None
+
+
+def _force_cleanup_error(cancel_error: str | None, terminate_error: str | None) -> str | None:
+    """A forced cleanup succeeds if either the cancellation or the termination did."""
+    if cancel_error is None or terminate_error is None:
+        return None
+    return f"cancel: {cancel_error}; terminate: {terminate_error}"
+
+
+async def connect_temporal_client(temporal_address: str | None = None) -> Any:
+    """Connect the Temporal client shared by a cleanup run."""
+    if TemporalClient is None:
+        raise ImportError("temporalio package not available for direct workflow termination")
+    address = temporal_address or os.getenv("TEMPORAL_ADDRESS") or _DEFAULT_TEMPORAL_ADDRESS
+    return await TemporalClient.connect(address)  # type: ignore
+
+
+async def cleanup_single_task_direct(task_id: str, temporal_client: Any = None) -> None:
     """
     Directly terminate a workflow using Temporal client.
-    
+
     Args:
         task_id: ID of the task (used as workflow_id)
+        temporal_client: Connected client to reuse; a new connection to
+            localhost:7233 is made if omitted
     """
-    if TemporalClient is None:
-        raise ImportError("temporalio package not available for direct workflow termination")
-    
     try:
-        # Connect to Temporal server (assumes default localhost:7233)
-        client = await TemporalClient.connect("localhost:7233")  # type: ignore
-        
+        client = temporal_client or await connect_temporal_client(_DEFAULT_TEMPORAL_ADDRESS)
+
         # Get workflow handle and terminate
         handle = client.get_workflow_handle(workflow_id=task_id)  # type: ignore
-        await handle.terminate()  # type: ignore
-        
+        await handle.terminate(reason=_TERMINATE_REASON)  # type: ignore
+
         logger.debug(f"Successfully terminated workflow {task_id} via Temporal client")
-        
+
     except Exception as e:
         # Check if the workflow was already completed - this is actually a success case
         if "workflow execution already completed" in str(e).lower():
             logger.debug(f"Workflow {task_id} was already completed - no termination needed")
             return  # Don't raise an exception for this case
-        
+
         logger.error(f"Failed to terminate workflow {task_id} via Temporal client: {e}")
         raise
 
 
+async def terminate_workflows_by_query(
+    temporal_client: Any,
+    query: str,
+    *,
+    reason: str = _TERMINATE_REASON,
+    poll_interval: float = _BATCH_POLL_INTERVAL_S,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> BatchTerminationResult:
+    """
+    Terminate every workflow matching a visibility query in one Temporal batch operation.
+
+    Starts the batch job and polls it until it finishes, calling
+    ``on_progress(completed, total)`` after each poll.
+
+    Args:
+        temporal_client: Connected Temporal client
+        query: Visibility query, e.g. ``TaskQueue = 'my-agent' AND ExecutionStatus = 'Running'``
+        reason: Termination reason recorded on each workflow
+        poll_interval: Seconds between batch job status checks
+        on_progress: Optional progress callback
+
+    Raises:
+        RuntimeError: If the batch job fails
+    """
+    from temporalio.api.batch.v1 import BatchOperationTermination
+    from temporalio.api.enums.v1 import BatchOperationState
+    from temporalio.api.workflowservice.v1 import (
+        StartBatchOperationRequest,
+        DescribeBatchOperationRequest,
+    )
+
+    job_id = f"agentex-cleanup-{uuid.uuid4()}"
+    await temporal_client.workflow_service.start_batch_operation(
+        StartBatchOperationRequest(
+            namespace=temporal_client.namespace,
+            job_id=job_id,
+            visibility_query=query,
+            reason=reason,
+            termination_operation=BatchOperationTermination(identity=temporal_client.identity),
+        )
+    )
+    logger.debug(f"Started batch termination {job_id} for query: {query}")
+
+    while True:
+        status = await temporal_client.workflow_service.describe_batch_operation(
+            DescribeBatchOperationRequest(namespace=temporal_client.namespace, job_id=job_id)
+        )
+        if on_progress is not None:
+            on_progress(status.complete_operation_count, status.total_operation_count)
+        if status.state == BatchOperationState.BATCH_OPERATION_STATE_FAILED:
+            raise RuntimeError(f"Batch termination {job_id} failed")
+        if status.state == BatchOperationState.BATCH_OPERATION_STATE_COMPLETED:
+            return BatchTerminationResult(
+                job_id=job_id,
+                total=status.total_operation_count,
+                completed=status.complete_operation_count,
+                failed=status.failure_operation_count,
+            )
+        await asyncio.sleep(poll_interval)
+
+
+async def _batch_terminate_task_workflows(temporal_client: Any, task_ids: list[str]) -> set[str]:
+    """Terminate the workflows of ``task_ids`` with batch operations.
+
+    Returns the ids covered by batch jobs that finished without failures; the
+    rest are left to per-workflow termination.
+    """
+    terminated: set[str] = set()
+    with Progress(console=console, transient=True) as progress:
+        progress_task = progress.add_task("Terminating workflows", total=len(task_ids))
+        for start in range(0, len(task_ids), _BATCH_TERMINATE_MAX_IDS):
+            chunk = task_ids[start : start + _BATCH_TERMINATE_MAX_IDS]
+            quoted_ids = ", ".join("'" + task_id.replace("'", "\\'") + "'" for task_id in chunk)
+            query = f"WorkflowId IN ({quoted_ids}) AND ExecutionStatus = 'Running'"
+            try:
+                result = await terminate_workflows_by_query(
+                    temporal_client,
+                    query,
+                    on_progress=lambda completed, _total, start=start: progress.update(
+                        progress_task, completed=start + completed
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"Batch termination failed, terminating workflows one by one: {e}")
+                continue
+            if result.failed:
+                logger.warning(
+                    f"Batch termination {result.job_id} failed for {result.failed} workflow(s), "
+                    f"terminating them one by one"
+                )
+                continue
+            terminated.update(chunk)
+            progress.update(progress_task, completed=start + len(chunk))
+    return terminated
+
+
 def cleanup_single_task(client: Agentex, agent_name: str, task_id: str) -> None:
     """
     Clean up a single task/workflow using agent RPC cancel method.
-    
+
     Args:
-        client: Agentex client instance  
+        client: Agentex client instance
         agent_name: Name of the agent that owns the task
         task_id: ID of the task to cleanup
     """
@@ -177,7 +424,37 @@ def cleanup_single_task(client: Agentex, agent_name: str, task_id: str) -> None:
             params={"task_id": task_id}
         )
         logger.debug(f"Successfully cancelled task {task_id} via agent '{agent_name}'")
-    
+
+    except Exception as e:
+        logger.warning(f"RPC task/cancel failed for task {task_id}: {e}")
+        raise
+
+
+async def cleanup_single_task_async(client: AsyncAgentex, agent_name: str, task_id: str) -> None:
+    """Async counterpart of :func:`cleanup_single_task`."""
+    try:
+        await client.agents.rpc_by_name(
+            agent_name=agent_name,
+            method="task/cancel",
+            params={"task_id": task_id}
+        )
+        logger.debug(f"Successfully cancelled task {task_id} via agent '{agent_name}'")
+
     except Exception as e:
         logger.warning(f"RPC task/cancel failed for task {task_id}: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+def _run_sync(make_coro: Callable[[], Coroutine[Any, Any, CleanupReport]]) -> CleanupReport:
+    """Run a coroutine to completion from sync code.
+
+    ``agentex agents run`` calls cleanup from inside its event loop on worker
+    restarts, so in that case the coroutine runs on a fresh loop in a worker
+    thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(make_coro())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(make_coro())).result()
@@ -240,7 +240,8 @@ def add_acp_command_to_helm_values(helm_values: dict[str, Any], manifest: AgentM
     """Add dynamic ACP command to helm values based on manifest configuration"""
     try:
         docker_acp_module = calculate_docker_acp_module(manifest, manifest_path)
-        # Create the uvicorn command with the correct module path
+        # Create the uvicorn command with the correct module path. The worker count is
+        # not fixed here: uvicorn reads WEB_CONCURRENCY from the deployment's env vars.
         helm_values["command"] = ["uvicorn", f"{docker_acp_module}:acp", "--host", "0.0.0.0", "--port", "8000"]
         logger.info(f"Using dynamic ACP command: uvicorn {docker_acp_module}:acp")
     except (PathResolutionError, Exception) as e:
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import os
-import json
 import asyncio
 from typing import Any, Annotated, override
 from collections.abc import AsyncIterator
 
 import redis.asyncio as redis
 from fastapi import Depends
+from pydantic import BaseModel
 
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.core.adapters.streams.port import StreamRepository
 
@@ -51,7 +52,7 @@ class RedisStreamRepository(StreamRepository):
         )
 
     @override
-    async def send_event(self, topic: str, event: dict[str, Any]) -> str:
+    async def send_event(self, topic: str, event: dict[str, Any] | BaseModel) -> str:
         """
         Send an event to a Redis stream.
 
@@ -63,8 +64,7 @@ class RedisStreamRepository(StreamRepository):
             The message ID from Redis
         """
         try:
-            # Simple JSON serialization
-            event_json = json.dumps(event)
+            event_json = json_codec.dumps(event)
 
             # # Uncomment to debug
             # logger.info(f"Sending event to Redis stream {topic}: {event_json}")
@@ -148,8 +148,7 @@ class RedisStreamRepository(StreamRepository):
                             # Extract and parse the JSON data
                             if b"data" in fields:
                                 try:
-                                    data_str = fields[b"data"].decode("utf-8")
-                                    event = json.loads(data_str)
+                                    event = json_codec.loads(fields[b"data"])
                                     yield event
                                 except Exception as e:
                                     logger.warning(
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import Any
 from collections.abc import AsyncIterator
 
+from pydantic import BaseModel
+
 
 class StreamRepository(ABC):
     """
@@ -12,13 +14,14 @@ class StreamRepository(ABC):
     """
 
     @abstractmethod
-    async def send_event(self, topic: str, event: dict[str, Any]) -> str:
+    async def send_event(self, topic: str, event: dict[str, Any] | BaseModel) -> str:
         """
         Send an event to a stream.
 
         Args:
             topic: The stream topic/name
-            event: The event data
+            event: The event data, as a JSON-compatible dict or a pydantic
+                model (serialized directly, without an intermediate dict)
 
         Returns:
             The message ID or other identifier
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import time
+import base64
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, override
+from datetime import timedelta
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from temporalio.converter import PayloadCodec
+from temporalio.api.common.v1 import Payload
+
+from agentex.lib.utils.logging import make_logger
+
+if TYPE_CHECKING:
+    from agentex import AsyncAgentex
+
+logger = make_logger(__name__)
+
+CLAIM_CHECK_ENCODING = b"agentex/claim-check"
+DEFAULT_CLAIM_CHECK_THRESHOLD = 32 * 1024
+_EXPIRED_WINDOWS_SWEPT = 3
+
+
+class ClaimCheckBlobNotFoundError(LookupError):
+    """Raised when a claim-check reference points at a blob the store no longer has."""
+
+    def __init__(self, key: str):
+        super().__init__(f"Claim-check blob {key!r} not found")
+        self.key = key
+
+
+class BlobStore(ABC):
+    """Storage backend for payloads offloaded by :class:`ClaimCheckPayloadCodec`.
+
+    Keys are content hashes, so ``put`` may be called repeatedly with the same
+    key and data and must be idempotent. The codec calls ``put`` for every
+    payload it offloads; stores for which a write is expensive should skip
+    keys they know they already hold.
+    """
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None: ...
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        """Return the blob stored under ``key``.
+
+        Raises:
+            ClaimCheckBlobNotFoundError: If no blob exists for ``key``.
+        """
+        ...
+
+
+class InMemoryBlobStore(BlobStore):
+    """Process-local blob store. Only suitable for tests and single-process setups."""
+
+    def __init__(self) -> None:
+        self.blobs: dict[str, bytes] = {}
+
+    @override
+    async def put(self, key: str, data: bytes) -> None:
+        self.blobs[key] = data
+
+    @override
+    async def get(self, key: str) -> bytes:
+        try:
+            return self.blobs[key]
+        except KeyError:
+            raise ClaimCheckBlobNotFoundError(key) from None
+
+
+class AgentexBlobStore(BlobStore):
+    """Stores blobs in the Agentex backend through the ``/checkpoints`` API.
+
+    This repurposes the LangGraph checkpoint storage: each blob is written as a
+    single-channel checkpoint (``checkpoint_id`` is the blob key, the data is
+    the ``payload`` channel blob), so no extra infrastructure is needed beyond
+    the Agentex server the agent already talks to.
+
+    Blobs expire. They are grouped into one checkpoint thread per
+    ``retention`` window (``{thread_id}-{window}``) and ``get`` looks in the
+    current and the previous window, so a blob stays readable for at least
+    ``retention`` after its last ``put``. The first ``put`` in a new window
+    deletes the threads of windows that have fallen out of reach, which keeps
+    storage bounded to roughly two windows of traffic. ``retention`` must be
+    longer than any workflow that may replay a payload (including the
+    workflow's history retention if old runs are replayed or inspected);
+    decoding a payload whose blob has expired raises
+    :class:`ClaimCheckBlobNotFoundError`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncAgentex | None = None,
+        *,
+        thread_id: str = "agentex-claim-check",
+        namespace: str = "",
+        retention: timedelta = timedelta(days=30),
+    ):
+        if retention.total_seconds() <= 0:
+            raise ValueError("retention must be positive")
+        self._client = client
+        self.thread_id = thread_id
+        self.namespace = namespace
+        self.retention = retention
+        self._window: int | None = None
+        self._written: set[str] = set()
+
+    @property
+    def client(self) -> AsyncAgentex:
+        if self._client is None:
+            from agentex.lib.adk.utils._modules.client import create_async_agentex_client
+
+            self._client = create_async_agentex_client()
+        return self._client
+
+    def _current_window(self) -> int:
+        return int(time.time() // self.retention.total_seconds())
+
+    def _thread(self, window: int) -> str:
+        return f"{self.thread_id}-{window}"
+
+    async def _delete_expired(self, window: int) -> None:
+        # Windows older than the previous one are unreachable; also sweep a few
+        # more in case no blob was written for a while.
+        for expired in range(window - 2, window - 2 - _EXPIRED_WINDOWS_SWEPT, -1):
+            try:
+                await self.client.checkpoints.delete_thread(thread_id=self._thread(expired))
+            except Exception as e:
+                logger.warning(f"Failed to delete expired claim-check thread {self._thread(expired)!r}: {e}")
+
+    @override
+    async def put(self, key: str, data: bytes) -> None:
+        window = self._current_window()
+        if window != self._window:
+            self._window = window
+            self._written = set()
+            await self._delete_expired(window)
+        if key in self._written:
+            return
+        await self.client.checkpoints.put(
+            thread_id=self._thread(window),
+            checkpoint_ns=self.namespace,
+            checkpoint_id=key,
+            checkpoint={"id": key, "channel_versions": {"payload": key}},
+            metadata={"source": "claim-check", "size": len(data)},
+            blobs=[
+                {
+                    "channel": "payload",
+                    "version": key,
+                    "type": "bytes",
+                    "blob": base64.b64encode(data).decode("ascii"),
+                }
+            ],
+        )
+        self._written.add(key)
+
+    @override
+    async def get(self, key: str) -> bytes:
+        window = self._current_window()
+        for thread_id in (self._thread(window), self._thread(window - 1)):
+            response = await self.client.checkpoints.get_tuple(
+                thread_id=thread_id, checkpoint_ns=self.namespace, checkpoint_id=key
+            )
+            for blob in (response.blobs or []) if response is not None else []:
+                if blob.channel == "payload" and blob.version == key and blob.blob is not None:
+                    return base64.b64decode(blob.blob)
+        raise ClaimCheckBlobNotFoundError(key)
+
+
+class ClaimCheckPayloadCodec(PayloadCodec):
+    """Keeps large payloads out of Temporal history.
+
+    Payloads bigger than ``threshold`` bytes (for example the full ``state``
+    dict a workflow sends to the state activities, or the ``State`` they
+    return) are written to ``store`` and replaced by a small reference payload
+    holding the blob's SHA-256. Only the reference is recorded in history; the
+    original payload is restored transparently before it reaches workflow or
+    activity code.
+
+    The codec must be configured on every party that reads the payloads: the
+    worker (``AgentexWorker(payload_codec=...)``), the ACP server's Temporal
+    client (``TemporalACPConfig(payload_codec=...)``) and, to see decoded
+    values, the Temporal UI codec server.
+
+    Args:
+        store: Where offloaded payloads are kept.
+        threshold: Serialized payload size above which payloads are offloaded.
+        cache_size: Number of recently stored or fetched blobs kept in memory so
+            workflow replays skip the fetch.
+    """
+
+    def __init__(
+        self,
+        store: BlobStore,
+        *,
+        threshold: int = DEFAULT_CLAIM_CHECK_THRESHOLD,
+        cache_size: int = 128,
+    ):
+        self.store = store
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = data
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _encode_one(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") == CLAIM_CHECK_ENCODING or payload.ByteSize() <= self.threshold:
+            return payload
+        data = payload.SerializeToString()
+        key = hashlib.sha256(data).hexdigest()
+        # Always hand the blob to the store, even when cached here: the store
+        # knows whether its copy is still live (see AgentexBlobStore retention).
+        await self.store.put(key, data)
+        self._remember(key, data)
+        logger.debug(f"Offloaded {len(data)} byte payload to claim-check blob {key}")
+        return Payload(metadata={"encoding": CLAIM_CHECK_ENCODING}, data=key.encode("ascii"))
+
+    async def _decode_one(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != CLAIM_CHECK_ENCODING:
+            return payload
+        key = payload.data.decode("ascii")
+        data = self._cache.get(key)
+        if data is None:
+            data = await self.store.get(key)
+            if hashlib.sha256(data).hexdigest() != key:
+                raise ValueError(f"Claim-check blob {key!r} does not match its content hash")
+            self._remember(key, data)
+        return Payload.FromString(data)
+
+    @override
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return list(await asyncio.gather(*(self._encode_one(p) for p in payloads)))
+
+    @override
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return list(await asyncio.gather(*(self._decode_one(p) for p in payloads)))
@@ -0,0 +1,38 @@
+"""Type-keyed event dispatch for the harness taps.
+
+The taps convert every streamed token, so each one picks the handler for an
+event with a dict lookup on the event's class (or its ``type`` tag) instead of
+walking an ``isinstance`` chain that grows with every event type it supports.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, TypeVar, Optional
+
+from agentex.lib.core.harness.types import StreamTaskMessage
+
+H = TypeVar("H")
+
+NO_EVENTS: tuple[StreamTaskMessage, ...] = ()
+"""Returned by a handler that emits nothing, so no-op events allocate nothing."""
+
+
+class TypeDispatch(Dict[type, Optional[H]]):
+    """Handlers keyed by class, resolved the way ``isinstance`` would be.
+
+    Look handlers up with ``table[obj.__class__]`` (``__class__`` rather than
+    ``type()``: a mock built with ``spec=`` reports its spec class there, just
+    as it does to ``isinstance``). A registered class is a plain dict hit; any
+    other class gets the handler of its nearest registered base, or ``None``
+    when it has none, and the answer is stored so only the first event of that
+    class walks its MRO.
+    """
+
+    def __init__(self, handlers: Mapping[type, H]) -> None:
+        super().__init__(handlers)
+        self._registered = dict(handlers)
+
+    def __missing__(self, cls: type) -> H | None:
+        handler = next((self._registered[base] for base in cls.__mro__ if base in self._registered), None)
+        self[cls] = handler
+        return handler
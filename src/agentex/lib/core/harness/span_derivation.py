@@ -6,9 +6,9 @@ every event and act on the returned signals.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 
+from agentex.lib.utils import json_codec
 from agentex.lib.core.harness.types import OpenSpan, CloseSpan, SpanSignal, StreamTaskMessage
 from agentex.types.tool_request_delta import ToolRequestDelta
 from agentex.types.task_message_update import (
@@ -161,8 +161,8 @@ class SpanDeriver:
             args = meta.arguments
             if meta.args_buf:
                 try:
-                    args = json.loads(meta.args_buf)
-                except json.JSONDecodeError:
+                    args = json_codec.loads(meta.args_buf)
+                except json_codec.JSONDecodeError:
                     args = {"_raw": meta.args_buf}
             self._open_tool_ids[meta.tool_call_id] = None
             return [OpenSpan(key=meta.tool_call_id, kind="tool", name=meta.name, input=args)]
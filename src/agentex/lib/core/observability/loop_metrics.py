@@ -0,0 +1,45 @@
+"""OTel metrics for event-loop responsiveness in ACP servers and workers.
+
+Recorded by ``EventLoopMonitor`` (see
+``agentex.lib.core.observability.loop_monitor``), which ``BaseACPServer`` and
+``AgentexWorker`` start on their loop. The meter is no-op when the
+application has not configured a ``MeterProvider``; set
+``AGENTEX_EVENT_LOOP_METRICS=0`` to skip the lag sampler entirely.
+
+Cardinality is bounded:
+- ``component``: ``acp`` | ``worker``
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from opentelemetry import metrics
+
+
+class LoopMetrics:
+    """Lazily-created OTel instruments for event-loop telemetry."""
+
+    def __init__(self) -> None:
+        meter = metrics.get_meter("agentex.event_loop")
+        self.lag = meter.create_histogram(
+            name="agentex.event_loop.lag",
+            unit="ms",
+            description="How late the event loop ran a timer that was due, sampled periodically",
+        )
+        self.slow_callbacks = meter.create_counter(
+            name="agentex.event_loop.slow_callbacks",
+            unit="1",
+            description="Times the event loop was blocked for longer than the slow-callback threshold",
+        )
+
+
+_loop_metrics: Optional[LoopMetrics] = None
+
+
+def get_loop_metrics() -> LoopMetrics:
+    """Return the event-loop metrics singleton, creating it on first use."""
+    global _loop_metrics
+    if _loop_metrics is None:
+        _loop_metrics = LoopMetrics()
+    return _loop_metrics
@@ -0,0 +1,160 @@
+"""Event-loop lag sampling and blocked-loop detection.
+
+``BaseACPServer`` and ``AgentexWorker`` start an ``EventLoopMonitor`` on their
+loop (see ``EventLoopMonitor.from_env``):
+
+- ``AGENTEX_EVENT_LOOP_METRICS`` — lag metrics, on by default; ``0`` turns
+  them off. ``agentex.event_loop.lag`` is recorded every
+  ``AGENTEX_EVENT_LOOP_LAG_INTERVAL_SECONDS`` (default 0.5) from a
+  ``ResourceSampler``, the worker's resource tuner's own when it has one.
+- ``AGENTEX_SLOW_CALLBACK_SECONDS`` — off by default. When set, a watchdog
+  thread logs the loop thread's stack whenever the loop has been stuck in one
+  callback for longer than this many seconds, and counts it in
+  ``agentex.event_loop.slow_callbacks``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import asyncio
+import threading
+import traceback
+
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.core.observability.loop_metrics import get_loop_metrics
+from agentex.lib.core.observability.resource_sampler import ResourceSampler
+
+logger = make_logger(__name__)
+
+_METRICS_ENV = "AGENTEX_EVENT_LOOP_METRICS"
+_LAG_INTERVAL_ENV = "AGENTEX_EVENT_LOOP_LAG_INTERVAL_SECONDS"
+_SLOW_CALLBACK_ENV = "AGENTEX_SLOW_CALLBACK_SECONDS"
+_DEFAULT_LAG_INTERVAL = 0.5
+
+
+def loop_metrics_enabled() -> bool:
+    return os.environ.get(_METRICS_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _seconds_from_env(name: str) -> float | None:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not a number of seconds", name, raw)
+        return None
+    return value if value > 0 else None
+
+
+class EventLoopMonitor:
+    """Samples event-loop lag and, optionally, catches callbacks that block the loop.
+
+    With ``lag_interval`` set, a :class:`ResourceSampler` on the loop sleeps
+    for that long and each time records how late it woke up into
+    ``agentex.event_loop.lag``, in milliseconds. Pass ``sampler`` to record
+    from a sampler that already runs on the loop (the worker's resource
+    tuner's) instead of starting another one; its interval then applies, and
+    :meth:`stop` leaves it running for its owner. With
+    ``slow_callback_threshold`` set, a watchdog thread pings the loop and,
+    when a ping goes unanswered for that many seconds,
+    logs the loop thread's current stack (the code that is blocking it) and
+    increments ``agentex.event_loop.slow_callbacks``, once per stall.
+
+    ``component`` labels the metrics: ``acp`` or ``worker``.
+    """
+
+    def __init__(
+        self,
+        component: str,
+        *,
+        lag_interval: float | None = _DEFAULT_LAG_INTERVAL,
+        slow_callback_threshold: float | None = None,
+        sampler: ResourceSampler | None = None,
+    ):
+        self.component = component
+        self.lag_interval = lag_interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self._attributes = {"component": component}
+        self._sampler = sampler
+        self._owns_sampler = sampler is None
+        self._recording = False
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @classmethod
+    def from_env(cls, component: str, *, sampler: ResourceSampler | None = None) -> EventLoopMonitor | None:
+        """A monitor configured from the environment, or ``None`` if everything is turned off."""
+        lag_interval = None
+        if loop_metrics_enabled():
+            lag_interval = _seconds_from_env(_LAG_INTERVAL_ENV) or _DEFAULT_LAG_INTERVAL
+        slow_callback_threshold = _seconds_from_env(_SLOW_CALLBACK_ENV)
+        if lag_interval is None and slow_callback_threshold is None:
+            return None
+        return cls(
+            component, lag_interval=lag_interval, slow_callback_threshold=slow_callback_threshold, sampler=sampler
+        )
+
+    def start(self) -> None:
+        """Start monitoring the running event loop; a no-op if already running."""
+        loop = asyncio.get_running_loop()
+        if self.lag_interval is not None and not self._recording:
+            if self._sampler is None:
+                self._sampler = ResourceSampler(self.lag_interval)
+            self._sampler.add_listener(self._record_lag)
+            self._sampler.start()
+            self._recording = True
+        if self.slow_callback_threshold is not None and self._watchdog is None:
+            self._stopped = threading.Event()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident(), self.slow_callback_threshold, self._stopped),
+                name="agentex-event-loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._sampler is not None and self._recording:
+            self._sampler.remove_listener(self._record_lag)
+            if self._owns_sampler:
+                self._sampler.stop()
+            self._recording = False
+        if self._watchdog is not None:
+            self._stopped.set()
+            self._watchdog = None
+
+    def _record_lag(self, sampler: ResourceSampler) -> None:
+        get_loop_metrics().lag.record(sampler.event_loop_lag * 1000, self._attributes)
+
+    def _watch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread_id: int,
+        threshold: float,
+        stopped: threading.Event,
+    ) -> None:
+        pong = threading.Event()
+        while not stopped.wait(threshold / 2):
+            pong.clear()
+            try:
+                loop.call_soon_threadsafe(pong.set)
+            except RuntimeError:
+                return  # the loop was closed
+            if pong.wait(threshold):
+                continue
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+            logger.warning(
+                "Event loop (%s) blocked for more than %.3fs; loop thread stack:\n%s",
+                self.component,
+                threshold,
+                stack.rstrip("\n"),
+            )
+            get_loop_metrics().slow_callbacks.add(1, self._attributes)
+            # Report each stall once: wait for the loop to catch up before pinging again.
+            while not pong.wait(threshold):
+                if stopped.is_set():
+                    return
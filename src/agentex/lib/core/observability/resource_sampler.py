@@ -0,0 +1,99 @@
+"""Periodic sampling of process CPU, memory and event-loop lag.
+
+One :class:`ResourceSampler` per event loop is enough: the worker's
+resource-based slot tuner (``agentex.lib.core.temporal.workers.concurrency``)
+reads its latest values, and ``EventLoopMonitor`` records each sample's lag
+through a listener, so the loop runs a single sampling task for both.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from collections.abc import Callable
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _memory_limit_bytes() -> int | None:
+    """The cgroup memory limit if there is one, else physical memory."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as handle:
+                raw = handle.read().strip()
+        except OSError:
+            continue
+        # "max" (v2) or a page-rounded 2**63 (v1) mean no limit
+        if raw.isdigit() and int(raw) < 1 << 60:
+            return int(raw)
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class ResourceSampler:
+    """Samples this process's CPU and memory usage and its event-loop lag.
+
+    ``cpu`` and ``memory`` are fractions of the CPUs available to the
+    process and of its memory limit. ``event_loop_lag`` is how late, in
+    seconds, the sampler's own ``asyncio.sleep`` woke up. The first sample
+    is taken ``interval`` seconds after :meth:`start`. On platforms without
+    ``/proc`` memory reads as 0. Listeners added with :meth:`add_listener`
+    are called with the sampler after every sample.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.cpu = 0.0
+        self.memory = 0.0
+        self.event_loop_lag = 0.0
+        self._cpus = _available_cpus()
+        self._memory_limit = _memory_limit_bytes()
+        self._listeners: list[Callable[[ResourceSampler], None]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def add_listener(self, listener: Callable[[ResourceSampler], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[ResourceSampler], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start(self) -> None:
+        """Start sampling on the running event loop; a no-op if already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="agentex-resource-sampler")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            await asyncio.sleep(self.interval)
+            elapsed = time.perf_counter() - wall_start
+            self.event_loop_lag = max(0.0, elapsed - self.interval)
+            self.cpu = (time.process_time() - cpu_start) / (elapsed * self._cpus)
+            rss = _rss_bytes()
+            if rss is not None and self._memory_limit:
+                self.memory = rss / self._memory_limit
+            for listener in list(self._listeners):
+                listener(self)
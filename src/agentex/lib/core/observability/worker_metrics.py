@@ -0,0 +1,51 @@
+"""OTel metrics for Temporal activity slots on ``AgentexWorker``.
+
+Recorded by the worker's activity interceptor and the resource-based slot
+tuner (see ``agentex.lib.core.temporal.workers.concurrency``). The meter is
+no-op when the application has not configured a ``MeterProvider``; set
+``AGENTEX_WORKER_METRICS=0`` to skip the interceptor entirely.
+
+Cardinality is bounded:
+- ``group``: concurrency group name, or ``default``
+- ``activity_type``: registered activity names (schedule-to-start only)
+- ``reason``: ``cpu`` | ``memory`` | ``event_loop_lag`` | ``max_slots`` (tuner waits only)
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from opentelemetry import metrics
+
+
+class WorkerMetrics:
+    """Lazily-created OTel instruments for activity slot telemetry."""
+
+    def __init__(self) -> None:
+        meter = metrics.get_meter("agentex.worker")
+        self.activity_slots_used = meter.create_up_down_counter(
+            name="agentex.worker.activity.slots_used",
+            unit="1",
+            description="Activities currently executing, by concurrency group",
+        )
+        self.activity_schedule_to_start = meter.create_histogram(
+            name="agentex.worker.activity.schedule_to_start",
+            unit="ms",
+            description="Time from an activity attempt being scheduled to a worker starting it",
+        )
+        self.activity_slot_waits = meter.create_counter(
+            name="agentex.worker.activity.slot_waits",
+            unit="1",
+            description="Slot reservations the resource-based tuner held back, by limiting resource",
+        )
+
+
+_worker_metrics: Optional[WorkerMetrics] = None
+
+
+def get_worker_metrics() -> WorkerMetrics:
+    """Return the worker metrics singleton, creating it on first use."""
+    global _worker_metrics
+    if _worker_metrics is None:
+        _worker_metrics = WorkerMetrics()
+    return _worker_metrics
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-from typing import Any, List, cast
+from typing import Any, List, Union, cast
+from collections.abc import AsyncGenerator
 
 from agentex import AsyncAgentex
 from agentex.types.task import Task
 from agentex.types.event import Event
 from agentex.lib.utils.logging import make_logger
-from agentex.lib.utils.temporal import heartbeat_if_in_workflow
+from agentex.lib.utils.temporal import heartbeat_if_in_activity, heartbeat_if_in_workflow
 from agentex.types.task_message import TaskMessage
 from agentex.types.agent_rpc_params import (
     ParamsSendEventRequest as RpcParamsSendEventRequest,
     ParamsCancelTaskRequest as RpcParamsCancelTaskRequest,
+    ParamsSendMessageRequest as RpcParamsSendMessageRequest,
 )
 from agentex.lib.core.tracing.tracer import AsyncTracer
+from agentex.types.task_message_update import (
+    TaskMessageUpdate,
+    StreamTaskMessageDone,
+    StreamTaskMessageFull,
+    StreamTaskMessageDelta,
+    StreamTaskMessageStart,
+)
 from agentex.types.task_message_content import TaskMessageContent
+from agentex.lib.core.services.adk.streaming import StreamingService, StreamingTaskMessageContext
 from agentex.types.task_message_content_param import TaskMessageContentParam
 
 logger = make_logger(__name__)
@@ -24,9 +34,11 @@ class ACPService:
         self,
         agentex_client: AsyncAgentex,
         tracer: AsyncTracer,
+        streaming_service: StreamingService | None = None,
     ):
         self._agentex_client = agentex_client
         self._tracer = tracer
+        self._streaming_service = streaming_service
 
     async def task_create(
         self,
@@ -136,7 +148,7 @@ class ACPService:
                 raise ValueError("Either agent_name or agent_id must be provided")
 
             task_messages: List[TaskMessage] = []
-            logger.info("json_rpc_response: %s", json_rpc_response)
+            logger.debug("json_rpc_response: %s", json_rpc_response)
             if isinstance(json_rpc_response.result, list):
                 for message in json_rpc_response.result:
                     task_message = TaskMessage.model_validate(message)
@@ -148,6 +160,178 @@ class ACPService:
                 span.output = [task_message.model_dump() for task_message in task_messages]
             return task_messages
 
+    async def message_send_stream(
+        self,
+        content: TaskMessageContent,
+        agent_id: str | None = None,
+        agent_name: str | None = None,
+        task_id: str | None = None,
+        task_name: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        request: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[TaskMessageUpdate, None]:
+        """
+        Send a message to an agent and yield its updates as they arrive.
+
+        Unlike message_send, this does not wait for the whole reply. The span
+        records how many updates of each type were received rather than the
+        updates themselves.
+
+        Raises:
+            ValueError: If neither agent_name nor agent_id is provided
+            RuntimeError: If the agent reports an error mid-stream
+        """
+        if not agent_name and not agent_id:
+            raise ValueError("Either agent_name or agent_id must be provided")
+
+        trace = self._tracer.trace(trace_id=trace_id)
+        async with trace.span(
+            parent_id=parent_span_id,
+            name="message_send_stream",
+            input={
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+                "task_id": task_id,
+                "task_name": task_name,
+                "message": content,
+            },
+        ) as span:
+            heartbeat_if_in_activity("message send stream")
+
+            # Extract headers from request; pass-through to agent
+            extra_headers = request.get("headers") if request else None
+
+            params: RpcParamsSendMessageRequest = {
+                "task_id": task_id,
+                "content": cast(TaskMessageContentParam, content.model_dump()),
+                "stream": True,
+            }
+            if task_name:
+                params["task_name"] = task_name
+
+            update_counts: dict[str, int] = {}
+            async for response in self._agentex_client.agents.send_message_stream(
+                agent_id=None if agent_name else agent_id,
+                agent_name=agent_name,
+                params=params,
+                extra_headers=extra_headers,
+            ):
+                if response.error is not None:
+                    raise RuntimeError(f"Agent {agent_name or agent_id} failed while streaming: {response.error}")
+                if response.result is None:
+                    continue
+                update_counts[response.result.type] = update_counts.get(response.result.type, 0) + 1
+                heartbeat_if_in_activity("message send stream update")
+                yield response.result
+
+            if span:
+                span.output = {"updates": update_counts}
+
+    async def message_send_stream_auto_send(
+        self,
+        parent_task_id: str,
+        content: TaskMessageContent,
+        agent_id: str | None = None,
+        agent_name: str | None = None,
+        task_id: str | None = None,
+        task_name: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        request: dict[str, Any] | None = None,
+    ) -> List[TaskMessage]:
+        """
+        Send a message to an agent and forward its reply to another task's stream.
+
+        Each message the agent streams back is re-created on ``parent_task_id``
+        and its deltas are streamed there as they arrive, so the parent task's
+        clients see the reply without waiting for the agent to finish.
+
+        Returns:
+            The messages created on the parent task, in the order they completed.
+        """
+        if self._streaming_service is None:
+            raise ValueError("Streaming service is not set")
+        streaming_service = self._streaming_service
+
+        contexts: dict[Union[int, str, None], StreamingTaskMessageContext] = {}
+        forwarded: List[TaskMessage] = []
+
+        async def open_context(key: Union[int, str, None], initial_content: TaskMessageContent) -> StreamingTaskMessageContext:
+            context = streaming_service.streaming_task_message_context(
+                task_id=parent_task_id,
+                initial_content=initial_content,
+            )
+            contexts[key] = await context.open()
+            return context
+
+        async def close_context(key: Union[int, str, None]) -> None:
+            context = contexts.pop(key)
+            forwarded.append(await context.close())
+
+        trace = self._tracer.trace(trace_id=trace_id)
+        async with trace.span(
+            parent_id=parent_span_id,
+            name="message_send_stream_auto_send",
+            input={
+                "parent_task_id": parent_task_id,
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+                "task_id": task_id,
+                "task_name": task_name,
+                "message": content,
+            },
+        ) as span:
+            try:
+                async for update in self.message_send_stream(
+                    content=content,
+                    agent_id=agent_id,
+                    agent_name=agent_name,
+                    task_id=task_id,
+                    task_name=task_name,
+                    trace_id=trace_id,
+                    parent_span_id=span.id if span else parent_span_id,
+                    request=request,
+                ):
+                    key = _update_key(update)
+                    if isinstance(update, StreamTaskMessageStart):
+                        if key in contexts:
+                            await close_context(key)
+                        await open_context(key, update.content)
+                    elif isinstance(update, StreamTaskMessageDelta):
+                        context = contexts.get(key)
+                        if context is None:
+                            logger.warning("Dropping delta for message %s of %s: no start update", key, agent_name or agent_id)
+                            continue
+                        await context.stream_update(
+                            StreamTaskMessageDelta(
+                                parent_task_message=context.task_message,
+                                delta=update.delta,
+                                type="delta",
+                            )
+                        )
+                    elif isinstance(update, StreamTaskMessageFull):
+                        context = contexts.get(key) or await open_context(key, update.content)
+                        await context.stream_update(
+                            StreamTaskMessageFull(
+                                parent_task_message=context.task_message,
+                                content=update.content,
+                                type="full",
+                            )
+                        )
+                        await close_context(key)
+                    elif isinstance(update, StreamTaskMessageDone) and key in contexts:
+                        await close_context(key)
+            finally:
+                # Close anything the agent left open, so the parent task's
+                # messages are not stuck IN_PROGRESS if the stream broke off
+                for key in list(contexts):
+                    await close_context(key)
+
+            if span:
+                span.output = [task_message.model_dump() for task_message in forwarded]
+        return forwarded
+
     async def event_send(
         self,
         content: TaskMessageContent,
@@ -283,3 +467,12 @@ class ACPService:
             if span:
                 span.output = task_entry.model_dump()
             return task_entry
+
+
+def _update_key(update: TaskMessageUpdate) -> Union[int, str, None]:
+    """Which of the agent's messages an update belongs to: its index, else its parent message's id."""
+    if update.index is not None:
+        return update.index
+    if update.parent_task_message is not None:
+        return update.parent_task_message.id
+    return None
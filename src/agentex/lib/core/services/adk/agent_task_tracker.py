@@ -4,22 +4,37 @@ from agentex import AsyncAgentex
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.core.tracing.tracer import AsyncTracer
 from agentex.types.agent_task_tracker import AgentTaskTracker
+from agentex.lib.core.services.adk.read_cache import ReadCache, read_cache_ttl_seconds
 
 logger = make_logger(__name__)
 
 
 class AgentTaskTrackerService:
     def __init__(
-        self, agentex_client: AsyncAgentex, tracer: AsyncTracer,
+        self, agentex_client: AsyncAgentex, tracer: AsyncTracer, cache_ttl_seconds: float | None = None,
     ):
         self._agentex_client = agentex_client
         self._tracer = tracer
+        # Concurrent identical reads share one request; with a TTL the result
+        # is also cached until the tracker is updated through this service.
+        self._reads = ReadCache(read_cache_ttl_seconds(cache_ttl_seconds))
 
     async def get_agent_task_tracker(
         self,
         tracker_id: str,
         trace_id: str | None = None,
         parent_span_id: str | None = None,
+    ) -> AgentTaskTracker:
+        return await self._reads.get(
+            ("id", tracker_id),
+            lambda: self._get_agent_task_tracker(tracker_id, trace_id, parent_span_id),
+        )
+
+    async def _get_agent_task_tracker(
+        self,
+        tracker_id: str,
+        trace_id: str | None,
+        parent_span_id: str | None,
     ) -> AgentTaskTracker:
         trace = self._tracer.trace(trace_id)
         async with trace.span(
@@ -40,6 +55,18 @@ class AgentTaskTrackerService:
         agent_id: str,
         trace_id: str | None = None,
         parent_span_id: str | None = None,
+    ) -> AgentTaskTracker | None:
+        return await self._reads.get(
+            ("task_and_agent", task_id, agent_id),
+            lambda: self._get_by_task_and_agent(task_id, agent_id, trace_id, parent_span_id),
+        )
+
+    async def _get_by_task_and_agent(
+        self,
+        task_id: str,
+        agent_id: str,
+        trace_id: str | None,
+        parent_span_id: str | None,
     ) -> AgentTaskTracker | None:
         trace = self._tracer.trace(trace_id)
         async with trace.span(
@@ -82,6 +109,7 @@ class AgentTaskTrackerService:
                 status=status,
                 status_reason=status_reason,
             )
+            self._reads.invalidate_if(lambda cached: cached.id == tracker_id)
             if span:
                 span.output = tracker.model_dump()
             return tracker
@@ -5,6 +5,7 @@ from agentex.types.agent import Agent
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.temporal import heartbeat_if_in_workflow
 from agentex.lib.core.tracing.tracer import AsyncTracer
+from agentex.lib.core.services.adk.read_cache import ReadCache, read_cache_ttl_seconds
 
 logger = make_logger(__name__)
 
@@ -14,9 +15,13 @@ class AgentsService:
         self,
         agentex_client: AsyncAgentex,
         tracer: AsyncTracer,
+        cache_ttl_seconds: Optional[float] = None,
     ):
         self._agentex_client = agentex_client
         self._tracer = tracer
+        # Concurrent identical get_agent calls share one request; with a TTL
+        # the result is also cached. Agents are not written through the ADK.
+        self._reads = ReadCache(read_cache_ttl_seconds(cache_ttl_seconds))
 
     async def get_agent(
         self,
@@ -24,6 +29,18 @@ class AgentsService:
         agent_name: Optional[str] = None,
         trace_id: Optional[str] = None,
         parent_span_id: Optional[str] = None,
+    ) -> Agent:
+        return await self._reads.get(
+            ("id", agent_id) if agent_id else ("name", agent_name),
+            lambda: self._get_agent(agent_id, agent_name, trace_id, parent_span_id),
+        )
+
+    async def _get_agent(
+        self,
+        agent_id: Optional[str],
+        agent_name: Optional[str],
+        trace_id: Optional[str],
+        parent_span_id: Optional[str],
     ) -> Agent:
         trace = self._tracer.trace(trace_id)
         async with trace.span(
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import Any, TypeVar, Callable, Hashable, Awaitable
+from functools import partial
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from agentex.lib.utils.logging import make_logger
+
+logger = make_logger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_READ_CACHE_TTL_SECONDS = 0.0
+_READ_CACHE_MAX_ENTRIES = 1024
+
+
+def read_cache_ttl_seconds(ttl_seconds: float | None = None) -> float:
+    """``ttl_seconds`` if given, else ``AGENTEX_ADK_READ_CACHE_TTL_SECONDS`` (default 0: no caching)."""
+    if ttl_seconds is not None:
+        return ttl_seconds
+    return float(os.environ.get("AGENTEX_ADK_READ_CACHE_TTL_SECONDS", _DEFAULT_READ_CACHE_TTL_SECONDS))
+
+
+def _copy(value: T) -> T:
+    # Callers may mutate what they get back; never share one model between them.
+    return value.model_copy(deep=True) if isinstance(value, BaseModel) else value
+
+
+class ReadCache:
+    """
+    Single-flight reads with an optional TTL cache in front of them.
+
+    Concurrent ``get`` calls for the same key share one fetch: the first
+    starts it and the rest wait for its result. With ``ttl_seconds > 0`` the
+    result is also kept for that long. Write paths call ``invalidate`` (or
+    ``invalidate_if``) so later reads go back to the server; a fetch that was
+    already in flight when a write invalidated it is neither joined nor cached.
+
+    Other processes' writes are only observed once an entry expires, so keep
+    the TTL short. The fetch runs once on behalf of every caller waiting on
+    it, so only the first caller's span is recorded for it.
+    """
+
+    def __init__(self, ttl_seconds: float = 0.0, max_entries: int = _READ_CACHE_MAX_ENTRIES):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future[Any]] = {}
+        # Bumped by every invalidation; a fetch started before one is not cached.
+        self._generation = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """The value for ``key``: cached, joined from a fetch in flight, or fetched."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_at, value = entry
+            if time.monotonic() - cached_at <= self._ttl_seconds:
+                self._entries.move_to_end(key)
+                return _copy(value)
+            del self._entries[key]
+
+        # Futures belong to a loop; only join fetches running on this one.
+        flight_key = (asyncio.get_running_loop(), key)
+        flight = self._in_flight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(fetch())
+            self._in_flight[flight_key] = flight
+            flight.add_done_callback(partial(self._landed, flight_key, self._generation))
+        # Shielded so one caller being cancelled does not cancel the others' fetch.
+        return _copy(await asyncio.shield(flight))
+
+    def _landed(
+        self,
+        flight_key: tuple[asyncio.AbstractEventLoop, Hashable],
+        generation: int,
+        flight: asyncio.Future[Any],
+    ) -> None:
+        if self._in_flight.get(flight_key) is flight:
+            del self._in_flight[flight_key]
+        if flight.cancelled() or flight.exception() is not None:
+            return
+        if generation == self._generation:
+            self._store(flight_key[1], flight.result())
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        # A missing resource may be created at any moment, so None is not kept.
+        if value is None or self._ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, value: Any, *keys: Hashable) -> None:
+        """Cache ``value``, as returned by a write, under ``keys``, replacing whatever was cached or in flight."""
+        self.invalidate(*keys)
+        for key in keys:
+            self._store(key, _copy(value))
+
+    def add(self, key: Hashable, value: Any) -> None:
+        """Also cache a value just read under another ``key`` it is known by, unless that key is already cached."""
+        if key not in self._entries:
+            self._store(key, _copy(value))
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Forget ``keys``, cached or in flight."""
+        self._generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+        for flight_key in [k for k in self._in_flight if k[1] in keys]:
+            del self._in_flight[flight_key]
+
+    def invalidate_if(self, predicate: Callable[[Any], bool]) -> None:
+        """Forget cached values matching ``predicate``, and every fetch in flight."""
+        self._generation += 1
+        for key in [k for k, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+        self._in_flight.clear()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._in_flight.clear()
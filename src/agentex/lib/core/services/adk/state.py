@@ -5,17 +5,53 @@ from typing import Any, Dict
 from agentex import AsyncAgentex
 from agentex.types.state import State
 from agentex.lib.utils.logging import make_logger
+from agentex.lib.utils.json_patch import JsonPatchOp, apply_json_patch
 from agentex.lib.core.tracing.tracer import AsyncTracer
+from agentex.lib.core.services.adk.read_cache import ReadCache, read_cache_ttl_seconds
 
 logger = make_logger(__name__)
 
 
+def state_version(state: State) -> str:
+    """Version token of a state: the timestamp of its last write."""
+    return (state.updated_at or state.created_at).isoformat()
+
+
+class StateVersionConflictError(Exception):
+    """Raised when a state changed since the version a patch was based on."""
+
+    def __init__(self, state_id: str, expected_version: str, actual_version: str):
+        super().__init__(
+            f"State {state_id} is at version {actual_version}, expected {expected_version}"
+        )
+        self.state_id = state_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
+def _state_keys(state: State) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    return ("id", state.id), ("task_and_agent", state.task_id, state.agent_id)
+
+
 class StateService:
     def __init__(
-        self, agentex_client: AsyncAgentex, tracer: AsyncTracer
+        self,
+        agentex_client: AsyncAgentex,
+        tracer: AsyncTracer,
+        cache_ttl_seconds: float | None = None,
     ):
         self._agentex_client = agentex_client
         self._tracer = tracer
+        # Concurrent identical get_state misses share one request. With a TTL
+        # (AGENTEX_ADK_READ_CACHE_TTL_SECONDS) states this process read or
+        # wrote are also cached; other writers are only observed once an entry
+        # expires, except by version-checked patches, which always read fresh.
+        self._reads = ReadCache(read_cache_ttl_seconds(cache_ttl_seconds))
+
+    def _wrote(self, state: State) -> None:
+        # Cache what was written. Reads in flight may predate the write; later
+        # reads must not join them.
+        self._reads.put(state, *_state_keys(state))
 
     async def create_state(
         self,
@@ -36,6 +72,7 @@ class StateService:
                 agent_id=agent_id,
                 state=state,
             )
+            self._wrote(state_model)
             if span:
                 span.output = state_model.model_dump()
             return state_model
@@ -47,6 +84,23 @@ class StateService:
         agent_id: str | None = None,
         trace_id: str | None = None,
         parent_span_id: str | None = None,
+    ) -> State | None:
+        state = await self._reads.get(
+            ("id", state_id) if state_id else ("task_and_agent", task_id, agent_id),
+            lambda: self._get_state(state_id, task_id, agent_id, trace_id, parent_span_id),
+        )
+        if state is not None:
+            for key in _state_keys(state):
+                self._reads.add(key, state)
+        return state
+
+    async def _get_state(
+        self,
+        state_id: str | None,
+        task_id: str | None,
+        agent_id: str | None,
+        trace_id: str | None,
+        parent_span_id: str | None,
     ) -> State | None:
         trace = self._tracer.trace(trace_id) if self._tracer else None
         if trace is None:
@@ -105,10 +159,69 @@ class StateService:
                 state=state,
                 extra_body={"task_id": task_id, "agent_id": agent_id},
             )
+            self._wrote(state_model)
             if span:
                 span.output = state_model.model_dump()
             return state_model
 
+    async def patch_state(
+        self,
+        state_id: str,
+        task_id: str,
+        agent_id: str,
+        patch: list[JsonPatchOp],
+        expected_version: str | None = None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+    ) -> State:
+        """
+        Apply a JSON Patch to a state and store the result.
+
+        The states API only accepts whole documents, so the patch is applied
+        here against the current state and the result is written back. When
+        ``expected_version`` is given the current state is always read from
+        the server and the write is refused with ``StateVersionConflictError``
+        if the state has moved on; only unversioned patches start from the
+        cache. The check is made client-side and is best-effort: the backend
+        has no conditional update, so a write landing between the read and the
+        write is not detected.
+        """
+        trace = self._tracer.trace(trace_id)
+        async with trace.span(
+            parent_id=parent_span_id,
+            name="patch_state",
+            input={
+                "state_id": state_id,
+                "task_id": task_id,
+                "agent_id": agent_id,
+                "patch": patch,
+                "expected_version": expected_version,
+            },
+        ) as span:
+            if expected_version is None:
+                current = await self._reads.get(
+                    ("id", state_id), lambda: self._agentex_client.states.retrieve(state_id=state_id)
+                )
+            else:
+                # A cached entry can predate another process's write, so it
+                # could pass the check and the patch would overwrite that write.
+                current = await self._agentex_client.states.retrieve(state_id=state_id)
+                if state_version(current) != expected_version:
+                    self._reads.put(current, *_state_keys(current))
+                    raise StateVersionConflictError(
+                        state_id, expected_version, state_version(current)
+                    )
+
+            state_model = await self._agentex_client.states.update(
+                state_id=state_id,
+                state=apply_json_patch(current.state, patch),
+                extra_body={"task_id": task_id, "agent_id": agent_id},
+            )
+            self._wrote(state_model)
+            if span:
+                span.output = {"state_id": state_model.id, "version": state_version(state_model)}
+            return state_model
+
     async def delete_state(
         self,
         state_id: str,
@@ -122,6 +235,7 @@ class StateService:
             input={"state_id": state_id},
         ) as span:
             state = await self._agentex_client.states.delete(state_id)
+            self._reads.invalidate(*_state_keys(state))
             if span:
                 span.output = state.model_dump()
             return state
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import asyncio
 from typing import Literal, Callable, Awaitable
 from datetime import datetime
 
 from agentex import AsyncAgentex
 from agentex._types import omit
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 from agentex.types.data_content import DataContent
 from agentex.types.task_message import (
@@ -304,8 +304,8 @@ class DeltaAccumulator:
             data_deltas = [delta for delta in self._accumulated_deltas if isinstance(delta, DataDelta)]
             data_content_str = "".join([delta.data_delta or "" for delta in data_deltas])
             try:
-                data = json.loads(data_content_str)
-            except json.JSONDecodeError as e:
+                data = json_codec.loads(data_content_str)
+            except json_codec.JSONDecodeError as e:
                 raise ValueError(f"Accumulated data content is not valid JSON: {data_content_str}") from e
             return DataContent(
                 author="agent",
@@ -316,8 +316,8 @@ class DeltaAccumulator:
             tool_request_deltas = [delta for delta in self._accumulated_deltas if isinstance(delta, ToolRequestDelta)]
             arguments_content_str = "".join([delta.arguments_delta or "" for delta in tool_request_deltas])
             try:
-                arguments = json.loads(arguments_content_str)
-            except json.JSONDecodeError as e:
+                arguments = json_codec.loads(arguments_content_str)
+            except json_codec.JSONDecodeError as e:
                 raise ValueError(
                     f"Accumulated tool request arguments is not valid JSON: {arguments_content_str}"
                 ) from e
@@ -565,7 +565,7 @@ class StreamingService:
         try:
             await self._stream_repository.send_event(
                 topic=stream_topic,
-                event=update.model_dump(mode="json"),  # type: ignore
+                event=update,
             )
             return update
         except Exception as e:
@@ -7,6 +7,7 @@ from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.temporal import heartbeat_if_in_workflow
 from agentex.lib.core.tracing.tracer import AsyncTracer
 from agentex.types.task_retrieve_response import TaskRetrieveResponse
+from agentex.lib.core.services.adk.read_cache import ReadCache, read_cache_ttl_seconds
 from agentex.types.task_query_workflow_response import TaskQueryWorkflowResponse
 from agentex.types.task_retrieve_by_name_response import TaskRetrieveByNameResponse
 
@@ -18,9 +19,16 @@ class TasksService:
         self,
         agentex_client: AsyncAgentex,
         tracer: AsyncTracer,
+        cache_ttl_seconds: float | None = None,
     ):
         self._agentex_client = agentex_client
         self._tracer = tracer
+        # Concurrent identical get_task calls share one request; with a TTL
+        # the result is also cached until a write through this service.
+        self._reads = ReadCache(read_cache_ttl_seconds(cache_ttl_seconds))
+
+    def _forget_task(self, task_id: str | None, task_name: str | None = None) -> None:
+        self._reads.invalidate_if(lambda task: task.id == task_id or (task_name is not None and task.name == task_name))
 
     async def get_task(
         self,
@@ -28,6 +36,18 @@ class TasksService:
         task_name: str | None = None,
         trace_id: str | None = None,
         parent_span_id: str | None = None,
+    ) -> TaskRetrieveResponse | TaskRetrieveByNameResponse:
+        return await self._reads.get(
+            ("id", task_id) if task_id else ("name", task_name),
+            lambda: self._get_task(task_id, task_name, trace_id, parent_span_id),
+        )
+
+    async def _get_task(
+        self,
+        task_id: str | None,
+        task_name: str | None,
+        trace_id: str | None,
+        parent_span_id: str | None,
     ) -> TaskRetrieveResponse | TaskRetrieveByNameResponse:
         trace = self._tracer.trace(trace_id)
         async with trace.span(
@@ -59,6 +79,7 @@ class TasksService:
         if trace is None:
             # Handle case without tracing
             response = await self._agentex_client.tasks.delete(task_id)
+            self._forget_task(task_id, task_name)
             return Task(**response.model_dump())
 
         async with trace.span(
@@ -75,6 +96,7 @@ class TasksService:
                 task_model = await self._agentex_client.tasks.delete_by_name(task_name=task_name)
             else:
                 raise ValueError("Either task_id or task_name must be provided.")
+            self._forget_task(task_id, task_name)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -94,6 +116,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("cancel task")
             task_model = await self._agentex_client.tasks.cancel(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -113,6 +136,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("interrupt task")
             task_model = await self._agentex_client.tasks.interrupt(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -132,6 +156,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("complete task")
             task_model = await self._agentex_client.tasks.complete(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -151,6 +176,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("fail task")
             task_model = await self._agentex_client.tasks.fail(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -170,6 +196,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("terminate task")
             task_model = await self._agentex_client.tasks.terminate(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -189,6 +216,7 @@ class TasksService:
         ) as span:
             heartbeat_if_in_workflow("timeout task")
             task_model = await self._agentex_client.tasks.timeout(task_id=task_id, reason=reason)
+            self._forget_task(task_id)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -218,6 +246,7 @@ class TasksService:
                 )
             else:
                 raise ValueError("Either task_id or task_name must be provided.")
+            self._forget_task(task_id, task_name)
             if span:
                 span.output = task_model.model_dump()
             return task_model
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 from datetime import datetime
+from collections import OrderedDict
+from dataclasses import dataclass
 
-from jinja2 import BaseLoader, Environment
+from jinja2 import Template, BaseLoader, Environment, meta, nodes
 
 from agentex.lib.utils.temporal import heartbeat_if_in_workflow
 from agentex.lib.core.tracing.tracer import AsyncTracer
@@ -16,6 +19,86 @@ JINJA_ENV = Environment(
     extensions=["jinja2.ext.do"],
 )
 
+GLOBAL_VARIABLES = {
+    "datetime": datetime,
+}
+
+# Maximum number of compiled templates kept in memory.
+TEMPLATE_CACHE_SIZE = 256
+
+# Globals and filters whose output changes between calls. Templates using them
+# cannot be rendered inside a workflow, where replays must be deterministic.
+_NONDETERMINISTIC_GLOBALS = frozenset({"datetime", "lipsum"})
+_NONDETERMINISTIC_FILTERS = frozenset({"random"})
+
+
+@dataclass
+class _CachedTemplate:
+    template: Template
+    deterministic: bool | None = None
+
+
+_template_cache: OrderedDict[str, _CachedTemplate] = OrderedDict()
+
+
+def _cached_template(template: str) -> _CachedTemplate:
+    key = hashlib.sha256(template.encode()).hexdigest()
+    cached = _template_cache.get(key)
+    if cached is not None:
+        _template_cache.move_to_end(key)
+        return cached
+    cached = _CachedTemplate(JINJA_ENV.from_string(template, globals=GLOBAL_VARIABLES))
+    _template_cache[key] = cached
+    while len(_template_cache) > TEMPLATE_CACHE_SIZE:
+        _template_cache.popitem(last=False)
+    return cached
+
+
+def compile_jinja(template: str) -> Template:
+    """
+    Return the compiled form of ``template``.
+
+    Compiled templates are cached by the SHA-256 of their source in a bounded
+    LRU, so a prompt rendered on every turn is only parsed and compiled once.
+    """
+    return _cached_template(template).template
+
+
+def is_deterministic_jinja(template: str) -> bool:
+    """
+    Whether rendering ``template`` depends only on the variables passed in.
+
+    Templates that reference ``datetime``, ``lipsum`` or the ``random`` filter
+    are not deterministic and must not be rendered in workflow code.
+    """
+    cached = _cached_template(template)
+    if cached.deterministic is None:
+        ast = JINJA_ENV.parse(template)
+        # find_undeclared_variables skips environment globals such as lipsum,
+        # so those are matched by name (conservatively, even if shadowed).
+        referenced = meta.find_undeclared_variables(ast) | {
+            name.name for name in ast.find_all(nodes.Name) if name.ctx == "load" and name.name in JINJA_ENV.globals
+        }
+        cached.deterministic = not (
+            referenced & _NONDETERMINISTIC_GLOBALS
+            or any(f.name in _NONDETERMINISTIC_FILTERS for f in ast.find_all(nodes.Filter))
+        )
+    return cached.deterministic
+
+
+def render_jinja_template(template: str, variables: dict[str, Any]) -> str:
+    """
+    Render ``template`` with ``variables`` using the compiled-template cache.
+
+    Raises:
+        ValueError: If rendering fails.
+    """
+    jinja_template = compile_jinja(template)
+    try:
+        return jinja_template.render(variables)
+    except Exception as e:
+        raise ValueError(f"Error rendering Jinja template: {str(e)}") from e
+
 
 class TemplatingService:
     def __init__(self, tracer: AsyncTracer | None = None):
@@ -49,14 +132,7 @@ class TemplatingService:
             input={"template": template, "variables": variables},
         ) as span:
             heartbeat_if_in_workflow("render jinja")
-            global_variables = {
-                "datetime": datetime,
-            }
-            jinja_template = JINJA_ENV.from_string(template, globals=global_variables)
-            try:
-                rendered_template = jinja_template.render(variables)
-                if span:
-                    span.output = {"jinja_output": rendered_template}
-                return rendered_template
-            except Exception as e:
-                raise ValueError(f"Error rendering Jinja template: {str(e)}") from e
+            rendered_template = render_jinja_template(template, variables)
+            if span:
+                span.output = {"jinja_output": rendered_template}
+            return rendered_template
@@ -18,12 +18,29 @@ from agentex.lib.core.services.adk.utils.templating import TemplatingService
 from agentex.lib.core.adapters.streams.adapter_redis import RedisStreamRepository
 from agentex.lib.core.services.adk.providers.litellm import LiteLLMService
 from agentex.lib.core.services.adk.agent_task_tracker import AgentTaskTrackerService
-from agentex.lib.core.temporal.activities.adk.state_activities import StateActivities
-from agentex.lib.core.temporal.activities.adk.tasks_activities import TasksActivities
-from agentex.lib.core.temporal.activities.adk.events_activities import EventsActivities
+from agentex.lib.core.temporal.activities.adk.batch_activities import BatchActivities
+from agentex.lib.core.temporal.activities.adk.state_activities import (
+    StateActivities,
+    StateActivityName,
+    UpdateStateParams,
+)
+from agentex.lib.core.temporal.activities.adk.tasks_activities import (
+    TasksActivities,
+    UpdateTaskParams,
+    TasksActivityName,
+)
+from agentex.lib.core.temporal.activities.adk.events_activities import (
+    EventsActivities,
+    ListEventsParams,
+    EventsActivityName,
+)
 from agentex.lib.core.temporal.activities.adk.acp.acp_activities import ACPActivities
 from agentex.lib.core.temporal.activities.adk.tracing_activities import TracingActivities
-from agentex.lib.core.temporal.activities.adk.messages_activities import MessagesActivities
+from agentex.lib.core.temporal.activities.adk.messages_activities import (
+    MessagesActivities,
+    CreateMessageParams,
+    MessagesActivityName,
+)
 from agentex.lib.core.temporal.activities.adk.streaming_activities import (
     StreamingActivities,
 )
@@ -39,6 +56,8 @@ from agentex.lib.core.temporal.activities.adk.providers.litellm_activities impor
 )
 from agentex.lib.core.temporal.activities.adk.agent_task_tracker_activities import (
     AgentTaskTrackerActivities,
+    AgentTaskTrackerActivityName,
+    UpdateAgentTaskTrackerParams,
 )
 
 
@@ -101,6 +120,7 @@ def get_all_activities(sgp_client=None):
     acp_service = ACPService(
         agentex_client=agentex_client,
         tracer=tracer,
+        streaming_service=streaming_service,
     )
 
     ## Providers
@@ -139,6 +159,18 @@ def get_all_activities(sgp_client=None):
     streaming_activities = StreamingActivities(streaming_service=streaming_service)
     tasks_activities = TasksActivities(tasks_service=tasks_service)
     tracing_activities = TracingActivities(tracing_service=tracing_service)
+    batch_activities = BatchActivities(
+        operations={
+            MessagesActivityName.CREATE_MESSAGE: (CreateMessageParams, messages_activities.create_message),
+            StateActivityName.UPDATE_STATE: (UpdateStateParams, state_activities.update_state),
+            TasksActivityName.UPDATE_TASK: (UpdateTaskParams, tasks_activities.update_task),
+            AgentTaskTrackerActivityName.UPDATE_AGENT_TASK_TRACKER: (
+                UpdateAgentTaskTrackerParams,
+                agent_task_tracker_activities.update_agent_task_tracker,
+            ),
+            EventsActivityName.LIST_EVENTS: (ListEventsParams, events_activities.list_events),
+        }
+    )
 
     ## ACP
     acp_activities = ACPActivities(acp_service=acp_service)
@@ -174,6 +206,7 @@ def get_all_activities(sgp_client=None):
         state_activities.create_state,
         state_activities.get_state,
         state_activities.update_state,
+        state_activities.patch_state,
         state_activities.delete_state,
         ## Streaming activities
         streaming_activities.stream_update,
@@ -191,9 +224,12 @@ def get_all_activities(sgp_client=None):
         ## Tracing activities
         tracing_activities.start_span,
         tracing_activities.end_span,
+        ## Batch activities
+        batch_activities.execute_batch,
         # ACP activities
         acp_activities.task_create,
         acp_activities.message_send,
+        acp_activities.message_send_stream_auto_send,
         acp_activities.event_send,
         acp_activities.task_cancel,
         # Providers
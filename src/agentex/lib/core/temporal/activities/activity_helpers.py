@@ -8,9 +8,24 @@ from temporalio import workflow
 from temporalio.common import RetryPolicy
 
 from agentex.lib.utils.model_utils import BaseModel
+from agentex.lib.core.temporal.workers.concurrency import activity_task_queue
 
 T = TypeVar("T", bound="BaseModel")
 
+# Building a TypeAdapter compiles a pydantic core schema, which is far more
+# expensive than validating with it, so adapters are reused per response type.
+_type_adapters: dict[Any, TypeAdapter[Any]] = {}
+
+
+def _get_type_adapter(response_type: Any) -> TypeAdapter[Any]:
+    try:
+        adapter = _type_adapters.get(response_type)
+    except TypeError:  # unhashable type expression
+        return TypeAdapter(response_type)
+    if adapter is None:
+        adapter = _type_adapters[response_type] = TypeAdapter(response_type)
+    return adapter
+
 
 class ActivityHelpers:
     @staticmethod
@@ -29,7 +44,7 @@ class ActivityHelpers:
             start_to_close_timeout=start_to_close_timeout,
             retry_policy=retry_policy,
             heartbeat_timeout=heartbeat_timeout,
+            task_queue=activity_task_queue(activity_name),
         )
 
-        adapter = TypeAdapter(response_type)
-        return adapter.validate_python(response)
+        return _get_type_adapter(response_type).validate_python(response)
@@ -19,6 +19,7 @@ logger = make_logger(__name__)
 class ACPActivityName(str, Enum):
     TASK_CREATE = "task-create"
     MESSAGE_SEND = "message-send"
+    MESSAGE_SEND_STREAM_AUTO_SEND = "message-send-stream-auto-send"
     EVENT_SEND = "event-send"
     TASK_CANCEL = "task-cancel"
 
@@ -39,6 +40,11 @@ class MessageSendParams(BaseModelWithTraceParams):
     request: dict[str, Any] | None = None
 
 
+class MessageSendStreamAutoSendParams(MessageSendParams):
+    parent_task_id: str
+    task_name: str | None = None
+
+
 class EventSendParams(BaseModelWithTraceParams):
     agent_id: str | None = None
     agent_name: str | None = None
@@ -83,6 +89,20 @@ class ACPActivities:
             request=params.request,
         )
 
+    @activity.defn(name=ACPActivityName.MESSAGE_SEND_STREAM_AUTO_SEND)
+    async def message_send_stream_auto_send(self, params: MessageSendStreamAutoSendParams) -> List[TaskMessage]:
+        return await self._acp_service.message_send_stream_auto_send(
+            parent_task_id=params.parent_task_id,
+            agent_id=params.agent_id,
+            agent_name=params.agent_name,
+            task_id=params.task_id,
+            task_name=params.task_name,
+            content=params.content,
+            trace_id=params.trace_id,
+            parent_span_id=params.parent_span_id,
+            request=params.request,
+        )
+
     @activity.defn(name=ACPActivityName.EVENT_SEND)
     async def event_send(self, params: EventSendParams) -> Event:
         return await self._acp_service.event_send(
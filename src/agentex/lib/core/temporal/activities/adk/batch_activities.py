@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, Awaitable
+from collections.abc import Mapping
+
+from temporalio import activity
+from pydantic_core import to_jsonable_python
+
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.utils.model_utils import BaseModel
+
+logger = make_logger(__name__)
+
+
+class BatchActivityName(str, Enum):
+    EXECUTE_BATCH = "execute-batch"
+
+
+class BatchOperationParams(BaseModel):
+    activity_name: str
+    """Name of the ADK activity this operation would otherwise run as, e.g. ``create-message``."""
+    params: dict[str, Any]
+    """That activity's params, dumped to JSON."""
+
+
+class ExecuteBatchParams(BaseModel):
+    operations: list[BatchOperationParams]
+    stop_on_error: bool = False
+
+
+class BatchOperationResult(BaseModel):
+    value: Any = None
+    error_type: str | None = None
+    error: str | None = None
+    skipped: bool = False
+
+
+BatchableActivity = tuple[type[BaseModel], Callable[[Any], Awaitable[Any]]]
+"""An activity's params model and its implementation."""
+
+
+class BatchActivities:
+    """
+    Runs several ADK activities inside one activity execution.
+
+    A workflow that persists a message, updates state and advances its tracker
+    otherwise schedules three activities, paying three schedule-to-start
+    latencies and adding three sets of history events.
+    """
+
+    def __init__(self, operations: Mapping[str, BatchableActivity]):
+        # Keys may be the ``XActivityName`` enum members; look them up by value.
+        self._operations = {getattr(name, "value", name): operation for name, operation in operations.items()}
+
+    @activity.defn(name=BatchActivityName.EXECUTE_BATCH)
+    async def execute_batch(self, params: ExecuteBatchParams) -> list[BatchOperationResult]:
+        """
+        Run the operations in order and report each one's result or error.
+
+        An operation that raises does not fail the activity (so it is not
+        retried along with the operations that succeeded); its error is
+        returned in its result instead. With ``stop_on_error`` the operations
+        after a failed one are skipped.
+        """
+        results: list[BatchOperationResult] = []
+        failed = False
+        for index, operation in enumerate(params.operations):
+            if failed and params.stop_on_error:
+                results.append(BatchOperationResult(skipped=True))
+                continue
+            activity.heartbeat(index)
+            try:
+                params_model, run = self._operations[operation.activity_name]
+            except KeyError:
+                failed = True
+                results.append(
+                    BatchOperationResult(
+                        error_type="ValueError",
+                        error=f"Activity {operation.activity_name!r} cannot run in a batch",
+                    )
+                )
+                continue
+            try:
+                value = await run(params_model.model_validate(operation.params))
+            except Exception as e:
+                logger.warning(f"Batched {operation.activity_name} failed: {e}")
+                failed = True
+                results.append(BatchOperationResult(error_type=type(e).__name__, error=str(e)))
+            else:
+                results.append(BatchOperationResult(value=to_jsonable_python(value)))
+        return results
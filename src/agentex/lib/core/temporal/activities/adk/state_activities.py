@@ -17,6 +17,7 @@ class StateActivityName(str, Enum):
     CREATE_STATE = "create-state"
     GET_STATE = "get-state"
     UPDATE_STATE = "update-state"
+    PATCH_STATE = "patch-state"
     DELETE_STATE = "delete-state"
 
 
@@ -39,6 +40,14 @@ class UpdateStateParams(BaseModelWithTraceParams):
     state: dict[str, Any]
 
 
+class PatchStateParams(BaseModelWithTraceParams):
+    state_id: str
+    task_id: str
+    agent_id: str
+    patch: list[dict[str, Any]]
+    expected_version: str | None = None
+
+
 class DeleteStateParams(BaseModelWithTraceParams):
     state_id: str
 
@@ -78,6 +87,18 @@ class StateActivities:
             parent_span_id=params.parent_span_id,
         )
 
+    @activity.defn(name=StateActivityName.PATCH_STATE)
+    async def patch_state(self, params: PatchStateParams) -> State:
+        return await self._state_service.patch_state(
+            state_id=params.state_id,
+            task_id=params.task_id,
+            agent_id=params.agent_id,
+            patch=params.patch,
+            expected_version=params.expected_version,
+            trace_id=params.trace_id,
+            parent_span_id=params.parent_span_id,
+        )
+
     @activity.defn(name=StateActivityName.DELETE_STATE)
     async def delete_state(self, params: DeleteStateParams) -> State:
         return await self._state_service.delete_state(
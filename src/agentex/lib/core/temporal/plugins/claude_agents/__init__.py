@@ -21,10 +21,12 @@ Features:
 - Tool call visibility (Read, Write, Bash, etc.)
 - Subagent support with nested tracing
 - Workspace isolation per task
+- Optional warm CLI sessions reused across turns (session_pool.py)
 
 Architecture:
 - activities.py: Temporal activity definitions
 - message_handler.py: Message parsing and streaming logic
+- session_pool.py: Per-worker pool of warm Claude Code sessions
 - Reuses OpenAI's ContextInterceptor for context threading
 
 Usage:
@@ -55,6 +57,10 @@ from agentex.lib.core.temporal.plugins.claude_agents.activities import (
     run_claude_agent_activity,
     create_workspace_directory,
 )
+from agentex.lib.core.temporal.plugins.claude_agents.session_pool import (
+    ClaudeSessionPool,
+    get_claude_session_pool,
+)
 from agentex.lib.core.temporal.plugins.claude_agents.message_handler import (
     ClaudeMessageHandler,
 )
@@ -74,6 +80,9 @@ __all__ = [
     "claude_options_to_dict",
     # Message handling
     "ClaudeMessageHandler",
+    # Session reuse
+    "ClaudeSessionPool",
+    "get_claude_session_pool",
     # Hooks
     "create_streaming_hooks",
     "TemporalStreamingHooks",
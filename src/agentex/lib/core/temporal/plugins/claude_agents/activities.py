@@ -10,6 +10,7 @@ from __future__ import annotations
 import os
 import dataclasses
 from typing import Any
+from contextlib import aclosing
 
 from temporalio import activity
 from claude_agent_sdk import AgentDefinition, ClaudeSDKClient, ClaudeAgentOptions
@@ -32,6 +33,7 @@ from agentex.types.reasoning_content import ReasoningContent
 from agentex.types.task_message_update import StreamTaskMessageFull, StreamTaskMessageDelta
 from agentex.types.tool_request_content import ToolRequestContent
 from agentex.lib.core.temporal.plugins.claude_agents.hooks.hooks import create_streaming_hooks
+from agentex.lib.core.temporal.plugins.claude_agents.session_pool import get_claude_session_pool
 from agentex.lib.core.temporal.plugins.openai_agents.interceptors.context_interceptor import (
     streaming_task_id,
     streaming_trace_id,
@@ -155,6 +157,9 @@ async def run_claude_agent_activity(
             These are merged with the explicit params above, with explicit
             params taking precedence.
 
+    With ``AGENTEX_CLAUDE_SESSION_POOL_SIZE`` set, the CLI process is kept warm
+    between turns of the same task and workspace (see ``session_pool``).
+
     Returns:
         dict with "messages", "session_id", "usage", and "cost_usd" keys
     """
@@ -224,6 +229,11 @@ async def run_claude_agent_activity(
             else:
                 activity_hooks[event] = matchers  # type: ignore[assignment]
 
+    # Warm sessions register only the AgentEx streaming hooks, so turns with
+    # user hooks always get a fresh client
+    session_pool = get_claude_session_pool() if task_id and not user_hooks else None
+    session_options = dict(options_dict)
+
     options_dict["hooks"] = activity_hooks
     options = ClaudeAgentOptions(**options_dict)
 
@@ -382,16 +392,33 @@ async def run_claude_agent_activity(
         cost_str = f"${cost_info:.4f}" if cost_info is not None else "N/A"
         logger.info(f"Cost: {cost_str}, Duration: {message.duration_ms}ms, Turns: {message.num_turns}")
 
+    async def handle_message(message: Any) -> None:
+        if isinstance(message, AssistantMessage):
+            await handle_assistant_message(message)
+        elif isinstance(message, SystemMessage):
+            await handle_system_message(message)
+        elif isinstance(message, ResultMessage):
+            await handle_result_message(message)
+
     try:
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query(prompt)
-            async for message in client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    await handle_assistant_message(message)
-                elif isinstance(message, SystemMessage):
-                    await handle_system_message(message)
-                elif isinstance(message, ResultMessage):
-                    await handle_result_message(message)
+        if session_pool is not None and task_id:
+            turn = session_pool.run_turn(
+                prompt,
+                task_id=task_id,
+                workspace_path=workspace_path,
+                options=session_options,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+                subagent_spans=subagent_spans,
+            )
+            async with aclosing(turn):
+                async for message in turn:
+                    await handle_message(message)
+        else:
+            async with ClaudeSDKClient(options=options) as client:
+                await client.query(prompt)
+                async for message in client.receive_response():
+                    await handle_message(message)
 
         logger.debug("Message loop completed, cleaning up...")
         await close_text_stream()
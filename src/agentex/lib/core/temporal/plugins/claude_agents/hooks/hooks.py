@@ -64,6 +64,31 @@ class TemporalStreamingHooks:
         self.parent_span_id = parent_span_id
         self.subagent_spans = subagent_spans if subagent_spans is not None else {}
 
+    def rebind(
+        self,
+        task_id: str | None,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        subagent_spans: dict[str, Any] | None = None,
+    ) -> None:
+        """Point the hooks at a new turn.
+
+        A warm session registers its hook callbacks once, when the CLI starts,
+        so each turn updates the streaming context on the same instance.
+        """
+        self.task_id = task_id
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self.subagent_spans = subagent_spans if subagent_spans is not None else {}
+
+    def hook_matchers(self) -> dict[HookEvent, list[HookMatcher]]:
+        """Hooks dict suitable for ClaudeAgentOptions(hooks=...)."""
+        return {
+            "PreToolUse": [HookMatcher(matcher=None, hooks=[self.auto_allow_hook])],
+            "PostToolUse": [HookMatcher(matcher=None, hooks=[self.post_tool_use_hook])],
+            "PostToolUseFailure": [HookMatcher(matcher=None, hooks=[self.post_tool_use_failure_hook])],
+        }
+
     async def auto_allow_hook(
         self,
         _input_data: HookInput,
@@ -203,10 +228,4 @@ def create_streaming_hooks(
     Returns:
         Dict with PreToolUse, PostToolUse, and PostToolUseFailure hook configurations
     """
-    hooks_instance = TemporalStreamingHooks(task_id, trace_id, parent_span_id, subagent_spans)
-
-    return {
-        "PreToolUse": [HookMatcher(matcher=None, hooks=[hooks_instance.auto_allow_hook])],
-        "PostToolUse": [HookMatcher(matcher=None, hooks=[hooks_instance.post_tool_use_hook])],
-        "PostToolUseFailure": [HookMatcher(matcher=None, hooks=[hooks_instance.post_tool_use_failure_hook])],
-    }
+    return TemporalStreamingHooks(task_id, trace_id, parent_span_id, subagent_spans).hook_matchers()
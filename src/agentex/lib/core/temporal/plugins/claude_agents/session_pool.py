@@ -0,0 +1,373 @@
+"""Warm Claude Code sessions reused across the turns of a task.
+
+Without a pool, every ``run_claude_agent_activity`` call starts a new Claude
+SDK client, and with it a new ``claude`` CLI subprocess. Each time the CLI has
+to boot, start its MCP servers and reload the session transcript from disk
+before it can answer, so every message in a conversation pays that cost.
+
+:class:`ClaudeSessionPool` keeps the CLI process for a ``(task_id,
+workspace_path)`` pair alive on the worker between turns:
+
+- A session is reused only when the next turn asks for the same options and
+  resumes the session id that the previous turn ended on. Any other request
+  replaces the session: a new conversation, a changed model or MCP config, or
+  a workflow that was reset to an earlier turn.
+- At most ``max_sessions`` CLI processes are alive at once. Starting a new
+  session evicts the least recently used idle one, or waits for one to be
+  released.
+- Sessions idle for longer than ``idle_timeout`` seconds are closed.
+- A reused session may fail before producing any output, for example because
+  its process died while idle. The turn is then retried once on a fresh
+  process that resumes the same session id. A failure after output has been
+  streamed is raised, and the session is discarded.
+
+The SDK client must be used from the task that connected it, so each session
+runs in its own task and receives turns over a queue. Hooks are registered
+once, when the CLI starts, so every session owns a
+:class:`TemporalStreamingHooks` and rebinds it to each turn's streaming
+context.
+
+The pool is per worker process and disabled by default. To enable it, set
+``AGENTEX_CLAUDE_SESSION_POOL_SIZE`` to the maximum number of warm sessions.
+``AGENTEX_CLAUDE_SESSION_IDLE_TIMEOUT`` sets the idle eviction time in
+seconds (default 300). If Temporal schedules a turn on another worker, that
+worker starts a fresh session, as it would without the pool.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import asyncio
+import dataclasses
+from typing import Any
+from contextlib import suppress
+from collections.abc import Callable, AsyncIterator
+
+from claude_agent_sdk import ClaudeSDKError, ClaudeSDKClient, ClaudeAgentOptions
+from claude_agent_sdk.types import ResultMessage, SystemMessage
+
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.core.temporal.plugins.claude_agents.hooks.hooks import TemporalStreamingHooks
+
+logger = make_logger(__name__)
+
+_POOL_SIZE_ENV = "AGENTEX_CLAUDE_SESSION_POOL_SIZE"
+_IDLE_TIMEOUT_ENV = "AGENTEX_CLAUDE_SESSION_IDLE_TIMEOUT"
+
+DEFAULT_MAX_SESSIONS = 8
+DEFAULT_IDLE_TIMEOUT_S = 300.0
+# How long a graceful close may take before the session task is cancelled
+_CLOSE_TIMEOUT_S = 10.0
+
+SessionKey = tuple[str, str]
+
+_TURN_END = object()
+
+
+def _options_fingerprint(options: dict[str, Any]) -> str:
+    """Stable identity of the options a session was started with, minus ``resume``.
+
+    Values without a JSON form fall back to ``repr``. Objects such as
+    in-process MCP servers therefore never match a later turn, and their
+    sessions are not reused.
+    """
+
+    def _default(value: Any) -> Any:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return dataclasses.asdict(value)
+        return repr(value)
+
+    return json.dumps({k: v for k, v in options.items() if k != "resume"}, sort_keys=True, default=_default)
+
+
+class _Turn:
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+        self.messages: asyncio.Queue[Any] = asyncio.Queue()
+
+
+class WarmClaudeSession:
+    """One Claude SDK client, connected in its own task and serving turns in order."""
+
+    def __init__(
+        self,
+        key: SessionKey,
+        options: dict[str, Any],
+        client_factory: Callable[..., Any],
+    ):
+        self.key = key
+        self.fingerprint = _options_fingerprint(options)
+        self.session_id: str | None = options.get("resume")
+        self.turns_served = 0
+        self.last_used = time.monotonic()
+        self.in_use = False
+        self.hooks = TemporalStreamingHooks(task_id=key[0])
+        self._options = ClaudeAgentOptions(**options, hooks=self.hooks.hook_matchers())
+        self._client_factory = client_factory
+        self._turns: asyncio.Queue[_Turn | None] = asyncio.Queue()
+        self._ready: asyncio.Future[None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def reusable_for(self, fingerprint: str, resume_session_id: str | None) -> bool:
+        return (
+            self.alive
+            and fingerprint == self.fingerprint
+            and resume_session_id is not None
+            and resume_session_id == self.session_id
+        )
+
+    async def start(self) -> None:
+        """Start the CLI and wait until it has answered the SDK's initialize request."""
+        self._ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._serve(), name=f"claude-session-{self.key[0]}")
+        await asyncio.shield(self._ready)
+
+    async def run_turn(self, prompt: str) -> AsyncIterator[Any]:
+        """Send ``prompt`` and yield messages up to and including the ``ResultMessage``."""
+        if not self.alive:
+            raise ClaudeSDKError("Claude Code session is not running")
+        turn = _Turn(prompt)
+        self._turns.put_nowait(turn)
+        while (message := await turn.messages.get()) is not _TURN_END:
+            if isinstance(message, BaseException):
+                raise message
+            yield message
+        self.turns_served += 1
+
+    async def close(self, *, graceful: bool = True) -> None:
+        """Stop the CLI process. A non-graceful close cancels a turn in flight."""
+        if self._task is None or self._task.done():
+            return
+        if graceful:
+            self._turns.put_nowait(None)
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), _CLOSE_TIMEOUT_S)
+                return
+            except TimeoutError:
+                logger.warning(f"Claude session for task {self.key[0]} did not close in time, cancelling")
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _serve(self) -> None:
+        assert self._ready is not None
+        turn: _Turn | None = None
+        try:
+            async with self._client_factory(options=self._options) as client:
+                self._ready.set_result(None)
+                while (turn := await self._turns.get()) is not None:
+                    await client.query(turn.prompt)
+                    finished = False
+                    async for message in client.receive_response():
+                        self._observe(message)
+                        turn.messages.put_nowait(message)
+                        finished = isinstance(message, ResultMessage)
+                    if not finished:
+                        raise ClaudeSDKError("Claude Code exited before finishing the turn")
+                    turn.messages.put_nowait(_TURN_END)
+                    turn = None
+        except BaseException as e:
+            error = e if isinstance(e, Exception) else ClaudeSDKError("Claude Code session closed during the turn")
+            if not self._ready.done():
+                self._ready.set_exception(error)
+            if turn is not None:
+                turn.messages.put_nowait(error)
+            while not self._turns.empty():
+                pending = self._turns.get_nowait()
+                if pending is not None:
+                    pending.messages.put_nowait(error)
+            if not isinstance(e, Exception):
+                raise
+            logger.warning(f"Claude session for task {self.key[0]} stopped: {e}")
+
+    def _observe(self, message: Any) -> None:
+        if isinstance(message, SystemMessage) and message.subtype == "init":
+            self.session_id = message.data.get("session_id") or self.session_id
+        elif isinstance(message, ResultMessage) and message.session_id:
+            self.session_id = message.session_id
+
+
+class ClaudeSessionPool:
+    """Per-worker pool of warm Claude Code sessions, keyed by task and workspace."""
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_S,
+        client_factory: Callable[..., Any] = ClaudeSDKClient,
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._client_factory = client_factory
+        self._sessions: dict[SessionKey, WarmClaudeSession] = {}
+        self._changed: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reaper: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def run_turn(
+        self,
+        prompt: str,
+        *,
+        task_id: str,
+        workspace_path: str,
+        options: dict[str, Any],
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        subagent_spans: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Run one turn on the task's warm session, starting one if needed.
+
+        ``options`` are ``ClaudeAgentOptions`` keyword arguments without
+        ``hooks``; ``resume`` is the session id the turn continues, if any.
+        Close the returned generator (``contextlib.aclosing``) if you stop
+        iterating early, so that the session is released.
+        """
+        key = (task_id, workspace_path)
+        session = await self._checkout(key, options)
+        completed = False
+        try:
+            session.hooks.rebind(task_id, trace_id, parent_span_id, subagent_spans)
+            streamed = False
+            try:
+                async for message in session.run_turn(prompt):
+                    streamed = True
+                    yield message
+            except ClaudeSDKError as e:
+                if streamed or session.turns_served == 0:
+                    raise
+                logger.warning(f"Warm Claude session for task {task_id} failed ({e}), restarting it")
+                resume_options = {**options, "resume": session.session_id}
+                await self._release(session, discard=True)
+                session = await self._checkout(key, resume_options)
+                session.hooks.rebind(task_id, trace_id, parent_span_id, subagent_spans)
+                async for message in session.run_turn(prompt):
+                    yield message
+            completed = True
+        finally:
+            await self._release(session, discard=not completed)
+
+    async def evict_idle(self) -> int:
+        """Close sessions idle for at least ``idle_timeout``; returns how many were closed."""
+        now = time.monotonic()
+        async with self._condition():
+            expired = [
+                s for s in self._sessions.values() if not s.in_use and now - s.last_used >= self.idle_timeout
+            ]
+            for session in expired:
+                del self._sessions[session.key]
+            self._condition().notify_all()
+        await asyncio.gather(*(session.close() for session in expired))
+        if expired:
+            logger.info(f"Closed {len(expired)} idle Claude session(s)")
+        return len(expired)
+
+    async def close(self) -> None:
+        """Close every session and stop idle eviction."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(session.close(graceful=not session.in_use) for session in sessions))
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._changed is None or self._loop is not loop:
+            # sessions started on another loop died with it
+            self._changed = asyncio.Condition()
+            self._loop = loop
+            self._sessions.clear()
+            self._reaper = None
+        return self._changed
+
+    async def _checkout(self, key: SessionKey, options: dict[str, Any]) -> WarmClaudeSession:
+        fingerprint = _options_fingerprint(options)
+        resume_session_id = options.get("resume")
+        changed = self._condition()
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_idle(), name="claude-session-reaper")
+
+        stale: list[WarmClaudeSession] = []
+        async with changed:
+            while True:
+                session = self._sessions.get(key)
+                if session is not None and session.in_use:
+                    await changed.wait()
+                    continue
+                if session is not None:
+                    if session.reusable_for(fingerprint, resume_session_id):
+                        session.in_use = True
+                        logger.debug(f"Reusing warm Claude session for task {key[0]}")
+                        return session
+                    del self._sessions[key]
+                    stale.append(session)
+                    continue
+                if len(self._sessions) >= self.max_sessions:
+                    idle = [s for s in self._sessions.values() if not s.in_use]
+                    if not idle:
+                        await changed.wait()
+                        continue
+                    evicted = min(idle, key=lambda s: s.last_used)
+                    del self._sessions[evicted.key]
+                    stale.append(evicted)
+                    continue
+                session = WarmClaudeSession(key, options, self._client_factory)
+                session.in_use = True
+                self._sessions[key] = session
+                break
+
+        # close replaced and evicted processes before starting another one
+        await asyncio.gather(*(s.close() for s in stale))
+        logger.info(f"Starting Claude session for task {key[0]} ({len(self._sessions)}/{self.max_sessions} live)")
+        try:
+            await session.start()
+        except BaseException:
+            await self._release(session, discard=True)
+            raise
+        return session
+
+    async def _release(self, session: WarmClaudeSession, *, discard: bool) -> None:
+        changed = self._condition()
+        async with changed:
+            session.in_use = False
+            session.last_used = time.monotonic()
+            if discard and self._sessions.get(session.key) is session:
+                del self._sessions[session.key]
+            changed.notify_all()
+        if discard:
+            await session.close(graceful=False)
+
+    async def _reap_idle(self) -> None:
+        interval = min(max(self.idle_timeout / 2, 0.05), 30.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Failed to evict idle Claude sessions: {e}")
+
+
+_session_pool: ClaudeSessionPool | None = None
+
+
+def get_claude_session_pool() -> ClaudeSessionPool | None:
+    """The worker's session pool, or ``None`` unless ``AGENTEX_CLAUDE_SESSION_POOL_SIZE`` is set."""
+    global _session_pool
+    if _session_pool is None:
+        size = int(os.environ.get(_POOL_SIZE_ENV, "0") or 0)
+        if size <= 0:
+            return None
+        idle_timeout = float(os.environ.get(_IDLE_TIMEOUT_ENV, "") or DEFAULT_IDLE_TIMEOUT_S)
+        _session_pool = ClaudeSessionPool(max_sessions=size, idle_timeout=idle_timeout)
+    return _session_pool
@@ -0,0 +1,98 @@
+"""Content-derived Temporal build ids for ``AgentexWorker``.
+
+A random build id per start means two pods running identical code look like
+different builds, so Temporal's worker-versioning features cannot group them.
+The build id is derived from what the worker actually runs instead:
+
+1. ``AGENTEX_WORKER_BUILD_ID``, if set (e.g. by a build pipeline that already
+   knows the image digest or commit).
+2. Otherwise a hash of the agent's own source: the top-level package of every
+   module that defines a registered workflow or activity, hashed with
+   ``build_provenance.working_tree_hash``. The agentex SDK version is mixed
+   in; the SDK's own sources are not hashed. ``__pycache__`` directories are
+   skipped because bytecode is written at import time on some pods and not
+   others.
+3. A random id, as before, if no agent source can be located (e.g. workflows
+   defined in an interactive session).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import uuid
+import hashlib
+from pathlib import Path
+from collections.abc import Callable, Iterable
+
+from agentex._version import __version__
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.utils.build_provenance import working_tree_hash
+
+logger = make_logger(__name__)
+
+_BUILD_ID_ENV = "AGENTEX_WORKER_BUILD_ID"
+_EXCLUDE_DIRS = frozenset({"__pycache__", ".git", ".venv", "node_modules"})
+
+
+def _source_root(module_name: str) -> Path | None:
+    """Directory of the top-level package defining ``module_name``, or the file of a top-level module."""
+    module = sys.modules.get(module_name)
+    if module_name == "__main__" and module is not None:
+        spec = getattr(module, "__spec__", None)
+        top_name = spec.name.split(".")[0] if spec is not None else "__main__"
+        # `python -m project.run_worker` imports `project` as a parent package
+        top = sys.modules.get(top_name) if top_name != "__main__" else None
+        if top is None or not getattr(top, "__path__", None):
+            top = module
+    else:
+        top = sys.modules.get(module_name.split(".")[0])
+    if top is None:
+        return None
+    package_paths = list(getattr(top, "__path__", []))
+    if package_paths:
+        return Path(package_paths[0]).resolve()
+    filename = getattr(top, "__file__", None)
+    return Path(filename).resolve() if filename else None
+
+
+def agent_source_roots(definitions: Iterable[type | Callable]) -> list[Path]:
+    """Source roots of the agent code defining ``definitions``, excluding the agentex SDK."""
+    roots: set[Path] = set()
+    for definition in definitions:
+        module_name = getattr(definition, "__module__", None)
+        if not module_name or module_name.split(".")[0] == "agentex":
+            continue
+        root = _source_root(module_name)
+        if root is not None:
+            roots.add(root)
+    return sorted(roots)
+
+
+def _hash_root(root: Path) -> str:
+    if root.is_file():
+        return hashlib.sha256(root.read_bytes()).hexdigest()
+    return working_tree_hash(root, exclude_dirs=_EXCLUDE_DIRS)
+
+
+def worker_build_id(definitions: Iterable[type | Callable]) -> str:
+    """Build id for a worker running ``definitions`` (workflow classes and activity functions)."""
+    configured = os.environ.get(_BUILD_ID_ENV, "").strip()
+    if configured:
+        return configured
+
+    roots = agent_source_roots(definitions)
+    if not roots:
+        logger.warning("Could not locate agent source to derive a build id; using a random one")
+        return str(uuid.uuid4())
+
+    digest = hashlib.sha256(f"agentex {__version__}\n".encode())
+    try:
+        for root in roots:
+            digest.update(f"{root.name}\x00{_hash_root(root)}\n".encode())
+    except OSError as e:
+        logger.warning(f"Failed to hash agent source for the build id ({e}); using a random one")
+        return str(uuid.uuid4())
+    build_id = digest.hexdigest()[:32]
+    logger.info(f"Worker build id {build_id} (agentex {__version__}, source: {', '.join(str(r) for r in roots)})")
+    return build_id
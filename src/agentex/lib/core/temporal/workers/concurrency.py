@@ -0,0 +1,276 @@
+"""Activity concurrency groups and resource-based slot tuning for ``AgentexWorker``.
+
+By default every activity on a worker shares one fixed pool of slots, so a
+burst of long streaming LLM activities can hold them all while short state
+and message activities queue behind them.
+
+- :class:`ActivityConcurrencyGroup` gives a set of activity types their own
+  task queue (``<task_queue>.<group name>``) and slot limit. ``AgentexWorker``
+  runs one extra Temporal worker per group, and
+  ``ActivityHelpers.execute_activity`` schedules grouped activities on their
+  group's queue. The main worker still registers every activity, so an
+  activity scheduled some other way still runs.
+- :class:`ResourceBasedActivityTuner` replaces the main worker's fixed
+  activity slot count. It grants slots between ``min_slots`` and
+  ``max_slots`` while process CPU, memory and event-loop lag are below their
+  targets. Set ``AGENTEX_WORKER_RESOURCE_TUNER=1`` to enable it with defaults.
+- :class:`ActivitySlotMetricsInterceptor` records slot usage and
+  schedule-to-start latency (see ``observability.worker_metrics``). It is on
+  unless ``AGENTEX_WORKER_METRICS=0``.
+
+Group routing is part of the commands a workflow emits. Every worker on the
+task queue needs the same groups, or grouped activities wait on a group queue
+that nothing polls.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import Any, override
+from dataclasses import dataclass
+from collections.abc import Sequence
+
+from temporalio import activity
+from temporalio.worker import (
+    SlotPermit,
+    Interceptor,
+    CustomSlotSupplier,
+    SlotReleaseContext,
+    SlotReserveContext,
+    SlotMarkUsedContext,
+    ExecuteActivityInput,
+    ActivityInboundInterceptor,
+)
+
+from agentex.lib.utils.logging import make_logger
+from agentex.lib.core.observability.resource_sampler import ResourceSampler
+
+logger = make_logger(__name__)
+
+DEFAULT_GROUP = "default"
+_METRICS_ENV = "AGENTEX_WORKER_METRICS"
+_RESOURCE_TUNER_ENV = "AGENTEX_WORKER_RESOURCE_TUNER"
+
+
+@dataclass(frozen=True)
+class ActivityConcurrencyGroup:
+    """Activity types that run on their own task queue with their own slot limit.
+
+    Args:
+        name: Group name; also the task queue suffix and the metrics label.
+        activity_types: Registered activity names in the group.
+        max_concurrent: Activity slots for the group.
+        max_workers: Threads for the group's sync activities (default:
+            ``max_concurrent``).
+    """
+
+    name: str
+    activity_types: Sequence[str]
+    max_concurrent: int
+    max_workers: int | None = None
+
+    def task_queue(self, base_task_queue: str) -> str:
+        return f"{base_task_queue}.{self.name}"
+
+
+def validate_activity_groups(groups: Sequence[ActivityConcurrencyGroup]) -> None:
+    """Raise ``ValueError`` for unnamed or duplicate groups, bad limits, or
+    activity types that belong to more than one group."""
+    seen_names: set[str] = set()
+    seen_types: dict[str, str] = {}
+    for group in groups:
+        if not group.name or group.name == DEFAULT_GROUP:
+            raise ValueError(f"Invalid activity group name {group.name!r}")
+        if group.name in seen_names:
+            raise ValueError(f"Duplicate activity group {group.name!r}")
+        seen_names.add(group.name)
+        if group.max_concurrent < 1:
+            raise ValueError(f"Activity group {group.name!r} needs max_concurrent >= 1")
+        for activity_type in group.activity_types:
+            if activity_type in seen_types:
+                raise ValueError(
+                    f"Activity {activity_type!r} is in both {seen_types[activity_type]!r} and {group.name!r}"
+                )
+            seen_types[activity_type] = group.name
+
+
+# activity name -> task queue, installed by AgentexWorker.run and read from
+# workflow code via ActivityHelpers. Workflows run in the worker's process.
+_activity_task_queues: dict[str, str] = {}
+
+
+def route_activity_groups(task_queue: str, groups: Sequence[ActivityConcurrencyGroup]) -> None:
+    """Route grouped activities scheduled by ``ActivityHelpers`` to their group queues."""
+    _activity_task_queues.clear()
+    for group in groups:
+        for activity_type in group.activity_types:
+            _activity_task_queues[activity_type] = group.task_queue(task_queue)
+
+
+def activity_task_queue(activity_name: str) -> str | None:
+    """The task queue to schedule ``activity_name`` on; None means the workflow's own."""
+    return _activity_task_queues.get(activity_name)
+
+
+def worker_metrics_enabled() -> bool:
+    return os.environ.get(_METRICS_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def resource_tuner_from_env() -> ResourceBasedActivityTuner | None:
+    """A default :class:`ResourceBasedActivityTuner` if ``AGENTEX_WORKER_RESOURCE_TUNER`` is set."""
+    raw = os.environ.get(_RESOURCE_TUNER_ENV, "").strip().lower()
+    if raw in ("", "0", "false", "no", "off"):
+        return None
+    return ResourceBasedActivityTuner()
+
+
+class ActivitySlotMetricsInterceptor(Interceptor):
+    """Records activity slot usage and schedule-to-start latency per group."""
+
+    def __init__(self, groups: Sequence[ActivityConcurrencyGroup] = ()):
+        self._group_of = {activity_type: group.name for group in groups for activity_type in group.activity_types}
+
+    @override
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        return _SlotMetricsActivityInbound(next, self._group_of)
+
+
+class _SlotMetricsActivityInbound(ActivityInboundInterceptor):
+    def __init__(self, next: ActivityInboundInterceptor, group_of: dict[str, str]):
+        super().__init__(next)
+        self._group_of = group_of
+
+    @override
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        from agentex.lib.core.observability.worker_metrics import get_worker_metrics
+
+        info = activity.info()
+        group = self._group_of.get(info.activity_type, DEFAULT_GROUP)
+        metrics = get_worker_metrics()
+        if info.current_attempt_scheduled_time is not None:
+            schedule_to_start = info.started_time - info.current_attempt_scheduled_time
+            metrics.activity_schedule_to_start.record(
+                schedule_to_start.total_seconds() * 1000,
+                {"activity_type": info.activity_type, "group": group},
+            )
+        attributes = {"group": group}
+        metrics.activity_slots_used.add(1, attributes)
+        try:
+            return await self.next.execute_activity(input)
+        finally:
+            metrics.activity_slots_used.add(-1, attributes)
+
+
+class _TunerPermit(SlotPermit):
+    pass
+
+
+class ResourceBasedActivityTuner(CustomSlotSupplier):
+    """Activity slot supplier that scales with CPU, memory and event-loop lag.
+
+    Always grants up to ``min_slots``. Above that it grants another slot
+    only if the process is under ``target_cpu`` and ``target_memory`` and the
+    event loop lags less than ``max_event_loop_lag`` seconds, waiting at
+    least ``ramp_throttle`` seconds between grants so new activities can show
+    up in the next sample. Never grants more than ``max_slots``.
+
+    Pass it to ``AgentexWorker(activity_tuner=...)``.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_slots: int = 2,
+        max_slots: int = 100,
+        target_cpu: float = 0.8,
+        target_memory: float = 0.8,
+        max_event_loop_lag: float = 0.1,
+        ramp_throttle: float = 0.05,
+        sampler: ResourceSampler | None = None,
+    ):
+        if not 1 <= min_slots <= max_slots:
+            raise ValueError("Need 1 <= min_slots <= max_slots")
+        self.min_slots = min_slots
+        self.max_slots = max_slots
+        self.target_cpu = target_cpu
+        self.target_memory = target_memory
+        self.max_event_loop_lag = max_event_loop_lag
+        self.ramp_throttle = ramp_throttle
+        self.sampler = sampler or ResourceSampler()
+        self._lock = threading.Lock()
+        self._reserved = 0
+        self._last_grant = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._released: asyncio.Event | None = None
+
+    @property
+    def reserved_slots(self) -> int:
+        return self._reserved
+
+    def limiting_resource(self) -> str | None:
+        """Why another slot would not be granted now, or None if it would."""
+        if self._reserved < self.min_slots:
+            return None
+        if self._reserved >= self.max_slots:
+            return "max_slots"
+        if self.sampler.cpu >= self.target_cpu:
+            return "cpu"
+        if self.sampler.memory >= self.target_memory:
+            return "memory"
+        if self.sampler.event_loop_lag >= self.max_event_loop_lag:
+            return "event_loop_lag"
+        return None
+
+    def _try_grant(self, *, throttle: bool) -> bool:
+        with self._lock:
+            if self.limiting_resource() is not None:
+                return False
+            now = time.monotonic()
+            if throttle and self._reserved >= self.min_slots and now - self._last_grant < self.ramp_throttle:
+                return False
+            self._reserved += 1
+            self._last_grant = now
+            return True
+
+    @override
+    async def reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._released = asyncio.Event()
+        assert self._released is not None
+        self.sampler.start()
+        waited_on: str | None = None
+        while not self._try_grant(throttle=True):
+            reason = self.limiting_resource()
+            if reason is not None and waited_on is None:
+                from agentex.lib.core.observability.worker_metrics import get_worker_metrics
+
+                get_worker_metrics().activity_slot_waits.add(1, {"reason": reason})
+                waited_on = reason
+            self._released.clear()
+            # Wake on a release, or re-check after the throttle / next sample
+            timeout = self.ramp_throttle if reason is None else self.sampler.interval
+            try:
+                await asyncio.wait_for(self._released.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+        return _TunerPermit()
+
+    @override
+    def try_reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit | None:
+        return _TunerPermit() if self._try_grant(throttle=False) else None
+
+    @override
+    def mark_slot_used(self, ctx: SlotMarkUsedContext) -> None:
+        pass
+
+    @override
+    def release_slot(self, ctx: SlotReleaseContext) -> None:
+        with self._lock:
+            self._reserved -= 1
+        # May be called off the event loop
+        if self._loop is not None and self._released is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._released.set)
@@ -0,0 +1,176 @@
+"""Readiness gating for ``AgentexWorker``.
+
+The worker's ``/readyz`` endpoint used to report ready as soon as the Temporal
+``Worker`` objects were constructed, before they had validated against the
+server or started polling. During a rolling deploy the old pods could then be
+torn down while the new ones were not yet taking any work.
+
+:class:`WorkerReadiness` tracks the stages a worker goes through and only
+reports ready once all of them are done:
+
+- ``warmup``: the worker's warm-up callables (e.g. an LLM or MCP client's
+  first connection) have finished, succeeded or not. They run before any
+  Temporal worker starts, so the first task does not pay for cold clients.
+- ``workers``: every Temporal worker has validated against the server and is
+  running.
+- ``pollers``: the server lists this worker's identity among the pollers of
+  each of its task queues (``DescribeTaskQueue``). If the server refuses that
+  call (e.g. missing permission), the running workers are trusted instead.
+
+After that, readiness follows the workers: it drops again as soon as one of
+them stops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from collections.abc import Mapping, Callable, Sequence, Awaitable
+
+from temporalio.client import Client
+from temporalio.service import RPCError
+from temporalio.api.enums.v1 import TaskQueueKind, TaskQueueType
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueRequest
+
+from agentex.lib.utils.logging import make_logger
+
+logger = make_logger(__name__)
+
+Warmup = Callable[[], Awaitable[Any]]
+
+DEFAULT_WARMUP_TIMEOUT_S = 30.0
+_POLL_INTERVAL_S = 0.5
+_MONITOR_INTERVAL_S = 5.0
+
+
+class WorkerReadiness:
+    """Stages an ``AgentexWorker`` must complete before ``/readyz`` reports ready."""
+
+    STAGES = ("warmup", "workers", "pollers")
+
+    def __init__(self) -> None:
+        self._done: set[str] = set()
+        self._stopped = False
+
+    @property
+    def ready(self) -> bool:
+        return not self._stopped and self._done.issuperset(self.STAGES)
+
+    @property
+    def pending(self) -> list[str]:
+        """Stages not yet complete, or ``["stopped"]`` once the workers have stopped."""
+        if self._stopped:
+            return ["stopped"]
+        return [stage for stage in self.STAGES if stage not in self._done]
+
+    def mark(self, stage: str) -> None:
+        if stage not in self.STAGES:
+            raise ValueError(f"Unknown readiness stage {stage!r}")
+        self._done.add(stage)
+        logger.info(f"Worker readiness: {stage} done" + ("" if not self.pending else f", waiting for {self.pending}"))
+
+    def stop(self) -> None:
+        self._stopped = True
+
+
+async def run_warmups(warmups: Mapping[str, Warmup], timeout: float = DEFAULT_WARMUP_TIMEOUT_S) -> dict[str, bool]:
+    """Run warm-up callables concurrently; returns which succeeded.
+
+    Failures and timeouts are logged, not raised: a dependency that is slow
+    to answer should not keep the worker out of service indefinitely.
+    """
+
+    async def _one(name: str, warmup: Warmup) -> bool:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await asyncio.wait_for(warmup(), timeout)
+        except TimeoutError:
+            logger.warning(f"Warm-up {name!r} timed out after {timeout:.0f}s")
+            return False
+        except Exception as e:
+            logger.warning(f"Warm-up {name!r} failed: {e}")
+            return False
+        logger.info(f"Warm-up {name!r} done in {(loop.time() - start) * 1000:.0f}ms")
+        return True
+
+    names = list(warmups)
+    results = await asyncio.gather(*(_one(name, warmups[name]) for name in names))
+    return dict(zip(names, results, strict=True))
+
+
+async def _has_poller(client: Client, task_queue: str, queue_type: TaskQueueType.ValueType, identity: str) -> bool:
+    response = await client.workflow_service.describe_task_queue(
+        DescribeTaskQueueRequest(
+            namespace=client.namespace,
+            task_queue=TaskQueue(name=task_queue, kind=TaskQueueKind.TASK_QUEUE_KIND_NORMAL),
+            task_queue_type=queue_type,
+        )
+    )
+    return any(poller.identity == identity for poller in response.pollers)
+
+
+async def wait_for_pollers(
+    client: Client,
+    queues: Sequence[tuple[str, bool]],
+    identity: str,
+    *,
+    interval: float | None = None,
+) -> bool:
+    """Wait until the server lists ``identity`` polling each queue.
+
+    ``queues`` holds ``(task_queue, polls_workflows)`` pairs; every queue is
+    checked for activity pollers, and for workflow pollers too where
+    ``polls_workflows`` is set. Returns ``False`` without waiting further if
+    the server rejects ``DescribeTaskQueue``.
+    """
+    pending = [
+        (task_queue, queue_type)
+        for task_queue, polls_workflows in queues
+        for queue_type in (
+            (TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW, TaskQueueType.TASK_QUEUE_TYPE_ACTIVITY)
+            if polls_workflows
+            else (TaskQueueType.TASK_QUEUE_TYPE_ACTIVITY,)
+        )
+    ]
+    interval = _POLL_INTERVAL_S if interval is None else interval
+    while pending:
+        try:
+            seen = await asyncio.gather(*(_has_poller(client, q, t, identity) for q, t in pending))
+        except RPCError as e:
+            logger.warning(f"Cannot check pollers with DescribeTaskQueue ({e}); trusting worker state instead")
+            return False
+        pending = [queue for queue, polled in zip(pending, seen, strict=True) if not polled]
+        if pending:
+            await asyncio.sleep(interval)
+    return True
+
+
+async def follow_workers(
+    readiness: WorkerReadiness,
+    workers: Sequence[Any],
+    client: Client,
+    queues: Sequence[tuple[str, bool]],
+    identity: str,
+    *,
+    interval: float | None = None,
+    monitor_interval: float | None = None,
+) -> None:
+    """Complete the ``workers`` and ``pollers`` stages, then watch for workers stopping."""
+    interval = _POLL_INTERVAL_S if interval is None else interval
+    monitor_interval = _MONITOR_INTERVAL_S if monitor_interval is None else monitor_interval
+    while not all(worker.is_running for worker in workers):
+        if any(worker.is_shutdown for worker in workers):
+            readiness.stop()
+            return
+        await asyncio.sleep(interval)
+    readiness.mark("workers")
+
+    await wait_for_pollers(client, queues, identity, interval=interval)
+    readiness.mark("pollers")
+
+    while all(worker.is_running for worker in workers):
+        await asyncio.sleep(monitor_interval)
+    logger.warning("A Temporal worker stopped; reporting not ready")
+    readiness.stop()
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import os
-import uuid
+import asyncio
 import datetime
 import dataclasses
 from typing import Any, overload, override
-from collections.abc import Callable
+from collections.abc import Mapping, Callable
 from concurrent.futures import ThreadPoolExecutor
 
 from aiohttp import web
@@ -14,9 +14,12 @@ from temporalio.worker import (
     Plugin as WorkerPlugin,
     Worker,
     Interceptor,
+    WorkerTuner,
+    FixedSizeSlotSupplier,
     UnsandboxedWorkflowRunner,
 )
 from temporalio.runtime import Runtime, TelemetryConfig, OpenTelemetryConfig
+from temporalio.activity import _Definition as _ActivityDefinition
 from temporalio.converter import (
     PayloadCodec,
     DataConverter,
@@ -31,9 +34,30 @@ from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.registration import register_agent
 from agentex.lib.environment_variables import EnvironmentVariables
 from agentex.lib.core.compat.version_guard import assert_backend_compatible
+from agentex.lib.core.temporal.workers.build_id import worker_build_id
+from agentex.lib.core.observability.loop_monitor import EventLoopMonitor
+from agentex.lib.core.temporal.workers.readiness import (
+    DEFAULT_WARMUP_TIMEOUT_S,
+    Warmup,
+    WorkerReadiness,
+    run_warmups,
+    follow_workers,
+)
+from agentex.lib.core.temporal.workers.concurrency import (
+    ActivityConcurrencyGroup,
+    ResourceBasedActivityTuner,
+    ActivitySlotMetricsInterceptor,
+    route_activity_groups,
+    worker_metrics_enabled,
+    resource_tuner_from_env,
+    validate_activity_groups,
+)
 
 logger = make_logger(__name__)
 
+# Temporal's own defaults for the slot kinds a composite tuner must also cover
+_DEFAULT_FIXED_SLOTS = 100
+
 
 class DateTimeJSONEncoder(AdvancedJSONEncoder):
     @override
@@ -157,13 +181,41 @@ class AgentexWorker:
         metrics_url: str | None = None,
         payload_codec: PayloadCodec | None = None,
         data_converter: DataConverter | None = None,
+        activity_groups: list[ActivityConcurrencyGroup] | None = None,
+        activity_tuner: ResourceBasedActivityTuner | None = None,
+        warmups: Mapping[str, Warmup] | None = None,
+        warmup_timeout: float = DEFAULT_WARMUP_TIMEOUT_S,
+        build_id: str | None = None,
     ):
+        """
+        Args:
+            activity_groups: Activity types to run on their own task queues
+                with their own slot limits (see ``ActivityConcurrencyGroup``).
+            activity_tuner: Resource-based slot supplier replacing
+                ``max_concurrent_activities`` for the main task queue. Defaults
+                to one with default settings if ``AGENTEX_WORKER_RESOURCE_TUNER``
+                is set.
+            warmups: Named async callables run before the Temporal workers
+                start, e.g. opening the first connection of an LLM or MCP
+                client. ``/readyz`` stays not-ready until they finish; a
+                failure or a timeout after ``warmup_timeout`` seconds is
+                logged and does not stop the worker.
+            build_id: Temporal build id for the workers. Defaults to
+                ``AGENTEX_WORKER_BUILD_ID`` or a hash of the agent's source
+                (see ``build_id.worker_build_id``).
+
+        ``run`` samples event-loop lag and can log callbacks that block the
+        loop (see ``agentex.lib.core.observability.loop_monitor``). To run
+        the worker on uvloop, start it with
+        ``agentex.lib.utils.event_loop.run_event_loop`` instead of
+        ``asyncio.run``.
+        """
         self.task_queue = task_queue
         self.activity_handles = []
         self.max_workers = max_workers
         self.max_concurrent_activities = max_concurrent_activities
         self.health_check_server_running = False
-        self.healthy = False
+        self.readiness = WorkerReadiness()
         self.health_check_port = (
             health_check_port if health_check_port is not None else EnvironmentVariables.refresh().HEALTH_CHECK_PORT
         )
@@ -172,6 +224,17 @@ class AgentexWorker:
         self.metrics_url = metrics_url
         self.payload_codec = payload_codec
         self.data_converter = data_converter
+        self.activity_groups = activity_groups or []
+        validate_activity_groups(self.activity_groups)
+        self.activity_tuner = activity_tuner if activity_tuner is not None else resource_tuner_from_env()
+        self.warmups = dict(warmups or {})
+        self.warmup_timeout = warmup_timeout
+        self.build_id = build_id
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the worker is warmed up and its pollers are live (see ``WorkerReadiness``)."""
+        return self.readiness.ready
 
     @overload
     async def run(
@@ -219,27 +282,104 @@ class AgentexWorker:
         if workflow is None and workflows is None:
             raise ValueError("Either workflow or workflows must be provided")
 
+        interceptors = list(self.interceptors)
+        if worker_metrics_enabled():
+            interceptors.append(ActivitySlotMetricsInterceptor(self.activity_groups))
+        workflows = [workflow] if workflows is None else workflows
+        build_id = self.build_id or worker_build_id([*workflows, *activities])
+
+        if self.activity_tuner is not None:
+            slot_kwargs: dict[str, Any] = {
+                "tuner": WorkerTuner.create_composite(
+                    workflow_supplier=FixedSizeSlotSupplier(_DEFAULT_FIXED_SLOTS),
+                    activity_supplier=self.activity_tuner,
+                    local_activity_supplier=FixedSizeSlotSupplier(_DEFAULT_FIXED_SLOTS),
+                    nexus_supplier=FixedSizeSlotSupplier(_DEFAULT_FIXED_SLOTS),
+                )
+            }
+            max_workers = max(self.max_workers, self.activity_tuner.max_slots)
+        else:
+            slot_kwargs = {"max_concurrent_activities": self.max_concurrent_activities}
+            max_workers = self.max_workers
+
         worker = Worker(
             client=temporal_client,
             task_queue=self.task_queue,
-            activity_executor=ThreadPoolExecutor(max_workers=self.max_workers),
-            workflows=[workflow] if workflows is None else workflows,
+            activity_executor=ThreadPoolExecutor(max_workers=max_workers),
+            workflows=workflows,
             activities=activities,
             workflow_runner=UnsandboxedWorkflowRunner(),
-            max_concurrent_activities=self.max_concurrent_activities,
-            build_id=str(uuid.uuid4()),
+            build_id=build_id,
             debug_mode=debug_enabled,  # Disable deadlock detection in debug mode
-            interceptors=self.interceptors,  # Pass interceptors to Worker
+            interceptors=interceptors,  # Pass interceptors to Worker
+            **slot_kwargs,
         )
-
-        logger.info(f"Starting workers for task queue: {self.task_queue}")
-        # Eagerly set the worker status to healthy
-        self.healthy = True
-        logger.info(f"Running workers for task queue: {self.task_queue}")
-        await worker.run()
+        workers = [worker, *self._group_workers(temporal_client, activities, interceptors, build_id)]
+        route_activity_groups(self.task_queue, self.activity_groups)
+
+        # Share the tuner's sampler so the loop runs one sampling task, not two
+        sampler = self.activity_tuner.sampler if self.activity_tuner is not None else None
+        loop_monitor = EventLoopMonitor.from_env("worker", sampler=sampler)
+        if loop_monitor is not None:
+            loop_monitor.start()
+
+        # Warm shared clients before polling, so the first tasks don't pay for cold connections
+        if self.warmups:
+            await run_warmups(self.warmups, timeout=self.warmup_timeout)
+        self.readiness.mark("warmup")
+
+        queues = [(self.task_queue, True), *((group.task_queue(self.task_queue), False) for group in self.activity_groups)]
+        readiness_task = asyncio.create_task(
+            follow_workers(self.readiness, workers, temporal_client, queues, temporal_client.identity)
+        )
+        logger.info(f"Running workers for task queue: {self.task_queue} (build id {build_id})")
+        try:
+            if len(workers) == 1:
+                await worker.run()
+                return
+            async with asyncio.TaskGroup() as task_group:
+                for group_worker in workers:
+                    task_group.create_task(group_worker.run())
+        finally:
+            self.readiness.stop()
+            readiness_task.cancel()
+            if loop_monitor is not None:
+                loop_monitor.stop()
+
+    def _group_workers(
+        self,
+        temporal_client: Client,
+        activities: list[Callable],
+        interceptors: list,
+        build_id: str,
+    ) -> list[Worker]:
+        """One activity-only worker per concurrency group, on the group's task queue."""
+        by_name = {_ActivityDefinition.must_from_callable(fn).name: fn for fn in activities}
+        group_workers = []
+        for group in self.activity_groups:
+            missing = [name for name in group.activity_types if name not in by_name]
+            if missing:
+                raise ValueError(f"Activity group {group.name!r} lists unregistered activities: {missing}")
+            group_workers.append(
+                Worker(
+                    client=temporal_client,
+                    task_queue=group.task_queue(self.task_queue),
+                    activity_executor=ThreadPoolExecutor(max_workers=group.max_workers or group.max_concurrent),
+                    activities=[by_name[name] for name in group.activity_types],
+                    max_concurrent_activities=group.max_concurrent,
+                    build_id=build_id,
+                    interceptors=interceptors,
+                )
+            )
+            logger.info(
+                f"Activity group {group.name!r}: {len(group.activity_types)} activities on "
+                f"{group.task_queue(self.task_queue)}, {group.max_concurrent} slots"
+            )
+        return group_workers
 
     async def _health_check(self):
-        return web.json_response(self.healthy)
+        ready = self.readiness.ready
+        return web.json_response(ready, status=200 if ready else 503)
 
     async def start_health_check_server(self):
         if not self.health_check_server_running:
@@ -1,6 +1,7 @@
 from agentex.types.span import Span
 from agentex.lib.core.tracing.trace import Trace, AsyncTrace
 from agentex.lib.core.tracing.tracer import Tracer, AsyncTracer
+from agentex.lib.core.tracing.sampling import SpanSampler, PolicySampler
 from agentex.lib.core.tracing.span_queue import (
     AsyncSpanQueue,
     get_default_span_queue,
@@ -13,6 +14,8 @@ __all__ = [
     "Span",
     "Tracer",
     "AsyncTracer",
+    "SpanSampler",
+    "PolicySampler",
     "AsyncSpanQueue",
     "get_default_span_queue",
     "shutdown_default_span_queue",
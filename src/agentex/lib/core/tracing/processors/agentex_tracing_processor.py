@@ -8,6 +8,7 @@ from agentex.types.span import Span
 from agentex.lib.types.tracing import AgentexTracingProcessorConfig
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.adk.utils._modules.client import create_async_agentex_client
+from agentex.lib.core.tracing.processors.export_encoding import ExportBodyEncoder
 from agentex.lib.core.tracing.processors.tracing_processor_interface import (
     SyncTracingProcessor,
     AsyncTracingProcessor,
@@ -67,6 +68,28 @@ def _create_kwargs(span: Span) -> Dict[str, Any]:
     }
 
 
+def _update_body(span: Span) -> Dict[str, Any]:
+    return span.model_dump(
+        mode="json",
+        exclude={"id"},
+        exclude_defaults=True,
+        exclude_none=True,
+        exclude_unset=True,
+    )
+
+
+def _snapshot(span: Span) -> Span:
+    """Shallow copy of ``span`` that is safe to encode on a worker thread.
+
+    Other processors handling the same span event (the SGP processor tags
+    ``span.data`` with source keys) mutate ``span.data`` on the loop, so the
+    copy gets its own top-level ``data`` dict.
+    """
+    if isinstance(span.data, dict):
+        return span.model_copy(update={"data": dict(span.data)})
+    return span
+
+
 class AgentexSyncTracingProcessor(SyncTracingProcessor):
     def __init__(self, config: AgentexTracingProcessorConfig):  # noqa: ARG002
         self.client = Agentex()
@@ -150,11 +173,16 @@ class AgentexAsyncTracingProcessor(AsyncTracingProcessor):
         # env per event would let a mid-span toggle (tests, config reload) split
         # the decision. Deploy-time flag, so a single read is correct.
         self._skip_span_start = _skip_span_start_enabled()
+        # Off-loop (optionally compressed) body encoding; None keeps the
+        # client's own JSON encoding. See export_encoding.
+        self._encoder = ExportBodyEncoder.from_env()
         logger.info(
             "Agentex tracing span-start write %s (%s)",
             "disabled — end-only ingest" if self._skip_span_start else "enabled",
             _SKIP_SPAN_START_ENV,
         )
+        if self._encoder is not None:
+            logger.info("Agentex tracing export bodies encoded off-loop (compression=%s)", self._encoder.compression)
 
     def _build_client(self) -> "AsyncAgentex":
         import httpx
@@ -188,14 +216,14 @@ class AgentexAsyncTracingProcessor(AsyncTracingProcessor):
         # _skip_span_start_enabled) so each span is persisted once, on end.
         if self._skip_span_start:
             return
-        await self.client.spans.create(**_create_kwargs(span))
+        await self._create(span)
 
     @override
     async def on_span_end(self, span: Span) -> None:
         # End-only ingest: the start create was skipped, so persist the complete
         # span as a single INSERT here (a bare spans.update would 404 — no row).
         if self._skip_span_start:
-            await self.client.spans.create(**_create_kwargs(span))
+            await self._create(span)
             return
 
         update: Dict[str, Any] = {}
@@ -216,16 +244,23 @@ class AgentexAsyncTracingProcessor(AsyncTracingProcessor):
         if span.data:
             update["data"] = span.data
 
-        await self.client.spans.update(
-            span.id,
-            **span.model_dump(
-                mode="json",
-                exclude={"id"},
-                exclude_defaults=True,
-                exclude_none=True,
-                exclude_unset=True,
-            ),
-        )
+        if self._encoder is not None:
+            snapshot = _snapshot(span)
+            body = await self._encoder.encode_async(lambda: _update_body(snapshot))
+            await self.client.patch(
+                f"/spans/{span.id}", cast_to=Span, content=body.content, options={"headers": body.headers}
+            )
+            return
+
+        await self.client.spans.update(span.id, **_update_body(span))
+
+    async def _create(self, span: Span) -> None:
+        if self._encoder is None:
+            await self.client.spans.create(**_create_kwargs(span))
+            return
+        kwargs = _create_kwargs(_snapshot(span))
+        body = await self._encoder.encode_async(lambda: kwargs)
+        await self.client.post("/spans", cast_to=Span, content=body.content, options={"headers": body.headers})
 
     @override
     async def shutdown(self) -> None:
@@ -0,0 +1,132 @@
+"""Request-body encoding for the async tracing processors.
+
+By default the async processors hand span payloads to the generated API
+clients, which JSON-encode them on the event loop and send them uncompressed.
+Span bodies carry full LLM inputs and outputs, so a large batch can hold the
+loop for tens of milliseconds while it is encoded — time taken away from the
+ACP traffic served by the same loop.
+
+Setting ``AGENTEX_TRACING_EXPORT_COMPRESSION`` switches both processors to a
+pre-encoded body: the payload is JSON-encoded and compressed on a worker
+thread and sent as raw bytes with a ``Content-Encoding`` header.
+
+- ``gzip`` — compress bodies of at least
+  ``AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES`` (default 1024) bytes.
+- ``zstd`` — same, with zstd; requires the optional ``zstandard`` package and
+  falls back to gzip without it.
+- ``identity`` — encode off the loop but send uncompressed.
+
+Unset (the default) keeps the client-side encoding. The tracing backend must
+accept the chosen ``Content-Encoding``.
+"""
+
+from __future__ import annotations
+
+import os
+import gzip
+import asyncio
+from typing import Any, Literal, Callable, get_args
+from dataclasses import dataclass
+
+from agentex.lib.utils import json_codec
+from agentex.lib.utils.logging import make_logger
+
+logger = make_logger(__name__)
+
+ExportCompression = Literal["gzip", "zstd", "identity"]
+
+_COMPRESSION_ENV = "AGENTEX_TRACING_EXPORT_COMPRESSION"
+_MIN_BYTES_ENV = "AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES"
+_DEFAULT_MIN_BYTES = 1024
+
+
+def export_compression_from_env() -> ExportCompression | None:
+    """Read ``AGENTEX_TRACING_EXPORT_COMPRESSION``; ``None`` keeps client-side encoding."""
+    raw = os.environ.get(_COMPRESSION_ENV, "").strip().lower()
+    if raw in ("", "0", "false", "no", "off"):
+        return None
+    if raw not in get_args(ExportCompression):
+        logger.warning("Ignoring unknown %s=%r; expected one of %s", _COMPRESSION_ENV, raw, get_args(ExportCompression))
+        return None
+    if raw == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logger.warning("%s=zstd requires the 'zstandard' package; using gzip", _COMPRESSION_ENV)
+            return "gzip"
+    return raw  # type: ignore[return-value]
+
+
+def _min_bytes_from_env() -> int:
+    raw = os.environ.get(_MIN_BYTES_ENV)
+    if raw is None:
+        return _DEFAULT_MIN_BYTES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", _MIN_BYTES_ENV, raw)
+        return _DEFAULT_MIN_BYTES
+
+
+@dataclass(frozen=True)
+class ExportBody:
+    """An encoded request body and the headers that describe it."""
+
+    content: bytes
+    headers: dict[str, str]
+    # JSON size before compression, for logging/benchmarks
+    raw_size: int
+
+
+class ExportBodyEncoder:
+    """Encodes export payloads to (optionally compressed) JSON bytes.
+
+    Args:
+        compression: Body compression; ``"identity"`` sends plain JSON.
+        min_bytes: Smallest JSON body worth compressing. Smaller bodies are
+            sent as-is, since the compression header overhead outweighs the
+            saving.
+    """
+
+    def __init__(self, compression: ExportCompression, min_bytes: int = _DEFAULT_MIN_BYTES):
+        self.compression = compression
+        self.min_bytes = min_bytes
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ValueError("compression='zstd' requires the 'zstandard' package") from e
+
+    @classmethod
+    def from_env(cls) -> ExportBodyEncoder | None:
+        compression = export_compression_from_env()
+        if compression is None:
+            return None
+        return cls(compression, _min_bytes_from_env())
+
+    def encode(self, payload: Any) -> ExportBody:
+        """Encode ``payload`` synchronously. On the event loop use :meth:`encode_async`."""
+        data = json_codec.dumps(payload)
+        raw_size = len(data)
+        headers = {"Content-Type": "application/json"}
+        if self.compression == "identity" or raw_size < self.min_bytes:
+            return ExportBody(content=data, headers=headers, raw_size=raw_size)
+        if self.compression == "gzip":
+            # Level 5 is within a few percent of the default 9's ratio at a
+            # fraction of the CPU; span bodies are JSON and compress well either way.
+            data = gzip.compress(data, compresslevel=5)
+        else:
+            # ZstdCompressor instances are not thread-safe, so use one per call.
+            import zstandard
+
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        headers["Content-Encoding"] = self.compression
+        return ExportBody(content=data, headers=headers, raw_size=raw_size)
+
+    async def encode_async(self, build_payload: Callable[[], Any]) -> ExportBody:
+        """Build the payload and encode it on a worker thread.
+
+        ``build_payload`` runs on the worker thread too, so it must only read
+        state that nothing on the loop mutates concurrently.
+        """
+        return await asyncio.to_thread(lambda: self.encode(build_payload()))
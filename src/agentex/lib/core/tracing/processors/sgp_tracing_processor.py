@@ -9,6 +9,7 @@ import scale_gp_beta.lib.tracing as tracing
 from scale_gp_beta import SGPClient, AsyncSGPClient
 from scale_gp_beta.lib.tracing import create_span, flush_queue
 from scale_gp_beta.lib.tracing.span import Span as SGPSpan
+from scale_gp_beta.types.api_list_span import APIListSpan
 
 from agentex.types.span import Span
 from agentex.lib.types.tracing import SGPTracingProcessorConfig
@@ -16,6 +17,7 @@ from agentex.lib.utils.logging import make_logger
 from agentex.lib.core.observability import tracing_metrics_recording as _metrics
 from agentex.lib.environment_variables import EnvironmentVariables
 from agentex.lib.core.tracing.span_error import get_span_error
+from agentex.lib.core.tracing.processors.export_encoding import ExportBodyEncoder
 from agentex.lib.core.tracing.processors.tracing_processor_interface import (
     SyncTracingProcessor,
     AsyncTracingProcessor,
@@ -143,11 +145,16 @@ class SGPAsyncTracingProcessor(AsyncTracingProcessor):
             asyncio.AbstractEventLoop, AsyncSGPClient
         ] = weakref.WeakKeyDictionary()
         self.env_vars = EnvironmentVariables.refresh()
+        # Off-loop (optionally compressed) body encoding; None keeps the
+        # client's own JSON encoding. See export_encoding.
+        self._encoder = ExportBodyEncoder.from_env()
         logger.info(
             "SGP tracing span-start upsert %s (%s)",
             "disabled — end-only ingest" if _skip_span_start_enabled() else "enabled",
             _SKIP_SPAN_START_ENV,
         )
+        if self._encoder is not None:
+            logger.info("SGP tracing export bodies encoded off-loop (compression=%s)", self._encoder.compression)
 
     def _build_client(self) -> AsyncSGPClient:
         import httpx
@@ -181,6 +188,20 @@ class SGPAsyncTracingProcessor(AsyncTracingProcessor):
             self._clients_by_loop[loop] = client
         return client
 
+    async def _upsert_batch(self, client: AsyncSGPClient, sgp_spans: list[SGPSpan]) -> None:
+        if self._encoder is None:
+            await client.spans.upsert_batch(items=[s.to_request_params() for s in sgp_spans])
+            return
+        # to_request_params deep-copies each span's input/output, so it runs
+        # on the worker thread along with the JSON encoding and compression.
+        body = await self._encoder.encode_async(lambda: {"items": [s.to_request_params() for s in sgp_spans]})
+        await client.put(
+            "/v5/spans/batch",
+            cast_to=APIListSpan,
+            content=body.content,
+            options={"headers": body.headers},
+        )
+
     @override
     async def on_span_start(self, span: Span) -> None:
         await self.on_spans_start([span])
@@ -204,7 +225,7 @@ class SGPAsyncTracingProcessor(AsyncTracingProcessor):
             return
 
         sgp_spans = [_build_sgp_span(span, self.env_vars) for span in spans]
-        await client.spans.upsert_batch(items=[s.to_request_params() for s in sgp_spans])
+        await self._upsert_batch(client, sgp_spans)
         _metrics.record_export_success(
             event_type="start", span_count=len(spans), processor="sgp"
         )
@@ -223,7 +244,7 @@ class SGPAsyncTracingProcessor(AsyncTracingProcessor):
             sgp_span = _build_sgp_span(span, self.env_vars)
             sgp_span.end_time = span.end_time.isoformat()  # type: ignore[union-attr]
             sgp_spans.append(sgp_span)
-        await client.spans.upsert_batch(items=[s.to_request_params() for s in sgp_spans])
+        await self._upsert_batch(client, sgp_spans)
         _metrics.record_export_success(
             event_type="end", span_count=len(spans), processor="sgp"
         )
@@ -0,0 +1,246 @@
+"""Span sampling for the tracing pipeline.
+
+A :class:`SpanSampler` sits between ``Trace``/``AsyncTrace`` and the tracing
+processors and decides which span events are exported. Register one
+process-wide with
+:func:`~agentex.lib.core.tracing.tracing_processor_manager.set_span_sampler`;
+without a sampler every span is exported, as before.
+
+Samplers see each span twice. ``on_start`` decides whether the start event is
+emitted right away. ``on_end`` returns the events to emit when the span ends,
+which can include spans whose start was held back (their start event is
+emitted first, so processors always see start before end) or a whole buffered
+trace released by a tail decision.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+import fnmatch
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, override
+from collections import OrderedDict
+from dataclasses import field, dataclass
+
+from agentex.types.span import Span
+from agentex.lib.core.observability import tracing_metrics_recording as _metrics
+from agentex.lib.core.tracing.span_error import get_span_error
+
+
+@dataclass
+class SamplingResult:
+    """Span events to emit when a span ends, in order: all ``starts``, then all ``ends``."""
+
+    starts: list[Span] = field(default_factory=list)
+    ends: list[Span] = field(default_factory=list)
+
+
+class SpanSampler(ABC):
+    """Decides which spans reach the tracing processors."""
+
+    @abstractmethod
+    def on_start(self, span: Span) -> bool:
+        """Return whether the start event of ``span`` should be emitted now."""
+
+    @abstractmethod
+    def on_end(self, span: Span) -> SamplingResult:
+        """Return the span events to emit now that ``span`` has ended."""
+
+    def reset_after_fork(self) -> None:  # noqa: B027
+        """Drop state inherited from the parent process; called in a forked child."""
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, clock: Callable[[], float]):
+        self.rate = rate
+        # A rate of 0 drops every span; fractional rates still allow one span per 1/rate seconds.
+        self.capacity = max(1.0, rate) if rate > 0 else 0.0
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def take(self) -> bool:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+@dataclass
+class _OpenSpan:
+    emitted: bool
+    # Whether the span is the local root of its trace: it has no parent, or its
+    # parent was not started in this process (a trace continued from elsewhere).
+    local_root: bool
+
+
+class PolicySampler(SpanSampler):
+    """Head/tail sampler combining the common policies.
+
+    Args:
+        trace_sample_rate: Fraction of traces kept by head sampling. The
+            decision is a hash of the trace ID, so every span of a trace (and
+            every process handling it) agrees.
+        span_rate_limits: Maximum spans per second per span name. Keys are
+            exact names or ``fnmatch`` patterns (``"tool:*"``); exact names
+            win, otherwise the first matching pattern applies.
+        always_keep_errors: Export spans that recorded an error (see
+            :func:`~agentex.lib.core.tracing.span_error.set_span_error`) even
+            when they were sampled out.
+        tail_sampling: Instead of dropping sampled-out child spans right away,
+            buffer them until the local root span of their trace ends, then keep the whole buffered trace if any span failed
+            (with ``always_keep_errors``) or the root took at least
+            ``tail_latency_threshold`` seconds. The local root is the span
+            without a parent or, for a trace continued from another process
+            (an activity under a workflow's span, say), a span whose parent
+            was not started in this process.
+        tail_latency_threshold: Root duration in seconds that keeps a trace
+            under tail sampling. ``None`` keeps only failed traces.
+        max_buffered_traces: Traces buffered at once under tail sampling; the
+            least recently touched trace is discarded beyond this.
+        max_buffered_spans_per_trace: Spans buffered per trace; the oldest are
+            discarded beyond this. Buffered spans are deep copies, so these
+            two bound the memory tail sampling can hold.
+        max_open_spans: Started but not yet ended spans tracked at once; the
+            oldest are forgotten beyond this (their end is then treated as
+            that of a sampled-out span).
+    """
+
+    def __init__(
+        self,
+        *,
+        trace_sample_rate: float = 1.0,
+        span_rate_limits: dict[str, float] | None = None,
+        always_keep_errors: bool = True,
+        tail_sampling: bool = False,
+        tail_latency_threshold: float | None = None,
+        max_buffered_traces: int = 100,
+        max_buffered_spans_per_trace: int = 200,
+        max_open_spans: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0.0 <= trace_sample_rate <= 1.0:
+            raise ValueError(f"trace_sample_rate must be between 0 and 1, got {trace_sample_rate}")
+        self.trace_sample_rate = trace_sample_rate
+        self.always_keep_errors = always_keep_errors
+        self.tail_sampling = tail_sampling
+        self.tail_latency_threshold = tail_latency_threshold
+        self.max_buffered_traces = max_buffered_traces
+        self.max_buffered_spans_per_trace = max_buffered_spans_per_trace
+        self.max_open_spans = max_open_spans
+
+        rate_limits = span_rate_limits or {}
+        self._buckets = {name: _TokenBucket(rate, clock) for name, rate in rate_limits.items()}
+        self._patterns = [name for name in rate_limits if any(c in name for c in "*?[")]
+        self._bucket_by_name: dict[str, _TokenBucket | None] = {}
+
+        self._lock = threading.Lock()
+        # span ID -> state of spans that started and have not ended yet
+        self._open: OrderedDict[str, _OpenSpan] = OrderedDict()
+        # trace_id -> sampled-out spans awaiting the tail decision, in end order
+        self._buffers: OrderedDict[str, list[Span]] = OrderedDict()
+
+    @override
+    def reset_after_fork(self) -> None:
+        # The inherited lock may have been held by another thread at the fork,
+        # and the open spans and buffers belong to the parent's in-flight traces.
+        self._lock = threading.Lock()
+        self._open = OrderedDict()
+        self._buffers = OrderedDict()
+
+    def _head_keep(self, trace_id: str | None) -> bool:
+        if self.trace_sample_rate >= 1.0:
+            return True
+        if self.trace_sample_rate <= 0.0 or not trace_id:
+            return False
+        return zlib.crc32(trace_id.encode()) / 0xFFFFFFFF < self.trace_sample_rate
+
+    def _bucket_for(self, name: str) -> _TokenBucket | None:
+        try:
+            return self._bucket_by_name[name]
+        except KeyError:
+            pass
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            pattern = next((p for p in self._patterns if fnmatch.fnmatchcase(name, p)), None)
+            bucket = self._buckets[pattern] if pattern is not None else None
+        self._bucket_by_name[name] = bucket
+        return bucket
+
+    def _is_error(self, span: Span) -> bool:
+        return self.always_keep_errors and get_span_error(span) is not None
+
+    def _buffer(self, span: Span) -> None:
+        trace_id = span.trace_id or ""
+        spans = self._buffers.get(trace_id)
+        if spans is None:
+            spans = self._buffers[trace_id] = []
+            if len(self._buffers) > self.max_buffered_traces:
+                _, evicted = self._buffers.popitem(last=False)
+                _metrics.record_span_dropped("sampled_out", len(evicted))
+        else:
+            self._buffers.move_to_end(trace_id)
+        # Copy so later mutations by the caller don't leak into the buffered span.
+        spans.append(span.model_copy(deep=True))
+        if len(spans) > self.max_buffered_spans_per_trace:
+            del spans[0]
+            _metrics.record_span_dropped("sampled_out")
+
+    def _keep_trace(self, root: Span, buffered: list[Span]) -> bool:
+        if self._is_error(root) or any(self._is_error(s) for s in buffered):
+            return True
+        if self.tail_latency_threshold is not None and root.end_time is not None:
+            return (root.end_time - root.start_time).total_seconds() >= self.tail_latency_threshold
+        return False
+
+    @override
+    def on_start(self, span: Span) -> bool:
+        with self._lock:
+            keep = self._head_keep(span.trace_id)
+            if keep:
+                bucket = self._bucket_for(span.name)
+                keep = bucket is None or bucket.take()
+            local_root = span.parent_id is None or span.parent_id not in self._open
+            self._open[span.id] = _OpenSpan(emitted=keep, local_root=local_root)
+            if len(self._open) > self.max_open_spans:
+                self._open.popitem(last=False)
+            return keep
+
+    @override
+    def on_end(self, span: Span) -> SamplingResult:
+        result = SamplingResult()
+        with self._lock:
+            state = self._open.pop(span.id, None)
+            started = state is not None and state.emitted
+            local_root = span.parent_id is None or (state is not None and state.local_root)
+
+            if self.tail_sampling and local_root:
+                buffered = self._buffers.pop(span.trace_id or "", [])
+                keep_trace = self._keep_trace(span, buffered)
+                if keep_trace:
+                    result.starts.extend(buffered)
+                    result.ends.extend(buffered)
+                else:
+                    _metrics.record_span_dropped("sampled_out", len(buffered))
+                if started:
+                    result.ends.append(span)
+                elif keep_trace:
+                    result.starts.append(span)
+                    result.ends.append(span)
+                else:
+                    _metrics.record_span_dropped("sampled_out")
+            elif started:
+                result.ends.append(span)
+            elif self.tail_sampling:
+                self._buffer(span)
+            elif self._is_error(span):
+                result.starts.append(span)
+                result.ends.append(span)
+            else:
+                _metrics.record_span_dropped("sampled_out")
+        return result
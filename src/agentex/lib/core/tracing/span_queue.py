@@ -475,3 +475,14 @@ async def shutdown_default_span_queue(timeout: float = 30.0) -> None:
     if _default_span_queue is not None:
         await _default_span_queue.shutdown(timeout=timeout)
         _default_span_queue = None
+
+
+def _forget_default_span_queue() -> None:
+    # In a forked child the inherited queue, its drain task and the spans
+    # still in it belong to the parent, which flushes them; start a new one.
+    global _default_span_queue
+    _default_span_queue = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_default_span_queue)
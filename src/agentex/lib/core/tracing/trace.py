@@ -12,6 +12,7 @@ from agentex.types.span import Span
 from agentex.lib.utils.logging import make_logger
 from agentex.lib.utils.model_utils import recursive_model_dump
 from agentex.lib.core.tracing.obs_ids import obs_correlation
+from agentex.lib.core.tracing.sampling import SpanSampler
 from agentex.lib.core.tracing.span_error import set_span_error
 from agentex.lib.core.tracing.span_queue import (
     SpanEventType,
@@ -38,6 +39,7 @@ class Trace:
         processors: list[SyncTracingProcessor],
         client: Agentex,
         trace_id: str | None = None,
+        sampler: SpanSampler | None = None,
     ):
         """
         Initialize a new trace with the specified trace ID.
@@ -45,10 +47,12 @@ class Trace:
         Args:
             trace_id: Required trace ID to use for this trace.
             processors: Optional list of tracing processors to use for this trace.
+            sampler: Optional sampler deciding which spans reach the processors.
         """
         self.processors = processors
         self.client = client
         self.trace_id = trace_id
+        self.sampler = sampler
 
     def start_span(
         self,
@@ -99,8 +103,9 @@ class Trace:
             task_id=task_id,
         )
 
-        for processor in self.processors:
-            processor.on_span_start(span)
+        if self.processors and (self.sampler is None or self.sampler.on_start(span)):
+            for processor in self.processors:
+                processor.on_span_start(span)
 
         return span
 
@@ -124,8 +129,20 @@ class Trace:
         span.output = recursive_model_dump(span.output) if span.output else None
         span.data = recursive_model_dump(span.data) if span.data else None
 
-        for processor in self.processors:
-            processor.on_span_end(span)
+        if not self.processors:
+            return span
+        if self.sampler is None:
+            for processor in self.processors:
+                processor.on_span_end(span)
+            return span
+
+        sampled = self.sampler.on_end(span)
+        for sampled_span in sampled.starts:
+            for processor in self.processors:
+                processor.on_span_start(sampled_span)
+        for sampled_span in sampled.ends:
+            for processor in self.processors:
+                processor.on_span_end(sampled_span)
 
         return span
 
@@ -193,6 +210,7 @@ class AsyncTrace:
         client: AsyncAgentex,
         trace_id: str | None = None,
         span_queue: AsyncSpanQueue | None = None,
+        sampler: SpanSampler | None = None,
     ):
         """
         Initialize a new trace with the specified trace ID.
@@ -201,11 +219,13 @@ class AsyncTrace:
             trace_id: Required trace ID to use for this trace.
             processors: Optional list of tracing processors to use for this trace.
             span_queue: Optional span queue for background processing.
+            sampler: Optional sampler deciding which spans reach the processors.
         """
         self.processors = processors
         self.client = client
         self.trace_id = trace_id
         self._span_queue = span_queue or get_default_span_queue()
+        self.sampler = sampler
 
     async def start_span(
         self,
@@ -255,7 +275,7 @@ class AsyncTrace:
             task_id=task_id,
         )
 
-        if self.processors:
+        if self.processors and (self.sampler is None or self.sampler.on_start(span)):
             self._span_queue.enqueue(SpanEventType.START, span.model_copy(deep=True), self.processors)
 
         return span
@@ -280,8 +300,17 @@ class AsyncTrace:
         span.output = recursive_model_dump(span.output) if span.output else None
         span.data = recursive_model_dump(span.data) if span.data else None
 
-        if self.processors:
+        if not self.processors:
+            return span
+        if self.sampler is None:
             self._span_queue.enqueue(SpanEventType.END, span.model_copy(deep=True), self.processors)
+            return span
+
+        sampled = self.sampler.on_end(span)
+        for sampled_span in sampled.starts:
+            self._span_queue.enqueue(SpanEventType.START, sampled_span.model_copy(deep=True), self.processors)
+        for sampled_span in sampled.ends:
+            self._span_queue.enqueue(SpanEventType.END, sampled_span.model_copy(deep=True), self.processors)
 
         return span
 
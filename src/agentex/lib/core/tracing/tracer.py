@@ -4,6 +4,7 @@ from agentex import Agentex, AsyncAgentex
 from agentex.lib.core.tracing.trace import Trace, AsyncTrace
 from agentex.lib.core.tracing.span_queue import AsyncSpanQueue
 from agentex.lib.core.tracing.tracing_processor_manager import (
+    get_span_sampler,
     get_sync_tracing_processors,
     get_async_tracing_processors,
 )
@@ -38,6 +39,7 @@ class Tracer:
             processors=get_sync_tracing_processors(),
             client=self.client,
             trace_id=trace_id,
+            sampler=get_span_sampler(),
         )
 
 
@@ -72,4 +74,5 @@ class AsyncTracer:
             client=self.client,
             trace_id=trace_id,
             span_queue=span_queue,
+            sampler=get_span_sampler(),
         )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 from threading import Lock
 
 from agentex.lib.types.tracing import TracingProcessorConfig
+from agentex.lib.core.tracing.sampling import SpanSampler
 from agentex.lib.core.tracing.processors.sgp_tracing_processor import (
     SGPSyncTracingProcessor,
     SGPAsyncTracingProcessor,
@@ -30,11 +32,15 @@ class TracingProcessorManager:
         self.async_config_registry: dict[str, type[AsyncTracingProcessor]] = {
             "sgp": SGPAsyncTracingProcessor,
         }
+        # Configs the processors were built from, to rebuild them after a fork
+        self.processor_configs: list[TracingProcessorConfig] = []
         # Cache for processors
         self.sync_processors: list[SyncTracingProcessor] = []
         self.async_processors: list[AsyncTracingProcessor] = []
         self.lock = Lock()
         self._agentex_registered = False
+        # Optional sampler consulted by every trace; None exports every span
+        self.sampler: SpanSampler | None = None
 
     def _ensure_agentex_registered(self):
         """Lazily register agentex processors to avoid circular imports."""
@@ -54,6 +60,7 @@ class TracingProcessorManager:
             async_processor = self.async_config_registry[processor_config.type]
             self.sync_processors.append(sync_processor(processor_config))
             self.async_processors.append(async_processor(processor_config))
+            self.processor_configs.append(processor_config)
 
     def set_processor_configs(self, processor_configs: list[TracingProcessorConfig]):
         with self.lock:
@@ -66,15 +73,43 @@ class TracingProcessorManager:
     def get_async_processors(self) -> list[AsyncTracingProcessor]:
         return self.async_processors
 
+    def set_sampler(self, sampler: SpanSampler | None) -> None:
+        """Install ``sampler`` for traces created from now on, or remove it with ``None``."""
+        with self.lock:
+            self.sampler = sampler
+
+    def get_sampler(self) -> SpanSampler | None:
+        return self.sampler
+
+    def reinit_after_fork(self) -> None:
+        """Give a forked child its own lock, processors and sampler state.
+
+        The inherited lock may have been held by another thread at the fork,
+        and the inherited processors hold the parent's HTTP clients and
+        connections, so the processors are rebuilt from their configs.
+        """
+        self.lock = Lock()
+        self.sync_processors = [self.sync_config_registry[c.type](c) for c in self.processor_configs]
+        self.async_processors = [self.async_config_registry[c.type](c) for c in self.processor_configs]
+        if self.sampler is not None:
+            self.sampler.reset_after_fork()
+
 
 # Global instance
 GLOBAL_TRACING_PROCESSOR_MANAGER = TracingProcessorManager()
 
 add_tracing_processor_config = GLOBAL_TRACING_PROCESSOR_MANAGER.add_processor_config
 set_tracing_processor_configs = GLOBAL_TRACING_PROCESSOR_MANAGER.set_processor_configs
+set_span_sampler = GLOBAL_TRACING_PROCESSOR_MANAGER.set_sampler
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=GLOBAL_TRACING_PROCESSOR_MANAGER.reinit_after_fork)
 
 def get_sync_tracing_processors():
     return GLOBAL_TRACING_PROCESSOR_MANAGER.get_sync_processors()
 
 def get_async_tracing_processors():
     return GLOBAL_TRACING_PROCESSOR_MANAGER.get_async_processors()
+
+def get_span_sampler():
+    return GLOBAL_TRACING_PROCESSOR_MANAGER.get_sampler()
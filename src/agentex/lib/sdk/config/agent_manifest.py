@@ -11,15 +11,21 @@ the promoted model remains slim-safe.
 from __future__ import annotations
 
 import io
+import os
 import time
+import zlib
+import queue
 import shutil
 import tarfile
 import tempfile
+import threading
 import subprocess
-from typing import IO, Any
+from typing import IO, Any, Callable, cast
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from agentex.lib.utils.io import load_yaml_file
 from agentex.lib.utils.logging import make_logger
@@ -28,6 +34,12 @@ from agentex.lib.utils.build_provenance import iter_context_files
 
 logger = make_logger(__name__)
 
+# Raw tar bytes compressed per block; also the gzip member size in parallel mode.
+_ARCHIVE_BLOCK_BYTES = 1 << 20
+# Compressed chunks the archiver may run ahead of the reader.
+_ARCHIVE_QUEUE_CHUNKS = 8
+_COMPRESS_WORKERS_ENV = "AGENTEX_BUILD_CONTEXT_COMPRESS_WORKERS"
+
 
 def load_agent_manifest(file_path: str) -> AgentManifest:
     """Load and validate a manifest.yaml file into an AgentManifest."""
@@ -113,17 +125,36 @@ class BuildContextManager:
         ignore_patterns: list[str] | None = None,
     ) -> None:
         """
-        Copies a directory to the temporary context directory root while maintaining its relative
+        Stages a directory in the temporary context directory root while maintaining its relative
         path to the context root.
+
+        Files are hardlinked rather than copied where the filesystem allows it, so staging
+        costs one metadata operation per file instead of a full read and write. Files on
+        another device, or on filesystems without hardlinks, are copied.
         """
         directory_copy_start_time = time.time()
         last_log_time = directory_copy_start_time
+        warned_slow = False
 
-        def copy_function_with_progress(src, dst):
-            nonlocal directory_copy_start_time
+        def link_or_copy(src, dst):
+            try:
+                os.link(src, dst)
+            except FileExistsError:
+                # Staged before (the same directory added twice, or overlapping
+                # directories). Never copy over dst: it may be a hardlink, and
+                # writing through it would modify the source file it shares.
+                if os.path.samefile(src, dst):
+                    return
+                os.unlink(dst)
+                link_or_copy(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+
+        def link_or_copy_with_progress(src, dst):
             nonlocal last_log_time
-            logger.info(f"Adding {src} to build context...")
-            shutil.copy2(src, dst)
+            nonlocal warned_slow
+            logger.debug(f"Adding {src} to build context...")
+            link_or_copy(src, dst)
             current_time = time.time()
             time_elapsed = current_time - directory_copy_start_time
 
@@ -133,11 +164,12 @@ class BuildContextManager:
                     f"seconds"
                 )
                 last_log_time = current_time
-            if time_elapsed > 5:
+            if time_elapsed > 5 and not warned_slow:
                 logger.warning(
                     f"This may take a while... "
                     f"Consider adding {directory_path} or {src} to your .dockerignore file."
                 )
+                warned_slow = True
 
         directory_path_relative_to_root = directory_path.relative_to(context_root)
         all_ignore_patterns = [f"{root_path}*"]
@@ -148,7 +180,7 @@ class BuildContextManager:
             dst=root_path / directory_path_relative_to_root,
             ignore=shutil.ignore_patterns(*all_ignore_patterns),
             dirs_exist_ok=True,
-            copy_function=copy_function_with_progress,
+            copy_function=link_or_copy_with_progress,
         )
         self.directory_paths.append(directory_path_relative_to_root)
 
@@ -178,26 +210,193 @@ class BuildContextManager:
             finally:
                 pass
 
+    @staticmethod
+    def iter_archive(
+        root_path: Path | None = None,
+        *,
+        compresslevel: int = 9,
+        compress_workers: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Yields a tar.gz archive of the temporary context directory in chunks.
+
+        The archive is built on a background thread that runs at most a few
+        megabytes ahead of the consumer, so memory stays flat however large the
+        context is. With ``compress_workers`` > 1 (default: the
+        ``AGENTEX_BUILD_CONTEXT_COMPRESS_WORKERS`` env var, else 1) blocks are
+        compressed in parallel as independent gzip members, like ``pigz``; the
+        result is a valid multi-member gzip stream.
+        """
+        if not root_path:
+            raise ValueError("root_path must be provided")
+        root = Path(root_path)
+        workers = compress_workers if compress_workers is not None else _compress_workers_from_env()
+        chunks: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=_ARCHIVE_QUEUE_CHUNKS)
+        cancelled = threading.Event()
+
+        def emit(item: bytes | BaseException | None) -> None:
+            while not cancelled.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _ArchiveCancelled()
+
+        def produce() -> None:
+            writer = _GzipBlockWriter(emit, compresslevel=compresslevel, workers=workers)
+            try:
+                # Sorted, relpath-stable enumeration (shared with the content hash) so the
+                # archive's member order is deterministic across machines.
+                with tarfile.open(fileobj=cast(IO[bytes], writer), mode="w|") as tar_file:
+                    for path in iter_context_files(root):
+                        tar_file.add(path, arcname=path.relative_to(root))
+                writer.close()
+                emit(None)
+            except _ArchiveCancelled:
+                writer.abort()
+            except BaseException as error:
+                writer.abort()
+                try:
+                    emit(error)
+                except _ArchiveCancelled:
+                    pass
+
+        producer = threading.Thread(target=produce, name="build-context-archive", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            producer.join()
+
     @staticmethod
     @contextmanager
-    def zipped(root_path: Path | None = None) -> Iterator[IO[bytes]]:
+    def zipped(
+        root_path: Path | None = None,
+        *,
+        compresslevel: int = 9,
+        compress_workers: int | None = None,
+    ) -> Iterator[IO[bytes]]:
         """
         Creates a tar.gz archive of the temporary context directory
         and returns a stream of the archive.
+
+        The stream is produced lazily by :meth:`iter_archive`; copy it out with
+        ``shutil.copyfileobj`` to keep memory bounded.
         """
         if not root_path:
             raise ValueError("root_path must be provided")
 
-        tar_buffer = io.BytesIO()
+        archive = BuildContextManager.iter_archive(
+            root_path, compresslevel=compresslevel, compress_workers=compress_workers
+        )
+        with closing(archive):
+            yield cast(IO[bytes], io.BufferedReader(_ChunkStream(archive), buffer_size=_ARCHIVE_BLOCK_BYTES))
+
+
+class _ArchiveCancelled(Exception):
+    """Raised on the archiver thread when the reader has gone away."""
+
+
+def _compress_workers_from_env() -> int:
+    raw = os.environ.get(_COMPRESS_WORKERS_ENV)
+    if raw is None:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {_COMPRESS_WORKERS_ENV}={raw!r}")
+        return 1
+
 
-        # Sorted, relpath-stable enumeration (shared with the content hash) so the
-        # archive's member order is deterministic across machines.
-        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar_file:
-            for path in iter_context_files(Path(root_path)):
-                tar_file.add(path, arcname=path.relative_to(root_path))
+def _gzip_member(block: bytes, compresslevel: int) -> bytes:
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+    return compressor.compress(block) + compressor.flush()
+
+
+class _GzipBlockWriter:
+    """
+    Write-only file object for ``tarfile`` that gzips what it is given in
+    blocks and passes the compressed chunks to ``emit``.
+
+    With one worker the output is a single gzip member. With more, each block
+    is compressed on a thread pool as its own member (zlib releases the GIL),
+    and at most two blocks per worker are in flight.
+    """
 
-        tar_buffer.seek(0)  # Reset the buffer position to the beginning
-        yield tar_buffer
+    def __init__(self, emit: Callable[[bytes], None], *, compresslevel: int, workers: int):
+        self._emit = emit
+        self._compresslevel = compresslevel
+        self._pending = bytearray()
+        self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31) if workers <= 1 else None
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="build-context-gzip") if workers > 1 else None
+        self._in_flight: deque[Future[bytes]] = deque()
+        self._max_in_flight = workers * 2
+
+    def write(self, data: bytes) -> int:
+        self._pending += data
+        while len(self._pending) >= _ARCHIVE_BLOCK_BYTES:
+            block = bytes(self._pending[:_ARCHIVE_BLOCK_BYTES])
+            del self._pending[:_ARCHIVE_BLOCK_BYTES]
+            self._compress(block)
+        return len(data)
+
+    def _compress(self, block: bytes) -> None:
+        if self._compressor is not None:
+            compressed = self._compressor.compress(block)
+            if compressed:
+                self._emit(compressed)
+            return
+        assert self._pool is not None
+        self._in_flight.append(self._pool.submit(_gzip_member, block, self._compresslevel))
+        while len(self._in_flight) > self._max_in_flight:
+            self._emit(self._in_flight.popleft().result())
+
+    def close(self) -> None:
+        """Compress what is left and flush the stream."""
+        if self._pending:
+            self._compress(bytes(self._pending))
+            self._pending.clear()
+        if self._compressor is not None:
+            self._emit(self._compressor.flush())
+            return
+        assert self._pool is not None
+        while self._in_flight:
+            self._emit(self._in_flight.popleft().result())
+        self._pool.shutdown()
+
+    def abort(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _ChunkStream(io.RawIOBase):
+    """Readable raw stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._current = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._current:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._current = memoryview(chunk)
+        size = min(len(buffer), len(self._current))
+        buffer[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
 
 
 def _extract_dockerignore_patterns(dockerignore_path: Path) -> list[str]:
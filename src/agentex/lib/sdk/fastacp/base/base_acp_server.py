@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import sys
 import uuid
 import asyncio
 import inspect
@@ -26,6 +28,7 @@ from agentex.protocol.acp import (
 )
 from agentex.lib.utils.logging import make_logger, ctx_var_request_id
 from agentex.protocol.json_rpc import JSONRPCError, JSONRPCRequest, JSONRPCResponse
+from agentex.lib.utils.event_loop import uvloop_loop_factory
 from agentex.lib.utils.model_utils import BaseModel
 from agentex.lib.utils.registration import register_agent
 
@@ -39,6 +42,7 @@ from agentex.lib.sdk.fastacp.base.constants import (
     FASTACP_HEADER_SKIP_EXACT,
     FASTACP_HEADER_SKIP_PREFIXES,
 )
+from agentex.lib.core.observability.loop_monitor import EventLoopMonitor
 
 logger = make_logger(__name__)
 
@@ -115,9 +119,14 @@ class BaseACPServer(FastAPI):
             else:
                 logger.warning("AGENTEX_BASE_URL not set, skipping agent registration")
 
+            loop_monitor = EventLoopMonitor.from_env("acp")
+            if loop_monitor is not None:
+                loop_monitor.start()
             try:
                 yield
             finally:
+                if loop_monitor is not None:
+                    loop_monitor.stop()
                 await shutdown_default_span_queue()
 
         return lifespan_context
@@ -429,8 +438,63 @@ class BaseACPServer(FastAPI):
     ACP Server Lifecycle Methods
     """
 
-    def run(self, host: str = "0.0.0.0", port: int = 8000, **kwargs):
-        """Start the Uvicorn server for async handlers."""
-        uvicorn.run(self, host=host, port=port, **kwargs)
+    def run(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        *,
+        workers: int | None = None,
+        app: str | None = None,
+        use_uvloop: bool | None = None,
+        **kwargs,
+    ):
+        """Start the Uvicorn server for async handlers.
+
+        ``workers`` (default: ``WEB_CONCURRENCY``, else 1) serves from that
+        many processes. Uvicorn starts each one fresh and imports the server
+        there, so more than one needs the server's import string: ``app``
+        (e.g. ``"project.acp:acp"``), or by default the module-level name this
+        server is assigned to. Each worker runs its own lifespan, so it
+        registers the agent and flushes its own spans when it shuts down.
+
+        ``use_uvloop`` (default: ``AGENTEX_UVLOOP``) runs the server on uvloop
+        when it is installed, and on the asyncio loop otherwise, even if uvloop
+        is installed; see ``agentex.lib.utils.event_loop``. An explicit
+        ``loop`` keyword is passed to Uvicorn unchanged.
+
+        Servers started with the ``uvicorn`` CLI instead (the generated
+        Dockerfiles and the Helm chart command) do not go through this method.
+        The CLI reads ``WEB_CONCURRENCY`` too, so setting it in the
+        deployment's environment (or passing ``--workers``) serves from that
+        many processes the same way; use ``--loop`` or ``UVICORN_LOOP`` for
+        the event loop. ``agentex agents run`` always serves from one process,
+        because Uvicorn's ``--reload`` does not combine with workers.
+        """
+        if workers is None:
+            workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+        if "loop" not in kwargs:
+            # Uvicorn's own default ("auto") picks uvloop whenever it is installed
+            kwargs["loop"] = "uvloop" if uvloop_loop_factory(use_uvloop) is not None else "asyncio"
+        if workers > 1:
+            uvicorn.run(app or self._import_string(), host=host, port=port, workers=workers, **kwargs)
+        else:
+            uvicorn.run(self, host=host, port=port, **kwargs)
+
+    def _import_string(self) -> str:
+        """``module:name`` of the module-level variable holding this server."""
+        main_spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+        for module_name, module in list(sys.modules.items()):
+            if module_name == "__main__":
+                # Run as ``python -m package.module``: workers import it by that name
+                if main_spec is None:
+                    continue
+                module_name = main_spec.name
+            for name, value in list(getattr(module, "__dict__", {}).items()):
+                if value is self:
+                    return f"{module_name}:{name}"
+        raise ValueError(
+            "Serving with more than one worker needs the server's import string; "
+            "pass app='package.module:variable' to run()"
+        )
 
     
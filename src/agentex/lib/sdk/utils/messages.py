@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from typing import Any, Literal, override
+from typing import Any, Literal, Callable, override
+from datetime import datetime
+from collections import OrderedDict
 
 from agentex.types.data_content import DataContent
 from agentex.types.task_message import TaskMessage
@@ -122,6 +124,87 @@ class DefaultUnknownContentConverter(TaskMessageConverter):
         return AssistantMessage(content=fallback_content)
 
 
+# The default converters are stateless, so one instance of each serves every call.
+_DEFAULT_TEXT_CONVERTER = DefaultTextContentConverter()
+_DEFAULT_TOOL_REQUEST_CONVERTER = DefaultToolRequestConverter()
+_DEFAULT_TOOL_RESPONSE_CONVERTER = DefaultToolResponseConverter()
+_DEFAULT_DATA_CONVERTER = DefaultDataContentConverter()
+_DEFAULT_UNKNOWN_CONVERTER = DefaultUnknownContentConverter()
+
+
+class LLMMessageCache:
+    """
+    Per-task cache of converted LLM history for ``convert_task_messages_to_llm_messages``.
+
+    Agents typically convert a task's whole message history on every turn. With a
+    cache, each converted message is kept under its task and message id together
+    with its ``updated_at``, so a later call only converts messages that are new or
+    were updated since; the rest are reused.
+
+    Cached results are reused only for the same ``output_mode`` and the same
+    converter instances, so pass custom converters that are created once rather
+    than per call. Messages without an ``id`` or ``updated_at``, and messages
+    still streaming, are always converted. Beyond ``max_tasks`` tasks, the least recently converted task is
+    dropped.
+
+    The returned list is new on every call, but the messages in it are shared
+    with the cache and with earlier calls: treat them as read-only.
+    """
+
+    def __init__(self, max_tasks: int = 256):
+        self._max_tasks = max_tasks
+        # task_id -> (output mode and converters the entries were made with,
+        #             message id -> (updated_at, converted message))
+        self._tasks: OrderedDict[str, tuple[tuple[Any, ...], dict[str, tuple[datetime, Message | dict[str, Any]]]]] = (
+            OrderedDict()
+        )
+
+    def convert(
+        self,
+        task_messages: list[TaskMessage],
+        convert: Callable[[TaskMessage], Message | dict[str, Any]],
+        signature: tuple[Any, ...],
+    ) -> list[Message | dict[str, Any]]:
+        """``convert`` applied to each message, reusing results cached under ``signature``."""
+        results: list[Message | dict[str, Any]] = []
+        task_id: str | None = None
+        entries: dict[str, tuple[datetime, Message | dict[str, Any]]] = {}
+        for task_message in task_messages:
+            message_id, updated_at = task_message.id, task_message.updated_at
+            if message_id is None or updated_at is None or task_message.streaming_status == "IN_PROGRESS":
+                results.append(convert(task_message))
+                continue
+            if task_message.task_id != task_id:
+                task_id = task_message.task_id
+                entries = self._entries(task_id, signature)
+            entry = entries.get(message_id)
+            if entry is not None and entry[0] == updated_at:
+                results.append(entry[1])
+                continue
+            message = convert(task_message)
+            entries[message_id] = (updated_at, message)
+            results.append(message)
+        return results
+
+    def _entries(
+        self, task_id: str, signature: tuple[Any, ...]
+    ) -> dict[str, tuple[datetime, Message | dict[str, Any]]]:
+        cached = self._tasks.get(task_id)
+        if cached is None or cached[0] != signature:
+            cached = self._tasks[task_id] = (signature, {})
+        self._tasks.move_to_end(task_id)
+        while len(self._tasks) > self._max_tasks:
+            self._tasks.popitem(last=False)
+        return cached[1]
+
+    def clear(self, task_id: str | None = None) -> None:
+        """Forget one task's converted messages, or every task's."""
+        if task_id is None:
+            self._tasks.clear()
+        else:
+            self._tasks.pop(task_id, None)
+
+
 def convert_task_message_to_llm_messages(
     task_message: TaskMessage,
     output_mode: Literal["pydantic", "dict"] = "pydantic",
@@ -150,35 +233,15 @@ def convert_task_message_to_llm_messages(
 
     # Get the appropriate converter for this content type
     if content.type == "text":
-        converter = (
-            text_converter
-            if text_converter is not None
-            else DefaultTextContentConverter()
-        )
+        converter = text_converter if text_converter is not None else _DEFAULT_TEXT_CONVERTER
     elif content.type == "tool_request":
-        converter = (
-            tool_request_converter
-            if tool_request_converter is not None
-            else DefaultToolRequestConverter()
-        )
+        converter = tool_request_converter if tool_request_converter is not None else _DEFAULT_TOOL_REQUEST_CONVERTER
     elif content.type == "tool_response":
-        converter = (
-            tool_response_converter
-            if tool_response_converter is not None
-            else DefaultToolResponseConverter()
-        )
+        converter = tool_response_converter if tool_response_converter is not None else _DEFAULT_TOOL_RESPONSE_CONVERTER
     elif content.type == "data":
-        converter = (
-            data_converter
-            if data_converter is not None
-            else DefaultDataContentConverter()
-        )
+        converter = data_converter if data_converter is not None else _DEFAULT_DATA_CONVERTER
     else:
-        converter = (
-            unknown_converter
-            if unknown_converter is not None
-            else DefaultUnknownContentConverter()
-        )
+        converter = unknown_converter if unknown_converter is not None else _DEFAULT_UNKNOWN_CONVERTER
 
     message = converter.convert(task_message)
 
@@ -195,6 +258,7 @@ def convert_task_messages_to_llm_messages(
     tool_response_converter: TaskMessageConverter | None = None,
     data_converter: TaskMessageConverter | None = None,
     unknown_converter: TaskMessageConverter | None = None,
+    cache: LLMMessageCache | None = None,
 ) -> list[Message | dict[str, Any]]:
     """
     Convert a list of TaskMessages to LLM Message format.
@@ -207,12 +271,16 @@ def convert_task_messages_to_llm_messages(
         tool_response_converter: Optional converter for TOOL_RESPONSE content. Uses DefaultToolResponseConverter if None.
         data_converter: Optional converter for DATA content. Uses DefaultDataContentConverter if None.
         unknown_converter: Optional converter for unknown content. Uses DefaultUnknownContentConverter if None.
+        cache: Optional LLMMessageCache kept across turns. Messages already converted
+            (same id and updated_at) are reused instead of converted again; see
+            LLMMessageCache for when results are shared.
 
     Returns:
         List of either Messages (Pydantic models) or dicts
     """
-    return [
-        convert_task_message_to_llm_messages(
+
+    def convert(task_message: TaskMessage) -> Message | dict[str, Any]:
+        return convert_task_message_to_llm_messages(
             task_message,
             output_mode,
             text_converter,
@@ -221,5 +289,15 @@ def convert_task_messages_to_llm_messages(
             data_converter,
             unknown_converter,
         )
-        for task_message in task_messages
-    ]
+
+    if cache is None:
+        return [convert(task_message) for task_message in task_messages]
+    signature = (
+        output_mode,
+        text_converter,
+        tool_request_converter,
+        tool_response_converter,
+        data_converter,
+        unknown_converter,
+    )
+    return cache.convert(task_messages, convert, signature)
@@ -5,18 +5,29 @@ from __future__ import annotations
 import os
 import stat
 import hashlib
+import tempfile
 import subprocess
 from typing import Optional
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
+from agentex.lib.utils import json_codec
 from agentex.lib.utils.logging import make_logger
 
 logger = make_logger(__name__)
 
 _GIT_TIMEOUT_S = 5
 _HASH_CHUNK_BYTES = 1 << 20
+# hashlib and file reads release the GIL, so threads scale until the disk does.
+_DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Files are handed to the pool in chunks so per-task overhead doesn't swamp
+# trees of many small files.
+_HASH_CHUNK_FILES = 256
+_HASH_CHUNK_TOTAL_BYTES = 8 << 20
+_HASH_CACHE_ENV = "AGENTEX_BUILD_HASH_CACHE"
+_HASH_CACHE_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -99,7 +110,7 @@ def normalize_remote(url: Optional[str]) -> Optional[str]:
     return f"{host.lower()}{slash}{path}"
 
 
-def _sha256_file(path: Path) -> str:
+def _sha256_file(path: str | Path) -> str:
     digest = hashlib.sha256()
     with open(path, "rb") as handle:
         while chunk := handle.read(_HASH_CHUNK_BYTES):
@@ -107,34 +118,197 @@ def _sha256_file(path: Path) -> str:
     return digest.hexdigest()
 
 
+def _walk_context(root: Path, exclude_dirs: frozenset[str] = frozenset()) -> list[tuple[str, str, bool]]:
+    """``(relative posix path, absolute path, is_symlink)`` for each file and
+    symlink under ``root``, sorted by relative path.
+
+    Matches ``root.rglob("*")``: symlinked directories are listed but not
+    descended into, and unreadable directories are skipped. Directories named
+    in ``exclude_dirs`` are skipped entirely. Uses ``os.scandir`` because
+    pathlib's per-path overhead dominates on large trees.
+    """
+    found: list[tuple[str, str, bool]] = []
+    pending: list[tuple[str, str]] = [(os.path.abspath(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relpath = prefix + entry.name
+                    if entry.is_symlink():
+                        found.append((relpath, entry.path, True))
+                    elif entry.is_dir():
+                        if entry.name in exclude_dirs:
+                            continue
+                        pending.append((entry.path, relpath + "/"))
+                    elif entry.is_file():
+                        found.append((relpath, entry.path, False))
+        except PermissionError:
+            continue
+    found.sort()
+    return found
+
+
 def iter_context_files(root: Path) -> list[Path]:
     """Return files and symlinks under ``root``, sorted by POSIX relative path."""
-    return sorted(
-        (path for path in root.rglob("*") if path.is_symlink() or path.is_file()),
-        key=lambda path: path.relative_to(root).as_posix(),
-    )
+    return [root / relpath for relpath, _, _ in _walk_context(root)]
+
+
+_HashItem = tuple[int, tuple[str, os.stat_result]]
+
+
+def _chunk_by_size(items: list[_HashItem]) -> list[list[_HashItem]]:
+    chunks: list[list[_HashItem]] = []
+    current: list[_HashItem] = []
+    current_bytes = 0
+    for item in items:
+        current.append(item)
+        current_bytes += item[1][1].st_size
+        if len(current) >= _HASH_CHUNK_FILES or current_bytes >= _HASH_CHUNK_TOTAL_BYTES:
+            chunks.append(current)
+            current, current_bytes = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _hash_chunk(chunk: list[_HashItem]) -> list[tuple[int, str]]:
+    return [(index, _sha256_file(abspath)) for index, (abspath, _) in chunk]
+
+
+class FileHashCache:
+    """Persistent SHA-256 digests of files, keyed by (path, size, mtime_ns, inode).
+
+    A file whose key is unchanged since it was last hashed is not read again.
+    Loading and saving never raise: an unreadable or corrupt cache file starts
+    empty, and a failed save only logs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, list[object]] = {}
+        self._dirty = False
+        try:
+            data = json_codec.loads(path.read_bytes())
+            if data.get("version") == _HASH_CACHE_VERSION:
+                self._entries = data["entries"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.debug("build-provenance: ignoring unreadable hash cache %s", path, exc_info=True)
 
+    @classmethod
+    def default(cls) -> Optional["FileHashCache"]:
+        """The per-user cache, or None when ``AGENTEX_BUILD_HASH_CACHE`` is ``0``/``off``.
 
-def working_tree_hash(root: Path) -> str:
-    """Hash sorted build inputs, normalized modes, and symlink target strings."""
-    lines: list[str] = []
-    for path in iter_context_files(root):
-        relpath = path.relative_to(root).as_posix()
-        if path.is_symlink():
-            mode = "120000"
-            content_digest = hashlib.sha256(os.readlink(path).encode("utf-8")).hexdigest()
+        ``AGENTEX_BUILD_HASH_CACHE`` may also name the cache file; otherwise it
+        lives under ``$XDG_CACHE_HOME`` (``~/.cache``) as ``agentex/file-hashes.json``.
+        """
+        raw = os.environ.get(_HASH_CACHE_ENV, "").strip()
+        if raw.lower() in ("0", "false", "no", "off"):
+            return None
+        if raw:
+            return cls(Path(raw).expanduser())
+        try:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        except RuntimeError:  # no resolvable home directory
+            return None
+        return cls(Path(cache_home) / "agentex" / "file-hashes.json")
+
+    @staticmethod
+    def _key(st: os.stat_result) -> list[object]:
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def get(self, path: str, st: os.stat_result) -> Optional[str]:
+        entry = self._entries.get(path)
+        if entry is not None and entry[:3] == self._key(st):
+            return str(entry[3])
+        return None
+
+    def put(self, path: str, st: os.stat_result, digest: str) -> None:
+        self._entries[path] = [*self._key(st), digest]
+        self._dirty = True
+
+    def prune(self, root: str, seen: set[str]) -> None:
+        """Forget files under ``root`` that were not seen in the latest walk."""
+        prefix = root.rstrip(os.sep) + os.sep
+        stale = [path for path in self._entries if path.startswith(prefix) and path not in seen]
+        for path in stale:
+            del self._entries[path]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent build never reads a torn file.
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(json_codec.dumps({"version": _HASH_CACHE_VERSION, "entries": self._entries}))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            logger.warning("build-provenance: could not save hash cache %s", self.path, exc_info=True)
+
+
+def working_tree_hash(
+    root: Path,
+    *,
+    cache: Optional[FileHashCache] = None,
+    max_workers: Optional[int] = None,
+    exclude_dirs: frozenset[str] = frozenset(),
+) -> str:
+    """Hash sorted build inputs, normalized modes, and symlink target strings.
+
+    File contents are hashed on ``max_workers`` threads (default scales with
+    CPU count; ``1`` hashes serially). With ``cache``, files whose
+    (path, size, mtime_ns, inode) are unchanged reuse their cached digest.
+    The result does not depend on either option. Directories named in
+    ``exclude_dirs`` (e.g. ``__pycache__``) are left out of the hash.
+    """
+    entries: list[tuple[str, str]] = []
+    digests: dict[int, str] = {}
+    to_hash: dict[int, tuple[str, os.stat_result]] = {}
+    seen: set[str] = set()
+    for index, (relpath, abspath, is_symlink) in enumerate(_walk_context(root, exclude_dirs)):
+        if is_symlink:
+            entries.append((relpath, "120000"))
+            digests[index] = hashlib.sha256(os.readlink(abspath).encode("utf-8")).hexdigest()
+            continue
+        st = os.stat(abspath)
+        executable = bool(st.st_mode & stat.S_IXUSR)
+        entries.append((relpath, "100755" if executable else "100644"))
+        seen.add(abspath)
+        cached = cache.get(abspath, st) if cache is not None else None
+        if cached is not None:
+            digests[index] = cached
         else:
-            executable = bool(path.stat().st_mode & stat.S_IXUSR)
-            mode = "100755" if executable else "100644"
-            content_digest = _sha256_file(path)
-        lines.append(f"{relpath}\x00{mode}\x00{content_digest}")
+            to_hash[index] = (abspath, st)
+
+    workers = max_workers if max_workers is not None else _DEFAULT_HASH_WORKERS
+    chunks = _chunk_by_size(list(to_hash.items()))
+    if workers <= 1 or len(chunks) <= 1:
+        hashed = dict(chunk_result for chunk in chunks for chunk_result in _hash_chunk(chunk))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tree-hash") as pool:
+            hashed = dict(chunk_result for results in pool.map(_hash_chunk, chunks) for chunk_result in results)
+    digests.update(hashed)
+
+    if cache is not None:
+        for index, (abspath, st) in to_hash.items():
+            cache.put(abspath, st, hashed[index])
+        cache.prune(os.path.abspath(root), seen)
+        cache.save()
+
+    lines = [f"{relpath}\x00{mode}\x00{digests[index]}" for index, (relpath, mode) in enumerate(entries)]
     return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
 
 
 def _safe_working_tree_hash(root: Path) -> Optional[str]:
     """Compute the context hash without allowing capture to fail a build."""
     try:
-        return working_tree_hash(root)
+        return working_tree_hash(root, cache=FileHashCache.default())
     except Exception:
         logger.warning("build-provenance: content hash failed; omitting", exc_info=True)
         return None
@@ -0,0 +1,57 @@
+"""Event-loop selection for ACP servers and Temporal workers.
+
+uvloop is opt-in: pass ``use_uvloop=True`` or set ``AGENTEX_UVLOOP=1``. It is
+not a dependency of the SDK; install ``uvloop`` alongside it. When uvloop is
+requested but not installed, a warning is logged and the standard asyncio
+loop is used.
+
+This covers ``BaseACPServer.run`` and workers started with
+:func:`run_event_loop`. An ACP server started with the ``uvicorn`` CLI (as
+the generated Dockerfiles, the Helm chart command and ``agentex agents run``
+do) gets the loop uvicorn chooses: by default uvloop whenever it is
+installed. Pass ``--loop asyncio`` or ``--loop uvloop`` (or set
+``UVICORN_LOOP``) to choose there.
+"""
+
+from __future__ import annotations
+
+import os
+import asyncio
+from typing import Any, TypeVar, Callable
+from collections.abc import Coroutine
+
+from agentex.lib.utils.logging import make_logger
+
+logger = make_logger(__name__)
+
+T = TypeVar("T")
+
+_UVLOOP_ENV = "AGENTEX_UVLOOP"
+
+
+def uvloop_requested(use_uvloop: bool | None = None) -> bool:
+    """``use_uvloop`` if given, else whether ``AGENTEX_UVLOOP`` is set (default off)."""
+    if use_uvloop is not None:
+        return use_uvloop
+    return os.environ.get(_UVLOOP_ENV, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+def uvloop_loop_factory(use_uvloop: bool | None = None) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's ``new_event_loop`` if uvloop is requested and installed, else ``None`` (the asyncio default)."""
+    if not uvloop_requested(use_uvloop):
+        return None
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        logger.warning("uvloop was requested but the 'uvloop' package is not installed; using the asyncio event loop")
+        return None
+    return uvloop.new_event_loop
+
+
+def run_event_loop(main: Coroutine[Any, Any, T], *, use_uvloop: bool | None = None) -> T:
+    """``asyncio.run(main)``, on a uvloop event loop if one is requested.
+
+    For process entry points such as a worker's ``run_worker.py``; the loop
+    has to be chosen before it starts, so this replaces ``asyncio.run``.
+    """
+    return asyncio.run(main, loop_factory=uvloop_loop_factory(use_uvloop))
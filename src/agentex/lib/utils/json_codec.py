@@ -0,0 +1,83 @@
+"""Fast JSON encoding and decoding for hot paths.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Pydantic models are serialized straight to bytes by their compiled
+pydantic-core serializer, skipping the intermediate ``model_dump`` dict.
+
+Output is compact (no whitespace) and always ``bytes``; use :func:`dumps_str`
+where a ``str`` is needed. Decoding errors are raised as
+:class:`json.JSONDecodeError` on both backends, so existing
+``except json.JSONDecodeError`` handlers keep working.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+JSONDecodeError = json.JSONDecodeError
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _default(value: Any) -> Any:
+    return to_jsonable_python(value)
+
+
+def dump_model(model: BaseModel, *, exclude_none: bool = False) -> bytes:
+    """Serialize a pydantic model to JSON bytes, equivalent to ``model_dump_json().encode()``."""
+    return model.__pydantic_serializer__.to_json(model, exclude_none=exclude_none)
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes.
+
+    Values the encoder does not handle natively are passed to ``default``
+    (by default anything pydantic can serialize: models, datetimes, UUIDs,
+    enums, ...).
+    """
+    if isinstance(obj, BaseModel):
+        return dump_model(obj)
+    default = default or _default
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson rejects a few inputs the stdlib accepts (e.g. integers
+            # beyond 64 bits); fall through so behaviour matches json.dumps.
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps_str(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Like :func:`dumps`, but returns ``str``."""
+    return dumps(obj, default=default).decode()
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON from ``bytes`` or ``str``.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (NaN/Infinity literals,
+            # huge integers); retry so accepted inputs stay the same.
+            pass
+    if not isinstance(data, str):
+        # Decoding up front skips json.loads' per-call encoding detection.
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
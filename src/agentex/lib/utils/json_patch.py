@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+# A JSON Patch (RFC 6902) operation, e.g. {"op": "replace", "path": "/plan", "value": [...]}
+JsonPatchOp = dict[str, Any]
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _split_pointer(path: str) -> list[str]:
+    if not path.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer {path!r}: must start with '/'")
+    return [_unescape(token) for token in path[1:].split("/")]
+
+
+def diff_json(old: dict[str, Any], new: dict[str, Any]) -> list[JsonPatchOp]:
+    """
+    Compute a JSON Patch that turns ``old`` into ``new``.
+
+    Changes are recorded per top-level key: a key whose value differs in any
+    way is replaced as a whole. This keeps patches cheap to compute and apply
+    while still leaving unchanged fields (the bulk of a large state) out.
+    """
+    ops: list[JsonPatchOp] = []
+    for key, value in new.items():
+        if key not in old:
+            ops.append({"op": "add", "path": f"/{_escape(key)}", "value": value})
+        elif old[key] != value:
+            ops.append({"op": "replace", "path": f"/{_escape(key)}", "value": value})
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"/{_escape(key)}"})
+    return ops
+
+
+def apply_json_patch(doc: dict[str, Any], ops: list[JsonPatchOp]) -> dict[str, Any]:
+    """
+    Apply ``add``/``replace``/``remove`` JSON Patch operations to ``doc``.
+
+    ``doc`` is not modified; containers along each patched path are copied and
+    the rest of the document is shared with the result. Values from ``ops`` are
+    deep-copied into the result.
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist.
+    """
+    result = dict(doc)
+    for op in ops:
+        kind = op.get("op")
+        if kind not in ("add", "replace", "remove"):
+            raise ValueError(f"Unsupported JSON Patch operation: {kind!r}")
+        tokens = _split_pointer(op["path"])
+
+        parent: Any = result
+        for token in tokens[:-1]:
+            key: Any = int(token) if isinstance(parent, list) else token
+            if not isinstance(parent, (dict, list)) or (isinstance(parent, dict) and key not in parent):
+                raise ValueError(f"Path {op['path']!r} does not exist")
+            child = parent[key]
+            if not isinstance(child, (dict, list)):
+                raise ValueError(f"Path {op['path']!r} does not exist")
+            parent[key] = child = child.copy()
+            parent = child
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if kind == "add":
+                parent.insert(len(parent) if last == "-" else int(last), deepcopy(op["value"]))
+            elif kind == "replace":
+                parent[int(last)] = deepcopy(op["value"])
+            else:
+                del parent[int(last)]
+        elif isinstance(parent, dict):
+            if kind != "add" and last not in parent:
+                raise ValueError(f"Path {op['path']!r} does not exist")
+            if kind == "remove":
+                del parent[last]
+            else:
+                parent[last] = deepcopy(op["value"])
+        else:
+            raise ValueError(f"Path {op['path']!r} does not exist")
+    return result
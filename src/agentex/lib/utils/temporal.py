@@ -26,3 +26,11 @@ def workflow_now_if_in_workflow() -> datetime | None:
     if in_temporal_workflow():
         return workflow.now()
     return None
+
+
+def heartbeat_if_in_activity(*details: object) -> None:
+    # Unlike heartbeat_if_in_workflow, which only fires in workflow code,
+    # this heartbeats from inside a running activity, where long streams
+    # actually need it to stay within heartbeat_timeout.
+    if activity.in_activity():
+        activity.heartbeat(*details)
@@ -13,6 +13,7 @@ from ...types import agent_rpc_params, agent_list_params, agent_rpc_by_name_para
 from ..._types import NOT_GIVEN, Body, Omit, Query, Headers, NotGiven, omit, not_given
 from ..._utils import path_template, maybe_transform, async_maybe_transform
 from ..._compat import cached_property
+from ..._ndjson import NDJSONDecoder, StreamFrameStats
 from .schedules import (
     SchedulesResource,
     AsyncSchedulesResource,
@@ -609,14 +610,23 @@ class AgentsResource(SyncAPIResource):
       extra_query: Query | None = None,
       extra_body: Body | None = None,
       timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+      lenient: bool = False,
+      frame_stats: StreamFrameStats | None = None,
     ) -> Generator[SendMessageStreamResponse, None, None]:
+      """Stream a message's updates as they arrive.
+
+      Lines that are not JSON are skipped and counted in ``frame_stats``. With
+      ``lenient=True``, updates that do not match ``SendMessageStreamResponse``
+      (e.g. from an agent on a newer schema) are yielded unvalidated instead of
+      being skipped.
+      """
       if agent_id is not None and agent_name is not None:
         raise ValueError("Either agent_id or agent_name must be provided, but not both")
 
       if "stream" in params and params["stream"] == False:
         raise ValueError("If stream is set to False, use send_message() instead")
       
-      params["stream"] = True
+      params = {**params, "stream": True}
       
       if agent_id is not None:
         raw_agent_rpc_response = self.with_streaming_response.rpc(
@@ -645,25 +655,16 @@ class AgentsResource(SyncAPIResource):
       else:
         raise ValueError("Either agent_id or agent_name must be provided")
       
+      decoder = NDJSONDecoder(SendMessageStreamResponse, lenient=lenient, stats=frame_stats)
       with raw_agent_rpc_response as response:
-        for _line in response.iter_lines():
-          if not _line:
-            continue
-          line = _line.strip()
-          # Handle optional SSE-style prefix
-          if line.startswith("data:"):
-            line = line[len("data:"):].strip()
-          if not line:
-            continue
+        for line in response.iter_lines():
           try:
-            chunk_rpc_response = SendMessageStreamResponse.model_validate(
-              json.loads(line),
-              from_attributes=True
-            )
-            yield chunk_rpc_response
-          except (json.JSONDecodeError, ValidationError):
-            # Skip invalid JSON lines or lines that cannot be validated
+            chunk_rpc_response = decoder.decode(line)
+          except ValueError:
+            # Skip lines that cannot be validated (counted in decoder.stats.invalid)
             continue
+          if chunk_rpc_response is not None:
+            yield chunk_rpc_response
     
     def send_event(
       self,
@@ -1270,14 +1271,23 @@ class AsyncAgentsResource(AsyncAPIResource):
       extra_query: Query | None = None,
       extra_body: Body | None = None,
       timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+      lenient: bool = False,
+      frame_stats: StreamFrameStats | None = None,
     ) -> AsyncGenerator[SendMessageStreamResponse, None]:
+      """Stream a message's updates as they arrive.
+
+      Lines that are not JSON are skipped and counted in ``frame_stats``. With
+      ``lenient=True``, updates that do not match ``SendMessageStreamResponse``
+      (e.g. from an agent on a newer schema) are yielded unvalidated instead of
+      raising ``ValueError``.
+      """
       if agent_id is not None and agent_name is not None:
         raise ValueError("Either agent_id or agent_name must be provided, but not both")
       
       if "stream" in params and params["stream"] == False:
         raise ValueError("If stream is set to False, use send_message() instead")
       
-      params["stream"] = True
+      params = {**params, "stream": True}
       
       if agent_id is not None:
         raw_agent_rpc_response = self.with_streaming_response.rpc(
@@ -1306,27 +1316,10 @@ class AsyncAgentsResource(AsyncAPIResource):
       else:
         raise ValueError("Either agent_id or agent_name must be provided")
       
+      decoder = NDJSONDecoder(SendMessageStreamResponse, lenient=lenient, stats=frame_stats)
       async with raw_agent_rpc_response as response:
-        async for _line in response.iter_lines():
-          if not _line:
-            continue
-          line = _line.strip()
-          # Handle optional SSE-style prefix
-          if line.startswith("data:"):
-            line = line[len("data:"):].strip()
-          if not line:
-            continue
-          try:
-            chunk_rpc_response = SendMessageStreamResponse.model_validate(
-              json.loads(line),
-              from_attributes=True
-            )
-            yield chunk_rpc_response
-          except json.JSONDecodeError:
-            # Skip invalid JSON lines
-            continue
-          except ValidationError as e:
-            raise ValueError(f"Invalid SendMessageStreamResponse returned: {line}") from e
+        async for chunk_rpc_response in decoder.aiter_lines(response.iter_lines()):
+          yield chunk_rpc_response
     
     async def send_event(
       self,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Union, Optional
+from typing import List, Union, Optional, Awaitable, AsyncIterator
 from datetime import datetime
 from typing_extensions import Literal
 
@@ -32,6 +32,7 @@ from ..._response import (
     async_to_raw_response_wrapper,
     async_to_streamed_response_wrapper,
 )
+from ..._pagination import DEFAULT_PREFETCH, auto_paginate, page_number_fetcher
 from ..._base_client import make_request_options
 from ...types.task_message import TaskMessage
 from ...types.message_list_response import MessageListResponse
@@ -2059,6 +2060,43 @@ class AsyncMessagesResource(AsyncAPIResource):
             cast_to=MessageListResponse,
         )
 
+    def list_auto_paging(
+        self,
+        *,
+        task_id: str,
+        filters: Optional[str] | Omit = omit,
+        limit: int | Omit = omit,
+        order_by: Optional[str] | Omit = omit,
+        order_direction: str | Omit = omit,
+        prefetch: int = DEFAULT_PREFETCH,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncIterator[TaskMessage]:
+        """Iterate over every message of a task, across all offset-based pages.
+
+        Takes the same filters as `list()`; `limit` is the page size. The next
+        page is fetched while the current one is consumed, up to `prefetch`
+        pages ahead.
+        """
+
+        def list_page(page_number: int) -> Awaitable[MessageListResponse]:
+            return self.list(
+                task_id=task_id,
+                filters=filters,
+                limit=limit,
+                order_by=order_by,
+                order_direction=order_direction,
+                page_number=page_number,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        return auto_paginate(page_number_fetcher(list_page), 1, prefetch=prefetch)
+
     async def list_paginated(
         self,
         *,
@@ -2638,6 +2676,44 @@ class AsyncMessagesResource(AsyncAPIResource):
             cast_to=MessageListPaginatedResponse,
         )
 
+    def list_paginated_auto_paging(
+        self,
+        *,
+        task_id: str,
+        cursor: Optional[str] | Omit = omit,
+        direction: Literal["older", "newer"] | Omit = omit,
+        filters: Optional[str] | Omit = omit,
+        limit: int | Omit = omit,
+        prefetch: int = DEFAULT_PREFETCH,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncIterator[TaskMessage]:
+        """Iterate over the messages of a task by following `next_cursor` until `has_more` is false.
+
+        Takes the same arguments as `list_paginated()`; `cursor` is where to
+        start. The next page is requested as soon as the current one arrives,
+        up to `prefetch` pages ahead of the one being consumed.
+        """
+
+        async def fetch_page(page_cursor: Optional[str] | Omit) -> tuple[List[TaskMessage], Optional[str] | Omit | None]:
+            page = await self.list_paginated(
+                task_id=task_id,
+                cursor=page_cursor,
+                direction=direction,
+                filters=filters,
+                limit=limit,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+            has_more = page.has_more if page.has_more is not None else page.next_cursor is not None
+            return page.data, (page.next_cursor if has_more and page.next_cursor else None)
+
+        return auto_paginate(fetch_page, cursor, prefetch=prefetch)
+
 
 class MessagesResourceWithRawResponse:
     def __init__(self, messages: MessagesResource) -> None:
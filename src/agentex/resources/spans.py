@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Union, Iterable, Optional
+from typing import Dict, Union, Iterable, Optional, Awaitable, AsyncIterator
 from datetime import datetime
 
 import httpx
@@ -19,6 +19,7 @@ from .._response import (
     async_to_streamed_response_wrapper,
 )
 from ..types.span import Span
+from .._pagination import DEFAULT_PREFETCH, auto_paginate, page_number_fetcher
 from .._base_client import make_request_options
 from ..types.span_list_response import SpanListResponse
 
@@ -530,6 +531,43 @@ class AsyncSpansResource(AsyncAPIResource):
             cast_to=SpanListResponse,
         )
 
+    def list_auto_paging(
+        self,
+        *,
+        limit: int | Omit = omit,
+        order_by: Optional[str] | Omit = omit,
+        order_direction: str | Omit = omit,
+        task_id: Optional[str] | Omit = omit,
+        trace_id: Optional[str] | Omit = omit,
+        prefetch: int = DEFAULT_PREFETCH,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncIterator[Span]:
+        """Iterate over every span matching the filters, across all pages.
+
+        Takes the same filters as `list()`; `limit` is the page size. The next
+        page is fetched while the current one is consumed, up to `prefetch`
+        pages ahead.
+        """
+
+        def list_page(page_number: int) -> Awaitable[SpanListResponse]:
+            return self.list(
+                limit=limit,
+                order_by=order_by,
+                order_direction=order_direction,
+                page_number=page_number,
+                task_id=task_id,
+                trace_id=trace_id,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        return auto_paginate(page_number_fetcher(list_page), 1, prefetch=prefetch)
+
 
 class SpansResourceWithRawResponse:
     def __init__(self, spans: SpansResource) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Awaitable, AsyncIterator
 from typing_extensions import Literal
 
 import httpx
@@ -32,8 +32,9 @@ from .._response import (
 )
 from .._streaming import Stream, AsyncStream
 from ..types.task import Task
+from .._pagination import DEFAULT_PREFETCH, auto_paginate, page_number_fetcher
 from .._base_client import make_request_options
-from ..types.task_list_response import TaskListResponse
+from ..types.task_list_response import TaskListResponse, TaskListResponseItem
 from ..types.shared.delete_response import DeleteResponse
 from ..types.task_retrieve_response import TaskRetrieveResponse
 from ..types.task_query_workflow_response import TaskQueryWorkflowResponse
@@ -804,6 +805,52 @@ class AsyncTasksResource(AsyncAPIResource):
             cast_to=TaskListResponse,
         )
 
+    def list_auto_paging(
+        self,
+        *,
+        agent_id: Optional[str] | Omit = omit,
+        agent_name: Optional[str] | Omit = omit,
+        limit: int | Omit = omit,
+        order_by: Optional[str] | Omit = omit,
+        order_direction: str | Omit = omit,
+        relationships: List[Literal["agents"]] | Omit = omit,
+        status: Optional[
+            Literal["CANCELED", "COMPLETED", "FAILED", "RUNNING", "INTERRUPTED", "TERMINATED", "TIMED_OUT", "DELETED"]
+        ]
+        | Omit = omit,
+        task_metadata: Optional[str] | Omit = omit,
+        prefetch: int = DEFAULT_PREFETCH,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncIterator[TaskListResponseItem]:
+        """Iterate over every task matching the filters, across all pages.
+
+        Takes the same filters as `list()`; `limit` is the page size. The next
+        page is fetched while the current one is consumed, up to `prefetch`
+        pages ahead.
+        """
+
+        def list_page(page_number: int) -> Awaitable[TaskListResponse]:
+            return self.list(
+                agent_id=agent_id,
+                agent_name=agent_name,
+                limit=limit,
+                order_by=order_by,
+                order_direction=order_direction,
+                page_number=page_number,
+                relationships=relationships,
+                status=status,
+                task_metadata=task_metadata,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        return auto_paginate(page_number_fetcher(list_page), 1, prefetch=prefetch)
+
     async def delete(
         self,
         task_id: str,
@@ -0,0 +1,209 @@
+"""In-memory stand-in for the agentex ``/checkpoints`` API.
+
+Mirrors the backend's storage semantics (checkpoints, versioned channel blobs
+and insert-or-ignore / upsert pending writes) behind an ``httpx.MockTransport``
+so ``HttpCheckpointSaver`` can be exercised without a server. Every request is
+counted per path, along with the bytes sent over the wire.
+
+With ``binary=True`` the backend also speaks the msgpack transport (and, with
+``stream_lists=True``, answers ``/list`` with length-prefixed msgpack frames);
+otherwise msgpack bodies are rejected with 415 like a JSON-only server.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import base64
+import struct
+from typing import Any
+from collections import Counter
+
+import httpx
+import ormsgpack
+
+from agentex import AsyncAgentex
+
+BASE_URL = "http://checkpoints.test"
+
+
+class FakeCheckpointBackend:
+    def __init__(self, *, binary: bool = False, stream_lists: bool = False) -> None:
+        self.binary = binary
+        self.stream_lists = stream_lists
+        # (thread_id, ns) -> checkpoint_id -> row, in insertion order
+        self.checkpoints: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        # (thread_id, ns, channel, version) -> blob row
+        self.blobs: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+        # (thread_id, ns, checkpoint_id) -> (task_id, idx) -> write row
+        self.writes: dict[tuple[str, str, str], dict[tuple[str, int], dict[str, Any]]] = {}
+        self.calls: Counter[str] = Counter()
+        self.content_types: Counter[str] = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.fail_next: int | None = None
+
+    # ── transport ──
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/checkpoints")
+        self.calls[path] += 1
+        self.request_bytes += len(request.content)
+        if self.fail_next is not None:
+            status, self.fail_next = self.fail_next, None
+            return httpx.Response(status)
+
+        content_type = request.headers.get("content-type", "application/json")
+        self.content_types[content_type] += 1
+        content = request.content
+        if request.headers.get("content-encoding") == "gzip":
+            content = gzip.decompress(content)
+        if content_type == "application/msgpack":
+            if not self.binary:
+                return httpx.Response(415)
+            body = ormsgpack.unpackb(content)
+        else:
+            body = _decode_json_blobs(json.loads(content or b"{}"))
+
+        result = getattr(self, "_" + path.strip("/").replace("-", "_"))(body)
+        if result is None:
+            return httpx.Response(204)
+        accept = request.headers.get("accept", "")
+        if self.binary and path == "/list" and self.stream_lists and "application/msgpack-seq" in accept:
+            frames = [ormsgpack.packb(item) for item in result]
+            payload = b"".join(struct.pack(">I", len(f)) + f for f in frames)
+            response_type = "application/msgpack-seq"
+        elif self.binary and "application/msgpack" in accept:
+            payload = ormsgpack.packb(result)
+            response_type = "application/msgpack"
+        else:
+            payload = json.dumps(result, default=lambda b: base64.b64encode(b).decode("ascii")).encode()
+            response_type = "application/json"
+        self.response_bytes += len(payload)
+        return httpx.Response(200, content=payload, headers={"content-type": response_type})
+
+    def client(self) -> AsyncAgentex:
+        http_client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(self.handler))
+        return AsyncAgentex(base_url=BASE_URL, api_key="test", http_client=http_client)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    # ── endpoints ──
+
+    def _put(self, body: dict[str, Any]) -> dict[str, Any]:
+        thread_id, ns = body["thread_id"], body["checkpoint_ns"]
+        self.checkpoints.setdefault((thread_id, ns), {})[body["checkpoint_id"]] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": ns,
+            "checkpoint_id": body["checkpoint_id"],
+            "parent_checkpoint_id": body.get("parent_checkpoint_id"),
+            "checkpoint": body["checkpoint"],
+            "metadata": body["metadata"],
+        }
+        for blob in body["blobs"]:
+            self.blobs[(thread_id, ns, blob["channel"], blob["version"])] = blob
+        return {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": body["checkpoint_id"]}
+
+    def _put_writes(self, body: dict[str, Any]) -> None:
+        rows = self.writes.setdefault((body["thread_id"], body["checkpoint_ns"], body["checkpoint_id"]), {})
+        for w in body["writes"]:
+            key = (w["task_id"], w["idx"])
+            if body["upsert"] or key not in rows:
+                rows[key] = w
+        return None
+
+    def _get_tuple(self, body: dict[str, Any]) -> dict[str, Any] | None:
+        thread_id, ns = body["thread_id"], body["checkpoint_ns"]
+        rows = self.checkpoints.get((thread_id, ns))
+        if not rows:
+            return None
+        checkpoint_id = body.get("checkpoint_id") or next(reversed(rows))
+        row = rows.get(checkpoint_id)
+        if row is None:
+            return None
+        blobs = [
+            self.blobs[(thread_id, ns, channel, version)]
+            for channel, version in row["checkpoint"]["channel_versions"].items()
+            if (thread_id, ns, channel, version) in self.blobs
+        ]
+        writes = sorted(
+            self.writes.get((thread_id, ns, checkpoint_id), {}).values(),
+            key=lambda w: (w.get("task_path", ""), w["task_id"], w["idx"]),
+        )
+        return {**row, "blobs": blobs, "pending_writes": writes}
+
+    def _list(self, body: dict[str, Any]) -> list[dict[str, Any]]:
+        items = [
+            row
+            for (thread_id, _), rows in self.checkpoints.items()
+            if body.get("thread_id") in (None, thread_id)
+            for row in reversed(rows.values())
+        ]
+        return items[: body["limit"]] if body.get("limit") is not None else items
+
+    def _delete_thread(self, body: dict[str, Any]) -> None:
+        thread_id = body["thread_id"]
+        self.checkpoints = {k: v for k, v in self.checkpoints.items() if k[0] != thread_id}
+        self.blobs = {k: v for k, v in self.blobs.items() if k[0] != thread_id}
+        self.writes = {k: v for k, v in self.writes.items() if k[0] != thread_id}
+        return None
+
+
+def _decode_json_blobs(body: dict[str, Any]) -> dict[str, Any]:
+    """Store blobs as raw bytes regardless of the transport they arrived on."""
+    for key in ("blobs", "writes"):
+        for item in body.get(key) or []:
+            if item.get("blob") is not None:
+                item["blob"] = base64.b64decode(item["blob"])
+    return body
+
+
+async def run_graph_turn(saver: Any, thread_id: str, user_message: str, nodes: list[list[str]]) -> int:
+    """Drive ``saver`` through the checkpoint calls of one LangGraph invocation.
+
+    Replays the sequence the Pregel loop issues: load the latest checkpoint,
+    store the input checkpoint, then for every superstep record one write
+    batch per node followed by the superstep checkpoint. ``nodes`` lists the
+    node names run in each superstep. Returns the number of supersteps.
+    """
+    from langgraph.checkpoint.base import empty_checkpoint
+
+    config: dict[str, Any] = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    saved = await saver.aget_tuple(config)
+    if saved is None:
+        checkpoint = empty_checkpoint()
+        messages: list[dict[str, Any]] = []
+    else:
+        checkpoint = saved.checkpoint
+        config = saved.config
+        messages = list(checkpoint["channel_values"].get("messages", []))
+
+    def _next_checkpoint(step: int, updated: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+        from langgraph.checkpoint.base import create_checkpoint
+
+        new_versions = {}
+        channel_values = dict(checkpoint["channel_values"])
+        channel_versions = dict(checkpoint["channel_versions"])
+        for channel, value in updated.items():
+            channel_values[channel] = value
+            channel_versions[channel] = saver.get_next_version(channel_versions.get(channel), None)
+            new_versions[channel] = channel_versions[channel]
+        nxt = create_checkpoint({**checkpoint, "channel_versions": channel_versions}, None, step)
+        nxt["channel_values"] = channel_values
+        return nxt, new_versions
+
+    messages = messages + [{"role": "user", "content": user_message}]
+    checkpoint, new_versions = _next_checkpoint(-1, {"messages": messages, "step": -1})
+    config = await saver.aput(config, checkpoint, {"source": "input", "step": -1}, new_versions)
+
+    for step, superstep in enumerate(nodes):
+        for node in superstep:
+            reply = {"role": "assistant", "content": f"{node}: {user_message}"}
+            await saver.aput_writes(config, [("messages", [reply])], task_id=f"{thread_id}-{step}-{node}")
+            messages = messages + [reply]
+        checkpoint, new_versions = _next_checkpoint(step, {"messages": messages, "step": step})
+        config = await saver.aput(config, checkpoint, {"source": "loop", "step": step}, new_versions)
+
+    return len(nodes)
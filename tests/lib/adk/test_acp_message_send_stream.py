@@ -0,0 +1,335 @@
+"""Tests for streaming agent-to-agent ``message/send`` (``ACPService.message_send_stream``).
+
+Two in-process ACP apps, an orchestrator and a sub-agent, sit behind a small
+ASGI gateway that plays the Agentex server's part: it routes
+``/agents/name/{name}/rpc`` to the named app's ``/api`` and streams the reply
+straight back. The sub-agent pauses mid-reply until the test has seen its
+first delta arrive at the far end, so any buffering along the way deadlocks
+(and times out) instead of passing.
+"""
+
+from __future__ import annotations
+
+import json
+import asyncio
+from typing import Any, AsyncGenerator
+from unittest.mock import patch
+
+import httpx
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from agentex import AsyncAgentex
+from agentex.types.data_content import DataContent
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.types.task_message_delta import TextDelta
+from agentex.types.task_message_update import (
+    TaskMessageUpdate,
+    StreamTaskMessageDone,
+    StreamTaskMessageFull,
+    StreamTaskMessageDelta,
+    StreamTaskMessageStart,
+)
+from agentex.lib.core.services.adk.acp.acp import ACPService
+from agentex.lib.core.services.adk.streaming import StreamingService
+from agentex.lib.sdk.fastacp.base.base_acp_server import BaseACPServer
+from agentex.lib.core.temporal.activities.adk.acp.acp_activities import (
+    ACPActivities,
+    MessageSendStreamAutoSendParams,
+)
+
+TIMEOUT = 5
+
+
+class StreamingASGITransport(httpx.AsyncBaseTransport):
+    """Like ``httpx.ASGITransport``, but returns as soon as the app starts its
+    response and streams the body, instead of waiting for the app to finish."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        started: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": "http",
+            "path": request.url.path,
+            "raw_path": request.url.raw_path.split(b"?")[0],
+            "query_string": request.url.query,
+            "root_path": "",
+            "headers": [(key.lower(), value) for key, value in request.headers.raw],
+            "server": ("agentex.test", 80),
+            "client": ("127.0.0.1", 50000),
+        }
+        received = False
+
+        async def receive() -> dict[str, Any]:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()  # no disconnect until cancelled
+            raise AssertionError("unreachable")
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                started.set_result(message)
+            elif message["type"] == "http.response.body":
+                if message.get("body"):
+                    chunks.put_nowait(message["body"])
+                if not message.get("more_body"):
+                    chunks.put_nowait(None)
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            error = None if task.cancelled() else task.exception()
+            if not started.done():
+                started.set_exception(error or RuntimeError("app returned without a response"))
+            chunks.put_nowait(None)
+
+        app_task = asyncio.create_task(self.app(scope, receive, send))
+        app_task.add_done_callback(on_done)
+        start = await started
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self) -> AsyncGenerator[bytes, None]:
+                while (chunk := await chunks.get()) is not None:
+                    yield chunk
+
+            async def aclose(self) -> None:
+                app_task.cancel()
+
+        return httpx.Response(start["status"], headers=start.get("headers", []), stream=Body())
+
+
+def gateway(apps: dict[str, Any]) -> Any:
+    """Routes ``/agents/name/{name}/rpc`` to ``apps[name]``'s ``/api``, in the shape the Agentex server sends."""
+
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        name = scope["path"].split("/")[3]
+        message = await receive()
+        rpc = json.loads(message["body"])
+        params = rpc["params"]
+        rpc.setdefault("id", 1)
+        rpc["params"] = {
+            "agent": {
+                "id": f"{name}-id",
+                "name": name,
+                "description": name,
+                "acp_type": "sync",
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:00Z",
+            },
+            "task": {"id": params.get("task_id") or f"{name}-task"},
+            "content": params["content"],
+            "stream": params.get("stream", False),
+        }
+        body = json.dumps(rpc).encode()
+        forwarded = False
+
+        async def forward_receive() -> dict[str, Any]:
+            nonlocal forwarded
+            if forwarded:
+                return await receive()
+            forwarded = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        headers = [(k, v) for k, v in scope["headers"] if k != b"content-length"]
+        headers.append((b"content-length", str(len(body)).encode()))
+        await apps[name]({**scope, "path": "/api", "raw_path": b"/api", "headers": headers}, forward_receive, send)
+
+    return app
+
+
+def _client(app: Any) -> AsyncAgentex:
+    return AsyncAgentex(
+        base_url="http://agentex.test",
+        api_key="key",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=StreamingASGITransport(app)),
+    )
+
+
+class NullTracer:
+    class _Trace:
+        def span(self, **_kwargs: Any) -> Any:
+            return _NullSpan()
+
+    def trace(self, trace_id: str | None = None) -> Any:  # noqa: ARG002
+        return self._Trace()
+
+
+class _NullSpan:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+class RecordingStreamRepository:
+    def __init__(self) -> None:
+        self.events: list[TaskMessageUpdate] = []
+        self.first_delta = asyncio.Event()
+
+    async def send_event(self, topic: str, event: TaskMessageUpdate) -> None:  # noqa: ARG002
+        self.events.append(event)
+        if isinstance(event, StreamTaskMessageDelta):
+            self.first_delta.set()
+
+
+class FakeMessages:
+    """Stands in for ``client.messages`` on the parent task."""
+
+    def __init__(self) -> None:
+        self.created: list[TaskMessage] = []
+        self.updates: list[dict[str, Any]] = []
+
+    async def create(self, *, task_id: str, content: dict[str, Any], **_kwargs: Any) -> TaskMessage:
+        message = TaskMessage.model_validate(
+            {"id": f"pm{len(self.created)}", "task_id": task_id, "content": content, "streaming_status": "IN_PROGRESS"}
+        )
+        self.created.append(message)
+        return message
+
+    async def update(self, **kwargs: Any) -> None:
+        self.updates.append(kwargs)
+
+
+class FakeParentClient:
+    def __init__(self) -> None:
+        self.messages = FakeMessages()
+
+
+def sub_agent(release: asyncio.Event, *, fail: bool = False) -> BaseACPServer:
+    """Streams "Hel" then, once ``release`` is set, "lo"; then sends a data message in one piece."""
+    with patch.dict("os.environ", {"AGENTEX_BASE_URL": ""}):
+        app = BaseACPServer.create()
+
+    @app.on_message_send
+    async def handle(params: Any) -> AsyncGenerator[TaskMessageUpdate, None]:  # noqa: ARG001
+        yield StreamTaskMessageStart(type="start", index=0, content=TextContent(author="agent", content=""))
+        yield StreamTaskMessageDelta(type="delta", index=0, delta=TextDelta(type="text", text_delta="Hel"))
+        await release.wait()
+        if fail:
+            raise RuntimeError("sub-agent crashed")
+        yield StreamTaskMessageDelta(type="delta", index=0, delta=TextDelta(type="text", text_delta="lo"))
+        yield StreamTaskMessageDone(type="done", index=0)
+        yield StreamTaskMessageFull(type="full", index=1, content=DataContent(author="agent", data={"answer": 42}))
+
+    return app
+
+
+def orchestrator(service: ACPService) -> BaseACPServer:
+    """Delegates every message to the sub-agent and relays its updates."""
+    with patch.dict("os.environ", {"AGENTEX_BASE_URL": ""}):
+        app = BaseACPServer.create()
+
+    @app.on_message_send
+    async def handle(params: Any) -> AsyncGenerator[TaskMessageUpdate, None]:
+        async for update in service.message_send_stream(content=params.content, agent_name="sub", task_id="sub-task"):
+            yield update
+
+    return app
+
+
+PROMPT = TextContent(author="user", content="hi")
+
+
+async def test_orchestrator_relays_deltas_before_sub_agent_finishes() -> None:
+    release = asyncio.Event()
+    apps: dict[str, Any] = {"sub": sub_agent(release)}
+    router = gateway(apps)
+    apps["orchestrator"] = orchestrator(ACPService(agentex_client=_client(router), tracer=NullTracer()))  # type: ignore[arg-type]
+
+    received: list[tuple[TaskMessageUpdate, bool]] = []
+
+    async def consume() -> None:
+        async for response in _client(router).agents.send_message_stream(
+            agent_name="orchestrator", params={"content": PROMPT.model_dump()}  # type: ignore[typeddict-item]
+        ):
+            assert response.result is not None
+            received.append((response.result, release.is_set()))
+            if isinstance(response.result, StreamTaskMessageDelta):
+                release.set()
+
+    await asyncio.wait_for(consume(), TIMEOUT)
+
+    updates = [update for update, _ in received]
+    assert [u.type for u in updates] == ["start", "delta", "delta", "done", "full"]
+    assert [u.delta.text_delta for u in updates if isinstance(u, StreamTaskMessageDelta)] == ["Hel", "lo"]  # type: ignore[union-attr]
+    # the first delta made it through both hops while the sub-agent was still paused
+    assert received[1] == (updates[1], False)
+
+
+async def test_auto_send_forwards_to_parent_task_stream() -> None:
+    release = asyncio.Event()
+    router = gateway({"sub": sub_agent(release)})
+    repository = RecordingStreamRepository()
+    parent = FakeParentClient()
+    service = ACPService(
+        agentex_client=_client(router),
+        tracer=NullTracer(),  # type: ignore[arg-type]
+        streaming_service=StreamingService(agentex_client=parent, stream_repository=repository),  # type: ignore[arg-type]
+    )
+
+    send = asyncio.create_task(
+        service.message_send_stream_auto_send(parent_task_id="parent", content=PROMPT, agent_name="sub")
+    )
+    await asyncio.wait_for(repository.first_delta.wait(), TIMEOUT)
+    assert not send.done()
+    release.set()
+    forwarded = await asyncio.wait_for(send, TIMEOUT)
+
+    assert [m.id for m in forwarded] == ["pm0", "pm1"]
+    assert forwarded[0].content == TextContent(author="agent", content="Hello")
+    assert forwarded[1].content == DataContent(author="agent", data={"answer": 42})
+    assert [e.type for e in repository.events] == ["start", "delta", "delta", "done", "start", "full"]
+    assert all(e.parent_task_message.task_id == "parent" for e in repository.events)  # type: ignore[union-attr]
+    assert {u["message_id"]: u["streaming_status"] for u in parent.messages.updates} == {"pm0": "DONE", "pm1": "DONE"}
+
+
+async def test_auto_send_closes_open_messages_when_sub_agent_fails() -> None:
+    release = asyncio.Event()
+    release.set()
+    router = gateway({"sub": sub_agent(release, fail=True)})
+    parent = FakeParentClient()
+    service = ACPService(
+        agentex_client=_client(router),
+        tracer=NullTracer(),  # type: ignore[arg-type]
+        streaming_service=StreamingService(agentex_client=parent, stream_repository=RecordingStreamRepository()),  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(RuntimeError, match="sub-agent crashed"):
+        await asyncio.wait_for(
+            service.message_send_stream_auto_send(parent_task_id="parent", content=PROMPT, agent_name="sub"), TIMEOUT
+        )
+
+    assert [(u["message_id"], u["streaming_status"]) for u in parent.messages.updates] == [("pm0", "DONE")]
+
+
+async def test_activity_heartbeats_per_update() -> None:
+    release = asyncio.Event()
+    release.set()
+    router = gateway({"sub": sub_agent(release)})
+    service = ACPService(
+        agentex_client=_client(router),
+        tracer=NullTracer(),  # type: ignore[arg-type]
+        streaming_service=StreamingService(agentex_client=FakeParentClient(), stream_repository=RecordingStreamRepository()),  # type: ignore[arg-type]
+    )
+    heartbeats: list[Any] = []
+    env = ActivityEnvironment()
+    env.on_heartbeat = lambda *details: heartbeats.append(details)
+
+    forwarded = await env.run(
+        ACPActivities(acp_service=service).message_send_stream_auto_send,
+        MessageSendStreamAutoSendParams(parent_task_id="parent", content=PROMPT, agent_name="sub"),
+    )
+
+    assert len(forwarded) == 2
+    assert heartbeats.count(("message send stream update",)) == 5
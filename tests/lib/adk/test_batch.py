@@ -0,0 +1,378 @@
+"""Tests for ``adk.batch``: several ADK operations executed in one activity."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from temporalio import workflow
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Worker, Replayer, UnsandboxedWorkflowRunner
+from temporalio.testing import ActivityEnvironment, WorkflowEnvironment
+
+import agentex.lib.adk._modules.batch as _batch_mod
+from agentex.types.state import State
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.lib.adk._modules.batch import BatchModule, BatchOperationError
+from agentex.lib.adk._modules.state import StateModule
+from agentex.types.agent_task_tracker import AgentTaskTracker
+from agentex.lib.adk._modules.messages import MessagesModule
+from agentex.lib.core.services.adk.state import StateService
+from agentex.lib.core.services.adk.messages import MessagesService
+from agentex.lib.adk._modules.agent_task_tracker import AgentTaskTrackerModule
+from agentex.lib.core.services.adk.agent_task_tracker import AgentTaskTrackerService
+from agentex.lib.core.temporal.activities.adk.batch_activities import (
+    BatchActivities,
+    ExecuteBatchParams,
+    BatchOperationParams,
+    BatchOperationResult,
+)
+from agentex.lib.core.temporal.activities.adk.state_activities import StateActivities, UpdateStateParams
+from agentex.lib.core.temporal.activities.adk.messages_activities import MessagesActivities, CreateMessageParams
+from agentex.lib.core.temporal.activities.adk.agent_task_tracker_activities import (
+    AgentTaskTrackerActivities,
+    UpdateAgentTaskTrackerParams,
+)
+
+_FIXED_NOW = datetime(2026, 5, 13, 18, 30, 0, tzinfo=timezone.utc)
+
+
+def _content(text: str = "hi") -> TextContent:
+    return TextContent(author="agent", content=text, format="markdown")
+
+
+def _task_message(message_id: str = "m1") -> TaskMessage:
+    return TaskMessage(id=message_id, task_id="t1", content=_content(), streaming_status="DONE")
+
+
+def _state() -> State:
+    return State(
+        id="s1",
+        task_id="t1",
+        agent_id="a1",
+        state={"turn": 2},
+        created_at=_FIXED_NOW,
+    )
+
+
+def _tracker() -> AgentTaskTracker:
+    return AgentTaskTracker(id="tr1", agent_id="a1", task_id="t1", created_at=_FIXED_NOW, last_processed_event_id="e9")
+
+
+def _services() -> tuple[AsyncMock, AsyncMock, AsyncMock]:
+    messages_service = AsyncMock(spec=MessagesService)
+    messages_service.create_message.return_value = _task_message()
+    state_service = AsyncMock(spec=StateService)
+    state_service.update_state.return_value = _state()
+    tracker_service = AsyncMock(spec=AgentTaskTrackerService)
+    tracker_service.update_agent_task_tracker.return_value = _tracker()
+    return messages_service, state_service, tracker_service
+
+
+def _batch_activities(messages_service, state_service, tracker_service) -> BatchActivities:
+    messages_activities = MessagesActivities(messages_service=messages_service)
+    state_activities = StateActivities(state_service=state_service)
+    tracker_activities = AgentTaskTrackerActivities(agent_task_tracker_service=tracker_service)
+    return BatchActivities(
+        operations={
+            "create-message": (CreateMessageParams, messages_activities.create_message),
+            "update-state": (UpdateStateParams, state_activities.update_state),
+            "update-agent-task-tracker": (UpdateAgentTaskTrackerParams, tracker_activities.update_agent_task_tracker),
+        }
+    )
+
+
+def _batch_module(messages_service, state_service, tracker_service) -> BatchModule:
+    return BatchModule(
+        messages=MessagesModule(messages_service=messages_service),
+        state=StateModule(state_service=state_service),
+        agent_task_tracker=AgentTaskTrackerModule(agent_task_tracker_service=tracker_service),
+    )
+
+
+def _record(batch) -> tuple[Any, Any, Any]:
+    message = batch.messages.create(task_id="t1", content=_content())
+    state = batch.state.update(state_id="s1", task_id="t1", agent_id="a1", state={"turn": 2})
+    tracker = batch.agent_task_tracker.update(tracker_id="tr1", last_processed_event_id="e9")
+    return message, state, tracker
+
+
+def _operation(activity_name: str, params: Any) -> BatchOperationParams:
+    return BatchOperationParams(activity_name=activity_name, params=params.model_dump(mode="json"))
+
+
+class TestExecuteBatchActivity:
+    async def test_runs_operations_in_order_and_returns_their_results(self) -> None:
+        services = _services()
+        messages_service, state_service, tracker_service = services
+        heartbeats: list[Any] = []
+        env = ActivityEnvironment()
+        env.on_heartbeat = lambda *details: heartbeats.append(details[0])
+
+        results = await env.run(
+            _batch_activities(*services).execute_batch,
+            ExecuteBatchParams(
+                operations=[
+                    _operation("create-message", CreateMessageParams(task_id="t1", content=_content())),
+                    _operation(
+                        "update-state", UpdateStateParams(state_id="s1", task_id="t1", agent_id="a1", state={"turn": 2})
+                    ),
+                    _operation(
+                        "update-agent-task-tracker",
+                        UpdateAgentTaskTrackerParams(
+                            tracker_id="tr1", last_processed_event_id="e9", status=None, status_reason=None
+                        ),
+                    ),
+                ]
+            ),
+        )
+
+        assert [r.error_type for r in results] == [None, None, None]
+        assert TaskMessage.model_validate(results[0].value) == _task_message()
+        assert State.model_validate(results[1].value) == _state()
+        assert AgentTaskTracker.model_validate(results[2].value) == _tracker()
+        assert heartbeats == [0, 1, 2]
+        messages_service.create_message.assert_awaited_once()
+        assert state_service.update_state.await_args.kwargs["state"] == {"turn": 2}
+        assert tracker_service.update_agent_task_tracker.await_args.kwargs["last_processed_event_id"] == "e9"
+
+    async def test_errors_are_reported_per_operation(self) -> None:
+        services = _services()
+        services[1].update_state.side_effect = RuntimeError("state store down")
+
+        results = await ActivityEnvironment().run(
+            _batch_activities(*services).execute_batch,
+            ExecuteBatchParams(
+                operations=[
+                    _operation("update-state", UpdateStateParams(state_id="s1", task_id="t1", agent_id="a1", state={})),
+                    _operation("delete-task", UpdateStateParams(state_id="s1", task_id="t1", agent_id="a1", state={})),
+                    _operation("create-message", CreateMessageParams(task_id="t1", content=_content())),
+                ]
+            ),
+        )
+
+        assert results[0].error_type == "RuntimeError"
+        assert results[0].error == "state store down"
+        assert results[1].error_type == "ValueError"
+        assert "delete-task" in (results[1].error or "")
+        assert results[2].error_type is None
+        services[0].create_message.assert_awaited_once()
+
+    async def test_stop_on_error_skips_later_operations(self) -> None:
+        services = _services()
+        services[0].create_message.side_effect = RuntimeError("boom")
+
+        results = await ActivityEnvironment().run(
+            _batch_activities(*services).execute_batch,
+            ExecuteBatchParams(
+                operations=[
+                    _operation("create-message", CreateMessageParams(task_id="t1", content=_content())),
+                    _operation("update-state", UpdateStateParams(state_id="s1", task_id="t1", agent_id="a1", state={})),
+                ],
+                stop_on_error=True,
+            ),
+        )
+
+        assert results[0].error_type == "RuntimeError"
+        assert results[1].skipped
+        services[1].update_state.assert_not_awaited()
+
+
+class TestBatchInWorkflow:
+    async def _execute(self, batch, results: list[BatchOperationResult], **kwargs: Any) -> list[dict[str, Any]]:
+        calls: list[dict[str, Any]] = []
+
+        async def fake_execute_activity(**call_kwargs: Any) -> Any:
+            calls.append(call_kwargs)
+            return results
+
+        with patch.object(_batch_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _batch_mod.ActivityHelpers, "execute_activity", side_effect=fake_execute_activity
+        ):
+            await batch.execute(**kwargs)
+        return calls
+
+    async def test_operations_execute_as_one_activity(self) -> None:
+        services = _services()
+        with patch.object(_batch_mod, "workflow_now_if_in_workflow", return_value=_FIXED_NOW):
+            batch = _batch_module(*services).new()
+            message, state, tracker = _record(batch)
+            second_message = batch.messages.create(task_id="t1", content=_content("again"))
+
+        calls = await self._execute(
+            batch,
+            [
+                BatchOperationResult(value=_task_message().model_dump(mode="json")),
+                BatchOperationResult(value=_state().model_dump(mode="json")),
+                BatchOperationResult(value=_tracker().model_dump(mode="json")),
+                BatchOperationResult(value=_task_message("m2").model_dump(mode="json")),
+            ],
+            stop_on_error=True,
+        )
+
+        assert len(calls) == 1
+        request = calls[0]["request"]
+        assert calls[0]["activity_name"] == "execute-batch"
+        assert request.stop_on_error is True
+        assert [op.activity_name for op in request.operations] == [
+            "create-message",
+            "update-state",
+            "update-agent-task-tracker",
+            "create-message",
+        ]
+        # messages created in one batch keep their order at the server
+        created_at = [op.params["created_at"] for op in request.operations if op.activity_name == "create-message"]
+        assert created_at == [_FIXED_NOW.isoformat().replace("+00:00", "Z"), "2026-05-13T18:30:00.000001Z"]
+
+        assert message.result() == _task_message()
+        assert state.result() == _state()
+        assert tracker.result() == _tracker()
+        assert second_message.result().id == "m2"
+        # nothing ran outside the batch activity
+        services[0].create_message.assert_not_awaited()
+        services[1].update_state.assert_not_awaited()
+        services[2].update_agent_task_tracker.assert_not_awaited()
+
+    async def test_failed_and_skipped_operations_raise_from_result(self) -> None:
+        batch = _batch_module(*_services()).new()
+        message, state, tracker = _record(batch)
+
+        await self._execute(
+            batch,
+            [
+                BatchOperationResult(value=_task_message().model_dump(mode="json")),
+                BatchOperationResult(error_type="RuntimeError", error="state store down"),
+                BatchOperationResult(skipped=True),
+            ],
+        )
+
+        assert message.exception() is None
+        with pytest.raises(BatchOperationError, match="state store down") as exc_info:
+            state.result()
+        assert exc_info.value.error_type == "RuntimeError"
+        assert exc_info.value.activity_name == "update-state"
+        with pytest.raises(BatchOperationError, match="earlier operation"):
+            tracker.result()
+
+    async def test_empty_batch_schedules_nothing(self) -> None:
+        calls = await self._execute(_batch_module(*_services()).new(), [])
+
+        assert calls == []
+
+
+class TestBatchOutsideWorkflow:
+    async def test_operations_call_services_in_order(self) -> None:
+        services = _services()
+        services[1].update_state.side_effect = RuntimeError("state store down")
+
+        async with _batch_module(*services).new() as batch:
+            message, state, tracker = _record(batch)
+
+        assert message.result() == _task_message()
+        assert isinstance(state.exception(), RuntimeError)
+        assert tracker.result() == _tracker()
+        assert services[0].create_message.await_args.kwargs["created_at"] is None
+
+    async def test_stop_on_error(self) -> None:
+        services = _services()
+        services[0].create_message.side_effect = RuntimeError("boom")
+        batch = _batch_module(*services).new()
+        message, state, tracker = _record(batch)
+
+        await batch.execute(stop_on_error=True)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            message.result()
+        with pytest.raises(BatchOperationError):
+            state.result()
+        services[1].update_state.assert_not_awaited()
+        services[2].update_agent_task_tracker.assert_not_awaited()
+
+    async def test_result_before_execute_and_reuse(self) -> None:
+        batch = _batch_module(*_services()).new()
+        message, _, _ = _record(batch)
+
+        with pytest.raises(RuntimeError, match="not been executed"):
+            message.result()
+        await batch.execute()
+        with pytest.raises(RuntimeError, match="already been executed"):
+            await batch.execute()
+        with pytest.raises(RuntimeError, match="already been executed"):
+            batch.tasks.update(task_id="t1", task_metadata={})
+
+
+# Workflows for the end-to-end test below. They take the module as a global so
+# the workflow definitions stay importable at module scope.
+_workflow_services = _services()
+_workflow_batch = _batch_module(*_workflow_services)
+
+
+@workflow.defn(sandboxed=False)
+class BatchedWorkflow:
+    @workflow.run
+    async def run(self) -> list[str]:
+        batch = _workflow_batch.new()
+        message, state, tracker = _record(batch)
+        await batch.execute()
+        return [message.result().id, state.result().id, tracker.result().id]
+
+
+@workflow.defn(sandboxed=False)
+class SequentialWorkflow:
+    @workflow.run
+    async def run(self) -> list[str]:
+        message = await _workflow_batch._messages.create(task_id="t1", content=_content())
+        state = await _workflow_batch._state.update(state_id="s1", task_id="t1", agent_id="a1", state={"turn": 2})
+        tracker = await _workflow_batch._agent_task_tracker.update(tracker_id="tr1", last_processed_event_id="e9")
+        return [message.id, state.id, tracker.id]
+
+
+async def test_batch_schedules_one_activity_and_replays() -> None:
+    try:
+        env = await WorkflowEnvironment.start_time_skipping()
+    except RuntimeError as e:  # the test server is downloaded on first use
+        pytest.skip(f"Temporal test server unavailable: {e}")
+
+    messages_activities = MessagesActivities(messages_service=_workflow_services[0])
+    state_activities = StateActivities(state_service=_workflow_services[1])
+    tracker_activities = AgentTaskTrackerActivities(agent_task_tracker_service=_workflow_services[2])
+    activities = [
+        _batch_activities(*_workflow_services).execute_batch,
+        messages_activities.create_message,
+        state_activities.update_state,
+        tracker_activities.update_agent_task_tracker,
+    ]
+    workflows = [BatchedWorkflow, SequentialWorkflow]
+
+    async def scheduled_activities(workflow_cls: type) -> tuple[list[str], WorkflowHistory]:
+        handle = await env.client.start_workflow(
+            workflow_cls.run, id=f"batch-{uuid.uuid4()}", task_queue=task_queue, run_timeout=timedelta(seconds=30)
+        )
+        assert await handle.result() == ["m1", "s1", "tr1"]
+        history = await handle.fetch_history()
+        return [
+            e.activity_task_scheduled_event_attributes.activity_type.name
+            for e in history.events
+            if e.HasField("activity_task_scheduled_event_attributes")
+        ], history
+
+    async with env:
+        task_queue = f"batch-{uuid.uuid4()}"
+        async with Worker(
+            env.client,
+            task_queue=task_queue,
+            workflows=workflows,
+            activities=activities,
+            workflow_runner=UnsandboxedWorkflowRunner(),
+        ):
+            batched, batched_history = await scheduled_activities(BatchedWorkflow)
+            sequential, _ = await scheduled_activities(SequentialWorkflow)
+
+    assert batched == ["execute-batch"]
+    assert sequential == ["create-message", "update-state", "update-agent-task-tracker"]
+    # replaying the history issues the same commands, so the batch is deterministic
+    await Replayer(workflows=workflows, workflow_runner=UnsandboxedWorkflowRunner()).replay_workflow(batched_history)
@@ -0,0 +1,290 @@
+"""Tests for HttpCheckpointSaver's cache, write coalescing and binary transport.
+
+Runs the saver against the in-memory ``/checkpoints`` backend in
+``_checkpoint_backend`` and checks that the cached / coalesced / binary paths
+return the same tuples as the plain JSON request-per-call path while issuing
+fewer requests or bytes.
+
+NOTE: conftest.py stubs out langgraph with MagicMock for ADK package-level
+tests, so the checkpointer module is re-imported against the real package
+inside a fixture.
+"""
+
+from __future__ import annotations
+
+import sys
+import struct
+import importlib
+from typing import Any
+
+import httpx
+import pytest
+
+from ._checkpoint_backend import FakeCheckpointBackend, run_graph_turn
+
+_MODULE = "agentex.lib.adk._modules._http_checkpointer"
+
+
+@pytest.fixture()
+def checkpointer_module():
+    stub_keys = [
+        k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _MODULE
+    ]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    yield importlib.import_module(_MODULE)
+    for k in [k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _MODULE]:
+        del sys.modules[k]
+    sys.modules.update(saved)
+
+
+@pytest.fixture()
+def saver_cls(checkpointer_module):
+    return checkpointer_module.HttpCheckpointSaver
+
+
+def _config(thread_id: str) -> dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+TWO_STEP_GRAPH = [["planner"], ["researcher", "writer"]]
+
+
+class TestCheckpointCache:
+    async def test_cached_tuple_matches_backend(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        cached = saver_cls(backend.client(), cache_size=8)
+        plain = saver_cls(backend.client())
+
+        await run_graph_turn(cached, "t1", "hello", TWO_STEP_GRAPH)
+        await run_graph_turn(cached, "t1", "again", TWO_STEP_GRAPH)
+
+        from_cache = await cached.aget_tuple(_config("t1"))
+        from_backend = await plain.aget_tuple(_config("t1"))
+        assert from_cache == from_backend
+        assert len(from_cache.checkpoint["channel_values"]["messages"]) == 8
+
+    async def test_second_turn_skips_get_tuple(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8)
+
+        await run_graph_turn(saver, "t1", "hello", TWO_STEP_GRAPH)
+        assert backend.calls["/get-tuple"] == 1
+        await run_graph_turn(saver, "t1", "again", TWO_STEP_GRAPH)
+        assert backend.calls["/get-tuple"] == 1
+
+    async def test_disabled_by_default(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client())
+
+        await run_graph_turn(saver, "t1", "hello", TWO_STEP_GRAPH)
+        await run_graph_turn(saver, "t1", "again", TWO_STEP_GRAPH)
+        assert backend.calls["/get-tuple"] == 2
+        assert backend.calls["/put-writes"] == 6
+
+    async def test_pending_writes_are_cached(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8)
+        plain = saver_cls(backend.client())
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+
+        latest = await saver.aget_tuple(_config("t1"))
+        await saver.aput_writes(latest.config, [("messages", ["a"]), ("step", 1)], task_id="task-1")
+        # Non-upsert writes keep the first value for a (task_id, idx) pair.
+        await saver.aput_writes(latest.config, [("messages", ["b"])], task_id="task-1")
+        # Special channels upsert.
+        await saver.aput_writes(latest.config, [("__error__", "boom")], task_id="task-1")
+        await saver.aput_writes(latest.config, [("__error__", "bang")], task_id="task-1")
+
+        from_cache = await saver.aget_tuple(_config("t1"))
+        from_backend = await plain.aget_tuple(_config("t1"))
+        assert sorted(from_cache.pending_writes) == sorted(from_backend.pending_writes)
+        assert ("task-1", "__error__", "bang") in from_cache.pending_writes
+        assert ("task-1", "messages", ["a"]) in from_cache.pending_writes
+
+    async def test_cached_checkpoint_is_isolated_from_callers(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+
+        first = await saver.aget_tuple(_config("t1"))
+        first.checkpoint["channel_values"]["messages"].append("mutated")
+        first.checkpoint["versions_seen"]["planner"] = {"messages": "x"}
+
+        second = await saver.aget_tuple(_config("t1"))
+        assert "mutated" not in second.checkpoint["channel_values"]["messages"]
+        assert "planner" not in second.checkpoint["versions_seen"]
+
+    async def test_lru_evicts_least_recently_used_thread(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=2)
+        for thread_id in ("t1", "t2", "t3"):
+            await run_graph_turn(saver, thread_id, "hello", [["planner"]])
+
+        before = backend.calls["/get-tuple"]
+        await saver.aget_tuple(_config("t3"))
+        await saver.aget_tuple(_config("t2"))
+        assert backend.calls["/get-tuple"] == before
+        await saver.aget_tuple(_config("t1"))
+        assert backend.calls["/get-tuple"] == before + 1
+
+    async def test_explicit_checkpoint_id_bypasses_stale_entry(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+        latest = await saver.aget_tuple(_config("t1"))
+
+        parent = await saver.aget_tuple(latest.parent_config)
+        assert parent.config["configurable"]["checkpoint_id"] == latest.parent_config["configurable"]["checkpoint_id"]
+        # Fetching history does not replace the cached latest checkpoint.
+        assert (await saver.aget_tuple(_config("t1"))).config == latest.config
+
+    async def test_delete_thread_drops_cache(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+
+        await saver.adelete_thread("t1")
+        assert await saver.aget_tuple(_config("t1")) is None
+
+
+class TestWriteCoalescing:
+    async def test_one_put_writes_per_superstep(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), coalesce_writes=True)
+        plain = saver_cls(backend.client())
+
+        await run_graph_turn(saver, "t1", "hello", [["a", "b", "c"], ["d", "e"]])
+        assert backend.calls["/put-writes"] == 2
+
+        # Writes for the last superstep's parent landed before its checkpoint.
+        latest = await plain.aget_tuple(_config("t1"))
+        parent = await plain.aget_tuple(latest.parent_config)
+        assert {w[0] for w in parent.pending_writes} == {"t1-1-d", "t1-1-e"}
+
+    async def test_special_channels_flush_immediately(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), coalesce_writes=True)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+        latest = await saver.aget_tuple(_config("t1"))
+        calls = backend.calls["/put-writes"]
+
+        await saver.aput_writes(latest.config, [("messages", ["partial"])], task_id="task-1")
+        assert backend.calls["/put-writes"] == calls
+        await saver.aput_writes(latest.config, [("__interrupt__", "stop")], task_id="task-2")
+        assert backend.calls["/put-writes"] == calls + 2
+
+        stored = backend.writes[("t1", "", latest.config["configurable"]["checkpoint_id"])]
+        assert set(stored) == {("task-1", 0), ("task-2", -3)}
+
+    async def test_reads_and_flush_drain_buffer(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), coalesce_writes=True)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+        latest = await saver.aget_tuple(_config("t1"))
+
+        await saver.aput_writes(latest.config, [("messages", ["x"])], task_id="task-1")
+        tup = await saver.aget_tuple(_config("t1"))
+        assert ("task-1", "messages", ["x"]) in tup.pending_writes
+
+        await saver.aput_writes(latest.config, [("messages", ["y"])], task_id="task-2")
+        await saver.aflush()
+        assert ("task-2", 0) in backend.writes[("t1", "", latest.config["configurable"]["checkpoint_id"])]
+
+    async def test_failed_flush_invalidates_cache(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), cache_size=8, coalesce_writes=True)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+        latest = await saver.aget_tuple(_config("t1"))
+
+        await saver.aput_writes(latest.config, [("messages", ["lost"])], task_id="task-1")
+        backend.fail_next = 500
+        with pytest.raises(httpx.HTTPStatusError):
+            await saver.aflush()
+
+        before = backend.calls["/get-tuple"]
+        tup = await saver.aget_tuple(_config("t1"))
+        assert backend.calls["/get-tuple"] == before + 1
+        assert ("task-1", "messages", ["lost"]) not in tup.pending_writes
+
+
+class TestBinaryTransport:
+    async def test_round_trip_matches_json(self, saver_cls):
+        json_backend = FakeCheckpointBackend()
+        binary_backend = FakeCheckpointBackend(binary=True)
+        json_saver = saver_cls(json_backend.client())
+        binary_saver = saver_cls(binary_backend.client(), binary_transport=True)
+
+        for saver in (json_saver, binary_saver):
+            await run_graph_turn(saver, "t1", "hello " * 500, TWO_STEP_GRAPH)
+            latest = await saver.aget_tuple(_config("t1"))
+            await saver.aput_writes(latest.config, [("messages", ["pending"])], task_id="task-1")
+
+        from_binary = await binary_saver.aget_tuple(_config("t1"))
+        from_json = await json_saver.aget_tuple(_config("t1"))
+        assert from_binary.checkpoint["channel_values"] == from_json.checkpoint["channel_values"]
+        assert from_binary.pending_writes == from_json.pending_writes
+        assert set(binary_backend.content_types) == {"application/msgpack"}
+        assert binary_backend.request_bytes < json_backend.request_bytes
+        assert binary_backend.response_bytes < json_backend.response_bytes
+
+    async def test_falls_back_to_json_when_rejected(self, saver_cls):
+        backend = FakeCheckpointBackend()
+        saver = saver_cls(backend.client(), binary_transport=True)
+        plain = saver_cls(backend.client())
+
+        await run_graph_turn(saver, "t1", "hello", TWO_STEP_GRAPH)
+        # Only the first request was attempted as msgpack.
+        assert backend.content_types["application/msgpack"] == 1
+        assert await saver.aget_tuple(_config("t1")) == await plain.aget_tuple(_config("t1"))
+
+    async def test_rejection_after_acceptance_is_an_error(self, saver_cls):
+        backend = FakeCheckpointBackend(binary=True)
+        saver = saver_cls(backend.client(), binary_transport=True)
+        await run_graph_turn(saver, "t1", "hello", [["planner"]])
+
+        backend.fail_next = 422
+        with pytest.raises(httpx.HTTPStatusError):
+            await saver.aget_tuple(_config("t1"))
+
+    async def test_gzip_compression_above_threshold(self, saver_cls):
+        backend = FakeCheckpointBackend(binary=True)
+        compressed = saver_cls(backend.client(), binary_transport=True, compression="gzip", compression_threshold=1024)
+        plain_backend = FakeCheckpointBackend(binary=True)
+        plain = saver_cls(plain_backend.client(), binary_transport=True)
+
+        for saver in (compressed, plain):
+            await run_graph_turn(saver, "t1", "x" * 50_000, [["planner"]])
+        assert backend.request_bytes < plain_backend.request_bytes / 10
+        latest = await compressed.aget_tuple(_config("t1"))
+        assert latest.checkpoint["channel_values"]["messages"][0]["content"] == "x" * 50_000
+
+    def test_zstd_requires_zstandard(self, saver_cls, monkeypatch):
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ValueError, match="zstandard"):
+            saver_cls(FakeCheckpointBackend().client(), compression="zstd")
+
+    @pytest.mark.parametrize("stream_lists", [False, True], ids=["msgpack", "msgpack-seq"])
+    async def test_alist_matches_json(self, saver_cls, stream_lists):
+        backend = FakeCheckpointBackend(binary=True, stream_lists=stream_lists)
+        saver = saver_cls(backend.client(), binary_transport=True)
+        plain = saver_cls(backend.client())
+        await run_graph_turn(saver, "t1", "hello", TWO_STEP_GRAPH)
+
+        binary_items = [t async for t in saver.alist(_config("t1"))]
+        json_items = [t async for t in plain.alist(_config("t1"))]
+        assert binary_items == json_items
+        assert len(binary_items) == 3
+
+    def test_iter_frames_handles_partial_chunks(self, checkpointer_module):
+        import ormsgpack
+
+        items = [{"checkpoint_id": str(i), "blob": bytes([i]) * i} for i in range(1, 6)]
+        stream = b"".join(struct.pack(">I", len(f)) + f for f in (ormsgpack.packb(item) for item in items))
+
+        buffer = bytearray()
+        decoded: list[Any] = []
+        for i in range(0, len(stream), 3):
+            buffer += stream[i : i + 3]
+            decoded.extend(checkpointer_module._iter_frames(buffer))
+        assert decoded == items
+        assert not buffer
@@ -0,0 +1,125 @@
+"""
+Manual benchmark for HttpCheckpointSaver checkpoint traffic.
+
+Replays a multi-node LangGraph conversation (fan-out supersteps, growing
+message history) against the in-memory ``/checkpoints`` backend and reports
+HTTP calls per graph step with and without the checkpoint cache and write
+coalescing, and bytes on the wire for the JSON and binary transports.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/adk/test_http_checkpointer_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import importlib
+
+import pytest
+
+from ._checkpoint_backend import FakeCheckpointBackend, run_graph_turn
+
+N_THREADS = 20
+TURNS_PER_THREAD = 25
+# planner -> (researcher, coder, critic) in parallel -> writer
+GRAPH = [["planner"], ["researcher", "coder", "critic"], ["writer"]]
+
+_MODULE = "agentex.lib.adk._modules._http_checkpointer"
+
+
+@pytest.fixture()
+def saver_cls():
+    stub_keys = [
+        k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _MODULE
+    ]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    module = importlib.import_module(_MODULE)
+    yield module.HttpCheckpointSaver
+    for k in [k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _MODULE]:
+        del sys.modules[k]
+    sys.modules.update(saved)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestHttpCheckpointerLoad:
+    async def test_calls_per_step(self, saver_cls):
+        configs = {
+            "baseline": {},
+            "cache": {"cache_size": N_THREADS},
+            "coalesce": {"coalesce_writes": True},
+            "cache+coalesce": {"cache_size": N_THREADS, "coalesce_writes": True},
+        }
+        results: dict[str, tuple[int, int, float, dict[str, int]]] = {}
+
+        for label, kwargs in configs.items():
+            backend = FakeCheckpointBackend()
+            saver = saver_cls(backend.client(), **kwargs)
+            steps = 0
+            t_start = time.monotonic()
+            for turn in range(TURNS_PER_THREAD):
+                for thread in range(N_THREADS):
+                    steps += await run_graph_turn(saver, f"thread-{thread}", f"turn {turn}", GRAPH)
+            elapsed = time.monotonic() - t_start
+            results[label] = (backend.total_calls, steps, elapsed, dict(backend.calls))
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 72}")
+        print(f" Checkpoint traffic: {N_THREADS} threads x {TURNS_PER_THREAD} turns,"
+              f" supersteps={[len(s) for s in GRAPH]}")
+        print(f"{'=' * 72}")
+        print(f" {'mode':<16}{'calls':>8}{'calls/step':>12}{'get-tuple':>11}{'put':>7}{'put-writes':>12}{'time':>9}")
+        for label, (calls, steps, elapsed, by_path) in results.items():
+            print(
+                f" {label:<16}{calls:>8,}{calls / steps:>12.2f}{by_path.get('/get-tuple', 0):>11,}"
+                f"{by_path.get('/put', 0):>7,}{by_path.get('/put-writes', 0):>12,}{elapsed:>8.2f}s"
+            )
+        print(f"{'=' * 72}")
+        print()
+
+        baseline_calls = results["baseline"][0]
+        assert results["cache+coalesce"][0] < baseline_calls
+
+    async def test_bytes_on_wire(self, saver_cls):
+        turns = 40
+        configs = {
+            "json": ({}, {}),
+            "binary": ({"binary": True}, {"binary_transport": True}),
+            "binary+gzip": ({"binary": True}, {"binary_transport": True, "compression": "gzip"}),
+        }
+        results: dict[str, tuple[int, int, float]] = {}
+
+        for label, (backend_kwargs, saver_kwargs) in configs.items():
+            backend = FakeCheckpointBackend(**backend_kwargs)
+            saver = saver_cls(backend.client(), compression_threshold=4096, **saver_kwargs)
+            t_start = time.monotonic()
+            for turn in range(turns):
+                # ~2 KB user messages so the message history blob grows every turn
+                await run_graph_turn(saver, "thread-0", f"turn {turn} " + "lorem ipsum " * 170, GRAPH)
+            elapsed = time.monotonic() - t_start
+            results[label] = (backend.request_bytes, backend.response_bytes, elapsed)
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 64}")
+        print(f" Checkpoint wire size: 1 thread x {turns} turns, growing history")
+        print(f"{'=' * 64}")
+        print(f" {'mode':<14}{'sent MB':>10}{'received MB':>14}{'vs json':>10}{'time':>10}")
+        json_sent = results["json"][0]
+        for label, (sent, received, elapsed) in results.items():
+            print(
+                f" {label:<14}{sent / 1e6:>10.2f}{received / 1e6:>14.2f}"
+                f"{sent / json_sent:>9.0%}{elapsed:>9.2f}s"
+            )
+        print(f"{'=' * 64}")
+        print()
+
+        assert results["binary"][0] < json_sent
@@ -0,0 +1,154 @@
+"""Tests for ``emit_langgraph_messages`` batching.
+
+Runs the helper against a real ``AsyncAgentex`` client on an
+``httpx.MockTransport`` that records every request, so the tests see the
+HTTP round trips a graph step actually costs.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import logging
+from typing import Any
+from unittest.mock import Mock, AsyncMock
+
+import httpx
+import pytest
+
+from agentex import AsyncAgentex
+from agentex.lib import adk
+from agentex.lib.adk._modules.messages import MessagesModule
+from agentex.lib.core.services.adk.messages import MessagesService
+from agentex.lib.adk._modules._langgraph_sync import emit_langgraph_messages
+
+
+@pytest.fixture(autouse=True)
+def _real_langchain_core():
+    """Remove conftest MagicMock stubs so real langchain_core types are used."""
+    stub_keys = [k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph")]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    import importlib
+
+    importlib.import_module("langchain_core.messages")
+    yield
+    sys.modules.update(saved)
+
+
+def _task_message(i: int, content: dict[str, Any]) -> dict[str, Any]:
+    return {"id": f"m{i}", "task_id": "t1", "content": content, "streaming_status": "DONE"}
+
+
+class _Backend:
+    """Mock transport handler that records requests and can reject messages."""
+
+    def __init__(self, *, batch_status: int | None = None, reject_content: str | None = None):
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+        self.batch_status = batch_status
+        self.reject_content = reject_content
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append((request.url.path, body))
+        if request.url.path == "/messages/batch":
+            if self.batch_status is not None:
+                return httpx.Response(self.batch_status, json={"detail": "batch failed"})
+            return httpx.Response(200, json=[_task_message(i, c) for i, c in enumerate(body["contents"])])
+        if self.reject_content is not None and body["content"].get("content") == self.reject_content:
+            return httpx.Response(422, json={"detail": "rejected"})
+        return httpx.Response(200, json=_task_message(len(self.requests), body["content"]))
+
+
+@pytest.fixture()
+def backend(monkeypatch) -> _Backend:
+    backend = _Backend()
+    client = AsyncAgentex(
+        base_url="http://agentex.test",
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(backend)),
+    )
+    trace = Mock()
+    trace.span.return_value.__aenter__ = AsyncMock(return_value=None)
+    trace.span.return_value.__aexit__ = AsyncMock(return_value=None)
+    tracer = Mock()
+    tracer.trace.return_value = trace
+    service = MessagesService(agentex_client=client, streaming_service=AsyncMock(), tracer=tracer)
+    monkeypatch.setattr(adk, "messages", MessagesModule(messages_service=service))
+    return backend
+
+
+def _graph_step() -> list[Any]:
+    from langchain_core.messages import AIMessage, ToolMessage
+
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[
+                {"id": "c1", "name": "search", "args": {"q": "a"}},
+                {"id": "c2", "name": "lookup", "args": {"id": 7}},
+            ],
+        ),
+        ToolMessage(content="result a", tool_call_id="c1", name="search"),
+        ToolMessage(content="result b", tool_call_id="c2", name="lookup"),
+        AIMessage(content=[{"type": "text", "text": "Done."}]),
+    ]
+
+
+class TestEmitLangGraphMessages:
+    async def test_step_is_persisted_in_one_batched_request(self, backend):
+        final_text = await emit_langgraph_messages(_graph_step(), "t1")
+
+        assert final_text == "Done."
+        assert [path for path, _ in backend.requests] == ["/messages/batch"]
+        contents = backend.requests[0][1]["contents"]
+        assert [(c["type"], c.get("tool_call_id") or c.get("content")) for c in contents] == [
+            ("tool_request", "c1"),
+            ("tool_request", "c2"),
+            ("tool_response", "c1"),
+            ("tool_response", "c2"),
+            ("text", "Done."),
+        ]
+
+    async def test_no_messages_means_no_requests(self, backend):
+        from langchain_core.messages import HumanMessage
+
+        assert await emit_langgraph_messages([HumanMessage(content="hi")], "t1") == ""
+        assert backend.requests == []
+
+    async def test_rejected_batch_falls_back_to_per_message_errors(self, backend, caplog):
+        from agentex import UnprocessableEntityError
+
+        backend.batch_status = 422
+        backend.reject_content = "result b"
+
+        with caplog.at_level(logging.ERROR), pytest.raises(UnprocessableEntityError):
+            await emit_langgraph_messages(_graph_step(), "t1")
+
+        # batch attempt, then one request per message up to the rejected one
+        assert [path for path, _ in backend.requests] == ["/messages/batch"] + ["/messages"] * 4
+        assert [body["content"]["type"] for _, body in backend.requests[1:]] == [
+            "tool_request",
+            "tool_request",
+            "tool_response",
+            "tool_response",
+        ]
+        assert "Failed to emit LangGraph message 4/5 (tool_response) on task t1" in caplog.text
+
+    @pytest.mark.parametrize("batch_status", [404, 405])
+    async def test_missing_batch_endpoint_falls_back_to_single_messages(self, backend, batch_status):
+        backend.batch_status = batch_status
+
+        assert await emit_langgraph_messages(_graph_step(), "t1") == "Done."
+        assert [path for path, _ in backend.requests] == ["/messages/batch"] + ["/messages"] * 5
+
+    async def test_server_error_is_not_retried_per_message(self, backend):
+        from agentex import InternalServerError
+
+        backend.batch_status = 500
+
+        with pytest.raises(InternalServerError):
+            await emit_langgraph_messages(_graph_step(), "t1")
+
+        # the batch may have been written; re-sending it one by one would duplicate it
+        assert [path for path, _ in backend.requests] == ["/messages/batch"]
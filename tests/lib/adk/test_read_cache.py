@@ -0,0 +1,341 @@
+"""Tests for single-flight and TTL caching of the hot ADK reads (``ReadCache``)."""
+
+from __future__ import annotations
+
+import json
+import asyncio
+from typing import Any
+from collections import Counter
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from agentex import AsyncAgentex
+from agentex.lib.core.services.adk.state import StateService
+from agentex.lib.core.services.adk.tasks import TasksService
+from agentex.lib.core.services.adk.agents import AgentsService
+from agentex.lib.core.services.adk.read_cache import ReadCache
+from agentex.lib.core.services.adk.agent_task_tracker import AgentTaskTrackerService
+
+LATENCY = 0.02
+CONCURRENCY = 50
+_NOW = "2026-01-01T00:00:00Z"
+
+
+class CountingTransport:
+    """Answers the task, agent, tracker and state endpoints after ``LATENCY``, counting requests."""
+
+    def __init__(self) -> None:
+        self.requests: Counter[str] = Counter()
+        self.fail = False
+        self.version = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests[f"{request.method} {path}"] += 1
+        await asyncio.sleep(LATENCY)
+        if self.fail:
+            return httpx.Response(500, json={"detail": "boom"})
+        if request.method != "GET":
+            self.version += 1
+        parts = path.strip("/").split("/")
+        if parts[0] == "tasks":
+            task_id = "t-by-name" if parts[1] == "name" else parts[1]
+            return httpx.Response(200, json={"id": task_id, "name": "task", "task_metadata": {"v": self.version}})
+        if parts[0] == "agents":
+            return httpx.Response(
+                200,
+                json={
+                    "id": "a1",
+                    "name": parts[-1],
+                    "acp_type": "async",
+                    "description": "",
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
+                },
+            )
+        if parts[0] == "tracker":
+            tracker = {"id": "tr1", "agent_id": "a1", "task_id": "t1", "created_at": _NOW}
+            if request.method == "PUT":
+                tracker.update(json.loads(request.content))
+            return httpx.Response(200, json=tracker if len(parts) > 1 else [tracker])
+        if parts[0] == "states":
+            state = {"id": "s1", "task_id": "t1", "agent_id": "a1", "state": {"v": self.version}, "created_at": _NOW}
+            return httpx.Response(200, json=state if len(parts) > 1 else [state])
+        return httpx.Response(404)
+
+    def count(self, method: str, path: str) -> int:
+        return self.requests[f"{method} {path}"]
+
+
+def _tracer() -> Mock:
+    span = Mock()
+    span.output = None
+
+    async def __aenter__(_self: Any) -> Mock:
+        return span
+
+    async def __aexit__(_self: Any, *args: Any) -> None:
+        pass
+
+    span.__aenter__ = __aenter__
+    span.__aexit__ = __aexit__
+    tracer = Mock()
+    tracer.trace.return_value.span.return_value = span
+    return tracer
+
+
+@pytest.fixture
+def transport() -> CountingTransport:
+    return CountingTransport()
+
+
+@pytest.fixture
+def client(transport: CountingTransport) -> AsyncAgentex:
+    return AsyncAgentex(
+        base_url="http://agentex.test",
+        api_key="key",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(transport)),
+    )
+
+
+async def _concurrently(call: Any, n: int = CONCURRENCY) -> list[Any]:
+    return await asyncio.gather(*(call() for _ in range(n)))
+
+
+class TestSingleFlight:
+    async def test_concurrent_identical_reads_share_one_request(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        tasks = TasksService(agentex_client=client, tracer=_tracer())
+        agents = AgentsService(agentex_client=client, tracer=_tracer())
+        trackers = AgentTaskTrackerService(agentex_client=client, tracer=_tracer())
+        states = StateService(agentex_client=client, tracer=_tracer())
+
+        results = await asyncio.gather(
+            _concurrently(lambda: tasks.get_task(task_id="t1")),
+            _concurrently(lambda: tasks.get_task(task_name="task")),
+            _concurrently(lambda: agents.get_agent(agent_name="my-agent")),
+            _concurrently(lambda: trackers.get_by_task_and_agent(task_id="t1", agent_id="a1")),
+            _concurrently(lambda: states.get_state(task_id="t1", agent_id="a1")),
+        )
+
+        assert transport.requests == {
+            "GET /tasks/t1": 1,
+            "GET /tasks/name/task": 1,
+            "GET /agents/name/my-agent": 1,
+            "GET /tracker": 1,
+            "GET /states": 1,
+        }
+        for group in results:
+            assert len(group) == CONCURRENCY
+            assert all(result == group[0] for result in group)
+        # every caller gets its own copy
+        assert len({id(result) for result in results[0]}) == CONCURRENCY
+
+    async def test_different_keys_are_fetched_separately(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        tasks = TasksService(agentex_client=client, tracer=_tracer())
+
+        await asyncio.gather(*(tasks.get_task(task_id=f"t{i % 5}") for i in range(CONCURRENCY)))
+
+        assert transport.requests == {f"GET /tasks/t{i}": 1 for i in range(5)}
+
+    async def test_sequential_reads_are_not_cached_by_default(
+        self, client: AsyncAgentex, transport: CountingTransport, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("AGENTEX_ADK_READ_CACHE_TTL_SECONDS", raising=False)
+        tasks = TasksService(agentex_client=client, tracer=_tracer())
+
+        await tasks.get_task(task_id="t1")
+        await tasks.get_task(task_id="t1")
+
+        assert transport.count("GET", "/tasks/t1") == 2
+
+    async def test_errors_reach_every_caller_and_are_not_cached(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        tasks = TasksService(agentex_client=client, tracer=_tracer(), cache_ttl_seconds=60)
+        transport.fail = True
+
+        results = await asyncio.gather(
+            *(tasks.get_task(task_id="t1") for _ in range(CONCURRENCY)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, Exception) for result in results)
+        assert transport.count("GET", "/tasks/t1") == 1
+
+        transport.fail = False
+        assert (await tasks.get_task(task_id="t1")).id == "t1"
+        assert transport.count("GET", "/tasks/t1") == 2
+
+    async def test_cancelling_one_caller_does_not_cancel_the_others(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        agents = AgentsService(agentex_client=client, tracer=_tracer())
+
+        first = asyncio.ensure_future(agents.get_agent(agent_id="a1"))
+        second = asyncio.ensure_future(agents.get_agent(agent_id="a1"))
+        await asyncio.sleep(LATENCY / 2)
+        first.cancel()
+
+        assert (await second).id == "a1"
+        assert first.cancelled()
+        assert transport.count("GET", "/agents/a1") == 1
+
+
+class TestTTLCache:
+    async def test_reads_within_ttl_are_served_from_the_cache(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        agents = AgentsService(agentex_client=client, tracer=_tracer(), cache_ttl_seconds=60)
+
+        for _ in range(3):
+            agent = await agents.get_agent(agent_name="my-agent")
+            agent.name = "mutated"
+
+        assert transport.count("GET", "/agents/name/my-agent") == 1
+        assert (await agents.get_agent(agent_name="my-agent")).name == "my-agent"
+
+    async def test_ttl_from_environment(
+        self, client: AsyncAgentex, transport: CountingTransport, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AGENTEX_ADK_READ_CACHE_TTL_SECONDS", "60")
+        trackers = AgentTaskTrackerService(agentex_client=client, tracer=_tracer())
+
+        await trackers.get_agent_task_tracker(tracker_id="tr1")
+        await trackers.get_agent_task_tracker(tracker_id="tr1")
+
+        assert transport.count("GET", "/tracker/tr1") == 1
+
+    async def test_state_reads_share_the_adk_read_cache_setting(
+        self, client: AsyncAgentex, transport: CountingTransport, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AGENTEX_ADK_READ_CACHE_TTL_SECONDS", "60")
+        states = StateService(agentex_client=client, tracer=_tracer())
+
+        await states.get_state(state_id="s1")
+        await states.get_state(state_id="s1")
+
+        assert transport.count("GET", "/states/s1") == 1
+
+    async def test_entries_expire(self) -> None:
+        cache = ReadCache(ttl_seconds=LATENCY)
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get("k", fetch) == 1
+        assert await cache.get("k", fetch) == 1
+        await asyncio.sleep(LATENCY * 2)
+        assert await cache.get("k", fetch) == 2
+
+    async def test_none_is_not_cached(self) -> None:
+        cache = ReadCache(ttl_seconds=60)
+        results = iter([None, 1])
+
+        async def fetch() -> int | None:
+            return next(results)
+
+        assert await cache.get("k", fetch) is None
+        assert await cache.get("k", fetch) == 1
+
+
+class TestInvalidation:
+    async def test_task_writes_invalidate_cached_reads(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        tasks = TasksService(agentex_client=client, tracer=_tracer(), cache_ttl_seconds=60)
+
+        await tasks.get_task(task_id="t1")
+        await tasks.get_task(task_name="task")
+        await tasks.update_task(task_id="t1", task_metadata={"k": "v"})
+        task = await tasks.get_task(task_id="t1")
+        await tasks.get_task(task_name="task")
+
+        assert transport.count("GET", "/tasks/t1") == 2
+        # the task read by name matches on name, not id, so it is still cached
+        assert transport.count("GET", "/tasks/name/task") == 1
+        assert task.task_metadata == {"v": 1}
+
+        await tasks.cancel_task(task_id="t1")
+        await tasks.update_task(task_name="task", task_metadata={})
+        await tasks.get_task(task_id="t1")
+        await tasks.get_task(task_name="task")
+        assert transport.count("GET", "/tasks/t1") == 3
+        assert transport.count("GET", "/tasks/name/task") == 2
+
+    async def test_tracker_update_invalidates_both_lookups(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        trackers = AgentTaskTrackerService(agentex_client=client, tracer=_tracer(), cache_ttl_seconds=60)
+
+        await trackers.get_agent_task_tracker(tracker_id="tr1")
+        await trackers.get_by_task_and_agent(task_id="t1", agent_id="a1")
+        await trackers.update_agent_task_tracker(tracker_id="tr1", last_processed_event_id="e2")
+        tracker = await trackers.get_by_task_and_agent(task_id="t1", agent_id="a1")
+        await trackers.get_agent_task_tracker(tracker_id="tr1")
+
+        assert transport.count("GET", "/tracker") == 2
+        assert transport.count("GET", "/tracker/tr1") == 2
+        assert tracker is not None
+
+    async def test_reads_after_a_write_do_not_join_a_read_from_before_it(
+        self, client: AsyncAgentex, transport: CountingTransport
+    ) -> None:
+        states = StateService(agentex_client=client, tracer=_tracer())
+
+        stale = asyncio.ensure_future(states.get_state(state_id="s1"))
+        await asyncio.sleep(0)
+        await states.update_state(state_id="s1", task_id="t1", agent_id="a1", state={})
+        fresh = await states.get_state(state_id="s1")
+
+        assert fresh is not None and fresh.state == {"v": 1}
+        assert (await stale) is not None
+        assert transport.count("GET", "/states/s1") == 2
+
+    async def test_read_in_flight_during_a_write_is_not_cached(self) -> None:
+        cache = ReadCache(ttl_seconds=60)
+        release = asyncio.Event()
+        values = iter(["before", "after"])
+
+        async def fetch() -> str:
+            value = next(values)
+            if value == "before":
+                await release.wait()
+            return value
+
+        read = asyncio.ensure_future(cache.get("k", fetch))
+        await asyncio.sleep(0)
+        cache.invalidate("k")
+        release.set()
+
+        assert await read == "before"
+        assert await cache.get("k", fetch) == "after"
+
+    async def test_put_replaces_a_read_in_flight(self) -> None:
+        cache = ReadCache(ttl_seconds=60)
+        release = asyncio.Event()
+
+        async def stale_fetch() -> str:
+            await release.wait()
+            return "before"
+
+        async def fetch() -> str:
+            raise AssertionError("served from the cache")
+
+        read = asyncio.ensure_future(cache.get("k", stale_fetch))
+        await asyncio.sleep(0)
+        cache.put("written", "k", "alias")
+        release.set()
+        await read
+        cache.add("alias", "before")
+
+        assert await cache.get("k", fetch) == "written"
+        assert await cache.get("alias", fetch) == "written"
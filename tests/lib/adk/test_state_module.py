@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import agentex.lib.adk._modules.state as _state_mod
+from agentex.types.state import State
+from agentex.lib.adk._modules.state import StateModule
+from agentex.lib.core.services.adk.state import StateService, StateVersionConflictError
+from agentex.lib.core.temporal.activities.adk.state_activities import PatchStateParams, StateActivityName
+
+_TS = datetime(2026, 5, 13, 18, 30, 0, tzinfo=timezone.utc)
+
+
+def _make_state(state: dict | None = None, updated_at: datetime | None = None) -> State:
+    return State(
+        id="s1",
+        agent_id="a1",
+        task_id="t1",
+        state=state if state is not None else {"history": ["hi"], "plan": []},
+        created_at=_TS,
+        updated_at=updated_at,
+    )
+
+
+def _make_module() -> tuple[AsyncMock, StateModule]:
+    mock_service = AsyncMock(spec=StateService)
+    return mock_service, StateModule(state_service=mock_service)
+
+
+class TestStateHandle:
+    async def test_load_returns_none_without_state(self):
+        mock_service, module = _make_module()
+        mock_service.get_state.return_value = None
+
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=False):
+            assert await module.load(task_id="t1", agent_id="a1") is None
+
+    async def test_save_sends_only_dirty_fields(self):
+        mock_service, module = _make_module()
+        mock_service.get_state.return_value = _make_state()
+        mock_service.patch_state.return_value = _make_state(updated_at=_TS + timedelta(seconds=1))
+
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=False):
+            handle = await module.load(task_id="t1", agent_id="a1")
+            handle["plan"].append("research")
+            handle["done"] = False
+            assert handle.dirty_fields == {"plan", "done"}
+            await handle.save()
+
+        kwargs = mock_service.patch_state.call_args.kwargs
+        assert kwargs["patch"] == [
+            {"op": "replace", "path": "/plan", "value": ["research"]},
+            {"op": "add", "path": "/done", "value": False},
+        ]
+        assert kwargs["expected_version"] == _TS.isoformat()
+        assert handle.version == (_TS + timedelta(seconds=1)).isoformat()
+        assert handle.dirty_fields == set()
+
+    async def test_save_without_changes_is_a_noop(self):
+        mock_service, module = _make_module()
+        mock_service.get_state.return_value = _make_state()
+
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=False):
+            handle = await module.load(task_id="t1", agent_id="a1")
+            assert await handle.save() is None
+
+        mock_service.patch_state.assert_not_called()
+
+    async def test_loaded_state_is_isolated_from_the_source(self):
+        mock_service, module = _make_module()
+        source = _make_state()
+        mock_service.get_state.return_value = source
+
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=False):
+            handle = await module.load(task_id="t1", agent_id="a1")
+        handle["history"].append("mutated")
+
+        assert source.state["history"] == ["hi"]
+        assert handle.dirty_fields == {"history"}
+
+    async def test_conflict_keeps_local_changes_dirty(self):
+        mock_service, module = _make_module()
+        mock_service.get_state.return_value = _make_state()
+        mock_service.patch_state.side_effect = StateVersionConflictError("s1", "v1", "v2")
+
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=False):
+            handle = await module.load(task_id="t1", agent_id="a1")
+            handle["plan"] = ["x"]
+            with pytest.raises(StateVersionConflictError):
+                await handle.save()
+
+        assert handle.dirty_fields == {"plan"}
+        assert handle.version == _TS.isoformat()
+
+    async def test_patch_in_workflow_sends_only_the_patch(self):
+        _, module = _make_module()
+        ops = [{"op": "add", "path": "/done", "value": True}]
+
+        execute = AsyncMock(return_value=_make_state())
+        with patch.object(_state_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _state_mod.ActivityHelpers, "execute_activity", new=execute
+        ):
+            await module.patch(state_id="s1", task_id="t1", agent_id="a1", patch=ops, expected_version="v1")
+
+        kwargs = execute.call_args.kwargs
+        assert kwargs["activity_name"] == StateActivityName.PATCH_STATE
+        assert kwargs["request"] == PatchStateParams(
+            state_id="s1", task_id="t1", agent_id="a1", patch=ops, expected_version="v1"
+        )
@@ -1,17 +1,22 @@
-"""Tests for StateService forwarding task_id/agent_id to the SDK client.
+"""Tests for StateService.
 
-Regression guard for the 0.13.0 incident: the generated client dropped
-task_id/agent_id from states.update(), so the ADK stopped sending them in the
-body and every state write 422'd against backends predating scale-agentex#278.
+Covers forwarding task_id/agent_id to the SDK client — a regression guard for
+the 0.13.0 incident: the generated client dropped task_id/agent_id from
+states.update(), so the ADK stopped sending them in the body and every state
+write 422'd against backends predating scale-agentex#278 — plus JSON Patch
+updates with version checks and the read-through cache.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from unittest.mock import Mock, AsyncMock
+import time
+from datetime import datetime, timezone, timedelta
+from unittest.mock import Mock, AsyncMock, patch
+
+import pytest
 
 from agentex.types.state import State
-from agentex.lib.core.services.adk.state import StateService
+from agentex.lib.core.services.adk.state import StateService, StateVersionConflictError, state_version
 
 _TS = datetime(2026, 5, 13, 18, 30, 0, tzinfo=timezone.utc)
 
@@ -67,3 +72,160 @@ class TestUpdateStateSendsParentIdentifiers:
         # task_id/agent_id must ride in extra_body — the generated client dropped
         # them from the typed signature, but old backends still require them.
         assert kwargs["extra_body"] == {"task_id": "t1", "agent_id": "a1"}
+
+
+def _make_backend_service(cache_ttl_seconds: float = 0.0) -> tuple[AsyncMock, StateService, dict[str, State]]:
+    """A service whose client keeps states in a dict and bumps updated_at on every write."""
+    client, svc = _make_service()
+    svc = StateService(agentex_client=client, tracer=svc._tracer, cache_ttl_seconds=cache_ttl_seconds)
+    store: dict[str, State] = {"s1": _make_state()}
+
+    async def retrieve(state_id: str) -> State:
+        return store[state_id].model_copy(deep=True)
+
+    async def update(state_id: str, state: dict, extra_body: dict) -> State:
+        current = store[state_id]
+        store[state_id] = current.model_copy(
+            update={"state": state, "updated_at": (current.updated_at or _TS) + timedelta(seconds=1)}
+        )
+        return store[state_id].model_copy(deep=True)
+
+    async def list_states(task_id: str, agent_id: str) -> list[State]:
+        return [s.model_copy(deep=True) for s in store.values() if (s.task_id, s.agent_id) == (task_id, agent_id)]
+
+    client.states.retrieve.side_effect = retrieve
+    client.states.update.side_effect = update
+    client.states.list.side_effect = list_states
+    return client, svc, store
+
+
+class TestPatchState:
+    async def test_applies_patch_to_current_state(self) -> None:
+        client, svc, store = _make_backend_service()
+
+        result = await svc.patch_state(
+            state_id="s1",
+            task_id="t1",
+            agent_id="a1",
+            patch=[{"op": "add", "path": "/plan", "value": ["step"]}],
+        )
+
+        assert result.state == {"k": "v", "plan": ["step"]}
+        assert store["s1"].state == {"k": "v", "plan": ["step"]}
+        assert client.states.update.call_args.kwargs["extra_body"] == {"task_id": "t1", "agent_id": "a1"}
+
+    async def test_version_conflict(self) -> None:
+        _, svc, store = _make_backend_service()
+        loaded_at = state_version(store["s1"])
+        await svc.update_state(state_id="s1", task_id="t1", agent_id="a1", state={"k": "other writer"})
+
+        with pytest.raises(StateVersionConflictError) as exc_info:
+            await svc.patch_state(
+                state_id="s1",
+                task_id="t1",
+                agent_id="a1",
+                patch=[{"op": "replace", "path": "/k", "value": "mine"}],
+                expected_version=loaded_at,
+            )
+
+        assert exc_info.value.expected_version == loaded_at
+        assert store["s1"].state == {"k": "other writer"}
+
+    async def test_stale_cache_entry_does_not_cause_false_conflict(self) -> None:
+        client, svc, store = _make_backend_service(cache_ttl_seconds=60)
+        await svc.get_state(state_id="s1")
+        # Another process writes; our cache entry is now stale.
+        store["s1"] = store["s1"].model_copy(update={"state": {"k": "new"}, "updated_at": _TS + timedelta(hours=1)})
+
+        result = await svc.patch_state(
+            state_id="s1",
+            task_id="t1",
+            agent_id="a1",
+            patch=[{"op": "add", "path": "/x", "value": 1}],
+            expected_version=state_version(store["s1"]),
+        )
+
+        assert result.state == {"k": "new", "x": 1}
+
+
+class TestStateCache:
+    async def test_disabled_by_default(self) -> None:
+        client, svc, _ = _make_backend_service()
+
+        await svc.get_state(state_id="s1")
+        await svc.get_state(state_id="s1")
+
+        assert client.states.retrieve.await_count == 2
+
+    async def test_reads_through_by_id_and_by_task_and_agent(self) -> None:
+        client, svc, _ = _make_backend_service(cache_ttl_seconds=60)
+
+        first = await svc.get_state(task_id="t1", agent_id="a1")
+        again = await svc.get_state(task_id="t1", agent_id="a1")
+        by_id = await svc.get_state(state_id="s1")
+
+        assert first == again == by_id
+        assert client.states.list.await_count == 1
+        assert client.states.retrieve.await_count == 0
+
+    async def test_returned_states_are_copies(self) -> None:
+        _, svc, _ = _make_backend_service(cache_ttl_seconds=60)
+
+        first = await svc.get_state(state_id="s1")
+        first.state["k"] = "mutated"
+
+        assert (await svc.get_state(state_id="s1")).state == {"k": "v"}
+
+    async def test_unversioned_patch_uses_cached_base_and_refreshes_entry(self) -> None:
+        client, svc, store = _make_backend_service(cache_ttl_seconds=60)
+        await svc.get_state(state_id="s1")
+
+        patched = await svc.patch_state(
+            state_id="s1",
+            task_id="t1",
+            agent_id="a1",
+            patch=[{"op": "add", "path": "/n", "value": 1}],
+        )
+
+        assert client.states.retrieve.await_count == 1
+        assert await svc.get_state(state_id="s1") == patched == store["s1"]
+
+    async def test_versioned_patch_catches_a_write_made_while_the_cache_is_warm(self) -> None:
+        client, svc, store = _make_backend_service(cache_ttl_seconds=60)
+        loaded = await svc.get_state(state_id="s1")
+        # Another process writes; our cache entry still matches the version we loaded.
+        store["s1"] = store["s1"].model_copy(
+            update={"state": {"k": "other writer"}, "updated_at": _TS + timedelta(hours=1)}
+        )
+
+        with pytest.raises(StateVersionConflictError):
+            await svc.patch_state(
+                state_id="s1",
+                task_id="t1",
+                agent_id="a1",
+                patch=[{"op": "replace", "path": "/k", "value": "mine"}],
+                expected_version=state_version(loaded),
+            )
+
+        assert store["s1"].state == {"k": "other writer"}
+        client.states.update.assert_not_awaited()
+        assert (await svc.get_state(state_id="s1")).state == {"k": "other writer"}
+
+    async def test_entries_expire(self) -> None:
+        client, svc, _ = _make_backend_service(cache_ttl_seconds=60)
+        await svc.get_state(state_id="s1")
+
+        with patch("agentex.lib.core.services.adk.read_cache.time.monotonic", return_value=time.monotonic() + 61):
+            await svc.get_state(state_id="s1")
+
+        assert client.states.retrieve.await_count == 2
+
+    async def test_delete_invalidates(self) -> None:
+        client, svc, store = _make_backend_service(cache_ttl_seconds=60)
+        client.states.delete.return_value = store["s1"]
+        await svc.get_state(task_id="t1", agent_id="a1")
+
+        await svc.delete_state(state_id="s1")
+        store.clear()
+
+        assert await svc.get_state(task_id="t1", agent_id="a1") is None
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from unittest.mock import Mock, AsyncMock, patch
+
+import pytest
+
+import agentex.lib.adk.utils._modules.templating as _templating_mod
+import agentex.lib.core.services.adk.utils.templating as _templating_service_mod
+from agentex.lib.adk.utils._modules.templating import TemplatingModule
+from agentex.lib.core.services.adk.utils.templating import (
+    TemplatingService,
+    compile_jinja,
+    render_jinja_template,
+    is_deterministic_jinja,
+)
+from agentex.lib.core.temporal.activities.adk.utils.templating_activities import JinjaActivityName
+
+PROMPT = "You are {{ name }}.\n{% for tool in tools %}- {{ tool }}\n{% endfor %}"
+
+
+def _mock_span():
+    span = Mock()
+    span.output = None
+
+    async def __aenter__(_self):
+        return span
+
+    async def __aexit__(_self, *args):
+        return None
+
+    span.__aenter__ = __aenter__
+    span.__aexit__ = __aexit__
+    return span
+
+
+def _make_service() -> TemplatingService:
+    tracer = Mock()
+    trace = Mock()
+    trace.span.return_value = _mock_span()
+    tracer.trace.return_value = trace
+    return TemplatingService(tracer=tracer)
+
+
+@pytest.fixture(autouse=True)
+def _clear_template_cache():
+    _templating_service_mod._template_cache.clear()
+    yield
+    _templating_service_mod._template_cache.clear()
+
+
+class TestTemplateCache:
+    def test_compiled_template_is_reused(self):
+        with patch.object(
+            _templating_service_mod.JINJA_ENV, "from_string", wraps=_templating_service_mod.JINJA_ENV.from_string
+        ) as from_string:
+            assert compile_jinja(PROMPT) is compile_jinja(PROMPT)
+            compile_jinja("other {{ x }}")
+
+        assert from_string.call_count == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(_templating_service_mod, "TEMPLATE_CACHE_SIZE", 2)
+        first = compile_jinja("a {{ x }}")
+        compile_jinja("b {{ x }}")
+        compile_jinja("a {{ x }}")  # refresh "a"
+        compile_jinja("c {{ x }}")  # evicts "b"
+
+        assert len(_templating_service_mod._template_cache) == 2
+        assert compile_jinja("a {{ x }}") is first
+
+    async def test_service_renders_through_the_cache(self):
+        service = _make_service()
+
+        first = await service.render_jinja(template=PROMPT, variables={"name": "Ada", "tools": ["search"]})
+        second = await service.render_jinja(template=PROMPT, variables={"name": "Bob", "tools": []})
+
+        assert first == "You are Ada.\n- search\n"
+        assert second == "You are Bob.\n"
+        assert len(_templating_service_mod._template_cache) == 1
+
+    async def test_render_errors_are_wrapped(self):
+        with pytest.raises(ValueError, match="Error rendering Jinja template"):
+            await _make_service().render_jinja(template="{{ x.y.z }}", variables={})
+
+    def test_datetime_global_is_available(self):
+        assert render_jinja_template("{{ datetime(2026, 1, 2).year }}", {}) == "2026"
+
+
+class TestDeterminism:
+    @pytest.mark.parametrize(
+        "template, expected",
+        [
+            (PROMPT, True),
+            ("{% set n = items | length %}{{ n }}", True),
+            ("Today is {{ datetime.now() }}", False),
+            ("{{ lipsum(1) }}", False),
+            ("{{ options | random }}", False),
+            ("{% set datetime = 'shadowed' %}{{ datetime }}", True),
+        ],
+    )
+    def test_is_deterministic(self, template, expected):
+        assert is_deterministic_jinja(template) is expected
+
+
+class TestTemplatingModuleInWorkflow:
+    async def test_deterministic_templates_render_without_an_activity(self):
+        module = TemplatingModule(templating_service=Mock(spec=TemplatingService))
+        execute = AsyncMock()
+
+        with patch.object(_templating_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _templating_mod.ActivityHelpers, "execute_activity", new=execute
+        ):
+            rendered = await module.render_jinja(
+                trace_id="t", template=PROMPT, variables={"name": "Ada", "tools": []}, render_in_workflow=True
+            )
+
+        assert rendered == "You are Ada.\n"
+        execute.assert_not_called()
+
+    async def test_nondeterministic_templates_still_use_the_activity(self):
+        module = TemplatingModule(templating_service=Mock(spec=TemplatingService))
+        execute = AsyncMock(return_value="rendered")
+
+        with patch.object(_templating_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _templating_mod.ActivityHelpers, "execute_activity", new=execute
+        ):
+            rendered = await module.render_jinja(
+                trace_id="t", template="{{ datetime.now() }}", variables={}, render_in_workflow=True
+            )
+
+        assert rendered == "rendered"
+        assert execute.call_args.kwargs["activity_name"] == JinjaActivityName.RENDER_JINJA
+
+    @pytest.mark.parametrize("template", ["{% if %}", "{{ missing.attribute }}"])
+    async def test_broken_templates_fail_in_the_activity(self, template):
+        module = TemplatingModule(templating_service=Mock(spec=TemplatingService))
+        execute = AsyncMock(side_effect=RuntimeError("activity failed"))
+
+        with patch.object(_templating_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _templating_mod.ActivityHelpers, "execute_activity", new=execute
+        ), pytest.raises(RuntimeError, match="activity failed"):
+            await module.render_jinja(trace_id="t", template=template, variables={}, render_in_workflow=True)
+
+        assert execute.call_args.kwargs["activity_name"] == JinjaActivityName.RENDER_JINJA
+
+    async def test_activity_is_the_default(self):
+        module = TemplatingModule(templating_service=Mock(spec=TemplatingService))
+        execute = AsyncMock(return_value="rendered")
+
+        with patch.object(_templating_mod, "in_temporal_workflow", return_value=True), patch.object(
+            _templating_mod.ActivityHelpers, "execute_activity", new=execute
+        ):
+            await module.render_jinja(trace_id="t", template=PROMPT, variables={"name": "Ada", "tools": []})
+
+        execute.assert_awaited_once()
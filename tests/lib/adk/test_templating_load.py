@@ -0,0 +1,109 @@
+"""
+Manual benchmark for the compiled-template cache in TemplatingService.
+
+Renders a typical system-prompt template (loops, conditionals, filters)
+10,000 times through ``TemplatingService.render_jinja``, once with the cache
+cleared before every render (the previous behaviour: parse and compile per
+call) and once warm, and reports renders per second.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/adk/test_templating_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import agentex.lib.core.services.adk.utils.templating as _templating_service_mod
+from agentex.lib.core.services.adk.utils.templating import TemplatingService
+
+N_RENDERS = 10_000
+
+PROMPT_TEMPLATE = """\
+You are {{ agent_name }}, an assistant for {{ company }}.
+{% if user.is_admin %}
+The user is an administrator; you may discuss account settings.
+{% endif %}
+Available tools:
+{% for tool in tools %}
+- {{ tool.name }}: {{ tool.description | trim }}{% if tool.args %} (args: {{ tool.args | join(", ") }}){% endif %}
+
+{% endfor %}
+Recent conversation ({{ history | length }} messages):
+{% for message in history[-10:] %}
+[{{ message.role | upper }}] {{ message.content | truncate(200) }}
+{% endfor %}
+Answer in {{ language | default("English") }}.
+"""
+
+VARIABLES = {
+    "agent_name": "Atlas",
+    "company": "Acme",
+    "user": {"is_admin": False},
+    "tools": [
+        {"name": f"tool_{i}", "description": f"  Does thing number {i}.  ", "args": ["query", "limit"]}
+        for i in range(8)
+    ],
+    "history": [{"role": "user" if i % 2 else "assistant", "content": "lorem ipsum " * 20} for i in range(30)],
+}
+
+
+def _make_service() -> TemplatingService:
+    span = Mock()
+
+    async def __aenter__(_self):
+        return span
+
+    async def __aexit__(_self, *args):
+        return None
+
+    span.__aenter__ = __aenter__
+    span.__aexit__ = __aexit__
+    tracer = Mock()
+    tracer.trace.return_value.span.return_value = span
+    return TemplatingService(tracer=tracer)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestTemplatingLoad:
+    async def test_cold_vs_warm_renders(self):
+        service = _make_service()
+        results: dict[str, float] = {}
+
+        t_start = time.perf_counter()
+        for _ in range(N_RENDERS):
+            _templating_service_mod._template_cache.clear()
+            cold = await service.render_jinja(template=PROMPT_TEMPLATE, variables=VARIABLES)
+        results["cold (compile per render)"] = time.perf_counter() - t_start
+
+        _templating_service_mod._template_cache.clear()
+        t_start = time.perf_counter()
+        for _ in range(N_RENDERS):
+            warm = await service.render_jinja(template=PROMPT_TEMPLATE, variables=VARIABLES)
+        results["warm (cached)"] = time.perf_counter() - t_start
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 64}")
+        print(f" Prompt template renders: {N_RENDERS:,} x {len(PROMPT_TEMPLATE)} char template")
+        print(f"{'=' * 64}")
+        print(f" {'mode':<28}{'total':>10}{'per render':>13}{'renders/s':>12}")
+        for label, elapsed in results.items():
+            print(f" {label:<28}{elapsed:>9.2f}s{elapsed / N_RENDERS * 1e6:>11.0f}us{N_RENDERS / elapsed:>12,.0f}")
+        speedup = results["cold (compile per render)"] / results["warm (cached)"]
+        print(f" speedup: {speedup:.1f}x")
+        print(f"{'=' * 64}")
+        print()
+
+        assert cold == warm
+        assert results["warm (cached)"] < results["cold (compile per render)"]
@@ -0,0 +1,310 @@
+"""Tests for bulk task cleanup in ``cleanup_handlers``.
+
+The Agentex API is mocked with respx; Temporal with an in-memory fake client
+that records terminations and batch jobs.
+"""
+
+from __future__ import annotations
+
+import re
+import json
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from agentex import AsyncAgentex
+from agentex.lib.cli.handlers import cleanup_handlers
+from agentex.lib.cli.handlers.cleanup_handlers import (
+    terminate_workflows_by_query,
+    cleanup_agent_workflows_async,
+)
+
+base_url = "http://agentex.test"
+AGENT = "my-agent"
+
+
+class _FakeHandle:
+    def __init__(self, client: FakeTemporalClient, workflow_id: str):
+        self._client = client
+        self._workflow_id = workflow_id
+
+    async def terminate(self, reason: str | None = None) -> None:
+        await asyncio.sleep(0)
+        error = self._client.terminate_errors.get(self._workflow_id)
+        if error:
+            raise RuntimeError(error)
+        self._client.terminated.append(self._workflow_id)
+
+
+class _FakeWorkflowService:
+    def __init__(self, client: FakeTemporalClient):
+        self._client = client
+        self.started: list[Any] = []
+        self._polls: dict[str, int] = {}
+
+    async def start_batch_operation(self, request: Any) -> None:
+        self.started.append(request)
+        self._polls[request.job_id] = 0
+
+    async def describe_batch_operation(self, request: Any) -> SimpleNamespace:
+        from temporalio.api.enums.v1 import BatchOperationState
+
+        self._polls[request.job_id] += 1
+        start = next(r for r in self.started if r.job_id == request.job_id)
+        ids = [i for i in re.findall(r"'([^']*)'", start.visibility_query) if i != "Running"]
+        done = self._polls[request.job_id] >= self._client.batch_polls
+        if done and self._client.batch_fails:
+            state = BatchOperationState.BATCH_OPERATION_STATE_FAILED
+        elif done:
+            state = BatchOperationState.BATCH_OPERATION_STATE_COMPLETED
+            self._client.batch_terminated.extend(ids)
+        else:
+            state = BatchOperationState.BATCH_OPERATION_STATE_RUNNING
+        completed = len(ids) if done else len(ids) // 2
+        return SimpleNamespace(
+            state=state,
+            total_operation_count=len(ids),
+            complete_operation_count=completed,
+            failure_operation_count=0,
+        )
+
+
+class FakeTemporalClient:
+    namespace = "default"
+    identity = "cleanup-test"
+
+    def __init__(self, *, terminate_errors: dict[str, str] | None = None, batch_polls: int = 1, batch_fails=False):
+        self.terminate_errors = terminate_errors or {}
+        self.batch_polls = batch_polls
+        self.batch_fails = batch_fails
+        self.terminated: list[str] = []
+        self.batch_terminated: list[str] = []
+        self.workflow_service = _FakeWorkflowService(self)
+
+    def get_workflow_handle(self, workflow_id: str) -> _FakeHandle:
+        return _FakeHandle(self, workflow_id)
+
+
+class _AgentexApi:
+    """respx side effects for the task list and the agent RPC endpoint."""
+
+    page_size = 25
+
+    def __init__(self, task_ids: list[str], *, failing_ids: set[str] = frozenset(), delay: float = 0.0):  # type: ignore[assignment]
+        self.task_ids = task_ids
+        self.failing_ids = failing_ids
+        self.delay = delay
+        self.cancelled: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.list_requests: list[httpx.Request] = []
+
+    def list_tasks(self, request: httpx.Request) -> httpx.Response:
+        self.list_requests.append(request)
+        tasks = [{"id": task_id, "status": "RUNNING"} for task_id in self.task_ids]
+        tasks.append({"id": "done-task", "status": "COMPLETED"})
+        page_number = int(request.url.params.get("page_number", 1))
+        start = (page_number - 1) * self.page_size
+        return httpx.Response(200, json=tasks[start : start + self.page_size])
+
+    async def rpc(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert body["method"] == "task/cancel"
+        task_id = body["params"]["task_id"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if task_id in self.failing_ids:
+            return httpx.Response(500, json={"detail": "agent unavailable"})
+        self.cancelled.append(task_id)
+        return httpx.Response(200, json={"id": 1, "jsonrpc": "2.0", "result": None})
+
+    def mount(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/tasks").mock(side_effect=self.list_tasks)
+        respx_mock.post(f"/agents/name/{AGENT}/rpc").mock(side_effect=self.rpc)
+
+
+@pytest.fixture
+def agentex_client() -> AsyncAgentex:
+    return AsyncAgentex(base_url=base_url, api_key="test", max_retries=0)
+
+
+def _task_ids(n: int) -> list[str]:
+    return [f"task-{i}" for i in range(n)]
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+class TestCleanupAgentWorkflows:
+    async def test_cancels_running_tasks_with_bounded_concurrency(self, respx_mock, agentex_client):
+        api = _AgentexApi(_task_ids(40), delay=0.01)
+        api.mount(respx_mock)
+
+        report = await cleanup_agent_workflows_async(AGENT, concurrency=8, agentex_client=agentex_client)
+
+        assert (report.total, report.succeeded, report.failures) == (40, 40, {})
+        assert sorted(api.cancelled) == sorted(_task_ids(40))
+        assert 1 < api.max_in_flight <= 8
+        assert api.list_requests[0].url.params["status"] == "RUNNING"
+
+    async def test_running_tasks_are_collected_from_every_page(self, respx_mock, agentex_client):
+        api = _AgentexApi(_task_ids(60))
+        api.mount(respx_mock)
+
+        report = await cleanup_agent_workflows_async(AGENT, agentex_client=agentex_client)
+
+        assert (report.total, report.succeeded) == (60, 60)
+        assert sorted(api.cancelled) == sorted(_task_ids(60))
+        pages = sorted(int(r.url.params["page_number"]) for r in api.list_requests)
+        assert pages[:4] == [1, 2, 3, 4]
+
+    async def test_failures_are_reported_not_raised(self, respx_mock, agentex_client):
+        api = _AgentexApi(_task_ids(5), failing_ids={"task-1", "task-3"})
+        api.mount(respx_mock)
+
+        report = await cleanup_agent_workflows_async(AGENT, agentex_client=agentex_client)
+
+        assert report.succeeded == 3
+        assert sorted(report.failures) == ["task-1", "task-3"]
+        assert "agent unavailable" in report.failures["task-1"]
+
+    async def test_no_running_tasks(self, respx_mock, agentex_client):
+        _AgentexApi([]).mount(respx_mock)
+
+        report = await cleanup_agent_workflows_async(AGENT, force=True, agentex_client=agentex_client)
+
+        assert (report.total, report.succeeded) == (0, 0)
+
+    async def test_force_shares_one_temporal_connection(self, respx_mock, agentex_client, monkeypatch):
+        api = _AgentexApi(_task_ids(10))
+        api.mount(respx_mock)
+        temporal = FakeTemporalClient()
+        connects: list[str] = []
+
+        class _FakeTemporalClientClass:
+            @staticmethod
+            async def connect(address: str) -> FakeTemporalClient:
+                connects.append(address)
+                return temporal
+
+        monkeypatch.setattr(cleanup_handlers, "TemporalClient", _FakeTemporalClientClass)
+        monkeypatch.setenv("TEMPORAL_ADDRESS", "temporal.test:7233")
+
+        report = await cleanup_agent_workflows_async(AGENT, force=True, agentex_client=agentex_client)
+
+        assert connects == ["temporal.test:7233"]
+        assert report.succeeded == 10
+        assert sorted(temporal.terminated) == sorted(_task_ids(10))
+
+    async def test_force_succeeds_if_either_cancel_or_terminate_does(self, respx_mock, agentex_client):
+        api = _AgentexApi(_task_ids(3), failing_ids={"task-0", "task-1"})
+        api.mount(respx_mock)
+        temporal = FakeTemporalClient(
+            terminate_errors={"task-1": "connection reset", "task-2": "Workflow execution already completed"}
+        )
+
+        report = await cleanup_agent_workflows_async(
+            AGENT, force=True, agentex_client=agentex_client, temporal_client=temporal
+        )
+
+        assert report.succeeded == 2
+        assert list(report.failures) == ["task-1"]
+        assert "cancel:" in report.failures["task-1"]
+        assert "terminate: connection reset" in report.failures["task-1"]
+
+    async def test_batch_terminate_uses_visibility_query_batches(self, respx_mock, agentex_client, monkeypatch):
+        monkeypatch.setattr(cleanup_handlers, "_BATCH_TERMINATE_MAX_IDS", 2)
+        monkeypatch.setattr(cleanup_handlers, "_BATCH_POLL_INTERVAL_S", 0)
+        api = _AgentexApi(_task_ids(5))
+        api.mount(respx_mock)
+        temporal = FakeTemporalClient(batch_polls=2)
+
+        report = await cleanup_agent_workflows_async(
+            AGENT, force=True, batch_terminate=True, agentex_client=agentex_client, temporal_client=temporal
+        )
+
+        assert report.succeeded == 5
+        assert temporal.terminated == []
+        assert sorted(temporal.batch_terminated) == sorted(_task_ids(5))
+        started = temporal.workflow_service.started
+        assert len(started) == 3
+        assert started[0].visibility_query == "WorkflowId IN ('task-0', 'task-1') AND ExecutionStatus = 'Running'"
+        assert started[0].termination_operation.identity == "cleanup-test"
+
+    async def test_batch_terminate_runs_after_every_cancellation(self, respx_mock, agentex_client, monkeypatch):
+        monkeypatch.setattr(cleanup_handlers, "_BATCH_POLL_INTERVAL_S", 0)
+        api = _AgentexApi(_task_ids(6), failing_ids={"task-2"}, delay=0.01)
+        api.mount(respx_mock)
+        temporal = FakeTemporalClient()
+        cancelled_before_batch: list[list[str]] = []
+        start_batch_operation = temporal.workflow_service.start_batch_operation
+
+        async def record_order(request: Any) -> None:
+            cancelled_before_batch.append(list(api.cancelled))
+            await start_batch_operation(request)
+
+        monkeypatch.setattr(temporal.workflow_service, "start_batch_operation", record_order)
+
+        report = await cleanup_agent_workflows_async(
+            AGENT, force=True, batch_terminate=True, agentex_client=agentex_client, temporal_client=temporal
+        )
+
+        # the agent saw every cancel (all but the failing one succeeded) before the batch started
+        assert [sorted(c) for c in cancelled_before_batch] == [sorted(set(_task_ids(6)) - {"task-2"})]
+        assert sorted(temporal.batch_terminated) == sorted(_task_ids(6))
+        assert (report.succeeded, report.failures) == (6, {})
+
+    async def test_failed_batch_falls_back_to_per_workflow_terminate(self, respx_mock, agentex_client, monkeypatch):
+        monkeypatch.setattr(cleanup_handlers, "_BATCH_POLL_INTERVAL_S", 0)
+        api = _AgentexApi(_task_ids(3))
+        api.mount(respx_mock)
+        temporal = FakeTemporalClient(batch_fails=True)
+
+        report = await cleanup_agent_workflows_async(
+            AGENT, force=True, batch_terminate=True, agentex_client=agentex_client, temporal_client=temporal
+        )
+
+        assert report.succeeded == 3
+        assert sorted(temporal.terminated) == sorted(_task_ids(3))
+
+    async def test_sync_entry_point_runs_inside_an_event_loop(self, respx_mock, monkeypatch):
+        # `agentex agents run` calls the sync entry point from its own loop
+        api = _AgentexApi(_task_ids(3))
+        api.mount(respx_mock)
+        monkeypatch.setattr(
+            cleanup_handlers, "AsyncAgentex", lambda: AsyncAgentex(base_url=base_url, api_key="test", max_retries=0)
+        )
+
+        report = cleanup_handlers.cleanup_agent_workflows(AGENT, development_only=False)
+
+        assert report is not None
+        assert report.succeeded == 3
+
+
+class TestTerminateWorkflowsByQuery:
+    async def test_polls_until_complete_and_reports_progress(self):
+        temporal = FakeTemporalClient(batch_polls=3)
+        progress: list[tuple[int, int]] = []
+
+        result = await terminate_workflows_by_query(
+            temporal,
+            "WorkflowId IN ('a', 'b') AND ExecutionStatus = 'Running'",
+            poll_interval=0,
+            on_progress=lambda completed, total: progress.append((completed, total)),
+        )
+
+        assert (result.total, result.completed, result.failed) == (2, 2, 0)
+        assert progress == [(1, 2), (1, 2), (2, 2)]
+        assert temporal.workflow_service.started[0].namespace == "default"
+
+    async def test_failed_job_raises(self):
+        temporal = FakeTemporalClient(batch_fails=True)
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await terminate_workflows_by_query(temporal, "TaskQueue = 'q'", poll_interval=0)
@@ -0,0 +1,366 @@
+"""Shared benchmark harness for the harness-tap converters.
+
+Builds a recorded stream for each converter (OpenAI Agents, Pydantic AI,
+LangGraph, Claude Code, Codex) in the shape its source actually emits: mostly
+per-token text deltas, with reasoning, a tool call and its result, and the
+bookkeeping events that produce no output (item added, part added, pings,
+turn lifecycle) interleaved the way providers send them.
+
+``replay`` runs a stream through its converter and returns the output;
+``measure`` reports input events per second and the peak memory traced while
+converting, so a change to a converter can be compared against the previous
+run. Used by ``test_converter_dispatch.py`` (correctness, small streams) and
+``test_converter_throughput_load.py`` (throughput, large streams).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import types
+import tracemalloc
+from typing import Any, Callable, Iterator, AsyncIterator
+from dataclasses import dataclass
+
+from agentex.lib.core.harness.types import StreamTaskMessage
+
+_WORDS = ["The", " model", " is", " streaming", " tokens", ",", " one", " at", " a", " time", ".\n"]
+
+
+def _tokens(n: int) -> Iterator[str]:
+    for i in range(n):
+        yield _WORDS[i % len(_WORDS)]
+
+
+@dataclass
+class RecordedStream:
+    name: str
+    events: list[Any]
+    convert: Callable[[AsyncIterator[Any]], AsyncIterator[StreamTaskMessage]]
+    text: str
+    """The assistant text the stream's text deltas must reassemble to."""
+
+
+@dataclass
+class BenchResult:
+    name: str
+    input_events: int
+    output_events: int
+    seconds: float
+    peak_kib: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.input_events / self.seconds
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<12} {self.input_events:>8} in {self.output_events:>8} out"
+            f"  {self.events_per_second:>12,.0f} events/s  peak {self.peak_kib:>9,.1f} KiB"
+        )
+
+
+async def _aiter(events: list[Any]) -> AsyncIterator[Any]:
+    for event in events:
+        yield event
+
+
+async def replay(stream: RecordedStream) -> list[StreamTaskMessage]:
+    return [event async for event in stream.convert(_aiter(stream.events))]
+
+
+async def measure(stream: RecordedStream, repeats: int = 3) -> BenchResult:
+    """Best-of-``repeats`` conversion time, then one traced run for peak memory."""
+    best = float("inf")
+    output_events = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output_events = 0
+        async for _event in stream.convert(_aiter(stream.events)):
+            output_events += 1
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        async for _event in stream.convert(_aiter(stream.events)):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchResult(stream.name, len(stream.events), output_events, best, peak / 1024)
+
+
+# ---------------------------------------------------------------------------
+# OpenAI Agents SDK: Runner.run_streamed(...).stream_events()
+# ---------------------------------------------------------------------------
+
+
+def openai_stream(n_tokens: int) -> RecordedStream:
+    from agents import RawResponsesStreamEvent
+    from openai.types.responses import (
+        ResponseOutputMessage,
+        ResponseReasoningItem,
+        ResponseTextDeltaEvent,
+        ResponseFunctionToolCall,
+        ResponseOutputItemDoneEvent,
+        ResponseOutputItemAddedEvent,
+        ResponseReasoningSummaryTextDeltaEvent,
+    )
+
+    from agentex.lib.adk._modules._openai_sync import convert_openai_to_agentex_events
+
+    seq = iter(range(10**9))
+
+    def raw(data: Any) -> Any:
+        return RawResponsesStreamEvent(data=data)
+
+    reasoning = ResponseReasoningItem(id="rs_1", summary=[], type="reasoning")
+    message = ResponseOutputMessage(id="msg_1", content=[], role="assistant", status="completed", type="message")
+    tool_call = ResponseFunctionToolCall(
+        arguments='{"city": "Paris"}', call_id="call_1", name="get_weather", type="function_call"
+    )
+    events: list[Any] = [
+        raw(
+            ResponseOutputItemAddedEvent(
+                item=reasoning, output_index=0, sequence_number=next(seq), type="response.output_item.added"
+            )
+        ),
+        *(
+            raw(
+                ResponseReasoningSummaryTextDeltaEvent(
+                    delta=token,
+                    item_id="rs_1",
+                    output_index=0,
+                    sequence_number=next(seq),
+                    summary_index=0,
+                    type="response.reasoning_summary_text.delta",
+                )
+            )
+            for token in _tokens(max(n_tokens // 10, 1))
+        ),
+        raw(
+            ResponseOutputItemDoneEvent(
+                item=reasoning, output_index=0, sequence_number=next(seq), type="response.output_item.done"
+            )
+        ),
+        types.SimpleNamespace(
+            type="run_item_stream_event", item=types.SimpleNamespace(type="tool_call_item", raw_item=tool_call)
+        ),
+        types.SimpleNamespace(
+            type="run_item_stream_event",
+            item=types.SimpleNamespace(type="tool_call_output_item", raw_item={"call_id": "call_1", "output": "Sunny"}),
+        ),
+        raw(
+            ResponseOutputItemAddedEvent(
+                item=message, output_index=1, sequence_number=next(seq), type="response.output_item.added"
+            )
+        ),
+    ]
+    tokens = list(_tokens(n_tokens))
+    events += [
+        raw(
+            ResponseTextDeltaEvent(
+                content_index=0,
+                delta=token,
+                item_id="msg_1",
+                logprobs=[],
+                output_index=1,
+                sequence_number=next(seq),
+                type="response.output_text.delta",
+            )
+        )
+        for token in tokens
+    ]
+    events.append(
+        raw(
+            ResponseOutputItemDoneEvent(
+                item=message, output_index=1, sequence_number=next(seq), type="response.output_item.done"
+            )
+        )
+    )
+    return RecordedStream("openai", events, convert_openai_to_agentex_events, "".join(tokens))
+
+
+# ---------------------------------------------------------------------------
+# Pydantic AI: agent.run_stream_events(...)
+# ---------------------------------------------------------------------------
+
+
+def pydantic_ai_stream(n_tokens: int) -> RecordedStream:
+    from pydantic_ai.messages import (
+        TextPart,
+        PartEndEvent,
+        ThinkingPart,
+        ToolCallPart,
+        TextPartDelta,
+        PartDeltaEvent,
+        PartStartEvent,
+        ToolReturnPart,
+        FinalResultEvent,
+        ThinkingPartDelta,
+        FunctionToolCallEvent,
+        FunctionToolResultEvent,
+    )
+
+    from agentex.lib.adk._modules._pydantic_ai_sync import convert_pydantic_ai_to_agentex_events
+
+    tool_call = ToolCallPart(tool_name="get_weather", args={"city": "Paris"}, tool_call_id="call_1")
+    events: list[Any] = [
+        PartStartEvent(index=0, part=ThinkingPart(content="")),
+        *(
+            PartDeltaEvent(index=0, delta=ThinkingPartDelta(content_delta=token))
+            for token in _tokens(max(n_tokens // 10, 1))
+        ),
+        PartEndEvent(index=0, part=ThinkingPart(content="")),
+        PartStartEvent(index=1, part=tool_call),
+        PartEndEvent(index=1, part=tool_call),
+        FunctionToolCallEvent(part=tool_call),
+        FunctionToolResultEvent(part=ToolReturnPart(tool_name="get_weather", content="Sunny", tool_call_id="call_1")),
+        PartStartEvent(index=0, part=TextPart(content="")),
+        FinalResultEvent(tool_name=None, tool_call_id=None),
+    ]
+    tokens = list(_tokens(n_tokens))
+    events += [PartDeltaEvent(index=0, delta=TextPartDelta(content_delta=token)) for token in tokens]
+    events.append(PartEndEvent(index=0, part=TextPart(content="".join(tokens))))
+    return RecordedStream("pydantic-ai", events, convert_pydantic_ai_to_agentex_events, "".join(tokens))
+
+
+# ---------------------------------------------------------------------------
+# LangGraph: graph.astream(..., stream_mode=["messages", "updates"])
+# ---------------------------------------------------------------------------
+
+
+def langgraph_stream(n_tokens: int) -> RecordedStream:
+    from langchain_core.messages import AIMessage, ToolMessage, AIMessageChunk
+
+    from agentex.lib.adk._modules._langgraph_sync import convert_langgraph_to_agentex_events
+
+    metadata = {"langgraph_node": "agent"}
+    tool_call = {"id": "call_1", "name": "get_weather", "args": {"city": "Paris"}}
+    events: list[Any] = [
+        (
+            "messages",
+            (
+                AIMessageChunk(content=[{"type": "reasoning", "summary": [{"type": "summary_text", "text": token}]}]),
+                metadata,
+            ),
+        )
+        for token in _tokens(max(n_tokens // 10, 1))
+    ]
+    events += [
+        ("updates", {"agent": {"messages": [AIMessage(content="", tool_calls=[tool_call])]}}),
+        ("updates", {"tools": {"messages": [ToolMessage(content="Sunny", tool_call_id="call_1", name="get_weather")]}}),
+        # tool-call chunks carry no content and produce nothing
+        ("messages", (AIMessageChunk(content=""), metadata)),
+    ]
+    tokens = list(_tokens(n_tokens))
+    events += [("messages", (AIMessageChunk(content=token), metadata)) for token in tokens]
+    events.append(("updates", {"agent": {"messages": [AIMessage(content="".join(tokens))]}}))
+    return RecordedStream("langgraph", events, convert_langgraph_to_agentex_events, "".join(tokens))
+
+
+# ---------------------------------------------------------------------------
+# Claude Code: claude -p --output-format stream-json --include-partial-messages
+# ---------------------------------------------------------------------------
+
+
+def claude_code_stream(n_tokens: int) -> RecordedStream:
+    from agentex.lib.adk._modules._claude_code_sync import convert_claude_code_to_agentex_events
+
+    def stream_event(event: dict[str, Any]) -> str:
+        return json.dumps({"type": "stream_event", "event": event, "session_id": "s1"})
+
+    def block_delta(delta: dict[str, Any]) -> str:
+        return stream_event({"type": "content_block_delta", "index": 0, "delta": delta})
+
+    thinking = list(_tokens(max(n_tokens // 10, 1)))
+    tokens = list(_tokens(n_tokens))
+    lines = [
+        json.dumps({"type": "system", "subtype": "init", "session_id": "s1", "tools": []}),
+        stream_event({"type": "message_start", "message": {"id": "m1"}}),
+        stream_event(
+            {"type": "content_block_start", "index": 0, "content_block": {"type": "thinking", "thinking": ""}}
+        ),
+        *(block_delta({"type": "thinking_delta", "thinking": token}) for token in thinking),
+        block_delta({"type": "signature_delta", "signature": "sig"}),
+        stream_event({"type": "content_block_stop", "index": 0}),
+        json.dumps(
+            {"type": "assistant", "message": {"content": [{"type": "thinking", "thinking": "".join(thinking)}]}}
+        ),
+        json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [{"type": "tool_use", "id": "call_1", "name": "Read", "input": {"path": "a.py"}}]
+                },
+            }
+        ),
+        json.dumps(
+            {
+                "type": "user",
+                "message": {"content": [{"type": "tool_result", "tool_use_id": "call_1", "content": "ok"}]},
+            }
+        ),
+        stream_event({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+    ]
+    for i, token in enumerate(tokens):
+        lines.append(block_delta({"type": "text_delta", "text": token}))
+        if i % 50 == 0:
+            lines.append(stream_event({"type": "ping"}))
+    lines += [
+        stream_event({"type": "content_block_stop", "index": 0}),
+        stream_event({"type": "message_delta", "delta": {"stop_reason": "end_turn"}}),
+        json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "".join(tokens)}]}}),
+        json.dumps({"type": "result", "subtype": "success", "usage": {"input_tokens": 1, "output_tokens": n_tokens}}),
+    ]
+    return RecordedStream("claude-code", lines, convert_claude_code_to_agentex_events, "".join(tokens))
+
+
+# ---------------------------------------------------------------------------
+# Codex: codex exec --json
+# ---------------------------------------------------------------------------
+
+
+def codex_stream(n_tokens: int) -> RecordedStream:
+    from agentex.lib.adk._modules._codex_sync import convert_codex_to_agentex_events
+
+    def line(event: dict[str, Any]) -> str:
+        return json.dumps(event)
+
+    thinking = "".join(_tokens(max(n_tokens // 10, 1)))
+    command = {"id": "cmd_1", "type": "command_execution", "command": "ls", "status": "in_progress"}
+    lines = [
+        line({"type": "thread.started", "thread_id": "th_1"}),
+        line({"type": "turn.started"}),
+        line({"type": "item.started", "item": {"id": "r1", "type": "reasoning", "text": ""}}),
+        line(
+            {"type": "item.updated", "item": {"id": "r1", "type": "reasoning", "text": thinking[: len(thinking) // 2]}}
+        ),
+        line({"type": "item.completed", "item": {"id": "r1", "type": "reasoning", "text": thinking}}),
+        line({"type": "item.started", "item": command}),
+        line(
+            {
+                "type": "item.completed",
+                "item": {**command, "status": "completed", "aggregated_output": "a.py", "exit_code": 0},
+            }
+        ),
+    ]
+    # Codex sends the cumulative text of an agent message on every update.
+    text = ""
+    for token in _tokens(n_tokens):
+        text += token
+        lines.append(line({"type": "item.updated", "item": {"id": "m1", "type": "agent_message", "text": text}}))
+    lines += [
+        line({"type": "item.completed", "item": {"id": "m1", "type": "agent_message", "text": text}}),
+        line({"type": "turn.completed", "usage": {"input_tokens": 1, "output_tokens": n_tokens}}),
+    ]
+    return RecordedStream("codex", lines, convert_codex_to_agentex_events, text)
+
+
+RECORDED_STREAMS: dict[str, Callable[[int], RecordedStream]] = {
+    "openai": openai_stream,
+    "pydantic-ai": pydantic_ai_stream,
+    "langgraph": langgraph_stream,
+    "claude-code": claude_code_stream,
+    "codex": codex_stream,
+}
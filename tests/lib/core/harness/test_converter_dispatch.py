@@ -0,0 +1,87 @@
+"""Tests for the type-keyed dispatch the harness-tap converters route events through."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from agentex.types.task_message_delta import TextDelta
+from agentex.lib.core.harness.dispatch import NO_EVENTS, TypeDispatch
+from agentex.types.task_message_update import (
+    StreamTaskMessageDone,
+    StreamTaskMessageDelta,
+    StreamTaskMessageStart,
+)
+
+from .converter_bench import RECORDED_STREAMS, replay
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class Other:
+    pass
+
+
+class TestTypeDispatch:
+    def test_exact_class(self) -> None:
+        dispatch = TypeDispatch({Base: "base", Other: "other"})
+
+        assert dispatch[Base] == "base"
+        assert dispatch[Other] == "other"
+
+    def test_subclass_resolves_to_nearest_registered_base(self) -> None:
+        dispatch = TypeDispatch({Base: "base"})
+
+        assert dispatch[Child] == "base"
+        assert TypeDispatch({Base: "base", Child: "child"})[Child] == "child"
+
+    def test_unregistered_class_resolves_to_none(self) -> None:
+        dispatch = TypeDispatch({Base: "base"})
+
+        assert dispatch[Other] is None
+        assert dispatch[Other] is None
+
+    def test_spec_mock_dispatches_like_its_spec(self) -> None:
+        dispatch = TypeDispatch({Base: "base"})
+
+        assert dispatch[Mock(spec=Child).__class__] == "base"
+
+
+@pytest.fixture(autouse=True)
+def _real_langchain_core():
+    """The ADK conftest stubs langchain_core; the LangGraph stream needs the real classes."""
+    stub_keys = [k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph")]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    yield
+    sys.modules.update(saved)
+
+
+@pytest.mark.parametrize("name", list(RECORDED_STREAMS))
+async def test_recorded_stream_converts_to_well_formed_messages(name: str) -> None:
+    stream = RECORDED_STREAMS[name](200)
+
+    out = await replay(stream)
+
+    started = {e.index for e in out if isinstance(e, StreamTaskMessageStart)}
+    done = [e.index for e in out if isinstance(e, StreamTaskMessageDone)]
+    assert sorted(done) == sorted(started)
+    text_index = next(e.index for e in out if isinstance(e, StreamTaskMessageStart) and e.content.type == "text")
+    text = "".join(
+        e.delta.text_delta or ""
+        for e in out
+        if isinstance(e, StreamTaskMessageDelta) and e.index == text_index and isinstance(e.delta, TextDelta)
+    )
+    assert text == stream.text
+
+
+def test_no_events_is_shared_and_empty() -> None:
+    assert NO_EVENTS == ()
+    assert list(NO_EVENTS) == []
@@ -0,0 +1,45 @@
+"""
+Throughput benchmark for the harness-tap converters.
+
+Replays a recorded stream through each converter (OpenAI Agents, Pydantic AI,
+LangGraph, Claude Code, Codex; see ``converter_bench.py``) and reports input
+events per second and the peak memory traced while converting. Codex resends
+an agent message's whole text on every update, so its stream is shorter.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/core/harness/test_converter_throughput_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from .converter_bench import RECORDED_STREAMS, replay, measure
+
+N_TOKENS = {"openai": 20_000, "pydantic-ai": 20_000, "langgraph": 20_000, "claude-code": 20_000, "codex": 2_000}
+
+
+@pytest.fixture(autouse=True)
+def _real_langchain_core():
+    """The ADK conftest stubs langchain_core; the LangGraph stream needs the real classes."""
+    stub_keys = [k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph")]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    yield
+    sys.modules.update(saved)
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+@pytest.mark.parametrize("name", list(RECORDED_STREAMS))
+async def test_converter_throughput(name: str) -> None:
+    stream = RECORDED_STREAMS[name](N_TOKENS[name])
+    assert len(await replay(stream)) > N_TOKENS[name]
+
+    result = await measure(stream)
+
+    print(f"\n{result}")
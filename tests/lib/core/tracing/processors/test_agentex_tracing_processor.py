@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 import asyncio
 import weakref
 from datetime import datetime, timezone
@@ -283,3 +285,56 @@ class TestAgentexAsyncTracingProcessor:
             "WeakKeyDictionary should have evicted the dead loop's entry; "
             "remaining keys would cause stale-client reuse on id() recycling."
         )
+
+
+class TestAgentexAsyncCompressedExport:
+    async def test_end_create_posts_a_compressed_body(self, monkeypatch):
+        monkeypatch.delenv(SKIP_ENV, raising=False)
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION", "gzip")
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES", "0")
+        with patch(f"{MODULE}.create_async_agentex_client") as mock_factory:
+            client = MagicMock()
+            client.post = AsyncMock()
+            client.spans.create = AsyncMock()
+            mock_factory.return_value = client
+
+            from agentex.lib.core.tracing.processors.agentex_tracing_processor import (
+                AgentexAsyncTracingProcessor,
+            )
+
+            processor = AgentexAsyncTracingProcessor(_make_config())
+            span = _make_span()
+            await processor.on_span_end(span)
+
+        client.spans.create.assert_not_called()
+        args, kwargs = client.post.call_args
+        assert args == ("/spans",)
+        assert kwargs["options"]["headers"]["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(kwargs["content"]))
+        assert body["id"] == "span-1"
+        assert body["input"] == {"in": 1}
+        assert body["output"] == {"out": 2}
+
+    async def test_update_patches_a_compressed_body_when_skip_disabled(self, monkeypatch):
+        monkeypatch.setenv(SKIP_ENV, "0")
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION", "gzip")
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES", "0")
+        with patch(f"{MODULE}.create_async_agentex_client") as mock_factory:
+            client = MagicMock()
+            client.patch = AsyncMock()
+            client.spans.update = AsyncMock()
+            mock_factory.return_value = client
+
+            from agentex.lib.core.tracing.processors.agentex_tracing_processor import (
+                AgentexAsyncTracingProcessor,
+            )
+
+            processor = AgentexAsyncTracingProcessor(_make_config())
+            await processor.on_span_end(_make_span())
+
+        client.spans.update.assert_not_called()
+        args, kwargs = client.patch.call_args
+        assert args == ("/spans/span-1",)
+        body = json.loads(gzip.decompress(kwargs["content"]))
+        assert "id" not in body
+        assert body["output"] == {"out": 2}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+
+import pytest
+
+from agentex.lib.core.tracing.processors.export_encoding import (
+    ExportBodyEncoder,
+    export_compression_from_env,
+)
+
+COMPRESSION_ENV = "AGENTEX_TRACING_EXPORT_COMPRESSION"
+PAYLOAD = {"items": [{"name": "llm", "input": {"prompt": "lorem ipsum " * 200}}]}
+
+
+class TestCompressionFromEnv:
+    @pytest.mark.parametrize("val", ["", "0", "off", "false"])
+    def test_unset_or_off_keeps_client_encoding(self, monkeypatch, val):
+        monkeypatch.setenv(COMPRESSION_ENV, val)
+        assert export_compression_from_env() is None
+        assert ExportBodyEncoder.from_env() is None
+
+    @pytest.mark.parametrize("val", ["gzip", "GZIP", " identity "])
+    def test_known_values(self, monkeypatch, val):
+        monkeypatch.setenv(COMPRESSION_ENV, val)
+        assert export_compression_from_env() == val.strip().lower()
+
+    def test_unknown_value_is_ignored(self, monkeypatch):
+        monkeypatch.setenv(COMPRESSION_ENV, "brotli")
+        assert export_compression_from_env() is None
+
+    def test_min_bytes_from_env(self, monkeypatch):
+        monkeypatch.setenv(COMPRESSION_ENV, "gzip")
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES", "10")
+        encoder = ExportBodyEncoder.from_env()
+        assert encoder is not None and encoder.min_bytes == 10
+
+
+class TestExportBodyEncoder:
+    def test_gzip_round_trip(self):
+        body = ExportBodyEncoder("gzip").encode(PAYLOAD)
+
+        assert body.headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(body.content)) == PAYLOAD
+        assert len(body.content) < body.raw_size
+
+    def test_zstd_round_trip(self):
+        zstandard = pytest.importorskip("zstandard")
+        body = ExportBodyEncoder("zstd").encode(PAYLOAD)
+
+        assert body.headers["Content-Encoding"] == "zstd"
+        assert json.loads(zstandard.ZstdDecompressor().decompress(body.content)) == PAYLOAD
+
+    def test_identity_and_small_bodies_are_not_compressed(self):
+        for encoder, payload in ((ExportBodyEncoder("identity"), PAYLOAD), (ExportBodyEncoder("gzip"), {"a": 1})):
+            body = encoder.encode(payload)
+            assert "Content-Encoding" not in body.headers
+            assert json.loads(body.content) == payload
+
+    async def test_encode_async_builds_and_encodes_off_the_loop(self):
+        threads: list[threading.Thread] = []
+
+        def build():
+            threads.append(threading.current_thread())
+            return PAYLOAD
+
+        body = await ExportBodyEncoder("gzip").encode_async(build)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert json.loads(gzip.decompress(body.content)) == PAYLOAD
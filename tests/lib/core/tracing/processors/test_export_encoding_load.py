@@ -0,0 +1,166 @@
+"""
+Manual benchmark for off-loop, compressed span export bodies.
+
+Exports 400 spans carrying ~150 KB LLM inputs/outputs through
+``AgentexAsyncTracingProcessor`` and a real HTTP client to a local stub
+server (on its own thread), 20 at a time, once per
+``AGENTEX_TRACING_EXPORT_COMPRESSION`` mode. While the export runs, a ticker
+task sleeps 1 ms in a loop on the same event loop and records how late it
+wakes up — the lag ACP traffic on that loop would see. Reports bytes on the
+wire, export time and loop lag per mode.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/core/tracing/processors/test_export_encoding_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+import asyncio
+import threading
+from datetime import UTC, datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from agentex import AsyncAgentex
+from agentex.types.span import Span
+
+N_SPANS = 400
+CONCURRENCY = 20
+TICK_S = 0.001
+MODES = ["client (default)", "identity", "gzip", "zstd"]
+
+_SPAN_RESPONSE = b'{"id":"s","name":"s","start_time":"2026-05-13T18:30:00Z","trace_id":"t"}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bytes_received = 0
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.lock:
+            type(self).bytes_received += len(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_SPAN_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(_SPAN_RESPONSE)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _span(i: int) -> Span:
+    now = datetime.now(UTC)
+    turns = [
+        {"role": "user" if t % 2 else "assistant", "content": f"turn {t} of span {i}: " + "lorem ipsum dolor " * 40}
+        for t in range(200)
+    ]
+    return Span(
+        id=str(uuid.uuid4()),
+        trace_id="trace-1",
+        name="llm",
+        start_time=now,
+        end_time=now,
+        input={"messages": turns},
+        output={"content": "sit amet " * 2000},
+        data={"model": "gpt-4o", "usage": {"prompt_tokens": 40_000, "completion_tokens": 4_000}},
+    )
+
+
+async def _export(base_url: str, mode: str, spans: list[Span], monkeypatch: pytest.MonkeyPatch) -> dict[str, float]:
+    from agentex.lib.core.tracing.processors.agentex_tracing_processor import AgentexAsyncTracingProcessor
+
+    if mode == "client (default)":
+        monkeypatch.delenv("AGENTEX_TRACING_EXPORT_COMPRESSION", raising=False)
+    else:
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION", mode)
+    processor = AgentexAsyncTracingProcessor(MagicMock())
+    client = AsyncAgentex(
+        base_url=base_url,
+        api_key="test",
+        http_client=httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=CONCURRENCY)),
+    )
+    processor._build_client = lambda: client  # type: ignore[method-assign]
+
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            t_start = time.perf_counter()
+            await asyncio.sleep(TICK_S)
+            lags.append(time.perf_counter() - t_start - TICK_S)
+
+    _StubHandler.bytes_received = 0
+    tick_task = asyncio.create_task(ticker())
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def export_one(span: Span) -> None:
+        async with semaphore:
+            await processor.on_span_end(span)
+
+    t_start = time.perf_counter()
+    await asyncio.gather(*(export_one(s) for s in spans))
+    elapsed = time.perf_counter() - t_start
+    done.set()
+    await tick_task
+    await client.close()
+
+    lags.sort()
+    return {
+        "bytes": _StubHandler.bytes_received,
+        "elapsed": elapsed,
+        "lag_p99": lags[int(len(lags) * 0.99)],
+        "lag_max": lags[-1],
+    }
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestExportEncodingLoad:
+    async def test_bytes_on_wire_and_loop_lag(self, monkeypatch):
+        pytest.importorskip("zstandard")
+        monkeypatch.setenv("AGENTEX_TRACING_SKIP_AGENTEX_SPAN_START", "1")
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        spans = [_span(i) for i in range(N_SPANS)]
+
+        try:
+            results = {mode: await _export(base_url, mode, spans, monkeypatch) for mode in MODES}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 76}")
+        print(f" Span export: {N_SPANS} spans, {CONCURRENCY} concurrent, local stub server")
+        print(f"{'=' * 76}")
+        print(f" {'mode':<20}{'MB on wire':>12}{'export':>10}{'loop lag p99':>15}{'max':>10}")
+        for mode, r in results.items():
+            print(
+                f" {mode:<20}{r['bytes'] / 1e6:>12.1f}{r['elapsed']:>9.2f}s"
+                f"{r['lag_p99'] * 1000:>13.1f}ms{r['lag_max'] * 1000:>8.1f}ms"
+            )
+        print(f"{'=' * 76}")
+        print()
+
+        baseline = results["client (default)"]
+        assert results["gzip"]["bytes"] < baseline["bytes"] / 5
+        assert results["zstd"]["bytes"] < baseline["bytes"] / 5
+        # Loop lag is reported, not asserted: the JSON encoders hold the GIL,
+        # so the gain depends on the machine and is too noisy to gate on.
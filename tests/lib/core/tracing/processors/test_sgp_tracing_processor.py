@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 import uuid
 import asyncio
 from datetime import UTC, datetime
@@ -494,3 +496,23 @@ class TestSkipSpanStartEnv:
     def test_other_values_keep_skip_enabled(self, monkeypatch, val):
         monkeypatch.setenv("AGENTEX_TRACING_SKIP_SPAN_START", val)
         assert self._fn()() is True
+
+
+class TestSGPAsyncCompressedExport:
+    async def test_batch_is_sent_as_a_compressed_body(self, monkeypatch):
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION", "gzip")
+        monkeypatch.setenv("AGENTEX_TRACING_EXPORT_COMPRESSION_MIN_BYTES", "0")
+        processor, _, mock_client = TestSGPAsyncTracingProcessor._make_processor()
+        mock_client.put = AsyncMock()
+
+        with patch(f"{MODULE}.create_span", side_effect=lambda **kw: _make_mock_sgp_span()):
+            spans = [_make_span() for _ in range(3)]
+            for s in spans:
+                s.end_time = datetime.now(UTC)
+            await processor.on_spans_end(spans)
+
+        mock_client.spans.upsert_batch.assert_not_called()
+        args, kwargs = mock_client.put.call_args
+        assert args == ("/v5/spans/batch",)
+        assert kwargs["options"]["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["content"])) == {"items": [{"mock": "params"}] * 3}
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentex.types.span import Span
+from agentex.lib.core.tracing.trace import Trace, AsyncTrace
+from agentex.lib.core.tracing.tracer import AsyncTracer
+from agentex.lib.core.tracing.sampling import PolicySampler
+from agentex.lib.core.tracing.span_error import set_span_error
+from agentex.lib.core.tracing.span_queue import SpanEventType
+from agentex.lib.core.tracing.tracing_processor_manager import set_span_sampler
+
+_TS = datetime(2026, 5, 13, 18, 30, 0, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _span(
+    name: str = "span",
+    trace_id: str = "trace-1",
+    parent_id: str | None = "root",
+    duration: float = 0.0,
+    error: bool = False,
+) -> Span:
+    span = Span(
+        id=str(uuid.uuid4()),
+        trace_id=trace_id,
+        name=name,
+        parent_id=parent_id,
+        start_time=_TS,
+        end_time=_TS + timedelta(seconds=duration),
+    )
+    if error:
+        set_span_error(span, RuntimeError("boom"))
+    return span
+
+
+def _run(sampler: PolicySampler, span: Span) -> tuple[bool, list[str], list[str]]:
+    started = sampler.on_start(span)
+    result = sampler.on_end(span)
+    return started, [s.name for s in result.starts], [s.name for s in result.ends]
+
+
+class TestHeadSampling:
+    def test_default_keeps_everything(self):
+        assert _run(PolicySampler(), _span("a")) == (True, [], ["a"])
+
+    def test_zero_rate_drops_everything(self):
+        assert _run(PolicySampler(trace_sample_rate=0.0), _span("a")) == (False, [], [])
+
+    def test_decision_is_per_trace(self):
+        sampler = PolicySampler(trace_sample_rate=0.5)
+        for i in range(50):
+            decisions = {sampler.on_start(_span(trace_id=f"trace-{i}")) for _ in range(5)}
+            assert len(decisions) == 1
+
+    def test_rate_is_roughly_respected(self):
+        sampler = PolicySampler(trace_sample_rate=0.25)
+        kept = sum(sampler.on_start(_span(trace_id=str(uuid.uuid4()))) for _ in range(4000))
+        assert 800 < kept < 1200
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            PolicySampler(trace_sample_rate=1.5)
+
+
+class TestRateLimits:
+    def test_limits_per_span_name(self):
+        clock = _Clock()
+        sampler = PolicySampler(span_rate_limits={"delta": 2}, clock=clock)
+
+        assert [sampler.on_start(_span("delta")) for _ in range(4)] == [True, True, False, False]
+        assert all(sampler.on_start(_span("other")) for _ in range(4))
+
+        clock.now = 0.5  # one token refilled
+        assert [sampler.on_start(_span("delta")) for _ in range(2)] == [True, False]
+
+    def test_patterns_and_exact_names(self):
+        clock = _Clock()
+        sampler = PolicySampler(span_rate_limits={"tool:*": 1, "tool:search": 3}, clock=clock)
+
+        assert [sampler.on_start(_span("tool:search")) for _ in range(4)] == [True, True, True, False]
+        # every other tool shares the pattern's bucket
+        assert [sampler.on_start(_span(name)) for name in ("tool:a", "tool:b")] == [True, False]
+
+    def test_rate_limited_span_end_is_dropped(self):
+        sampler = PolicySampler(span_rate_limits={"delta": 1})
+        _run(sampler, _span("delta"))
+        assert _run(sampler, _span("delta")) == (False, [], [])
+
+
+class TestErrorSpans:
+    def test_sampled_out_error_span_is_kept_with_its_start(self):
+        sampler = PolicySampler(trace_sample_rate=0.0)
+        assert _run(sampler, _span("failing", error=True)) == (False, ["failing"], ["failing"])
+
+    def test_errors_can_be_dropped(self):
+        sampler = PolicySampler(trace_sample_rate=0.0, always_keep_errors=False)
+        assert _run(sampler, _span("failing", error=True)) == (False, [], [])
+
+
+class TestTailSampling:
+    def _trace(self, sampler: PolicySampler, *, child_error: bool = False, root_duration: float = 0.0):
+        root = _span("root", parent_id=None, duration=root_duration)
+        sampler.on_start(root)
+        for name in ("llm", "tool"):
+            child = _span(name, parent_id=root.id, error=child_error and name == "tool")
+            sampler.on_start(child)
+            assert sampler.on_end(child).ends == []
+        return sampler.on_end(root)
+
+    def test_uneventful_trace_is_dropped_at_root_end(self):
+        result = self._trace(PolicySampler(trace_sample_rate=0.0, tail_sampling=True))
+        assert (result.starts, result.ends) == ([], [])
+
+    def test_failed_trace_is_kept_whole(self):
+        result = self._trace(PolicySampler(trace_sample_rate=0.0, tail_sampling=True), child_error=True)
+        assert [s.name for s in result.starts] == ["llm", "tool", "root"]
+        assert [s.name for s in result.ends] == ["llm", "tool", "root"]
+
+    def test_slow_trace_is_kept(self):
+        sampler = PolicySampler(trace_sample_rate=0.0, tail_sampling=True, tail_latency_threshold=5)
+        assert [s.name for s in self._trace(sampler, root_duration=10).ends] == ["llm", "tool", "root"]
+        assert self._trace(sampler, root_duration=1).ends == []
+
+    def test_head_kept_root_releases_rate_limited_children_on_error(self):
+        sampler = PolicySampler(span_rate_limits={"llm": 0, "tool": 0}, tail_sampling=True)
+        result = self._trace(sampler, child_error=True)
+        # the root's start was already emitted, so only its end follows
+        assert [s.name for s in result.starts] == ["llm", "tool"]
+        assert [s.name for s in result.ends] == ["llm", "tool", "root"]
+
+    def test_trace_continued_from_another_process_is_decided_at_its_local_root(self):
+        sampler = PolicySampler(trace_sample_rate=0.0, tail_sampling=True)
+        # e.g. an activity span whose parent is the workflow span, started in another process
+        activity = _span("activity", parent_id="remote-span")
+        sampler.on_start(activity)
+        child = _span("llm", parent_id=activity.id, error=True)
+        sampler.on_start(child)
+        assert sampler.on_end(child).ends == []
+
+        result = sampler.on_end(activity)
+
+        assert [s.name for s in result.ends] == ["llm", "activity"]
+        assert sampler._buffers == {} and not sampler._open
+
+    def test_remote_parent_trace_without_errors_is_not_left_buffered(self):
+        sampler = PolicySampler(trace_sample_rate=0.0, tail_sampling=True)
+        activity = _span("activity", parent_id="remote-span")
+        sampler.on_start(activity)
+        child = _span("llm", parent_id=activity.id)
+        sampler.on_start(child)
+        sampler.on_end(child)
+
+        assert sampler.on_end(activity).ends == []
+        assert sampler._buffers == {}
+
+    def test_open_spans_are_bounded(self):
+        sampler = PolicySampler(max_open_spans=2)
+        spans = [_span(str(i)) for i in range(3)]
+        for span in spans:
+            sampler.on_start(span)
+
+        assert list(sampler._open) == [spans[1].id, spans[2].id]
+
+    def test_buffers_are_bounded(self):
+        sampler = PolicySampler(
+            trace_sample_rate=0.0, tail_sampling=True, max_buffered_traces=2, max_buffered_spans_per_trace=3
+        )
+        for trace in ("a", "b", "c"):
+            for _ in range(5):
+                sampler.on_end(_span(trace_id=trace))
+
+        assert list(sampler._buffers) == ["b", "c"]
+        assert all(len(spans) == 3 for spans in sampler._buffers.values())
+
+    def test_buffered_spans_are_snapshots(self):
+        sampler = PolicySampler(trace_sample_rate=0.0, tail_sampling=True)
+        child = _span("child", error=True)
+        sampler.on_end(child)
+        child.name = "mutated"
+
+        result = sampler.on_end(_span("root", parent_id=None))
+        assert [s.name for s in result.ends] == ["child", "root"]
+
+
+class TestTraceIntegration:
+    def test_sync_trace_emits_held_back_start_before_end(self):
+        processor = MagicMock()
+        trace = Trace(
+            processors=[processor], client=MagicMock(), trace_id="t", sampler=PolicySampler(trace_sample_rate=0.0)
+        )
+
+        with trace.span("quiet"):
+            pass
+        with pytest.raises(RuntimeError):
+            with trace.span("failing"):
+                raise RuntimeError("boom")
+
+        calls = [(c[0], c.args[0].name) for c in processor.method_calls]
+        assert calls == [("on_span_start", "failing"), ("on_span_end", "failing")]
+
+    async def test_async_trace_enqueues_only_sampled_spans(self):
+        queue = MagicMock()
+        trace = AsyncTrace(
+            processors=[MagicMock()],
+            client=MagicMock(),
+            trace_id="t",
+            span_queue=queue,
+            sampler=PolicySampler(span_rate_limits={"delta": 1}),
+        )
+
+        for _ in range(10):
+            async with trace.span("delta"):
+                pass
+
+        events = [c.args[0] for c in queue.enqueue.call_args_list]
+        assert events == [SpanEventType.START, SpanEventType.END]
+
+    async def test_tracer_uses_the_registered_sampler(self):
+        sampler = PolicySampler()
+        set_span_sampler(sampler)
+        try:
+            assert AsyncTracer(MagicMock()).trace("t", span_queue=MagicMock()).sampler is sampler
+        finally:
+            set_span_sampler(None)
@@ -0,0 +1,147 @@
+"""
+Manual benchmark for span sampling.
+
+Simulates an agent workload — 1,000 traces, each a root ``turn`` span with
+four ``llm`` spans streaming 40 ``delta`` spans between them and a
+``tool:search`` span that occasionally fails — through ``AsyncTrace`` and a
+real ``AsyncSpanQueue`` into an exporter that serializes every batch (the CPU work of the HTTP
+processors). Runs once without a sampler and once per sampling policy, and
+reports enqueued span events, exported spans and exporter CPU time.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/core/tracing/test_sampling_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import override
+
+import pytest
+
+from agentex.lib.utils import json_codec
+from agentex.types.span import Span
+from agentex.lib.core.tracing.trace import AsyncTrace
+from agentex.lib.core.tracing.sampling import SpanSampler, PolicySampler
+from agentex.lib.core.tracing.span_queue import AsyncSpanQueue
+from agentex.lib.core.tracing.processors.tracing_processor_interface import AsyncTracingProcessor
+
+N_TRACES = 1_000
+LLM_CALLS = 4
+DELTAS_PER_TRACE = 40
+SPANS_PER_TRACE = DELTAS_PER_TRACE + LLM_CALLS + 2
+FAILURE_EVERY = 50  # one trace in FAILURE_EVERY has a failing tool call
+PAYLOAD = {"messages": [{"role": "user", "content": "lorem ipsum " * 40}] * 4}
+
+
+class _SerializingExporter(AsyncTracingProcessor):
+    def __init__(self) -> None:
+        self.exported = 0
+        self.cpu_seconds = 0.0
+
+    def _export(self, spans: list[Span]) -> None:
+        t_start = time.process_time()
+        json_codec.dumps([span.model_dump(mode="json", exclude_none=True) for span in spans])
+        self.cpu_seconds += time.process_time() - t_start
+        self.exported += len(spans)
+
+    @override
+    async def on_span_start(self, span: Span) -> None:
+        self._export([span])
+
+    @override
+    async def on_span_end(self, span: Span) -> None:
+        self._export([span])
+
+    @override
+    async def on_spans_start(self, spans: list[Span]) -> None:
+        self._export(spans)
+
+    @override
+    async def on_spans_end(self, spans: list[Span]) -> None:
+        self._export(spans)
+
+    @override
+    async def shutdown(self) -> None:
+        pass
+
+
+class _CountingQueue(AsyncSpanQueue):
+    enqueued = 0
+
+    @override
+    def enqueue(self, *args, **kwargs) -> None:
+        self.enqueued += 1
+        super().enqueue(*args, **kwargs)
+
+
+async def _run(sampler: SpanSampler | None) -> dict[str, float]:
+    exporter = _SerializingExporter()
+    queue = _CountingQueue(linger_ms=0, max_size=0)
+    t_start = time.perf_counter()
+
+    for i in range(N_TRACES):
+        trace = AsyncTrace(
+            processors=[exporter], client=None, trace_id=f"trace-{i}", span_queue=queue, sampler=sampler
+        )
+        async with trace.span("turn", input=PAYLOAD) as turn:
+            for _ in range(LLM_CALLS):
+                async with trace.span("llm", parent_id=turn.id, input=PAYLOAD) as llm:
+                    for _ in range(DELTAS_PER_TRACE // LLM_CALLS):
+                        async with trace.span("delta", parent_id=llm.id):
+                            pass
+            try:
+                async with trace.span("tool:search", parent_id=turn.id, input=PAYLOAD):
+                    if i % FAILURE_EVERY == 0:
+                        raise RuntimeError("search backend unavailable")
+            except RuntimeError:
+                pass
+
+    await queue.shutdown()
+    return {
+        "enqueued": queue.enqueued,
+        "exported": exporter.exported,
+        "cpu": exporter.cpu_seconds,
+        "wall": time.perf_counter() - t_start,
+    }
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestSamplingLoad:
+    async def test_sampling_reduces_enqueued_spans_and_exporter_cpu(self):
+        policies: dict[str, SpanSampler | None] = {
+            "no sampler": None,
+            "head 10%": PolicySampler(trace_sample_rate=0.1),
+            "delta limit 100/s": PolicySampler(span_rate_limits={"delta": 100}),
+            "tail (errors only)": PolicySampler(trace_sample_rate=0.0, tail_sampling=True),
+        }
+        results = {label: await _run(sampler) for label, sampler in policies.items()}
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 76}")
+        print(f" Span sampling: {N_TRACES:,} traces, {SPANS_PER_TRACE} spans each")
+        print(f"{'=' * 76}")
+        print(f" {'policy':<22}{'enqueued':>11}{'exported':>11}{'export CPU':>13}{'wall':>10}")
+        for label, r in results.items():
+            print(
+                f" {label:<22}{r['enqueued']:>11,.0f}{r['exported']:>11,.0f}"
+                f"{r['cpu'] * 1000:>11.0f}ms{r['wall']:>9.2f}s"
+            )
+        print(f"{'=' * 76}")
+        print()
+
+        baseline = results["no sampler"]
+        for label, r in results.items():
+            if label != "no sampler":
+                assert r["enqueued"] < baseline["enqueued"]
+                assert r["cpu"] < baseline["cpu"]
+        # failed traces survive tail sampling whole, start and end events
+        assert results["tail (errors only)"]["exported"] == N_TRACES // FAILURE_EVERY * SPANS_PER_TRACE * 2
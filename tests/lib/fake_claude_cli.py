@@ -0,0 +1,130 @@
+"""Stand-in for the ``claude`` CLI that speaks the SDK's stream-json protocol.
+
+Used by the Claude session pool tests in place of the real binary:
+
+- sleeps ``FAKE_CLAUDE_STARTUP_S`` seconds before reading stdin, to simulate
+  CLI start-up (Node boot, MCP servers, transcript load)
+- answers the ``initialize`` control request and remembers the hook callback
+  ids it registered
+- replies to each user message with a system ``init``, one assistant text
+  block ``"<pid> turn <n>: <prompt>"`` and a result, so tests can tell
+  processes and turns apart
+- a prompt starting with ``tool:`` first calls the registered PostToolUse hook
+- a prompt of ``crash`` exits the process in the middle of the turn
+- ``FAKE_CLAUDE_LOG`` names a file that gets one line per process start
+
+``-v`` prints a version, as the SDK probes it before starting a session.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import uuid
+
+
+def _emit(message: dict) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def main() -> None:
+    if "-v" in sys.argv[1:]:
+        print("2.1.300 (Claude Code)")
+        return
+
+    session_id = str(uuid.uuid4())
+    for arg in sys.argv[1:]:
+        if arg.startswith("--resume="):
+            session_id = arg.split("=", 1)[1]
+
+    log_path = os.environ.get("FAKE_CLAUDE_LOG")
+    if log_path:
+        with open(log_path, "a") as log:
+            log.write(f"{os.getpid()} {session_id}\n")
+
+    time.sleep(float(os.environ.get("FAKE_CLAUDE_STARTUP_S", "0")))
+
+    post_tool_use_ids: list[str] = []
+    turn = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        message = json.loads(line)
+
+        if message["type"] == "control_request":
+            request = message["request"]
+            if request["subtype"] == "initialize":
+                for matcher in (request.get("hooks") or {}).get("PostToolUse", []):
+                    post_tool_use_ids.extend(matcher["hookCallbackIds"])
+            _emit(
+                {
+                    "type": "control_response",
+                    "response": {"subtype": "success", "request_id": message["request_id"], "response": {}},
+                }
+            )
+            continue
+
+        if message["type"] == "control_response":
+            continue
+
+        if message["type"] != "user":
+            continue
+
+        turn += 1
+        prompt = message["message"]["content"]
+        _emit({"type": "system", "subtype": "init", "session_id": session_id, "data": {}})
+
+        if prompt == "crash":
+            sys.exit(3)
+
+        if prompt.startswith("tool:") and post_tool_use_ids:
+            _emit(
+                {
+                    "type": "control_request",
+                    "request_id": f"hook-{turn}",
+                    "request": {
+                        "subtype": "hook_callback",
+                        "callback_id": post_tool_use_ids[0],
+                        "tool_use_id": f"tool-{turn}",
+                        "input": {
+                            "hook_event_name": "PostToolUse",
+                            "tool_name": "Read",
+                            "tool_use_id": f"tool-{turn}",
+                            "tool_response": prompt,
+                        },
+                    },
+                }
+            )
+            # wait for the SDK's answer before finishing the turn
+            for reply in sys.stdin:
+                if json.loads(reply).get("type") == "control_response":
+                    break
+
+        _emit(
+            {
+                "type": "assistant",
+                "message": {
+                    "model": "fake",
+                    "content": [{"type": "text", "text": f"{os.getpid()} turn {turn}: {prompt}"}],
+                },
+            }
+        )
+        _emit(
+            {
+                "type": "result",
+                "subtype": "success",
+                "duration_ms": 1,
+                "duration_api_ms": 1,
+                "is_error": False,
+                "num_turns": turn,
+                "session_id": session_id,
+                "total_cost_usd": 0.0,
+            }
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Tests for multi-process serving (``BaseACPServer.run(workers=...)``) and fork-safe singletons."""
+
+from __future__ import annotations
+
+import os
+import sys
+import types
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import agentex.lib.core.tracing.span_queue as span_queue
+import agentex.lib.adk.utils._modules.client as client_module
+from agentex.types.span import Span
+from agentex.lib.types.tracing import AgentexTracingProcessorConfig
+from agentex.lib.core.tracing.sampling import PolicySampler
+from agentex.lib.adk.utils._modules.client import create_async_agentex_client
+from agentex.lib.sdk.fastacp.base.base_acp_server import BaseACPServer
+from agentex.lib.core.tracing.tracing_processor_manager import (
+    GLOBAL_TRACING_PROCESSOR_MANAGER,
+    TracingProcessorManager,
+)
+
+UVICORN_RUN = "agentex.lib.sdk.fastacp.base.base_acp_server.uvicorn.run"
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> BaseACPServer:
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.delenv("AGENTEX_UVLOOP", raising=False)
+    return BaseACPServer.create()
+
+
+class TestRunWorkers:
+    def test_single_process_serves_the_instance(self, server: BaseACPServer) -> None:
+        with patch(UVICORN_RUN) as run:
+            server.run(port=9000)
+        run.assert_called_once_with(server, host="0.0.0.0", port=9000, loop="asyncio")
+
+    def test_workers_serve_the_import_string(self, server: BaseACPServer) -> None:
+        with patch(UVICORN_RUN) as run:
+            server.run(port=9000, workers=4, app="project.acp:acp")
+        run.assert_called_once_with("project.acp:acp", host="0.0.0.0", port=9000, workers=4, loop="asyncio")
+
+    def test_import_string_is_found_from_the_module_variable(
+        self, server: BaseACPServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        module = types.ModuleType("my_agent.acp")
+        module.acp = server  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "my_agent.acp", module)
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+
+        with patch(UVICORN_RUN) as run:
+            server.run()
+
+        assert run.call_args.args == ("my_agent.acp:acp",)
+        assert run.call_args.kwargs["workers"] == 3
+
+    def test_server_run_with_python_dash_m_is_imported_by_module_name(
+        self, server: BaseACPServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        main = types.ModuleType("__main__")
+        main.__spec__ = types.SimpleNamespace(name="my_agent.acp")  # type: ignore[assignment]
+        main.acp = server  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "__main__", main)
+
+        with patch(UVICORN_RUN) as run:
+            server.run(workers=2)
+
+        assert run.call_args.args == ("my_agent.acp:acp",)
+
+    def test_unbound_server_needs_an_import_string(self, server: BaseACPServer) -> None:
+        with patch(UVICORN_RUN) as run, pytest.raises(ValueError, match="import string"):
+            server.run(workers=2)
+        run.assert_not_called()
+
+
+class TestForkSafety:
+    def test_child_starts_a_new_span_queue(self) -> None:
+        parent_queue = span_queue.get_default_span_queue()
+
+        span_queue._forget_default_span_queue()
+
+        assert span_queue.get_default_span_queue() is not parent_queue
+
+    def test_child_rebuilds_tracing_processors(self) -> None:
+        manager = TracingProcessorManager()
+        manager.add_processor_config(AgentexTracingProcessorConfig())
+        sync_before, async_before, lock_before = manager.sync_processors, manager.async_processors, manager.lock
+
+        manager.reinit_after_fork()
+
+        assert manager.lock is not lock_before
+        assert [type(p) for p in manager.sync_processors] == [type(p) for p in sync_before]
+        assert [type(p) for p in manager.async_processors] == [type(p) for p in async_before]
+        assert not set(map(id, manager.sync_processors)) & set(map(id, sync_before))
+        assert not set(map(id, manager.async_processors)) & set(map(id, async_before))
+
+    def test_child_resets_the_span_sampler(self) -> None:
+        manager = TracingProcessorManager()
+        sampler = PolicySampler(trace_sample_rate=0.0, tail_sampling=True)
+        manager.set_sampler(sampler)
+        root = Span(id="root", trace_id="t1", name="root", start_time=datetime.now(timezone.utc))
+        child = Span(id="child", trace_id="t1", parent_id="root", name="child", start_time=datetime.now(timezone.utc))
+        sampler.on_start(root)
+        sampler.on_start(child)
+        sampler.on_end(child)
+        lock_before = sampler._lock
+
+        manager.reinit_after_fork()
+
+        assert manager.get_sampler() is sampler
+        assert sampler._lock is not lock_before
+        assert not sampler._open
+        assert not sampler._buffers
+
+    def test_child_reopens_default_http_clients(self) -> None:
+        default = create_async_agentex_client(base_url="http://agentex.test", timeout=7.0)
+        custom_http = httpx.AsyncClient()
+        custom = create_async_agentex_client(base_url="http://agentex.test", http_client=custom_http)
+        inherited = default._client
+
+        client_module._reopen_http_clients()
+
+        assert default._client is not inherited
+        assert default._client.base_url == inherited.base_url
+        assert default._client.timeout == inherited.timeout
+        assert isinstance(default._client.auth, client_module.EnvAuth)
+        # never closed in the child: the parent still owns its connections
+        assert inherited in client_module._inherited_http_clients
+        assert custom._client is custom_http
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_hooks_run_in_a_forked_child(self) -> None:
+        parent_queue = span_queue.get_default_span_queue()
+        parent_processors = list(GLOBAL_TRACING_PROCESSOR_MANAGER.async_processors)
+        client = create_async_agentex_client(base_url="http://agentex.test")
+        parent_http = client._client
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # child
+            ok = (
+                span_queue._default_span_queue is None
+                and len(GLOBAL_TRACING_PROCESSOR_MANAGER.async_processors) == len(parent_processors)
+                and not any(p in parent_processors for p in GLOBAL_TRACING_PROCESSOR_MANAGER.async_processors)
+                and client._client is not parent_http
+            )
+            os.write(write_fd, b"1" if ok else b"0")
+            os._exit(0)
+        os.close(write_fd)
+        _, status = os.waitpid(pid, 0)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert result == b"1"
+        # the parent keeps its own
+        assert span_queue.get_default_span_queue() is parent_queue
+        assert client._client is parent_http
+
+
+async def test_each_worker_flushes_its_spans_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AGENT_NAME", "multi-worker-agent")
+    monkeypatch.setenv("ACP_URL", "http://localhost")
+    monkeypatch.setenv("AGENTEX_BASE_URL", "")
+    server = BaseACPServer.create()
+    queue = span_queue.get_default_span_queue()
+
+    with patch.object(queue, "shutdown", wraps=queue.shutdown) as shutdown:
+        async with server.router.lifespan_context(server):
+            await asyncio.sleep(0)
+
+    shutdown.assert_awaited_once()
+    assert span_queue._default_span_queue is None
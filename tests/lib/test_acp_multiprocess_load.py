@@ -0,0 +1,153 @@
+"""
+Throughput of ``BaseACPServer.run(workers=N)`` against a local stub agent.
+
+Starts a sync ACP agent whose ``message/send`` handler does some CPU-bound
+JSON work (standing in for building an LLM request from a long history) in a
+subprocess with 1, 2, ... workers, up to the CPU count, and drives it over
+HTTP from this process at a fixed concurrency. Prints requests per second per
+worker count; with two or more CPUs, two workers must serve clearly more than
+one.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_acp_multiprocess_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import subprocess
+from typing import Any
+from pathlib import Path
+
+import httpx
+import pytest
+
+DURATION = 5.0
+CONCURRENCY = 32
+MAX_WORKERS = 4
+
+STUB_AGENT = """
+import json
+
+from agentex.lib.sdk.fastacp.fastacp import FastACP
+from agentex.types.text_content import TextContent
+
+acp = FastACP.create(acp_type="sync")
+
+
+@acp.on_message_send
+async def handle_message_send(params):
+    history = [{"role": "user", "content": params.content.content, "turn": i} for i in range(200)]
+    for _ in range(10):
+        history = json.loads(json.dumps(history))
+    return TextContent(author="agent", content=f"{len(history)} messages")
+"""
+
+_NOW = "2026-01-01T00:00:00Z"
+REQUEST: dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "message/send",
+    "params": {
+        "agent": {
+            "id": "a1",
+            "name": "stub",
+            "acp_type": "sync",
+            "description": "",
+            "created_at": _NOW,
+            "updated_at": _NOW,
+        },
+        "task": {"id": "t1"},
+        "content": {"type": "text", "author": "user", "content": "lorem ipsum dolor sit amet " * 8},
+        "stream": False,
+    },
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_agent(tmp_path: Path, workers: int, port: int) -> subprocess.Popen[bytes]:
+    (tmp_path / "stub_agent.py").write_text(STUB_AGENT)
+    src = Path(__file__).resolve().parents[2] / "src"
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(tmp_path), str(src)]),
+        "AGENT_NAME": "stub",
+        "ACP_URL": f"http://127.0.0.1:{port}",
+        "AGENTEX_BASE_URL": "",
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+    }
+    code = (
+        f"import stub_agent; stub_agent.acp.run(host='127.0.0.1', port={port}, workers={workers}, log_level='warning')"
+    )
+    return subprocess.Popen([sys.executable, "-c", code], env=env)
+
+
+async def _wait_until_healthy(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/healthz")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError("stub agent did not become healthy")
+
+
+async def _requests_per_second(client: httpx.AsyncClient) -> float:
+    done = 0
+    deadline = time.monotonic() + DURATION
+
+    async def drive() -> None:
+        nonlocal done
+        while time.monotonic() < deadline:
+            response = await client.post("/api", json=REQUEST)
+            assert response.status_code == 200 and b'"error":null' in response.content, response.text
+            done += 1
+
+    start = time.monotonic()
+    await asyncio.gather(*(drive() for _ in range(CONCURRENCY)))
+    return done / (time.monotonic() - start)
+
+
+async def _measure(tmp_path: Path, workers: int) -> float:
+    port = _free_port()
+    process = _start_agent(tmp_path, workers, port)
+    try:
+        limits = httpx.Limits(max_connections=CONCURRENCY)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30) as client:
+            await _wait_until_healthy(client)
+            # warm-up round, so workers still starting up are not timed
+            await asyncio.gather(*(client.post("/api", json=REQUEST) for _ in range(CONCURRENCY)))
+            return await _requests_per_second(client)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+async def test_throughput_scales_with_workers(tmp_path: Path) -> None:
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, *range(2, min(cpus, MAX_WORKERS) + 1)})
+
+    results = {workers: await _measure(tmp_path, workers) for workers in counts}
+
+    print()
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>9}   ({cpus} CPUs, {CONCURRENCY} concurrent, {DURATION:.0f}s)")
+    for workers, rps in results.items():
+        print(f"{workers:>8} {rps:>10.1f} {rps / results[1]:>8.2f}x")
+
+    if cpus >= 2:
+        assert results[2] > 1.3 * results[1]
@@ -0,0 +1,201 @@
+"""Tests for ``BuildContextManager`` staging and streamed archives."""
+
+from __future__ import annotations
+
+import io
+import os
+import gzip
+import logging
+import tarfile
+import threading
+from pathlib import Path
+
+import pytest
+
+import agentex.lib.sdk.config.agent_manifest as agent_manifest_module
+from agentex.lib.sdk.config.agent_manifest import BuildContextManager
+
+
+@pytest.fixture
+def context_root(tmp_path: Path) -> Path:
+    root = tmp_path / "context"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "Dockerfile").write_text("FROM python:3.12-slim\n")
+    (root / "src" / "main.py").write_text("print('hello')\n")
+    (root / "src" / "pkg" / "data.bin").write_bytes(os.urandom(3 * 1024 * 1024))
+    (root / "src" / "link.py").symlink_to("main.py")
+    return root
+
+
+def _members(archive: bytes) -> dict[str, bytes | str]:
+    members: dict[str, bytes | str] = {}
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar_file:
+        for member in tar_file.getmembers():
+            if member.issym():
+                members[member.name] = f"-> {member.linkname}"
+            else:
+                extracted = tar_file.extractfile(member)
+                assert extracted is not None
+                members[member.name] = extracted.read()
+    return members
+
+
+class TestArchive:
+    def test_archive_round_trips_the_context(self, context_root: Path):
+        with BuildContextManager.zipped(root_path=context_root) as stream:
+            archive = stream.read()
+
+        assert _members(archive) == {
+            "Dockerfile": b"FROM python:3.12-slim\n",
+            "src/link.py": "-> main.py",
+            "src/main.py": b"print('hello')\n",
+            "src/pkg/data.bin": (context_root / "src" / "pkg" / "data.bin").read_bytes(),
+        }
+
+    def test_archive_is_byte_identical_across_runs(self, context_root: Path):
+        first = b"".join(BuildContextManager.iter_archive(context_root))
+        second = b"".join(BuildContextManager.iter_archive(context_root))
+
+        assert first == second
+
+    def test_parallel_compression_writes_multi_member_gzip(self, context_root: Path, monkeypatch):
+        monkeypatch.setattr(agent_manifest_module, "_ARCHIVE_BLOCK_BYTES", 256 * 1024)
+        serial = b"".join(BuildContextManager.iter_archive(context_root))
+        parallel = b"".join(BuildContextManager.iter_archive(context_root, compress_workers=4))
+
+        assert parallel != serial
+        assert gzip.decompress(parallel) == gzip.decompress(serial)
+        assert _members(parallel) == _members(serial)
+
+    def test_compress_workers_default_from_env(self, context_root: Path, monkeypatch):
+        monkeypatch.setattr(agent_manifest_module, "_ARCHIVE_BLOCK_BYTES", 256 * 1024)
+        monkeypatch.setenv("AGENTEX_BUILD_CONTEXT_COMPRESS_WORKERS", "3")
+        from_env = b"".join(BuildContextManager.iter_archive(context_root))
+
+        assert from_env == b"".join(BuildContextManager.iter_archive(context_root, compress_workers=3))
+
+    def test_archiver_runs_a_bounded_distance_ahead(self, context_root: Path, monkeypatch):
+        monkeypatch.setattr(agent_manifest_module, "_ARCHIVE_BLOCK_BYTES", 64 * 1024)
+        monkeypatch.setattr(agent_manifest_module, "_ARCHIVE_QUEUE_CHUNKS", 2)
+        written: list[int] = []
+        original_write = agent_manifest_module._GzipBlockWriter.write
+
+        def counting_write(self, data):
+            written.append(len(data))
+            return original_write(self, data)
+
+        monkeypatch.setattr(agent_manifest_module._GzipBlockWriter, "write", counting_write)
+        chunks = BuildContextManager.iter_archive(context_root, compresslevel=0)
+        next(chunks)
+        # give the archiver time to fill the queue and block
+        threading.Event().wait(0.2)
+
+        assert sum(written) < 1024 * 1024
+        chunks.close()
+
+    def test_closing_early_stops_the_archiver(self, context_root: Path):
+        chunks = BuildContextManager.iter_archive(context_root, compresslevel=0)
+        next(chunks)
+        chunks.close()
+
+        assert not [t for t in threading.enumerate() if t.name == "build-context-archive"]
+
+    def test_errors_on_the_archiver_reach_the_reader(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            with BuildContextManager.zipped(root_path=tmp_path / "missing") as stream:
+                stream.read()
+
+    def test_stream_supports_small_reads(self, context_root: Path):
+        with BuildContextManager.zipped(root_path=context_root) as stream:
+            pieces = iter(lambda: stream.read(1000), b"")
+            archive = b"".join(pieces)
+
+        assert "src/pkg/data.bin" in _members(archive)
+
+
+class TestAddDirectory:
+    def _manager(self, tmp_path: Path) -> BuildContextManager:
+        return BuildContextManager(agent_manifest=None, build_context_root=tmp_path)  # type: ignore[arg-type]
+
+    def test_files_are_hardlinked_into_the_staging_dir(self, context_root: Path, tmp_path: Path):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        self._manager(context_root).add_directory(
+            root_path=staging, directory_path=context_root / "src", context_root=context_root
+        )
+
+        source = context_root / "src" / "main.py"
+        staged = staging / "src" / "main.py"
+        assert staged.read_bytes() == source.read_bytes()
+        assert os.stat(staged).st_ino == os.stat(source).st_ino
+
+    def test_falls_back_to_copy_when_hardlinks_fail(self, context_root: Path, tmp_path: Path, monkeypatch):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        def no_links(src, dst):
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(agent_manifest_module.os, "link", no_links)
+        self._manager(context_root).add_directory(
+            root_path=staging, directory_path=context_root / "src", context_root=context_root
+        )
+
+        source = context_root / "src" / "pkg" / "data.bin"
+        staged = staging / "src" / "pkg" / "data.bin"
+        assert staged.read_bytes() == source.read_bytes()
+        assert os.stat(staged).st_ino != os.stat(source).st_ino
+
+    def test_adding_a_directory_twice(self, context_root: Path, tmp_path: Path):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        manager = self._manager(context_root)
+
+        for _ in range(2):
+            manager.add_directory(root_path=staging, directory_path=context_root / "src", context_root=context_root)
+
+        source = context_root / "src" / "main.py"
+        assert os.stat(staging / "src" / "main.py").st_ino == os.stat(source).st_ino
+
+    def test_existing_hardlink_is_replaced_not_written_through(self, context_root: Path, tmp_path: Path):
+        staging = tmp_path / "staging"
+        (staging / "src").mkdir(parents=True)
+        unrelated = tmp_path / "unrelated.py"
+        unrelated.write_text("keep me\n")
+        os.link(unrelated, staging / "src" / "main.py")
+
+        self._manager(context_root).add_directory(
+            root_path=staging, directory_path=context_root / "src", context_root=context_root
+        )
+
+        source = context_root / "src" / "main.py"
+        assert unrelated.read_text() == "keep me\n"
+        assert os.stat(staging / "src" / "main.py").st_ino == os.stat(source).st_ino
+
+    def test_ignore_patterns_still_apply(self, context_root: Path, tmp_path: Path):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        self._manager(context_root).add_directory(
+            root_path=staging,
+            directory_path=context_root / "src",
+            context_root=context_root,
+            ignore_patterns=["*.bin"],
+        )
+
+        assert (staging / "src" / "main.py").exists()
+        assert not (staging / "src" / "pkg" / "data.bin").exists()
+
+    def test_per_file_logging_is_debug(self, context_root: Path, tmp_path: Path, caplog):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        with caplog.at_level(logging.DEBUG, logger=agent_manifest_module.logger.name):
+            self._manager(context_root).add_directory(
+                root_path=staging, directory_path=context_root / "src", context_root=context_root
+            )
+
+        per_file = [r for r in caplog.records if "to build context" in r.getMessage()]
+        assert len(per_file) == 3
+        assert {r.levelno for r in per_file} == {logging.DEBUG}
@@ -0,0 +1,119 @@
+"""
+Manual benchmark for streamed build-context archives.
+
+Builds a 1 GB agent context (a few vendored 128 MB model files plus a tree of
+small, compressible source files), then archives it to disk in a fresh
+subprocess three ways: the previous implementation (whole tar.gz in a
+``BytesIO``), the streamed archive, and the streamed archive with parallel
+compression. Reports time, archive size and the growth in peak RSS over the
+subprocess's baseline after imports. The streamed archives must keep peak RSS
+flat; the previous implementation holds the whole archive in memory.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_build_context_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+N_LARGE_FILES = 7
+LARGE_FILE_BYTES = 128 * 1024 * 1024
+N_SMALL_FILES = 20_000
+SMALL_FILE_BYTES = 6 * 1024
+MAX_RSS_GROWTH_MB = 64
+
+_ARCHIVE_SCRIPT = """
+import io, sys, json, time, shutil, tarfile, resource
+from pathlib import Path
+from agentex.lib.sdk.config.agent_manifest import BuildContextManager
+from agentex.lib.utils.build_provenance import iter_context_files
+
+mode, root, output = sys.argv[1], Path(sys.argv[2]), Path(sys.argv[3])
+baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t_start = time.perf_counter()
+if mode == "previous (BytesIO)":
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar_file:
+        for path in iter_context_files(root):
+            tar_file.add(path, arcname=path.relative_to(root))
+    output.write_bytes(buffer.getvalue())
+else:
+    workers = 4 if mode.startswith("parallel") else 1
+    with BuildContextManager.zipped(root_path=root, compress_workers=workers) as stream:
+        with open(output, "wb") as output_file:
+            shutil.copyfileobj(stream, output_file)
+elapsed = time.perf_counter() - t_start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"elapsed": elapsed, "rss_growth_mb": (peak_kb - baseline_kb) / 1024}))
+"""
+
+MODES = ["previous (BytesIO)", "streamed", "parallel x4"]
+
+
+def _build_context(root: Path) -> None:
+    models = root / "models"
+    models.mkdir(parents=True)
+    for i in range(N_LARGE_FILES):
+        with open(models / f"weights{i}.bin", "wb") as handle:
+            for _ in range(LARGE_FILE_BYTES // (8 << 20)):
+                handle.write(os.urandom(8 << 20))
+    line = b"def handler(event, context):  # lorem ipsum dolor sit amet\n"
+    for i in range(N_SMALL_FILES):
+        directory = root / "src" / f"pkg{i // 500}"
+        if i % 500 == 0:
+            directory.mkdir(parents=True)
+        (directory / f"mod{i}.py").write_bytes(line * (SMALL_FILE_BYTES // len(line)))
+
+
+def _archive(mode: str, root: Path, output: Path) -> dict[str, float]:
+    src = Path(__file__).resolve().parents[2] / "src"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")])}
+    proc = subprocess.run(
+        [sys.executable, "-c", _ARCHIVE_SCRIPT, mode, str(root), str(output)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["size_mb"] = output.stat().st_size / 1e6
+    output.unlink()
+    return result
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestBuildContextArchiveLoad:
+    def test_peak_rss_stays_flat_for_a_1gb_context(self, tmp_path: Path):
+        root = tmp_path / "context"
+        _build_context(root)
+        context_mb = (N_LARGE_FILES * LARGE_FILE_BYTES + N_SMALL_FILES * SMALL_FILE_BYTES) / 1e6
+
+        results = {mode: _archive(mode, root, tmp_path / "context.tar.gz") for mode in MODES}
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 64}")
+        print(f" Build context archive: {context_mb:,.0f} MB context, {os.cpu_count()} core(s)")
+        print(f"{'=' * 64}")
+        print(f" {'mode':<22}{'time':>10}{'archive':>14}{'peak RSS +':>14}")
+        for mode, r in results.items():
+            print(f" {mode:<22}{r['elapsed']:>9.2f}s{r['size_mb']:>11.0f} MB{r['rss_growth_mb']:>11.0f} MB")
+        print(f"{'=' * 64}")
+        print()
+
+        assert results["streamed"]["rss_growth_mb"] < MAX_RSS_GROWTH_MB
+        assert results["parallel x4"]["rss_growth_mb"] < MAX_RSS_GROWTH_MB
+        assert results["previous (BytesIO)"]["rss_growth_mb"] > context_mb / 2
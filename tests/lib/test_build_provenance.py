@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
+import agentex.lib.utils.build_provenance as bp
 from agentex.lib.utils.build_provenance import (
+    FileHashCache,
     normalize_remote,
     working_tree_hash,
     iter_context_files,
@@ -13,6 +15,12 @@ from agentex.lib.utils.build_provenance import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_hash_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep capture_build_provenance's default cache out of the real ~/.cache."""
+    monkeypatch.setenv("AGENTEX_BUILD_HASH_CACHE", str(tmp_path / "hash-cache.json"))
+
+
 def _git(repo: Path, *args: str) -> None:
     subprocess.run(("git", "-C", str(repo), *args), check=True, capture_output=True, text=True)
 
@@ -117,6 +125,80 @@ def test_iter_context_files_skips_directories(tmp_path: Path) -> None:
     assert rels == ["pkg/mod.py", "top.txt"]
 
 
+def _tree(root: Path) -> Path:
+    for i in range(40):
+        _write(root, f"pkg{i % 4}/mod{i}.py", f"value = {i}\n" * (i + 1))
+    (root / "pkg0" / "mod0.py").chmod(0o755)
+    (root / "link").symlink_to("pkg1/mod1.py")
+    return root
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    real = bp._sha256_file
+
+    def counting(path: str) -> str:
+        reads.append(path)
+        return real(path)
+
+    monkeypatch.setattr(bp, "_sha256_file", counting)
+    return reads
+
+
+def test_parallel_hash_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _tree(tmp_path / "ctx")
+    monkeypatch.setattr(bp, "_HASH_CHUNK_FILES", 4)  # spread the 40 files over several workers
+    assert working_tree_hash(root, max_workers=8) == working_tree_hash(root, max_workers=1)
+
+
+def test_cache_skips_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _tree(tmp_path / "ctx")
+    cache_path = tmp_path / "cache.json"
+    expected = working_tree_hash(root)
+    reads = _count_reads(monkeypatch)
+
+    assert working_tree_hash(root, cache=FileHashCache(cache_path)) == expected
+    assert len(reads) == 40
+
+    reads.clear()
+    # A fresh instance reloads the persisted cache.
+    assert working_tree_hash(root, cache=FileHashCache(cache_path)) == expected
+    assert reads == []
+
+    _write(root, "pkg2/mod2.py", "changed\n")
+    changed = working_tree_hash(root, cache=FileHashCache(cache_path))
+    assert [Path(path).name for path in reads] == ["mod2.py"]
+    assert changed == working_tree_hash(root)
+
+
+def test_cache_forgets_deleted_files(tmp_path: Path) -> None:
+    root = _tree(tmp_path / "ctx")
+    cache = FileHashCache(tmp_path / "cache.json")
+    working_tree_hash(root, cache=cache)
+    (root / "pkg3" / "mod3.py").unlink()
+    working_tree_hash(root, cache=cache)
+
+    reloaded = FileHashCache(tmp_path / "cache.json")
+    assert len(reloaded._entries) == 39
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path) -> None:
+    root = _tree(tmp_path / "ctx")
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("{not json")
+    assert working_tree_hash(root, cache=FileHashCache(cache_path)) == working_tree_hash(root)
+
+
+def test_default_cache_location(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AGENTEX_BUILD_HASH_CACHE", "off")
+    assert FileHashCache.default() is None
+
+    monkeypatch.delenv("AGENTEX_BUILD_HASH_CACHE")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = FileHashCache.default()
+    assert cache is not None and cache.path == tmp_path / "agentex" / "file-hashes.json"
+
+
 # --- capture_build_provenance -------------------------------------------------
 
 
@@ -0,0 +1,107 @@
+"""
+Manual benchmark for ``working_tree_hash`` on a large build context.
+
+Builds a synthetic agent repo of 50,000 small source/data files plus a few
+vendored 10 MB model files, then hashes it with the previous implementation
+(pathlib walk, serial, no cache), on the thread pool with a cold cache, and
+again with a warm cache. All digests must match. The thread pool only pays
+off with several cores or a cold page cache; the walk and the cache carry
+the rest.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_build_provenance_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import time
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from agentex.lib.utils.build_provenance import FileHashCache, _sha256_file, working_tree_hash
+
+N_FILES = 50_000
+FILES_PER_DIR = 500
+N_LARGE_FILES = 10
+LARGE_FILE_BYTES = 10 * 1024 * 1024
+
+
+def _build_tree(root: Path) -> None:
+    for i in range(N_FILES):
+        directory = root / f"pkg{i // FILES_PER_DIR}"
+        if i % FILES_PER_DIR == 0:
+            directory.mkdir(parents=True)
+        (directory / f"mod{i}.py").write_bytes(f"# module {i}\n".encode() + os.urandom(1024 + i % 3072))
+    models = root / "models"
+    models.mkdir()
+    for i in range(N_LARGE_FILES):
+        (models / f"weights{i}.bin").write_bytes(os.urandom(LARGE_FILE_BYTES))
+
+
+def _legacy_working_tree_hash(root: Path) -> str:
+    paths = sorted(
+        (path for path in root.rglob("*") if path.is_symlink() or path.is_file()),
+        key=lambda path: path.relative_to(root).as_posix(),
+    )
+    lines: list[str] = []
+    for path in paths:
+        relpath = path.relative_to(root).as_posix()
+        if path.is_symlink():
+            mode = "120000"
+            content_digest = hashlib.sha256(os.readlink(path).encode("utf-8")).hexdigest()
+        else:
+            mode = "100755" if path.stat().st_mode & stat.S_IXUSR else "100644"
+            content_digest = _sha256_file(path)
+        lines.append(f"{relpath}\x00{mode}\x00{content_digest}")
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestWorkingTreeHashLoad:
+    def test_cold_and_warm_hashing(self, tmp_path: Path):
+        root = tmp_path / "agent"
+        _build_tree(root)
+        cache_path = tmp_path / "file-hashes.json"
+        results: dict[str, tuple[float, str]] = {}
+
+        t_start = time.perf_counter()
+        digest = _legacy_working_tree_hash(root)
+        results["previous (serial)"] = (time.perf_counter() - t_start, digest)
+
+        t_start = time.perf_counter()
+        digest = working_tree_hash(root, max_workers=1)
+        results["serial, no cache"] = (time.perf_counter() - t_start, digest)
+
+        t_start = time.perf_counter()
+        digest = working_tree_hash(root, cache=FileHashCache(cache_path))
+        results["parallel, cold cache"] = (time.perf_counter() - t_start, digest)
+
+        t_start = time.perf_counter()
+        digest = working_tree_hash(root, cache=FileHashCache(cache_path))
+        results["parallel, warm cache"] = (time.perf_counter() - t_start, digest)
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 64}")
+        print(f" working_tree_hash: {N_FILES:,} files + {N_LARGE_FILES} x 10 MB, {os.cpu_count()} core(s)")
+        print(f"{'=' * 64}")
+        print(f" {'mode':<26}{'time':>10}{'speedup':>10}")
+        baseline = results["previous (serial)"][0]
+        for label, (elapsed, _) in results.items():
+            print(f" {label:<26}{elapsed:>9.2f}s{baseline / elapsed:>9.1f}x")
+        print(f" cache file: {cache_path.stat().st_size / 1e6:.1f} MB")
+        print(f"{'=' * 64}")
+        print()
+
+        assert len({digest for _, digest in results.values()}) == 1
+        assert results["parallel, warm cache"][0] < baseline
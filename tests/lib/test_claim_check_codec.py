@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import base64
+import dataclasses
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from temporalio.contrib.pydantic import pydantic_data_converter
+
+from agentex import AsyncAgentex
+from agentex.types.state import State
+from agentex.lib.core.clients.temporal import claim_check
+from agentex.lib.core.temporal.activities import activity_helpers
+from agentex.lib.core.clients.temporal.claim_check import (
+    CLAIM_CHECK_ENCODING,
+    BlobStore,
+    AgentexBlobStore,
+    InMemoryBlobStore,
+    ClaimCheckPayloadCodec,
+    ClaimCheckBlobNotFoundError,
+)
+from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
+from agentex.lib.core.temporal.activities.adk.state_activities import UpdateStateParams
+
+
+def _update_params(size: int) -> UpdateStateParams:
+    return UpdateStateParams(state_id="s1", task_id="t1", agent_id="a1", state={"history": ["x" * 100] * size})
+
+
+def _converter(codec: ClaimCheckPayloadCodec):
+    return dataclasses.replace(pydantic_data_converter, payload_codec=codec)
+
+
+class TestClaimCheckPayloadCodec:
+    async def test_large_payloads_are_replaced_by_references(self):
+        store = InMemoryBlobStore()
+        converter = _converter(ClaimCheckPayloadCodec(store, threshold=1024))
+        params = _update_params(100)
+
+        payloads = await converter.encode([params])
+
+        assert payloads[0].metadata["encoding"] == CLAIM_CHECK_ENCODING
+        assert payloads[0].ByteSize() < 200
+        assert len(store.blobs) == 1
+        assert await converter.decode(payloads, [UpdateStateParams]) == [params]
+
+    async def test_small_payloads_pass_through(self):
+        store = InMemoryBlobStore()
+        converter = _converter(ClaimCheckPayloadCodec(store, threshold=1024))
+
+        payloads = await converter.encode([_update_params(1)])
+
+        assert payloads[0].metadata["encoding"] != CLAIM_CHECK_ENCODING
+        assert store.blobs == {}
+
+    async def test_identical_payloads_share_a_blob(self):
+        store = InMemoryBlobStore()
+        converter = _converter(ClaimCheckPayloadCodec(store, threshold=1024))
+
+        first = await converter.encode([_update_params(100)])
+        second = await converter.encode([_update_params(100)])
+
+        assert first == second
+        assert len(store.blobs) == 1
+
+    async def test_decode_fetches_from_the_store_when_not_cached(self):
+        store = InMemoryBlobStore()
+        payloads = await _converter(ClaimCheckPayloadCodec(store, threshold=1024)).encode([_update_params(100)])
+
+        # A fresh codec (another worker, or a replay after restart) has an empty cache.
+        decoded = await _converter(ClaimCheckPayloadCodec(store, threshold=1024)).decode(payloads, [UpdateStateParams])
+        assert decoded == [_update_params(100)]
+
+    async def test_missing_blob_raises(self):
+        store = InMemoryBlobStore()
+        payloads = await _converter(ClaimCheckPayloadCodec(store, threshold=1024)).encode([_update_params(100)])
+        store.blobs.clear()
+
+        with pytest.raises(ClaimCheckBlobNotFoundError):
+            await ClaimCheckPayloadCodec(store).decode(payloads)
+
+    async def test_tampered_blob_is_rejected(self):
+        store = InMemoryBlobStore()
+        payloads = await _converter(ClaimCheckPayloadCodec(store, threshold=1024)).encode([_update_params(100)])
+        key = next(iter(store.blobs))
+        store.blobs[key] = store.blobs[key][:-1]
+
+        with pytest.raises(ValueError):
+            await ClaimCheckPayloadCodec(store).decode(payloads)
+
+    async def test_custom_blob_store(self):
+        class DictStore(BlobStore):
+            def __init__(self):
+                self.data: dict[str, bytes] = {}
+
+            async def put(self, key, data):
+                self.data[key] = data
+
+            async def get(self, key):
+                return self.data[key]
+
+        store = DictStore()
+        converter = _converter(ClaimCheckPayloadCodec(store, threshold=0, cache_size=0))
+        payloads = await converter.encode(["hello"])
+
+        assert len(store.data) == 1
+        assert await converter.decode(payloads, [str]) == ["hello"]
+
+
+class TestAgentexBlobStore:
+    RETENTION = timedelta(days=1)
+
+    @pytest.fixture
+    def backend(self):
+        rows: dict[tuple[str, str], dict] = {}
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            calls.append(request.url.path)
+            if request.url.path == "/checkpoints/put":
+                rows[body["thread_id"], body["checkpoint_id"]] = body
+                return httpx.Response(200, json={k: body[k] for k in ("thread_id", "checkpoint_ns", "checkpoint_id")})
+            if request.url.path == "/checkpoints/delete-thread":
+                for row in [row for row in rows if row[0] == body["thread_id"]]:
+                    del rows[row]
+                return httpx.Response(204)
+            row = rows.get((body["thread_id"], body["checkpoint_id"]))
+            if row is None:
+                return httpx.Response(200, content=b"null", headers={"content-type": "application/json"})
+            return httpx.Response(200, json={**row, "pending_writes": []})
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        store = AgentexBlobStore(
+            AsyncAgentex(base_url="http://test", api_key="k", http_client=http_client), retention=self.RETENTION
+        )
+        return store, rows, calls
+
+    @staticmethod
+    def _at_window(window: float):
+        return patch.object(
+            claim_check.time, "time", return_value=window * TestAgentexBlobStore.RETENTION.total_seconds()
+        )
+
+    async def test_round_trip_through_checkpoints_api(self, backend):
+        store, rows, calls = backend
+
+        with self._at_window(100.5):
+            await store.put("abc", b"\x00payload")
+            await store.put("abc", b"\x00payload")
+
+            assert calls.count("/checkpoints/put") == 1
+            assert list(rows) == [("agentex-claim-check-100", "abc")]
+            assert base64.b64decode(rows["agentex-claim-check-100", "abc"]["blobs"][0]["blob"]) == b"\x00payload"
+            assert await store.get("abc") == b"\x00payload"
+            with pytest.raises(ClaimCheckBlobNotFoundError):
+                await store.get("missing")
+
+    async def test_blobs_expire_after_the_retention_window(self, backend):
+        store, rows, _ = backend
+
+        with self._at_window(100.9):
+            await store.put("old", b"old")
+        with self._at_window(101.5):
+            # still readable for a full window after it was written
+            assert await store.get("old") == b"old"
+            await store.put("new", b"new")
+        with self._at_window(102.1):
+            await store.put("newer", b"newer")
+
+            with pytest.raises(ClaimCheckBlobNotFoundError):
+                await store.get("old")
+            assert await store.get("new") == b"new"
+        assert set(rows) == {("agentex-claim-check-101", "new"), ("agentex-claim-check-102", "newer")}
+
+    async def test_rewriting_a_blob_renews_it(self, backend):
+        store, _, _ = backend
+        codec = ClaimCheckPayloadCodec(store, threshold=0)
+        converter = _converter(codec)
+
+        with self._at_window(100.5):
+            payloads = await converter.encode(["hello"])
+        with self._at_window(101.5):
+            # cached in the codec, but still re-written to the current window
+            assert await converter.encode(["hello"]) == payloads
+        with self._at_window(102.5):
+            await store.put("other", b"other")
+            assert await _converter(ClaimCheckPayloadCodec(store)).decode(payloads, [str]) == ["hello"]
+
+
+class TestActivityHelpersTypeAdapterCache:
+    async def test_adapter_is_built_once_per_response_type(self):
+        raw = {"id": "s1", "agent_id": "a1", "task_id": "t1", "state": {}, "created_at": "2026-01-01T00:00:00Z"}
+        activity_helpers._type_adapters.pop(State, None)
+
+        with patch.object(activity_helpers.workflow, "execute_activity", new=AsyncMock(return_value=raw)), patch.object(
+            activity_helpers, "TypeAdapter", wraps=activity_helpers.TypeAdapter
+        ) as type_adapter:
+            for _ in range(3):
+                result = await ActivityHelpers.execute_activity(
+                    activity_name="get-state", request={}, response_type=State
+                )
+
+        assert isinstance(result, State)
+        assert type_adapter.call_count == 1
@@ -73,6 +73,19 @@ for _pkg in [
         sys.modules[_pkg] = _mod
         _created_pkg_stubs.append(_pkg)
 
+# activities.py imports the session pool from the (stubbed) package; load it
+# from its file path too
+_pool_spec = importlib.util.spec_from_file_location(
+    "agentex.lib.core.temporal.plugins.claude_agents.session_pool",
+    _ACTIVITIES_PATH.with_name("session_pool.py"),
+)
+assert _pool_spec is not None and _pool_spec.loader is not None
+_created_pool_stub = _pool_spec.name not in sys.modules
+if _created_pool_stub:
+    _pool_mod = importlib.util.module_from_spec(_pool_spec)
+    sys.modules[_pool_spec.name] = _pool_mod
+    _pool_spec.loader.exec_module(_pool_mod)
+
 # Load activities.py directly from its file path
 _spec = importlib.util.spec_from_file_location(
     "agentex.lib.core.temporal.plugins.claude_agents.activities",
@@ -89,6 +102,9 @@ _spec.loader.exec_module(_activities_mod)
 # its bindings.
 for _pkg in _created_pkg_stubs:
     sys.modules.pop(_pkg, None)
+# Likewise the session pool, which was loaded against the stubbed hooks module
+if _created_pool_stub:
+    sys.modules.pop(_pool_spec.name, None)
 
 _reconstruct_agent_defs = _activities_mod._reconstruct_agent_defs  # type: ignore[attr-defined]
 claude_options_to_dict = _activities_mod.claude_options_to_dict  # type: ignore[attr-defined]
@@ -0,0 +1,270 @@
+"""Tests for warm Claude Code session reuse (``claude_agents.session_pool``).
+
+Sessions run against ``fake_claude_cli.py``, a stand-in for the ``claude``
+binary that speaks the SDK's stream-json protocol, so the SDK client, the
+subprocess and the pool's lifecycle handling are all real.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import signal
+import asyncio
+import contextvars
+import importlib.util
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from claude_agent_sdk import ClaudeSDKError
+from claude_agent_sdk.types import ResultMessage, AssistantMessage
+
+if TYPE_CHECKING:
+    from agentex.lib.core.temporal.plugins.claude_agents.session_pool import ClaudeSessionPool
+
+FAKE_CLI = Path(__file__).with_name("fake_claude_cli.py")
+
+# Load hooks.py, session_pool.py and activities.py from their file paths, as
+# test_claude_agents_activities.py does: importing the claude_agents package
+# pulls in the openai_agents plugin and its optional dependencies, and other
+# test modules leave stubs for these names in sys.modules. Everything the
+# loading adds to sys.modules is rolled back, so this module neither depends on
+# nor affects the import state of other test modules.
+_PLUGIN = "agentex.lib.core.temporal.plugins.claude_agents"
+_PLUGIN_PATH = Path(__file__).resolve().parents[2] / "src" / Path(*_PLUGIN.split("."))
+
+
+def _load(name: str, path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_interceptor_stub = ModuleType("context_interceptor")
+for _var in ("streaming_task_id", "streaming_trace_id", "streaming_parent_span_id"):
+    setattr(_interceptor_stub, _var, contextvars.ContextVar(_var, default=None))
+
+with patch.dict(
+    sys.modules,
+    {
+        "agentex.lib.adk": MagicMock(),
+        "agentex.lib.core.temporal.plugins.openai_agents.interceptors.context_interceptor": _interceptor_stub,
+    },
+):
+    hooks = _load(f"{_PLUGIN}.hooks.hooks", _PLUGIN_PATH / "hooks" / "hooks.py")
+    session_pool = _load(f"{_PLUGIN}.session_pool", _PLUGIN_PATH / "session_pool.py")
+    activities = _load(f"{_PLUGIN}.activities", _PLUGIN_PATH / "activities.py")
+
+
+class FakeClaude:
+    """A ``claude`` executable in ``tmp_path`` backed by the fake CLI script."""
+
+    def __init__(self, tmp_path: Path, startup_s: float = 0.0):
+        self.path = tmp_path / "claude"
+        self.path.write_text(f'#!/bin/sh\nexec {sys.executable} {FAKE_CLI} "$@"\n')
+        self.path.chmod(0o755)
+        self.log = tmp_path / "starts.log"
+        self.workspace = str(tmp_path)
+        self.startup_s = startup_s
+
+    def options(self, **extra: Any) -> dict[str, Any]:
+        return {
+            "cwd": self.workspace,
+            "cli_path": str(self.path),
+            "env": {"FAKE_CLAUDE_LOG": str(self.log), "FAKE_CLAUDE_STARTUP_S": str(self.startup_s)},
+            **extra,
+        }
+
+    def starts(self) -> list[tuple[int, str]]:
+        if not self.log.exists():
+            return []
+        return [(int(pid), sid) for pid, sid in (line.split() for line in self.log.read_text().splitlines())]
+
+
+class TurnResult:
+    def __init__(self, messages: list[Any]):
+        self.messages = messages
+        text = next(b.text for m in messages if isinstance(m, AssistantMessage) for b in m.content)
+        assert isinstance(text, str)
+        pid, _, self.turn, *_ = text.split(" ")
+        self.pid = int(pid)
+        self.session_id = next(m.session_id for m in messages if isinstance(m, ResultMessage))
+
+
+async def _turn(
+    pool: ClaudeSessionPool, fake: FakeClaude, prompt: str, task_id: str = "task-1", **kwargs
+) -> TurnResult:
+    options = fake.options(**kwargs.pop("options", {}))
+    turn = pool.run_turn(prompt, task_id=task_id, workspace_path=fake.workspace, options=options, **kwargs)
+    async with aclosing(turn):
+        return TurnResult([message async for message in turn])
+
+
+@pytest.fixture
+def fake(tmp_path: Path) -> FakeClaude:
+    return FakeClaude(tmp_path)
+
+
+@pytest.fixture
+async def pool():
+    pool = session_pool.ClaudeSessionPool(max_sessions=4, idle_timeout=60)
+    yield pool
+    await pool.close()
+
+
+class TestSessionReuse:
+    async def test_next_turn_reuses_the_warm_process(self, pool, fake):
+        first = await _turn(pool, fake, "hello")
+        second = await _turn(pool, fake, "again", options={"resume": first.session_id})
+
+        assert second.pid == first.pid
+        assert (first.turn, second.turn) == ("1:", "2:")
+        assert second.session_id == first.session_id
+        assert len(fake.starts()) == 1
+
+    async def test_new_conversation_or_changed_options_start_a_new_process(self, pool, fake):
+        first = await _turn(pool, fake, "hello")
+        fresh = await _turn(pool, fake, "new conversation")
+        changed = await _turn(pool, fake, "other model", options={"resume": fresh.session_id, "model": "opus"})
+
+        assert len({first.pid, fresh.pid, changed.pid}) == 3
+        assert fake.starts()[2] == (changed.pid, fresh.session_id)
+        assert len(pool) == 1
+
+    async def test_sessions_are_keyed_by_task(self, pool, fake):
+        a = await _turn(pool, fake, "hi", task_id="task-a")
+        b = await _turn(pool, fake, "hi", task_id="task-b")
+        a2 = await _turn(pool, fake, "hi", task_id="task-a", options={"resume": a.session_id})
+
+        assert a.pid != b.pid
+        assert a2.pid == a.pid
+        assert len(pool) == 2
+
+
+class TestLimits:
+    async def test_cap_evicts_the_least_recently_used_idle_session(self, fake):
+        pool = session_pool.ClaudeSessionPool(max_sessions=2, idle_timeout=60)
+        try:
+            a = await _turn(pool, fake, "hi", task_id="task-a")
+            await _turn(pool, fake, "hi", task_id="task-b")
+            await _turn(pool, fake, "hi", task_id="task-a", options={"resume": a.session_id})
+            await _turn(pool, fake, "hi", task_id="task-c")
+
+            assert len(pool) == 2
+            assert {key[0] for key in pool._sessions} == {"task-a", "task-c"}
+        finally:
+            await pool.close()
+
+    async def test_cap_waits_for_a_busy_session(self, tmp_path):
+        fake = FakeClaude(tmp_path, startup_s=0.2)
+        pool = session_pool.ClaudeSessionPool(max_sessions=1, idle_timeout=60)
+        try:
+            results = await asyncio.gather(*(_turn(pool, fake, "hi", task_id=f"task-{i}") for i in range(3)))
+
+            assert len({r.pid for r in results}) == 3
+            assert len(pool) == 1
+        finally:
+            await pool.close()
+
+    async def test_idle_sessions_are_evicted(self, fake):
+        pool = session_pool.ClaudeSessionPool(max_sessions=2, idle_timeout=0.2)
+        try:
+            first = await _turn(pool, fake, "hi")
+            await asyncio.sleep(0.6)
+
+            assert len(pool) == 0
+            second = await _turn(pool, fake, "hi", options={"resume": first.session_id})
+            assert second.pid != first.pid
+        finally:
+            await pool.close()
+
+
+class TestCrashRecovery:
+    async def test_process_that_died_while_idle_is_restarted_with_resume(self, pool, fake):
+        first = await _turn(pool, fake, "hello")
+        os.kill(first.pid, signal.SIGKILL)
+        await asyncio.sleep(0.1)
+
+        second = await _turn(pool, fake, "still there?", options={"resume": first.session_id})
+
+        assert second.pid != first.pid
+        assert second.session_id == first.session_id
+        assert fake.starts()[-1] == (second.pid, first.session_id)
+
+    async def test_crash_mid_turn_raises_and_drops_the_session(self, pool, fake):
+        first = await _turn(pool, fake, "hello")
+
+        with pytest.raises(ClaudeSDKError):
+            await _turn(pool, fake, "crash", options={"resume": first.session_id})
+
+        assert len(pool) == 0
+        recovered = await _turn(pool, fake, "hello again", options={"resume": first.session_id})
+        assert recovered.pid != first.pid
+
+    async def test_failed_start_is_not_pooled(self, pool, fake, tmp_path):
+        with pytest.raises(ClaudeSDKError):
+            await _turn(pool, fake, "hi", options={"cli_path": str(tmp_path / "missing")})
+
+        assert len(pool) == 0
+
+
+class TestHooks:
+    async def test_hooks_follow_the_current_turn(self, pool, fake):
+        stream_ctx = MagicMock()
+        stream_ctx.__aenter__ = AsyncMock(return_value=MagicMock())
+        stream_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_adk = MagicMock()
+        mock_adk.streaming.streaming_task_message_context = MagicMock(return_value=stream_ctx)
+        with patch.object(hooks, "adk", mock_adk):
+            first = await _turn(pool, fake, "tool:first", subagent_spans={})
+            span_ctx = MagicMock()
+            span_ctx.__aexit__ = AsyncMock(return_value=False)
+            spans = {"tool-2": (span_ctx, MagicMock())}
+            second = await _turn(pool, fake, "tool:second", options={"resume": first.session_id}, subagent_spans=spans)
+
+        assert second.pid == first.pid
+        # the second turn's hook closed the subagent span from that turn's dict
+        span_ctx.__aexit__.assert_awaited_once()
+        assert spans == {}
+        assert mock_adk.streaming.streaming_task_message_context.call_count == 2
+
+
+class TestActivity:
+    async def test_activity_reuses_sessions_when_the_pool_is_enabled(self, fake, monkeypatch):
+        streaming_task_id = activities.streaming_task_id
+
+        monkeypatch.setenv("AGENTEX_CLAUDE_SESSION_POOL_SIZE", "2")
+        monkeypatch.setattr(session_pool, "_session_pool", None)
+        monkeypatch.setattr(activities, "adk", MagicMock())
+        token = streaming_task_id.set("task-1")
+        try:
+            options = {k: v for k, v in fake.options().items() if k != "cwd"}
+            first = await activities.run_claude_agent_activity(
+                "hello", fake.workspace, ["Read"], claude_options=options
+            )
+            second = await activities.run_claude_agent_activity(
+                "again", fake.workspace, ["Read"], resume_session_id=first["session_id"], claude_options=options
+            )
+        finally:
+            streaming_task_id.reset(token)
+            pool = session_pool.get_claude_session_pool()
+            assert pool is not None
+            await pool.close()
+
+        assert len(fake.starts()) == 1
+        pid = first["messages"][0]["content"].split(" ")[0]
+        assert second["messages"][0]["content"] == f"{pid} turn 2: again"
+        assert second["session_id"] == first["session_id"]
+
+    def test_pool_is_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("AGENTEX_CLAUDE_SESSION_POOL_SIZE", raising=False)
+        monkeypatch.setattr(session_pool, "_session_pool", None)
+
+        assert session_pool.get_claude_session_pool() is None
@@ -0,0 +1,122 @@
+"""
+Benchmark for warm Claude Code session reuse.
+
+Runs a 10-turn conversation for each of 4 concurrent tasks against
+``fake_claude_cli.py`` with 0.5 s of simulated CLI start-up. It compares a
+fresh SDK client per turn (the behavior without the pool) with
+``ClaudeSessionPool``, and reports per-turn latency. With the pool, only the
+first turn of each task pays start-up.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_claude_session_pool_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import asyncio
+import statistics
+from typing import Any
+from pathlib import Path
+from contextlib import aclosing
+
+import pytest
+from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+from claude_agent_sdk.types import ResultMessage
+
+from agentex.lib.core.temporal.plugins.claude_agents.session_pool import ClaudeSessionPool
+
+N_TASKS = 4
+TURNS_PER_TASK = 10
+STARTUP_S = 0.5
+
+FAKE_CLI = Path(__file__).with_name("fake_claude_cli.py")
+
+
+def _options(tmp_path: Path) -> dict[str, Any]:
+    cli = tmp_path / "claude"
+    if not cli.exists():
+        cli.write_text(f'#!/bin/sh\nexec {sys.executable} {FAKE_CLI} "$@"\n')
+        cli.chmod(0o755)
+    return {"cwd": str(tmp_path), "cli_path": str(cli), "env": {"FAKE_CLAUDE_STARTUP_S": str(STARTUP_S)}}
+
+
+async def _conversation_cold(options: dict[str, Any]) -> list[float]:
+    latencies, session_id = [], None
+    for turn in range(TURNS_PER_TASK):
+        start = time.perf_counter()
+        async with ClaudeSDKClient(options=ClaudeAgentOptions(**options, resume=session_id)) as client:
+            await client.query(f"turn {turn}")
+            async for message in client.receive_response():
+                if isinstance(message, ResultMessage):
+                    session_id = message.session_id
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _conversation_warm(pool: ClaudeSessionPool, task_id: str, options: dict[str, Any]) -> list[float]:
+    latencies, session_id = [], None
+    for turn in range(TURNS_PER_TASK):
+        start = time.perf_counter()
+        messages = pool.run_turn(
+            f"turn {turn}",
+            task_id=task_id,
+            workspace_path=options["cwd"],
+            options={**options, "resume": session_id},
+        )
+        async with aclosing(messages):
+            async for message in messages:
+                if isinstance(message, ResultMessage):
+                    session_id = message.session_id
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+async def test_warm_sessions_skip_cli_startup(tmp_path):
+    options = _options(tmp_path)
+
+    start = time.perf_counter()
+    cold = await asyncio.gather(*(_conversation_cold(options) for _ in range(N_TASKS)))
+    cold_wall = time.perf_counter() - start
+
+    pool = ClaudeSessionPool(max_sessions=N_TASKS)
+    try:
+        start = time.perf_counter()
+        warm = await asyncio.gather(*(_conversation_warm(pool, f"task-{i}", options) for i in range(N_TASKS)))
+        warm_wall = time.perf_counter() - start
+    finally:
+        await pool.close()
+
+    def _row(name: str, runs: list[list[float]], wall: float) -> dict[str, float]:
+        later = [latency for run in runs for latency in run[1:]]
+        first = [run[0] for run in runs]
+        row = {
+            "first_ms": statistics.median(first) * 1000,
+            "later_p50_ms": statistics.median(later) * 1000,
+            "later_max_ms": max(later) * 1000,
+            "wall_s": wall,
+        }
+        print(
+            f"{name:<16} {row['first_ms']:>12.0f} {row['later_p50_ms']:>14.0f} "
+            f"{row['later_max_ms']:>14.0f} {row['wall_s']:>8.2f}"
+        )
+        return row
+
+    print()
+    print("=" * 68)
+    print(f"{N_TASKS} tasks x {TURNS_PER_TASK} turns, {STARTUP_S * 1000:.0f} ms simulated CLI start-up")
+    print("=" * 68)
+    print(f"{'mode':<16} {'turn 1 ms':>12} {'turns 2+ p50':>14} {'turns 2+ max':>14} {'wall s':>8}")
+    cold_row = _row("fresh client", cold, cold_wall)
+    warm_row = _row("session pool", warm, warm_wall)
+    print("=" * 68)
+
+    assert cold_row["later_p50_ms"] >= STARTUP_S * 1000
+    assert warm_row["later_max_ms"] < STARTUP_S * 1000
+    assert warm_wall < cold_wall / 3
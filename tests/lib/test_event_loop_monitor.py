@@ -0,0 +1,192 @@
+"""Tests for event-loop lag sampling and blocked-loop detection (``EventLoopMonitor``)."""
+
+from __future__ import annotations
+
+import time
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import agentex.lib.core.observability.loop_monitor as loop_monitor
+from agentex.lib.core.observability.loop_monitor import EventLoopMonitor
+from agentex.lib.sdk.fastacp.base.base_acp_server import BaseACPServer
+from agentex.lib.core.observability.resource_sampler import ResourceSampler
+
+BLOCK = 0.3
+THRESHOLD = 0.1
+
+
+def blocking_handler() -> None:
+    time.sleep(BLOCK)
+
+
+@pytest.fixture
+def loop_metrics():
+    metrics = MagicMock()
+    with patch.object(loop_monitor, "get_loop_metrics", return_value=metrics):
+        yield metrics
+
+
+@pytest.fixture
+def monitor_logger():
+    with patch.object(loop_monitor, "logger") as logger:
+        yield logger
+
+
+def _recorded_lags_ms(loop_metrics: MagicMock) -> list[float]:
+    return [c.args[0] for c in loop_metrics.lag.record.call_args_list]
+
+
+class TestLagSampler:
+    async def test_blocking_handler_shows_up_as_lag(self, loop_metrics: MagicMock) -> None:
+        monitor = EventLoopMonitor("worker", lag_interval=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+            blocking_handler()
+            await asyncio.sleep(0.1)
+        finally:
+            monitor.stop()
+
+        lags = _recorded_lags_ms(loop_metrics)
+        assert max(lags) >= (BLOCK - 0.05) * 1000
+        assert sorted(lags)[0] < BLOCK * 1000 / 2
+        assert all(c.args[1] == {"component": "worker"} for c in loop_metrics.lag.record.call_args_list)
+
+    async def test_stop_cancels_the_sampler(self, loop_metrics: MagicMock) -> None:
+        monitor = EventLoopMonitor("acp", lag_interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        monitor.stop()
+        recorded = loop_metrics.lag.record.call_count
+        await asyncio.sleep(0.05)
+
+        assert recorded > 0
+        assert loop_metrics.lag.record.call_count == recorded
+
+
+class TestSlowCallbacks:
+    async def test_blocked_loop_logs_the_blocking_stack_once(
+        self, loop_metrics: MagicMock, monitor_logger: MagicMock
+    ) -> None:
+        monitor = EventLoopMonitor("worker", lag_interval=None, slow_callback_threshold=THRESHOLD)
+        monitor.start()
+        try:
+            await asyncio.sleep(THRESHOLD)
+            blocking_handler()
+            await asyncio.sleep(THRESHOLD * 3)
+        finally:
+            monitor.stop()
+
+        monitor_logger.warning.assert_called_once()
+        message = monitor_logger.warning.call_args.args[0] % monitor_logger.warning.call_args.args[1:]
+        assert "Event loop (worker) blocked" in message
+        assert "in blocking_handler" in message
+        assert "time.sleep(BLOCK)" in message
+        loop_metrics.slow_callbacks.add.assert_called_once_with(1, {"component": "worker"})
+        loop_metrics.lag.record.assert_not_called()
+
+    async def test_responsive_loop_logs_nothing(self, loop_metrics: MagicMock, monitor_logger: MagicMock) -> None:
+        monitor = EventLoopMonitor("worker", lag_interval=None, slow_callback_threshold=THRESHOLD)
+        monitor.start()
+        for _ in range(20):
+            await asyncio.sleep(THRESHOLD / 5)
+        monitor.stop()
+
+        monitor_logger.warning.assert_not_called()
+        loop_metrics.slow_callbacks.add.assert_not_called()
+
+
+class TestFromEnv:
+    def test_lag_sampler_on_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENTEX_EVENT_LOOP_METRICS", raising=False)
+        monkeypatch.delenv("AGENTEX_EVENT_LOOP_LAG_INTERVAL_SECONDS", raising=False)
+        monkeypatch.delenv("AGENTEX_SLOW_CALLBACK_SECONDS", raising=False)
+
+        monitor = EventLoopMonitor.from_env("acp")
+
+        assert monitor is not None
+        assert monitor.lag_interval == 0.5
+        assert monitor.slow_callback_threshold is None
+
+    def test_everything_off(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTEX_EVENT_LOOP_METRICS", "0")
+        monkeypatch.delenv("AGENTEX_SLOW_CALLBACK_SECONDS", raising=False)
+
+        assert EventLoopMonitor.from_env("acp") is None
+
+    def test_slow_callback_threshold_without_lag_metrics(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTEX_EVENT_LOOP_METRICS", "off")
+        monkeypatch.setenv("AGENTEX_SLOW_CALLBACK_SECONDS", "0.25")
+
+        monitor = EventLoopMonitor.from_env("worker")
+
+        assert monitor is not None
+        assert monitor.lag_interval is None
+        assert monitor.slow_callback_threshold == 0.25
+
+    def test_invalid_values_are_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENTEX_EVENT_LOOP_METRICS", raising=False)
+        monkeypatch.setenv("AGENTEX_EVENT_LOOP_LAG_INTERVAL_SECONDS", "soon")
+        monkeypatch.setenv("AGENTEX_SLOW_CALLBACK_SECONDS", "-1")
+
+        monitor = EventLoopMonitor.from_env("worker")
+
+        assert monitor is not None
+        assert monitor.lag_interval == 0.5
+        assert monitor.slow_callback_threshold is None
+
+
+class TestACPServer:
+    def test_lifespan_catches_a_blocking_route(
+        self, monkeypatch: pytest.MonkeyPatch, loop_metrics: MagicMock, monitor_logger: MagicMock
+    ) -> None:
+        monkeypatch.setenv("AGENT_NAME", "blocking-agent")
+        monkeypatch.setenv("ACP_URL", "http://localhost")
+        monkeypatch.setenv("AGENTEX_BASE_URL", "")
+        monkeypatch.setenv("AGENTEX_EVENT_LOOP_LAG_INTERVAL_SECONDS", "0.05")
+        monkeypatch.setenv("AGENTEX_SLOW_CALLBACK_SECONDS", str(THRESHOLD))
+        server = BaseACPServer.create()
+
+        @server.get("/block")
+        async def block() -> dict[str, bool]:
+            blocking_handler()
+            return {"ok": True}
+
+        with TestClient(server) as client:
+            assert client.get("/block").json() == {"ok": True}
+            time.sleep(THRESHOLD * 2)
+
+        assert max(_recorded_lags_ms(loop_metrics)) >= (BLOCK - 0.05) * 1000
+        loop_metrics.slow_callbacks.add.assert_called_once_with(1, {"component": "acp"})
+        assert "in blocking_handler" in monitor_logger.warning.call_args.args[3]
+
+
+class TestSharedSampler:
+    async def test_lag_is_recorded_from_the_given_sampler(self, loop_metrics: MagicMock) -> None:
+        sampler = ResourceSampler(interval=0.01)
+        monitor = EventLoopMonitor("worker", sampler=sampler)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+
+        recorded = loop_metrics.lag.record.call_count
+        assert recorded > 0
+        # the sampler belongs to its caller and keeps running, but no longer records lag
+        assert sampler._task is not None and not sampler._task.done()
+        await asyncio.sleep(0.03)
+        assert loop_metrics.lag.record.call_count == recorded
+        sampler.stop()
+
+    async def test_worker_shares_its_tuners_sampler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENTEX_EVENT_LOOP_METRICS", raising=False)
+        sampler = ResourceSampler()
+
+        monitor = EventLoopMonitor.from_env("worker", sampler=sampler)
+
+        assert monitor is not None
+        assert monitor._sampler is sampler
@@ -0,0 +1,141 @@
+"""Tests for incremental LLM-history conversion (agentex.lib.sdk.utils.messages.LLMMessageCache)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone, timedelta
+
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.lib.sdk.utils.messages import (
+    LLMMessageCache,
+    TaskMessageConverter,
+    DefaultTextContentConverter,
+    convert_task_messages_to_llm_messages,
+)
+from agentex.lib.types.llm_messages import Message, UserMessage
+from agentex.types.tool_request_content import ToolRequestContent
+from agentex.types.tool_response_content import ToolResponseContent
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _history(n: int, task_id: str = "t1") -> list[TaskMessage]:
+    messages = []
+    for i in range(n):
+        if i % 3 == 0:
+            content = TextContent(author="user" if i % 2 else "agent", content=f"message {i}")
+        elif i % 3 == 1:
+            content = ToolRequestContent(author="agent", tool_call_id=f"call_{i}", name="lookup", arguments={"i": i})
+        else:
+            content = ToolResponseContent(author="agent", tool_call_id=f"call_{i - 1}", name="lookup", content="ok")
+        messages.append(
+            TaskMessage(
+                id=f"m{i}", task_id=task_id, content=content, created_at=_T0, updated_at=_T0 + timedelta(seconds=i)
+            )
+        )
+    return messages
+
+
+class CountingConverter(TaskMessageConverter):
+    def __init__(self) -> None:
+        self.calls = 0
+        self._inner = DefaultTextContentConverter()
+
+    def convert(self, task_message: TaskMessage) -> Message:
+        self.calls += 1
+        return self._inner.convert(task_message)
+
+
+def _text(i: int, *, updated_at: datetime | None = _T0, **kwargs) -> TaskMessage:
+    return TaskMessage(
+        id=f"m{i}", task_id="t1", content=TextContent(author="user", content=f"hi {i}"), updated_at=updated_at, **kwargs
+    )
+
+
+class TestLLMMessageCache:
+    def test_matches_uncached_conversion(self) -> None:
+        history = _history(30)
+        cache = LLMMessageCache()
+
+        for output_mode in ("pydantic", "dict"):
+            expected = convert_task_messages_to_llm_messages(history, output_mode)
+            assert convert_task_messages_to_llm_messages(history, output_mode, cache=cache) == expected
+            assert convert_task_messages_to_llm_messages(history, output_mode, cache=cache) == expected
+
+    def test_only_new_messages_are_converted(self) -> None:
+        converter = CountingConverter()
+        cache = LLMMessageCache()
+        history = [_text(i) for i in range(10)]
+
+        first = convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+        history.append(_text(10))
+        second = convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+
+        assert converter.calls == 11
+        assert second[:10] == first
+        assert second[10] == UserMessage(content="hi 10")
+        assert second is not first
+
+    def test_updated_message_is_converted_again(self) -> None:
+        converter = CountingConverter()
+        cache = LLMMessageCache()
+        history = [_text(0), _text(1)]
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+
+        history[1] = TaskMessage(
+            id="m1", task_id="t1", content=TextContent(author="user", content="edited"), updated_at=_T0 + timedelta(1)
+        )
+        result = convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+
+        assert converter.calls == 3
+        assert result[1] == UserMessage(content="edited")
+
+    def test_messages_without_id_or_updated_at_or_still_streaming_are_not_cached(self) -> None:
+        converter = CountingConverter()
+        cache = LLMMessageCache()
+        history = [
+            TaskMessage(task_id="t1", content=TextContent(author="user", content="no id"), updated_at=_T0),
+            _text(1, updated_at=None),
+            _text(2, streaming_status="IN_PROGRESS"),
+        ]
+
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+
+        assert converter.calls == 6
+
+    def test_results_are_not_reused_across_output_modes_or_converters(self) -> None:
+        cache = LLMMessageCache()
+        history = [_text(0)]
+        first, second = CountingConverter(), CountingConverter()
+
+        assert isinstance(convert_task_messages_to_llm_messages(history, "dict", cache=cache)[0], dict)
+        assert not isinstance(convert_task_messages_to_llm_messages(history, cache=cache)[0], dict)
+        convert_task_messages_to_llm_messages(history, text_converter=first, cache=cache)
+        convert_task_messages_to_llm_messages(history, text_converter=second, cache=cache)
+
+        assert (first.calls, second.calls) == (1, 1)
+
+    def test_tasks_are_cached_separately_and_evicted_least_recent_first(self) -> None:
+        converter = CountingConverter()
+        cache = LLMMessageCache(max_tasks=2)
+        histories = {task_id: [_text(0).model_copy(update={"task_id": task_id})] for task_id in ("a", "b", "c")}
+
+        for task_id in ("a", "b", "a", "c", "a", "b"):
+            convert_task_messages_to_llm_messages(histories[task_id], text_converter=converter, cache=cache)
+
+        # a, b, (a hit), c evicts b, (a hit), b again
+        assert converter.calls == 4
+
+    def test_clear(self) -> None:
+        converter = CountingConverter()
+        cache = LLMMessageCache()
+        history = [_text(0)]
+
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+        cache.clear("t1")
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+        cache.clear()
+        convert_task_messages_to_llm_messages(history, text_converter=converter, cache=cache)
+
+        assert converter.calls == 3
@@ -0,0 +1,79 @@
+"""
+Benchmark for incremental LLM-history conversion over a long conversation.
+
+Starts from a 5,000-message task history (text, tool requests and tool
+responses) and runs 20 turns, each of which appends a tool request, its
+response and an agent reply, then converts the whole history again with
+``convert_task_messages_to_llm_messages``, as an agent does before every LLM
+call. Reports the mean per-turn conversion time without a cache and with an
+``LLMMessageCache``, which only converts the messages added since the last
+turn.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_llm_message_cache_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Literal
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.lib.sdk.utils.messages import LLMMessageCache, convert_task_messages_to_llm_messages
+from agentex.types.tool_request_content import ToolRequestContent
+from agentex.types.tool_response_content import ToolResponseContent
+
+HISTORY = 5_000
+TURNS = 20
+MIN_SPEEDUP = 10
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _message(i: int) -> TaskMessage:
+    if i % 3 == 0:
+        content = TextContent(author="user" if i % 2 else "agent", content=f"message {i} " * 20)
+    elif i % 3 == 1:
+        content = ToolRequestContent(
+            author="agent", tool_call_id=f"call_{i}", name="search", arguments={"query": f"q{i}", "limit": 10}
+        )
+    else:
+        content = ToolResponseContent(
+            author="agent", tool_call_id=f"call_{i - 1}", name="search", content="result " * 50
+        )
+    return TaskMessage(id=f"m{i}", task_id="t1", content=content, created_at=_T0, updated_at=_T0 + timedelta(seconds=i))
+
+
+def _mean_turn_seconds(output_mode: Literal["pydantic", "dict"], cache: LLMMessageCache | None) -> float:
+    history = [_message(i) for i in range(HISTORY)]
+    # the first conversion of a history is a full conversion either way
+    convert_task_messages_to_llm_messages(history, output_mode, cache=cache)
+    elapsed = 0.0
+    for _ in range(TURNS):
+        history.extend(_message(len(history)) for _ in range(3))
+        start = time.perf_counter()
+        converted = convert_task_messages_to_llm_messages(history, output_mode, cache=cache)
+        elapsed += time.perf_counter() - start
+        assert len(converted) == len(history)
+    return elapsed / TURNS
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+@pytest.mark.parametrize("output_mode", ["pydantic", "dict"])
+def test_incremental_history_conversion(output_mode: Literal["pydantic", "dict"]) -> None:
+    uncached = _mean_turn_seconds(output_mode, None)
+    cached = _mean_turn_seconds(output_mode, LLMMessageCache())
+
+    print(
+        f"\n{output_mode:<8} {HISTORY:,}-message history, mean per turn:"
+        f"  uncached {uncached * 1000:8.2f} ms   cached {cached * 1000:6.2f} ms   ({uncached / cached:,.0f}x)"
+    )
+    assert uncached / cached >= MIN_SPEEDUP
@@ -0,0 +1,211 @@
+"""Tests for activity concurrency groups, slot metrics and the resource-based tuner."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agentex.lib.core.observability import worker_metrics
+from agentex.lib.core.temporal.workers import concurrency
+from agentex.lib.core.temporal.workers.concurrency import (
+    ActivityConcurrencyGroup,
+    ResourceBasedActivityTuner,
+    ActivitySlotMetricsInterceptor,
+    activity_task_queue,
+    route_activity_groups,
+    resource_tuner_from_env,
+    validate_activity_groups,
+)
+
+
+class _FakeSampler:
+    interval = 0.05
+
+    def __init__(self) -> None:
+        self.cpu = 0.0
+        self.memory = 0.0
+        self.event_loop_lag = 0.0
+
+    def start(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _clear_routes():
+    yield
+    route_activity_groups("unused", [])
+
+
+@pytest.fixture
+def metrics(monkeypatch) -> Mock:
+    fake = Mock()
+    monkeypatch.setattr(worker_metrics, "_worker_metrics", fake)
+    return fake
+
+
+class TestActivityGroups:
+    def test_routes_grouped_activities_to_group_queues(self):
+        route_activity_groups("agent-queue", [ActivityConcurrencyGroup("llm", ["stream_llm", "run_agent"], 4)])
+
+        assert activity_task_queue("stream_llm") == "agent-queue.llm"
+        assert activity_task_queue("run_agent") == "agent-queue.llm"
+        assert activity_task_queue("update_state") is None
+
+    @pytest.mark.parametrize(
+        "groups,match",
+        [
+            ([ActivityConcurrencyGroup("", ["a"], 1)], "Invalid"),
+            ([ActivityConcurrencyGroup("default", ["a"], 1)], "Invalid"),
+            ([ActivityConcurrencyGroup("llm", ["a"], 1), ActivityConcurrencyGroup("llm", ["b"], 1)], "Duplicate"),
+            ([ActivityConcurrencyGroup("llm", ["a"], 0)], "max_concurrent"),
+            ([ActivityConcurrencyGroup("llm", ["a"], 1), ActivityConcurrencyGroup("io", ["a"], 1)], "both"),
+        ],
+    )
+    def test_invalid_groups_are_rejected(self, groups, match):
+        with pytest.raises(ValueError, match=match):
+            validate_activity_groups(groups)
+
+    async def test_activity_helpers_schedule_on_the_group_queue(self):
+        from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
+
+        route_activity_groups("agent-queue", [ActivityConcurrencyGroup("llm", ["stream_llm"], 4)])
+        with patch("agentex.lib.core.temporal.activities.activity_helpers.workflow") as mock_workflow:
+            mock_workflow.execute_activity = Mock(side_effect=[asyncio.sleep(0, "a"), asyncio.sleep(0, "b")])
+            await ActivityHelpers.execute_activity("stream_llm", {}, str)
+            await ActivityHelpers.execute_activity("update_state", {}, str)
+
+        queues = [call.kwargs["task_queue"] for call in mock_workflow.execute_activity.call_args_list]
+        assert queues == ["agent-queue.llm", None]
+
+    def test_worker_validates_groups(self):
+        from agentex.lib.core.temporal.workers.worker import AgentexWorker
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            AgentexWorker(
+                task_queue="q",
+                health_check_port=8080,
+                activity_groups=[ActivityConcurrencyGroup("llm", ["a"], 1), ActivityConcurrencyGroup("llm", ["b"], 1)],
+            )
+
+    def test_resource_tuner_is_opt_in_by_env(self, monkeypatch):
+        from agentex.lib.core.temporal.workers.worker import AgentexWorker
+
+        monkeypatch.delenv("AGENTEX_WORKER_RESOURCE_TUNER", raising=False)
+        assert resource_tuner_from_env() is None
+        assert AgentexWorker(task_queue="q", health_check_port=8080).activity_tuner is None
+
+        monkeypatch.setenv("AGENTEX_WORKER_RESOURCE_TUNER", "1")
+        assert isinstance(AgentexWorker(task_queue="q", health_check_port=8080).activity_tuner, ResourceBasedActivityTuner)
+
+
+class TestSlotMetricsInterceptor:
+    async def test_records_slot_usage_and_schedule_to_start(self, metrics):
+        scheduled = datetime(2026, 1, 1, tzinfo=UTC)
+        info = SimpleNamespace(
+            activity_type="stream_llm",
+            current_attempt_scheduled_time=scheduled,
+            started_time=scheduled + timedelta(milliseconds=250),
+        )
+        in_flight: list[int] = []
+
+        class _Next:
+            async def execute_activity(self, input):
+                in_flight.append(metrics.activity_slots_used.add.call_count)
+                return "done"
+
+        interceptor = ActivitySlotMetricsInterceptor([ActivityConcurrencyGroup("llm", ["stream_llm"], 4)])
+        inbound = interceptor.intercept_activity(_Next())  # type: ignore[arg-type]
+        with patch.object(concurrency.activity, "info", return_value=info):
+            assert await inbound.execute_activity(Mock()) == "done"
+
+        metrics.activity_schedule_to_start.record.assert_called_once_with(
+            250.0, {"activity_type": "stream_llm", "group": "llm"}
+        )
+        assert in_flight == [1]
+        assert [c.args for c in metrics.activity_slots_used.add.call_args_list] == [
+            (1, {"group": "llm"}),
+            (-1, {"group": "llm"}),
+        ]
+
+    async def test_ungrouped_activities_use_the_default_group(self, metrics):
+        info = SimpleNamespace(activity_type="update_state", current_attempt_scheduled_time=None, started_time=None)
+
+        class _Next:
+            async def execute_activity(self, input):
+                raise RuntimeError("boom")
+
+        inbound = ActivitySlotMetricsInterceptor().intercept_activity(_Next())  # type: ignore[arg-type]
+        with patch.object(concurrency.activity, "info", return_value=info), pytest.raises(RuntimeError):
+            await inbound.execute_activity(Mock())
+
+        metrics.activity_schedule_to_start.record.assert_not_called()
+        assert metrics.activity_slots_used.add.call_args_list[-1].args == (-1, {"group": "default"})
+
+
+class TestResourceBasedActivityTuner:
+    def _tuner(self, **kwargs) -> tuple[ResourceBasedActivityTuner, _FakeSampler]:
+        sampler = _FakeSampler()
+        kwargs.setdefault("ramp_throttle", 0)
+        return ResourceBasedActivityTuner(sampler=sampler, **kwargs), sampler  # type: ignore[arg-type]
+
+    async def test_min_slots_are_granted_under_load(self, metrics):
+        tuner, sampler = self._tuner(min_slots=2, max_slots=10)
+        sampler.cpu = 1.0
+
+        await tuner.reserve_slot(Mock())
+        await tuner.reserve_slot(Mock())
+
+        assert tuner.reserved_slots == 2
+        assert tuner.try_reserve_slot(Mock()) is None
+        assert tuner.limiting_resource() == "cpu"
+
+    @pytest.mark.parametrize(
+        "attribute,value,reason",
+        [("cpu", 0.95, "cpu"), ("memory", 0.9, "memory"), ("event_loop_lag", 0.5, "event_loop_lag")],
+    )
+    async def test_waits_while_a_resource_is_over_target(self, metrics, attribute, value, reason):
+        tuner, sampler = self._tuner(min_slots=1, max_slots=10)
+        await tuner.reserve_slot(Mock())
+        setattr(sampler, attribute, value)
+
+        waiter = asyncio.ensure_future(tuner.reserve_slot(Mock()))
+        await asyncio.sleep(0.12)
+        assert not waiter.done()
+        metrics.activity_slot_waits.add.assert_called_once_with(1, {"reason": reason})
+
+        setattr(sampler, attribute, 0.0)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert tuner.reserved_slots == 2
+
+    async def test_release_wakes_a_waiter_at_max_slots(self, metrics):
+        tuner, _ = self._tuner(min_slots=1, max_slots=2)
+        await tuner.reserve_slot(Mock())
+        await tuner.reserve_slot(Mock())
+        tuner.sampler.interval = 10  # only a release can wake the waiter
+
+        waiter = asyncio.ensure_future(tuner.reserve_slot(Mock()))
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+
+        tuner.release_slot(Mock())
+        await asyncio.wait_for(waiter, timeout=1)
+        assert tuner.reserved_slots == 2
+
+    async def test_ramp_throttle_spaces_grants(self, metrics):
+        tuner, _ = self._tuner(min_slots=1, max_slots=10, ramp_throttle=0.05)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(4):
+            await tuner.reserve_slot(Mock())
+
+        # first grant is within min_slots; the next three are throttled
+        assert loop.time() - start >= 0.14
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            ResourceBasedActivityTuner(min_slots=5, max_slots=2)
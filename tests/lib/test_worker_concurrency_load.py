@@ -0,0 +1,159 @@
+"""
+Load test for activity concurrency groups on ``AgentexWorker``.
+
+Runs a mix of long "LLM" activities (1 s each) and short state-update
+activities (10 ms) against a local Temporal dev server, under three worker
+configurations:
+
+- a single task queue with 10 fixed activity slots (the previous behavior)
+- the same 10 slots, with the long activities in their own ``llm`` group
+- the resource-based tuner, with the long activities in the ``llm`` group
+
+Reports schedule-to-start latency of the short activities and total wall time.
+With one shared pool, short activities queue behind every wave of long ones;
+with a group they must start within a fraction of one long activity.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/test_worker_concurrency_load.py \
+        -v -o "addopts=--tb=short" -s
+
+Requires the Temporal dev server (downloaded by ``WorkflowEnvironment.start_local``
+on first use).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+import asyncio
+import statistics
+
+import pytest
+from temporalio import activity, workflow
+
+from agentex.lib.core.temporal.workers import worker as worker_module
+from agentex.lib.core.temporal.workers.worker import AgentexWorker
+from agentex.lib.core.temporal.workers.concurrency import (
+    ActivityConcurrencyGroup,
+    ResourceBasedActivityTuner,
+)
+from agentex.lib.core.temporal.activities.activity_helpers import ActivityHelpers
+
+N_WORKFLOWS = 30
+SHORT_PER_WORKFLOW = 4
+LONG_ACTIVITY_S = 1.0
+SHORT_ACTIVITY_S = 0.01
+FIXED_SLOTS = 10
+
+_short_schedule_to_start: list[float] = []
+
+
+@activity.defn(name="stream_llm")
+async def stream_llm(_: dict) -> str:
+    await asyncio.sleep(LONG_ACTIVITY_S)
+    return "done"
+
+
+@activity.defn(name="update_state")
+async def update_state(_: dict) -> str:
+    info = activity.info()
+    _short_schedule_to_start.append((info.started_time - info.current_attempt_scheduled_time).total_seconds())
+    await asyncio.sleep(SHORT_ACTIVITY_S)
+    return "done"
+
+
+@workflow.defn
+class MixedTurnWorkflow:
+    @workflow.run
+    async def run(self) -> None:
+        calls = [ActivityHelpers.execute_activity("stream_llm", {}, str)]
+        calls += [ActivityHelpers.execute_activity("update_state", {}, str) for _ in range(SHORT_PER_WORKFLOW)]
+        await asyncio.gather(*calls)
+
+
+async def _run_config(env, monkeypatch, **worker_kwargs) -> dict[str, float]:
+    async def _client(**_):
+        return env.client
+
+    async def _noop(self):
+        pass
+
+    monkeypatch.setattr(worker_module, "get_temporal_client", _client)
+    monkeypatch.setattr(AgentexWorker, "start_health_check_server", _noop)
+    monkeypatch.setattr(AgentexWorker, "_register_agent", _noop)
+
+    task_queue = f"load-{uuid.uuid4().hex[:8]}"
+    agentex_worker = AgentexWorker(task_queue=task_queue, health_check_port=0, **worker_kwargs)
+    worker_task = asyncio.create_task(
+        agentex_worker.run([stream_llm, update_state], workflow=MixedTurnWorkflow)
+    )
+    _short_schedule_to_start.clear()
+    try:
+        await asyncio.sleep(1)  # let pollers connect
+        start = time.perf_counter()
+        handles = [
+            await env.client.start_workflow(MixedTurnWorkflow.run, id=f"{task_queue}-{i}", task_queue=task_queue)
+            for i in range(N_WORKFLOWS)
+        ]
+        await asyncio.gather(*(handle.result() for handle in handles))
+        wall = time.perf_counter() - start
+    finally:
+        worker_task.cancel()
+        await asyncio.gather(worker_task, return_exceptions=True)
+
+    samples = sorted(_short_schedule_to_start)
+    return {
+        "wall_s": wall,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99) - 1] * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+async def test_groups_keep_short_activities_responsive(monkeypatch):
+    from temporalio.testing import WorkflowEnvironment
+
+    monkeypatch.delenv("AGENTEX_WORKER_RESOURCE_TUNER", raising=False)
+    llm_group = ActivityConcurrencyGroup("llm", ["stream_llm"], max_concurrent=FIXED_SLOTS)
+    try:
+        env = await WorkflowEnvironment.start_local()
+    except RuntimeError as e:  # the dev server is downloaded on first use
+        pytest.skip(f"Temporal dev server unavailable: {e}")
+
+    async with env:
+        results = {
+            "shared pool": await _run_config(env, monkeypatch, max_concurrent_activities=FIXED_SLOTS),
+            "llm group": await _run_config(
+                env, monkeypatch, max_concurrent_activities=FIXED_SLOTS, activity_groups=[llm_group]
+            ),
+            "llm group + tuner": await _run_config(
+                env,
+                monkeypatch,
+                activity_groups=[llm_group],
+                activity_tuner=ResourceBasedActivityTuner(min_slots=2, max_slots=FIXED_SLOTS),
+            ),
+        }
+
+    print()
+    print("=" * 72)
+    print(
+        f"{N_WORKFLOWS} workflows x (1 x {LONG_ACTIVITY_S:.0f}s LLM + {SHORT_PER_WORKFLOW} x "
+        f"{SHORT_ACTIVITY_S * 1000:.0f}ms update), {FIXED_SLOTS} slots per pool"
+    )
+    print("=" * 72)
+    print(f"{'config':<20} {'wall s':>8} {'short s2s p50':>15} {'p99 ms':>10} {'max ms':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['wall_s']:>8.2f} {result['p50_ms']:>12.1f} ms "
+            f"{result['p99_ms']:>10.1f} {result['max_ms']:>10.1f}"
+        )
+    print("=" * 72)
+
+    shared, grouped = results["shared pool"], results["llm group"]
+    assert grouped["p99_ms"] < shared["p99_ms"] / 2
+    assert grouped["p99_ms"] < LONG_ACTIVITY_S * 1000
+    assert results["llm group + tuner"]["p99_ms"] < LONG_ACTIVITY_S * 1000
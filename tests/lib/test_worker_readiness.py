@@ -0,0 +1,302 @@
+"""Tests for ``AgentexWorker`` readiness gating and content-derived build ids.
+
+Temporal is faked: ``Worker`` is replaced by a stand-in whose ``run`` flips
+``is_running`` after a short validation delay, and the client answers
+``DescribeTaskQueue`` from a set of live poller identities.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import asyncio
+import textwrap
+import importlib
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from temporalio import activity
+from temporalio.service import RPCError, RPCStatusCode
+from temporalio.api.enums.v1 import TaskQueueType
+
+from agentex.lib.core.temporal.workers import worker as worker_module
+from agentex.lib.core.temporal.workers.worker import AgentexWorker
+from agentex.lib.core.temporal.workers.build_id import worker_build_id, agent_source_roots
+from agentex.lib.core.temporal.workers.readiness import WorkerReadiness, run_warmups, wait_for_pollers
+from agentex.lib.core.temporal.workers.concurrency import ActivityConcurrencyGroup
+
+IDENTITY = "worker-1@host"
+
+
+class FakeWorkflowService:
+    def __init__(self, client: FakeClient):
+        self.client = client
+        self.calls: list[tuple[str, int]] = []
+
+    async def describe_task_queue(self, request):
+        self.calls.append((request.task_queue.name, request.task_queue_type))
+        if self.client.reject:
+            raise RPCError("permission denied", RPCStatusCode.PERMISSION_DENIED, b"")
+        identities = self.client.pollers.get((request.task_queue.name, request.task_queue_type), set())
+        return SimpleNamespace(pollers=[SimpleNamespace(identity=i) for i in identities])
+
+
+class FakeClient:
+    def __init__(self, reject: bool = False):
+        self.identity = IDENTITY
+        self.namespace = "default"
+        self.reject = reject
+        self.pollers: dict[tuple[str, int], set[str]] = {}
+        self.workflow_service = FakeWorkflowService(self)
+
+    def add_pollers(self, task_queue: str, polls_workflows: bool = True) -> None:
+        types = [TaskQueueType.TASK_QUEUE_TYPE_ACTIVITY]
+        if polls_workflows:
+            types.append(TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW)
+        for queue_type in types:
+            self.pollers.setdefault((task_queue, queue_type), set()).add(IDENTITY)
+
+
+class FakeWorker:
+    """Stand-in for ``temporalio.worker.Worker`` that registers its pollers once running."""
+
+    instances: list[FakeWorker] = []
+    validate_s = 0.05
+
+    def __init__(self, *, client: FakeClient, task_queue: str, build_id: str, **kwargs: Any):
+        self.client = client
+        self.task_queue = task_queue
+        self.build_id = build_id
+        self.polls_workflows = bool(kwargs.get("workflows"))
+        self.is_running = False
+        self.is_shutdown = False
+        self.stop = asyncio.Event()
+        FakeWorker.instances.append(self)
+
+    async def run(self) -> None:
+        await asyncio.sleep(self.validate_s)
+        self.is_running = True
+        try:
+            await asyncio.sleep(self.validate_s)
+            self.client.add_pollers(self.task_queue, self.polls_workflows)
+            await self.stop.wait()
+        finally:
+            self.is_running = False
+            self.is_shutdown = True
+
+
+@activity.defn
+async def dummy_activity() -> None:
+    pass
+
+
+class DummyWorkflow:
+    pass
+
+
+@pytest.fixture
+def fake_temporal(monkeypatch):
+    client = FakeClient()
+
+    async def _client(**_):
+        return client
+
+    async def _noop(self):
+        pass
+
+    FakeWorker.instances = []
+    monkeypatch.setattr(worker_module, "Worker", FakeWorker)
+    monkeypatch.setattr(worker_module, "get_temporal_client", _client)
+    monkeypatch.setattr(worker_module, "route_activity_groups", lambda *_: None)
+    monkeypatch.setattr(AgentexWorker, "start_health_check_server", _noop)
+    monkeypatch.setattr(AgentexWorker, "_register_agent", _noop)
+    monkeypatch.setattr("agentex.lib.core.temporal.workers.readiness._POLL_INTERVAL_S", 0.01)
+    monkeypatch.setattr("agentex.lib.core.temporal.workers.readiness._MONITOR_INTERVAL_S", 0.01)
+    return client
+
+
+async def _readyz(worker: AgentexWorker) -> tuple[int, Any]:
+    response = await worker._health_check()
+    assert response.body is not None
+    return response.status, json.loads(response.body)
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+class TestWorkerReadiness:
+    async def test_ready_only_once_pollers_are_live(self, fake_temporal):
+        worker = AgentexWorker(task_queue="q", health_check_port=0, build_id="b1")
+        assert await _readyz(worker) == (503, False)
+
+        run = asyncio.create_task(worker.run([dummy_activity], workflow=DummyWorkflow))
+        try:
+            await _wait_until(lambda: FakeWorker.instances and FakeWorker.instances[0].is_running)
+            # running, but the server does not list our pollers yet
+            assert await _readyz(worker) == (503, False)
+
+            await _wait_until(lambda: worker.healthy)
+            assert fake_temporal.pollers
+            assert await _readyz(worker) == (200, True)
+        finally:
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+    async def test_not_ready_after_a_worker_stops(self, fake_temporal):
+        worker = AgentexWorker(task_queue="q", health_check_port=0, build_id="b1")
+        run = asyncio.create_task(worker.run([dummy_activity], workflow=DummyWorkflow))
+        await _wait_until(lambda: worker.healthy)
+
+        FakeWorker.instances[0].stop.set()
+        await run
+
+        assert await _readyz(worker) == (503, False)
+        assert worker.readiness.pending == ["stopped"]
+
+    async def test_group_queues_must_be_polled_too(self, fake_temporal):
+        group = ActivityConcurrencyGroup(name="llm", activity_types=["dummy_activity"], max_concurrent=2)
+        worker = AgentexWorker(task_queue="q", health_check_port=0, build_id="b1", activity_groups=[group])
+        run = asyncio.create_task(worker.run([dummy_activity], workflow=DummyWorkflow))
+        try:
+            await _wait_until(lambda: worker.healthy)
+            assert len(FakeWorker.instances) == 2
+            checked = {name for name, _ in fake_temporal.workflow_service.calls}
+            assert checked == {"q", group.task_queue("q")}
+            assert {w.build_id for w in FakeWorker.instances} == {"b1"}
+        finally:
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+    async def test_warmups_run_before_polling(self, fake_temporal):
+        order: list[str] = []
+
+        async def warm_llm():
+            await asyncio.sleep(0.05)
+            order.append("llm")
+
+        async def broken_mcp():
+            raise ConnectionError("mcp down")
+
+        worker = AgentexWorker(
+            task_queue="q", health_check_port=0, build_id="b1", warmups={"llm": warm_llm, "mcp": broken_mcp}
+        )
+        run = asyncio.create_task(worker.run([dummy_activity], workflow=DummyWorkflow))
+        try:
+            await _wait_until(lambda: bool(FakeWorker.instances) and FakeWorker.instances[0].is_running)
+            order.append("workers")
+            # a failing warm-up is logged, not fatal
+            await _wait_until(lambda: worker.healthy)
+        finally:
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+        assert order == ["llm", "workers"]
+
+    async def test_rejected_describe_task_queue_falls_back_to_worker_state(self, fake_temporal):
+        fake_temporal.reject = True
+        worker = AgentexWorker(task_queue="q", health_check_port=0, build_id="b1")
+        run = asyncio.create_task(worker.run([dummy_activity], workflow=DummyWorkflow))
+        try:
+            await _wait_until(lambda: worker.healthy)
+            assert len(fake_temporal.workflow_service.calls) == 2
+        finally:
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+
+class TestReadinessPrimitives:
+    def test_stages_must_all_complete(self):
+        readiness = WorkerReadiness()
+        readiness.mark("warmup")
+        readiness.mark("workers")
+        assert not readiness.ready
+        assert readiness.pending == ["pollers"]
+        readiness.mark("pollers")
+        assert readiness.ready
+
+        with pytest.raises(ValueError):
+            readiness.mark("bogus")
+
+    async def test_warmup_timeout_is_reported(self):
+        async def slow():
+            await asyncio.sleep(1)
+
+        async def fast():
+            pass
+
+        assert await run_warmups({"slow": slow, "fast": fast}, timeout=0.05) == {"slow": False, "fast": True}
+
+    async def test_wait_for_pollers_ignores_other_identities(self):
+        client = FakeClient()
+        client.pollers[("q", TaskQueueType.TASK_QUEUE_TYPE_ACTIVITY)] = {"someone-else"}
+        waiter = asyncio.create_task(wait_for_pollers(client, [("q", False)], IDENTITY, interval=0.01))  # type: ignore[arg-type]
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        client.add_pollers("q", polls_workflows=False)
+        assert await asyncio.wait_for(waiter, 1) is True
+
+
+@pytest.fixture
+def agent_package(tmp_path, monkeypatch):
+    """An importable ``fake_agent`` package defining one workflow."""
+    package = tmp_path / "fake_agent"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "workflow.py").write_text(
+        textwrap.dedent(
+            """
+            class AgentWorkflow:
+                pass
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delenv("AGENTEX_WORKER_BUILD_ID", raising=False)
+    yield package
+    for name in [n for n in sys.modules if n == "fake_agent" or n.startswith("fake_agent.")]:
+        del sys.modules[name]
+
+
+def _load_workflow() -> type:
+    return importlib.import_module("fake_agent.workflow").AgentWorkflow
+
+
+class TestWorkerBuildId:
+    def test_stable_for_unchanged_source(self, agent_package):
+        workflow = _load_workflow()
+        first = worker_build_id([workflow, dummy_activity])
+
+        (agent_package / "__pycache__").mkdir()
+        (agent_package / "__pycache__" / "workflow.cpython-312.pyc").write_bytes(b"\x00bytecode")
+
+        assert worker_build_id([workflow, dummy_activity]) == first
+        assert len(first) == 32
+
+    def test_changes_with_agent_source(self, agent_package):
+        workflow = _load_workflow()
+        first = worker_build_id([workflow])
+
+        (agent_package / "tools.py").write_text("TOOLS = []\n")
+
+        assert worker_build_id([workflow]) != first
+
+    def test_sdk_definitions_are_not_agent_source(self, agent_package):
+        workflow = _load_workflow()
+
+        assert agent_source_roots([workflow, AgentexWorker]) == [agent_package.resolve()]
+
+    def test_env_override(self, agent_package, monkeypatch):
+        monkeypatch.setenv("AGENTEX_WORKER_BUILD_ID", "release-42")
+
+        assert worker_build_id([_load_workflow()]) == "release-42"
+
+    def test_random_when_source_is_unknown(self):
+        class Interactive:
+            __module__ = "not_a_loaded_module"
+
+        assert worker_build_id([Interactive]) != worker_build_id([Interactive])
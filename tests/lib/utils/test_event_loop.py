@@ -0,0 +1,107 @@
+"""Tests for opt-in uvloop selection (``agentex.lib.utils.event_loop``)."""
+
+from __future__ import annotations
+
+import sys
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import agentex.lib.utils.event_loop as event_loop
+from agentex.lib.sdk.fastacp.base.base_acp_server import BaseACPServer
+
+
+class _FakeUvloop:
+    """Stands in for the uvloop package, which is an optional install."""
+
+    def __init__(self) -> None:
+        self.loops_created = 0
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        self.loops_created += 1
+        return asyncio.new_event_loop()
+
+
+@pytest.fixture
+def no_uvloop():
+    # A None entry makes ``import uvloop`` raise ImportError
+    with patch.dict(sys.modules, {"uvloop": None}), patch.object(event_loop, "logger") as logger:
+        yield logger
+
+
+@pytest.fixture
+def fake_uvloop():
+    uvloop = _FakeUvloop()
+    with patch.dict(sys.modules, {"uvloop": uvloop}):
+        yield uvloop
+
+
+class TestUvloopRequested:
+    def test_off_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENTEX_UVLOOP", raising=False)
+        assert event_loop.uvloop_requested() is False
+
+    @pytest.mark.parametrize("value, expected", [("1", True), ("true", True), ("0", False), ("off", False)])
+    def test_from_environment(self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool) -> None:
+        monkeypatch.setenv("AGENTEX_UVLOOP", value)
+        assert event_loop.uvloop_requested() is expected
+
+    def test_argument_overrides_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTEX_UVLOOP", "1")
+        assert event_loop.uvloop_requested(False) is False
+
+
+class TestRunEventLoop:
+    def test_runs_on_uvloop_when_requested(self, fake_uvloop: _FakeUvloop) -> None:
+        async def main() -> str:
+            return "done"
+
+        assert event_loop.run_event_loop(main(), use_uvloop=True) == "done"
+        assert fake_uvloop.loops_created == 1
+
+    def test_missing_uvloop_falls_back_with_a_warning(self, no_uvloop: MagicMock) -> None:
+        async def main() -> str:
+            return "done"
+
+        assert event_loop.run_event_loop(main(), use_uvloop=True) == "done"
+        no_uvloop.warning.assert_called_once()
+
+    def test_not_requested_does_not_import_uvloop(self, no_uvloop: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("AGENTEX_UVLOOP", raising=False)
+
+        assert event_loop.uvloop_loop_factory() is None
+        no_uvloop.warning.assert_not_called()
+
+
+class TestACPServerRun:
+    def test_uvloop_is_passed_to_uvicorn(self, fake_uvloop: _FakeUvloop) -> None:  # noqa: ARG002
+        server = BaseACPServer.create()
+        with patch("agentex.lib.sdk.fastacp.base.base_acp_server.uvicorn.run") as run:
+            server.run(port=9000, use_uvloop=True)
+        assert run.call_args.kwargs == {"host": "0.0.0.0", "port": 9000, "loop": "uvloop"}
+
+    def test_missing_uvloop_falls_back_to_asyncio(self, no_uvloop: MagicMock) -> None:
+        server = BaseACPServer.create()
+        with patch("agentex.lib.sdk.fastacp.base.base_acp_server.uvicorn.run") as run:
+            server.run(use_uvloop=True)
+        assert run.call_args.kwargs["loop"] == "asyncio"
+        no_uvloop.warning.assert_called_once()
+
+    def test_installed_uvloop_is_not_used_unless_requested(
+        self,
+        fake_uvloop: _FakeUvloop,  # noqa: ARG002
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.delenv("AGENTEX_UVLOOP", raising=False)
+        server = BaseACPServer.create()
+        with patch("agentex.lib.sdk.fastacp.base.base_acp_server.uvicorn.run") as run:
+            server.run()
+        # uvicorn's default loop="auto" would pick uvloop because it is installed
+        assert run.call_args.kwargs["loop"] == "asyncio"
+
+    def test_explicit_loop_wins(self, fake_uvloop: _FakeUvloop) -> None:  # noqa: ARG002
+        server = BaseACPServer.create()
+        with patch("agentex.lib.sdk.fastacp.base.base_acp_server.uvicorn.run") as run:
+            server.run(use_uvloop=True, loop="asyncio")
+        assert run.call_args.kwargs["loop"] == "asyncio"
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentex.lib.utils import json_codec
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.types.task_message_delta import TextDelta
+from agentex.types.task_message_update import StreamTaskMessageDelta
+from agentex.lib.core.adapters.streams.adapter_redis import RedisStreamRepository
+
+_TS = datetime(2026, 5, 13, 18, 30, 0, tzinfo=timezone.utc)
+
+
+def _delta_update() -> StreamTaskMessageDelta:
+    return StreamTaskMessageDelta(
+        parent_task_message=TaskMessage(
+            id="m1", task_id="t1", content=TextContent(author="agent", content=""), created_at=_TS
+        ),
+        delta=TextDelta(type="text", text_delta="hello"),
+        index=0,
+        type="delta",
+    )
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return request.param
+
+
+class TestJsonCodec:
+    def test_models_match_model_dump(self, backend):
+        update = _delta_update()
+        assert json.loads(json_codec.dumps(update)) == update.model_dump(mode="json")
+
+    def test_nested_models_and_rich_types(self, backend):
+        value = {"update": _delta_update(), "at": _TS, "id": uuid.UUID(int=1), 1: "int key"}
+        decoded = json_codec.loads(json_codec.dumps(value))
+
+        assert decoded["update"] == _delta_update().model_dump(mode="json")
+        assert datetime.fromisoformat(decoded["at"]) == _TS
+        assert decoded["id"] == "00000000-0000-0000-0000-000000000001"
+        assert decoded["1"] == "int key"
+
+    def test_output_is_compact_bytes(self, backend):
+        assert json_codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        assert json_codec.dumps_str({"a": "é"}) == '{"a":"é"}'
+
+    def test_custom_default(self, backend):
+        assert json_codec.dumps({"b": b"\x00"}, default=lambda v: v.hex()) == b'{"b":"00"}'
+
+    def test_big_integers_round_trip(self, backend):
+        assert json_codec.loads(json_codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+    @pytest.mark.parametrize("data", ['{"a": 1}', b'{"a": 1}', bytearray(b'{"a": 1}'), memoryview(b'{"a": 1}')])
+    def test_loads_accepts_str_and_bytes(self, backend, data):
+        assert json_codec.loads(data) == {"a": 1}
+
+    def test_loads_accepts_stdlib_extensions(self, backend):
+        assert json_codec.loads("[NaN]")[0] != json_codec.loads("[NaN]")[0]
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"{not json")
+
+
+class TestRedisStreamRepositoryCodec:
+    def _repository(self) -> RedisStreamRepository:
+        repository = RedisStreamRepository.__new__(RedisStreamRepository)
+        repository.redis = MagicMock()
+        repository.redis.xadd = AsyncMock(return_value=b"1-0")
+        repository.stream_maxlen = 100
+        repository.stream_ttl_seconds = 0
+        return repository
+
+    async def test_send_event_serializes_models_directly(self):
+        repository = self._repository()
+        update = _delta_update()
+
+        await repository.send_event(topic="t", event=update)
+
+        fields = repository.redis.xadd.call_args.kwargs["fields"]
+        assert json.loads(fields["data"]) == update.model_dump(mode="json")
+
+    async def test_send_event_accepts_dicts(self):
+        repository = self._repository()
+
+        await repository.send_event(topic="t", event={"type": "delta", "index": 0})
+
+        assert repository.redis.xadd.call_args.kwargs["fields"]["data"] == b'{"type":"delta","index":0}'
@@ -0,0 +1,213 @@
+"""
+Manual benchmark for the shared JSON codec on the streaming, parsing and
+checkpoint hot paths.
+
+Each path runs its real code (Redis stream publish/read, delta
+accumulation, the codex line parser, span derivation, checkpoint bodies)
+once with the stdlib fallback and once with orjson, and reports operations
+per second. The two encode paths also report the previous
+``json.dumps(model.model_dump(mode="json"))`` implementation.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/lib/utils/test_json_codec_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import asyncio
+import importlib
+from typing import Any, Callable
+from datetime import datetime, timezone
+
+import pytest
+
+from agentex.lib.utils import json_codec
+from agentex.types.task_message import TaskMessage
+from agentex.types.text_content import TextContent
+from agentex.types.task_message_delta import TextDelta
+from agentex.types.tool_request_delta import ToolRequestDelta
+from agentex.types.task_message_update import (
+    StreamTaskMessageDone,
+    StreamTaskMessageDelta,
+    StreamTaskMessageStart,
+)
+from agentex.types.tool_request_content import ToolRequestContent
+from agentex.lib.adk._modules._codex_sync import _convert_codex_impl
+from agentex.lib.core.services.adk.streaming import DeltaAccumulator
+from agentex.lib.core.harness.span_derivation import SpanDeriver
+from agentex.lib.core.adapters.streams.adapter_redis import RedisStreamRepository
+
+N = 20_000
+_TS = datetime(2026, 5, 13, 18, 30, 0, tzinfo=timezone.utc)
+_CHECKPOINTER = "agentex.lib.adk._modules._http_checkpointer"
+
+
+class _StubRedis:
+    async def xadd(self, **kwargs: Any) -> bytes:
+        return b"1-0"
+
+
+def _update(i: int) -> StreamTaskMessageDelta:
+    return StreamTaskMessageDelta(
+        parent_task_message=TaskMessage(
+            id=f"m{i}", task_id="t1", content=TextContent(author="agent", content=""), created_at=_TS
+        ),
+        delta=TextDelta(type="text", text_delta=f"token {i} " * 4),
+        index=0,
+        type="delta",
+    )
+
+
+def _tool_args() -> dict[str, Any]:
+    return {"query": "latest filings", "filters": {"year": [2024, 2025], "tags": ["10-K", "10-Q"]}, "limit": 50}
+
+
+@pytest.fixture()
+def checkpointer_module():
+    stub_keys = [
+        k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _CHECKPOINTER
+    ]
+    saved = {k: sys.modules.pop(k) for k in stub_keys}
+    yield importlib.import_module(_CHECKPOINTER)
+    for k in [
+        k for k in sys.modules if k.startswith("langchain_core") or k.startswith("langgraph") or k == _CHECKPOINTER
+    ]:
+        del sys.modules[k]
+    sys.modules.update(saved)
+
+
+def _paths(checkpointer_module: Any) -> tuple[dict[str, tuple[int, Callable[[], Any]]], dict[str, Callable[[], Any]]]:
+    updates = [_update(i) for i in range(N)]
+    encoded = [json.dumps(u.model_dump(mode="json")).encode() for u in updates]
+    repository = RedisStreamRepository.__new__(RedisStreamRepository)
+    repository.redis = _StubRedis()  # type: ignore[assignment]
+    repository.stream_maxlen = 100
+    repository.stream_ttl_seconds = 0
+
+    args = json.dumps(_tool_args())
+    arg_chunks = [args[i : i + 8] for i in range(0, len(args), 8)]
+    codex_lines = [
+        json.dumps(
+            {"type": "item.completed", "item": {"id": f"i{i}", "type": "agent_message", "text": f"step {i} " * 10}}
+        )
+        for i in range(N)
+    ]
+    checkpoint_body = {
+        "thread_id": "thread-1",
+        "checkpoint_ns": "",
+        "checkpoint_id": "1f0",
+        "checkpoint": {"v": 4, "id": "1f0", "channel_versions": {"messages": "00000000000000000000000000000042.1"}},
+        "metadata": {"source": "loop", "step": 42},
+        "blobs": [{"channel": "messages", "version": "1", "type": "msgpack", "blob": b"\x92" * 512}],
+    }
+    checkpoint_response = json.dumps({**checkpoint_body, "blobs": [], "pending_writes": []}).encode()
+
+    async def send_events() -> None:
+        for update in updates:
+            await repository.send_event(topic="t", event=update)
+
+    def accumulate() -> None:
+        for _ in range(N // 50):
+            accumulator = DeltaAccumulator()
+            for chunk in arg_chunks:
+                accumulator.add_delta(
+                    ToolRequestDelta(type="tool_request", tool_call_id="c1", name="search", arguments_delta=chunk)
+                )
+            accumulator.convert_to_content()
+
+    async def parse_codex() -> None:
+        async def lines():
+            for line in codex_lines:
+                yield line
+
+        async for _ in _convert_codex_impl(lines()):
+            pass
+
+    def derive_spans() -> None:
+        deriver = SpanDeriver()
+        for i in range(N // 10):
+            content = ToolRequestContent(author="agent", tool_call_id=f"c{i}", name="search", arguments={})
+            deriver.observe(StreamTaskMessageStart(type="start", index=i, content=content))
+            deriver.observe(
+                StreamTaskMessageDelta(
+                    type="delta",
+                    index=i,
+                    delta=ToolRequestDelta(
+                        type="tool_request", tool_call_id=f"c{i}", name="search", arguments_delta=args
+                    ),
+                )
+            )
+            deriver.observe(StreamTaskMessageDone(type="done", index=i))
+
+    def checkpoint_bodies() -> None:
+        for _ in range(N):
+            json_codec.dumps(checkpoint_body, default=checkpointer_module._json_default)
+            checkpointer_module._decode_body("application/json", checkpoint_response)
+
+    # path -> (operations per run, run)
+    return {
+        "redis.send_event": (N, lambda: asyncio.run(send_events())),
+        "redis.subscribe (decode)": (N, lambda: [json_codec.loads(e) for e in encoded]),
+        "DeltaAccumulator": (N // 50, accumulate),
+        "codex line parser": (N, lambda: asyncio.run(parse_codex())),
+        "SpanDeriver args": (N // 10, derive_spans),
+        "checkpointer bodies": (N, checkpoint_bodies),
+    }, {
+        "redis.send_event": lambda: [json.dumps(u.model_dump(mode="json")) for u in updates],
+        "redis.subscribe (decode)": lambda: [json.loads(e.decode("utf-8")) for e in encoded],
+    }
+
+
+def _timed(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t_start)
+    return best
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_LOAD_TESTS"),
+    reason="Load test — run with RUN_LOAD_TESTS=1",
+)
+class TestJsonCodecLoad:
+    def test_per_path_throughput(self, checkpointer_module, monkeypatch):
+        pytest.importorskip("orjson")
+        paths, legacy = _paths(checkpointer_module)
+        results: dict[str, dict[str, float]] = {}
+
+        for label, fn in legacy.items():
+            results.setdefault(label, {})["legacy"] = _timed(fn)
+        with monkeypatch.context() as m:
+            m.setattr(json_codec, "orjson", None)
+            for label, (_, fn) in paths.items():
+                results.setdefault(label, {})["stdlib"] = _timed(fn)
+        for label, (_, fn) in paths.items():
+            results[label]["orjson"] = _timed(fn)
+
+        # ---- Report ----
+        print()
+        print(f"{'=' * 76}")
+        print(" JSON codec throughput (operations/s, best of 3)")
+        print(f"{'=' * 76}")
+        print(f" {'path':<26}{'legacy':>12}{'stdlib':>12}{'orjson':>12}{'speedup':>12}")
+        for label, timings in results.items():
+            ops = paths[label][0]
+            baseline = timings.get("legacy", timings["stdlib"])
+            legacy_ops = f"{ops / timings['legacy']:>12,.0f}" if "legacy" in timings else f"{'-':>12}"
+            print(
+                f" {label:<26}{legacy_ops}{ops / timings['stdlib']:>12,.0f}{ops / timings['orjson']:>12,.0f}"
+                f"{baseline / timings['orjson']:>11.1f}x"
+            )
+        print(f"{'=' * 76}")
+        print()
+
+        assert results["redis.subscribe (decode)"]["orjson"] < results["redis.subscribe (decode)"]["legacy"]
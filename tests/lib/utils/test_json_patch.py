@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from agentex.lib.utils.json_patch import diff_json, apply_json_patch
+
+
+class TestDiffJson:
+    def test_only_changed_top_level_fields(self):
+        old = {"history": ["a"] * 100, "plan": ["x"], "gone": 1, "same": {"k": "v"}}
+        new = {"history": ["a"] * 100, "plan": ["x", "y"], "same": {"k": "v"}, "added": True}
+
+        assert diff_json(old, new) == [
+            {"op": "replace", "path": "/plan", "value": ["x", "y"]},
+            {"op": "add", "path": "/added", "value": True},
+            {"op": "remove", "path": "/gone"},
+        ]
+
+    def test_keys_are_escaped(self):
+        ops = diff_json({}, {"a/b": 1, "c~d": 2})
+        assert [op["path"] for op in ops] == ["/a~1b", "/c~0d"]
+        assert apply_json_patch({}, ops) == {"a/b": 1, "c~d": 2}
+
+    def test_round_trip(self):
+        old = {"a": 1, "b": [1, 2], "c": {"d": 1}}
+        new = {"b": [1, 2, 3], "c": {"d": 2}, "e": None}
+        assert apply_json_patch(old, diff_json(old, new)) == new
+
+
+class TestApplyJsonPatch:
+    def test_nested_paths_copy_on_write(self):
+        doc = {"plan": {"steps": ["a", "b"]}, "untouched": {"big": [1, 2, 3]}}
+
+        result = apply_json_patch(
+            doc,
+            [
+                {"op": "add", "path": "/plan/steps/-", "value": "c"},
+                {"op": "replace", "path": "/plan/steps/0", "value": "A"},
+                {"op": "add", "path": "/plan/done", "value": False},
+            ],
+        )
+
+        assert result == {"plan": {"steps": ["A", "b", "c"], "done": False}, "untouched": {"big": [1, 2, 3]}}
+        assert doc == {"plan": {"steps": ["a", "b"]}, "untouched": {"big": [1, 2, 3]}}
+        assert result["untouched"] is doc["untouched"]
+
+    def test_values_are_copied(self):
+        value = {"k": [1]}
+        result = apply_json_patch({}, [{"op": "add", "path": "/v", "value": value}])
+        value["k"].append(2)
+        assert result == {"v": {"k": [1]}}
+
+    def test_remove_from_list(self):
+        assert apply_json_patch({"l": [1, 2, 3]}, [{"op": "remove", "path": "/l/1"}]) == {"l": [1, 3]}
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            {"op": "replace", "path": "/missing", "value": 1},
+            {"op": "remove", "path": "/missing"},
+            {"op": "add", "path": "/missing/child", "value": 1},
+            {"op": "add", "path": "/scalar/child", "value": 1},
+            {"op": "move", "from": "/a", "path": "/b"},
+            {"op": "add", "path": "no-slash", "value": 1},
+        ],
+    )
+    def test_invalid_operations(self, op):
+        with pytest.raises(ValueError):
+            apply_json_patch({"scalar": 1}, [op])
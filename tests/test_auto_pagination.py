@@ -0,0 +1,191 @@
+"""Tests for the prefetching ``*_auto_paging`` iterators (``agentex._pagination``)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+from contextlib import aclosing
+
+import httpx
+import pytest
+
+from agentex import AsyncAgentex
+
+base_url = "http://agentex.test"
+
+LATENCY = 0.02
+
+
+class PagedTransport:
+    """Serves ``page_number`` pages of ``page_size`` items, recording when each request starts, ends or is cancelled."""
+
+    def __init__(self, total: int, page_size: int, *, fail_on_page: Optional[int] = None) -> None:
+        self.total = total
+        self.page_size = page_size
+        self.fail_on_page = fail_on_page
+        self.events: List[tuple[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def page(self, page_number: int) -> List[int]:
+        start = (page_number - 1) * self.page_size
+        return list(range(start, min(start + self.page_size, self.total)))
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        page_number = int(params.get("page_number", 0))
+        self.events.append(("request", page_number))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", page_number))
+            raise
+        finally:
+            self.in_flight -= 1
+        if page_number == self.fail_on_page:
+            return httpx.Response(500, json={"detail": "boom"})
+        return httpx.Response(200, json=self.body(request.url.path, params, self.page(page_number)))
+
+    def body(self, path: str, params: Dict[str, str], ids: List[int]) -> Any:
+        if path == "/spans":
+            return [{"id": f"s{i}", "name": "n", "start_time": "2024-01-01T00:00:00Z", "trace_id": "t"} for i in ids]
+        if path == "/messages":
+            return [_message(i, params["task_id"]) for i in ids]
+        return [{"id": f"t{i}"} for i in ids]
+
+    @property
+    def requested(self) -> List[Any]:
+        return [arg for kind, arg in self.events if kind == "request"]
+
+
+def _message(i: int, task_id: str) -> Dict[str, Any]:
+    return {"id": f"m{i}", "task_id": task_id, "content": {"type": "text", "author": "agent", "content": str(i)}}
+
+
+def _client(transport: Any) -> AsyncAgentex:
+    return AsyncAgentex(
+        base_url=base_url,
+        api_key="key",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(transport)),
+    )
+
+
+async def test_yields_every_item_in_order() -> None:
+    transport = PagedTransport(total=7, page_size=3)
+
+    tasks = [task.id async for task in _client(transport).tasks.list_auto_paging(limit=3, agent_name="a")]
+
+    assert tasks == [f"t{i}" for i in range(7)]
+    # pages are requested one at a time, in order, until the first empty page
+    assert transport.requested == [1, 2, 3, 4]
+    assert transport.max_in_flight == 1
+
+
+async def test_next_page_is_fetched_while_current_page_is_consumed() -> None:
+    transport = PagedTransport(total=6, page_size=3)
+
+    async for task in _client(transport).tasks.list_auto_paging(limit=3):
+        transport.events.append(("consumed", task.id))
+        await asyncio.sleep(LATENCY)
+
+    # page 2 was requested before the consumer reached the end of page 1
+    assert transport.events.index(("request", 2)) < transport.events.index(("consumed", "t1"))
+
+
+@pytest.mark.parametrize("prefetch", [1, 3])
+async def test_read_ahead_is_bounded(prefetch: int) -> None:
+    transport = PagedTransport(total=100, page_size=2)
+
+    async with aclosing(_client(transport).tasks.list_auto_paging(limit=2, prefetch=prefetch)) as tasks:
+        async for _ in tasks:
+            await asyncio.sleep(LATENCY * (prefetch + 3))
+            break
+
+    # the page being consumed, plus `prefetch` pages ahead of it
+    assert transport.requested == list(range(1, prefetch + 2))
+
+
+async def test_closing_early_cancels_the_request_in_flight() -> None:
+    transport = PagedTransport(total=100, page_size=2)
+
+    async with aclosing(_client(transport).tasks.list_auto_paging(limit=2)) as tasks:
+        async for _ in tasks:
+            await asyncio.sleep(LATENCY / 2)
+            break
+    assert transport.events[-2:] == [("request", 2), ("cancelled", 2)]
+
+    await asyncio.sleep(LATENCY * 3)
+    assert transport.requested == [1, 2]
+
+
+async def test_error_is_raised_after_earlier_pages() -> None:
+    transport = PagedTransport(total=10, page_size=2, fail_on_page=2)
+    seen: List[str] = []
+
+    with pytest.raises(Exception, match="boom"):
+        async for span in _client(transport).spans.list_auto_paging(limit=2, trace_id="t"):
+            seen.append(span.id)
+
+    assert seen == ["s0", "s1"]
+    assert transport.requested == [1, 2]
+
+
+async def test_messages_list_auto_paging() -> None:
+    transport = PagedTransport(total=5, page_size=2)
+
+    messages = [m.id async for m in _client(transport).messages.list_auto_paging(task_id="task", limit=2)]
+
+    assert messages == [f"m{i}" for i in range(5)]
+
+
+async def test_invalid_prefetch() -> None:
+    with pytest.raises(ValueError, match="prefetch"):
+        async for _ in _client(PagedTransport(0, 1)).tasks.list_auto_paging(prefetch=0):
+            pass
+
+
+class CursorTransport:
+    """Serves ``/messages/paginated`` as a chain of cursors ``c1``, ``c2``, ..."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.requests: List[Dict[str, str]] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        await asyncio.sleep(0)
+        index = int(params.get("cursor", "c0")[1:])
+        has_more = index + 1 < self.pages
+        return httpx.Response(
+            200,
+            json={
+                "data": [_message(index, params["task_id"])],
+                "has_more": has_more,
+                "next_cursor": f"c{index + 1}" if has_more else None,
+            },
+        )
+
+
+async def test_list_paginated_follows_next_cursor() -> None:
+    transport = CursorTransport(pages=4)
+
+    messages = [
+        m.id
+        async for m in _client(transport).messages.list_paginated_auto_paging(task_id="task", direction="newer", limit=1)
+    ]
+
+    assert messages == ["m0", "m1", "m2", "m3"]
+    assert [r.get("cursor") for r in transport.requests] == [None, "c1", "c2", "c3"]
+    assert all(r["direction"] == "newer" for r in transport.requests)
+
+
+async def test_list_paginated_starts_at_given_cursor() -> None:
+    transport = CursorTransport(pages=4)
+
+    messages = [m.id async for m in _client(transport).messages.list_paginated_auto_paging(task_id="task", cursor="c2")]
+
+    assert messages == ["m2", "m3"]
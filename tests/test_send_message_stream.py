@@ -0,0 +1,161 @@
+"""Tests for decoding ``agents.send_message_stream`` responses (``agentex._ndjson``)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+import pydantic
+
+from agentex import Agentex, AsyncAgentex, StreamFrameStats
+from agentex.types.task_message_update import StreamTaskMessageDelta
+
+base_url = "http://agentex.test"
+
+
+def _delta(i: int) -> dict[str, Any]:
+    return {
+        "id": 1,
+        "jsonrpc": "2.0",
+        "result": {"type": "delta", "index": 0, "delta": {"type": "text", "text_delta": f"tok{i}"}},
+    }
+
+
+class RecordingTransport:
+    """Serves a fixed NDJSON body and records the request params."""
+
+    def __init__(self, lines: list[str]):
+        self.body = "".join(line + "\n" for line in lines).encode()
+        self.requests: list[dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(json.loads(request.content))
+        return httpx.Response(200, content=self.body, headers={"content-type": "application/x-ndjson"})
+
+
+def _clients(transport: RecordingTransport) -> tuple[Agentex, AsyncAgentex]:
+    mock = httpx.MockTransport(transport)
+    return (
+        Agentex(base_url=base_url, api_key="key", http_client=httpx.Client(transport=mock)),
+        AsyncAgentex(base_url=base_url, api_key="key", http_client=httpx.AsyncClient(transport=mock)),
+    )
+
+
+async def _stream(sync: bool, transport: RecordingTransport, params: dict[str, Any], **kwargs: Any) -> list[Any]:
+    client, async_client = _clients(transport)
+    if sync:
+        return list(client.agents.send_message_stream(agent_name="a", params=params, **kwargs))  # type: ignore[arg-type]
+    return [u async for u in async_client.agents.send_message_stream(agent_name="a", params=params, **kwargs)]  # type: ignore[arg-type]
+
+
+PARAMS = {"content": {"type": "text", "author": "user", "content": "hi"}}
+
+parametrize_sync = pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+
+
+@parametrize_sync
+async def test_yields_typed_updates(sync: bool) -> None:
+    transport = RecordingTransport([json.dumps(_delta(0)), "", f"data: {json.dumps(_delta(1))}", "   "])
+    stats = StreamFrameStats()
+
+    updates = await _stream(sync, transport, dict(PARAMS), frame_stats=stats)
+
+    assert [u.result.delta.text_delta for u in updates] == ["tok0", "tok1"]
+    assert all(isinstance(u.result, StreamTaskMessageDelta) for u in updates)
+    assert stats == StreamFrameStats(frames=2)
+
+
+@parametrize_sync
+async def test_does_not_mutate_params(sync: bool) -> None:
+    transport = RecordingTransport([json.dumps(_delta(0))])
+    params = dict(PARAMS)
+
+    await _stream(sync, transport, params)
+
+    assert "stream" not in params
+    assert transport.requests[0]["params"]["stream"] is True
+
+
+@parametrize_sync
+async def test_malformed_frames_are_counted(sync: bool) -> None:
+    transport = RecordingTransport([json.dumps(_delta(0)), "{not json", "event: ping", json.dumps(_delta(1))])
+    stats = StreamFrameStats()
+
+    updates = await _stream(sync, transport, dict(PARAMS), frame_stats=stats)
+
+    assert len(updates) == 2
+    assert (stats.frames, stats.malformed) == (4, 2)
+    assert stats.last_error is not None and "event: ping" in stats.last_error
+
+
+async def test_invalid_frame_raises_in_async() -> None:
+    invalid = {"id": 1, "result": {"type": "delta", "index": "not-an-int"}}
+    transport = RecordingTransport([json.dumps(_delta(0)), json.dumps(invalid)])
+    stats = StreamFrameStats()
+
+    with pytest.raises(ValueError, match="Invalid SendMessageStreamResponse"):
+        await _stream(False, transport, dict(PARAMS), frame_stats=stats)
+    assert stats.invalid == 1
+
+
+async def test_invalid_frame_is_skipped_in_sync() -> None:
+    invalid = {"id": 1, "result": {"type": "delta", "index": "not-an-int"}}
+    transport = RecordingTransport([json.dumps(invalid), json.dumps(_delta(0))])
+    stats = StreamFrameStats()
+
+    updates = await _stream(True, transport, dict(PARAMS), frame_stats=stats)
+
+    assert len(updates) == 1
+    assert stats.invalid == 1
+
+
+@parametrize_sync
+async def test_lenient_mode_yields_unvalidated_frames(sync: bool) -> None:
+    newer = {"id": 1, "result": {"type": "delta", "index": "first", "delta": {"type": "text", "text_delta": "x"}}}
+    transport = RecordingTransport([json.dumps(newer), json.dumps(_delta(0))])
+    stats = StreamFrameStats()
+
+    updates = await _stream(sync, transport, dict(PARAMS), lenient=True, frame_stats=stats)
+
+    assert len(updates) == 2
+    assert updates[0].result.delta.text_delta == "x"
+    assert (stats.unvalidated, stats.invalid) == (1, 0)
+
+
+_PARENT = {"id": "m1", "task_id": "t1", "content": {"type": "text", "author": "agent", "content": "hi"}}
+_FRAMES = [
+    {"type": "start", "index": 0, "content": {"type": "text", "author": "agent", "content": ""}},
+    {"type": "start", "content": {"type": "tool_request", "author": "agent", "tool_call_id": "c", "name": "n", "arguments": {}}},
+    {"type": "delta", "index": 0, "delta": {"type": "text", "text_delta": "x"}, "parent_task_message": _PARENT},
+    {"type": "delta", "delta": {"type": "tool_request", "tool_call_id": "c", "name": "n", "arguments_delta": "{"}},
+    {"type": "delta", "delta": {"type": "reasoning_summary", "summary_index": 0, "summary_delta": "s"}},
+    {"type": "delta", "delta": {"text_delta": "untagged"}},
+    {"type": "full", "index": 1, "content": {"type": "data", "author": "agent", "data": {"k": 1}}},
+    {"type": "done", "index": 1, "parent_task_message": _PARENT},
+    {"index": 2, "content": {"type": "text", "author": "agent", "content": "no tag"}},
+    {"type": "unknown", "index": 3},
+    None,
+]
+
+
+@pytest.mark.parametrize("frame", _FRAMES)
+def test_tag_first_validation_matches_plain_validation(frame: Any) -> None:
+    from agentex._ndjson import NDJSONDecoder
+    from agentex.types.agent_rpc_response import SendMessageStreamResponse
+
+    line = json.dumps({"id": 1, "jsonrpc": "2.0", "result": frame})
+
+    try:
+        expected = SendMessageStreamResponse.model_validate_json(line)
+    except pydantic.ValidationError:
+        with pytest.raises(ValueError, match="Invalid SendMessageStreamResponse"):
+            NDJSONDecoder(SendMessageStreamResponse).decode(line)
+        return
+
+    decoded = NDJSONDecoder(SendMessageStreamResponse).decode(line)
+    assert decoded == expected
+    assert type(decoded.result) is type(expected.result)
+    if expected.result is not None and getattr(expected.result, "delta", None) is not None:
+        assert type(decoded.result.delta) is type(expected.result.delta)  # type: ignore[union-attr]
@@ -0,0 +1,125 @@
+"""
+Benchmark for ``agents.send_message_stream`` decoding.
+
+A local ASGI stub answers ``message/send`` with 50k NDJSON text deltas. The
+same stream is consumed with the previous per-line decode loop
+(``json.loads`` + ``SendMessageStreamResponse.model_validate``) and with
+``send_message_stream``, which validates each line from its JSON text through
+a cached ``TypeAdapter``. Both run through the full client over
+``httpx.ASGITransport``, so transport and line splitting are included.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/test_send_message_stream_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from agentex import AsyncAgentex, StreamFrameStats
+from agentex.types.agent_rpc_response import SendMessageStreamResponse
+
+N_DELTAS = 50_000
+REPEATS = 3
+PARAMS: Any = {"content": {"type": "text", "author": "user", "content": "hi"}}
+
+
+def _body() -> bytes:
+    parent = {"id": "msg_1", "task_id": "task_1", "content": {"type": "text", "author": "agent", "content": ""}}
+    lines = [
+        json.dumps(
+            {
+                "id": 1,
+                "jsonrpc": "2.0",
+                "result": {
+                    "type": "delta",
+                    "index": 0,
+                    "delta": {"type": "text", "text_delta": f" tok{i}"},
+                    "parent_task_message": parent,
+                },
+            }
+        )
+        for i in range(N_DELTAS)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _stub_app(body: bytes):
+    async def app(scope, receive, send):
+        assert scope["type"] == "http"
+        while (await receive()).get("more_body"):
+            pass
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for start in range(0, len(body), 64 * 1024):
+            await send({"type": "http.response.body", "body": body[start : start + 64 * 1024], "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def _previous_loop(client: AsyncAgentex) -> int:
+    count = 0
+    async with client.agents.with_streaming_response.rpc_by_name(
+        agent_name="stub", method="message/send", params={**PARAMS, "stream": True}
+    ) as response:
+        async for _line in response.iter_lines():
+            line = _line.strip()
+            if line.startswith("data:"):
+                line = line[len("data:") :].strip()
+            if not line:
+                continue
+            try:
+                SendMessageStreamResponse.model_validate(json.loads(line), from_attributes=True)
+                count += 1
+            except (json.JSONDecodeError, ValidationError):
+                continue
+    return count
+
+
+async def _send_message_stream(client: AsyncAgentex) -> int:
+    stats = StreamFrameStats()
+    count = 0
+    async for _ in client.agents.send_message_stream(agent_name="stub", params=PARAMS, frame_stats=stats):
+        count += 1
+    assert stats.malformed == stats.invalid == 0
+    return count
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+async def test_send_message_stream_throughput():
+    body = _body()
+    client = AsyncAgentex(
+        base_url="http://stub",
+        api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=_stub_app(body))),
+    )
+
+    results: dict[str, float] = {}
+    for name, consume in (("previous loop", _previous_loop), ("send_message_stream", _send_message_stream)):
+        best = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            assert await consume(client) == N_DELTAS
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+
+    print()
+    print("=" * 64)
+    print(f"{N_DELTAS:,} deltas, {len(body) / 1e6:.1f} MB over ASGITransport, best of {REPEATS}")
+    print("=" * 64)
+    print(f"{'decoder':<22} {'wall s':>10} {'deltas/s':>14} {'us/delta':>12}")
+    for name, wall in results.items():
+        print(f"{name:<22} {wall:>10.2f} {N_DELTAS / wall:>14,.0f} {wall / N_DELTAS * 1e6:>12.1f}")
+    print("=" * 64)
+
+    assert results["send_message_stream"] < results["previous loop"]
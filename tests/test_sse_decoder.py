@@ -0,0 +1,135 @@
+"""Randomized equivalence tests for the incremental ``SSEDecoder``.
+
+Random streams mix every field type, comments, unknown fields, ``\\r``/``\\n``/
+``\\r\\n`` terminators, multi-byte and "special" newline characters (which
+must not split lines), and are cut into random chunks, including cuts inside a
+``\\r\\n`` pair and inside multi-byte characters. The decoded events must match
+``LegacySSEDecoder``, the line-at-a-time decoder it replaced, fed the whole
+stream at once. (Fed the same chunks, the legacy decoder can read ``\\r\\r``
+followed by a chunk starting with ``\\n`` as two blank lines and emit a
+spurious empty event.)
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Iterator, AsyncIterator
+
+import pytest
+
+from agentex._streaming import SSEDecoder, ServerSentEvent
+
+from .legacy_sse_decoder import LegacySSEDecoder
+
+_TEXT = ["hello", " world", "", "{\"delta\": \"tok\"}", "известни", " ", "\x1c", "\x0b", "😀", "\u2028", "\x85", ":", " lead", "a: b"]
+_TERMINATORS = [b"\n", b"\r", b"\r\n"]
+
+
+def _line(rng: random.Random) -> str:
+    text = "".join(rng.choice(_TEXT) for _ in range(rng.randint(0, 3)))
+    kind = rng.randrange(12)
+    if kind < 4:
+        return f"data: {text}"
+    if kind == 4:
+        return f"data:{text}"
+    if kind == 5:
+        return rng.choice(["data", "event", "id", "retry"])
+    if kind == 6:
+        return f"event: {text}"
+    if kind == 7:
+        return f"id: {text}" + rng.choice(["", "\0"])
+    if kind == 8:
+        return f"retry: {rng.choice(['10', ' 20', 'x', '', '3.5'])}"
+    if kind == 9:
+        return f":{text}"
+    if kind == 10:
+        return f"unknown: {text}"
+    return ""
+
+
+def _random_stream(rng: random.Random) -> bytes:
+    parts = []
+    for _ in range(rng.randint(0, 40)):
+        parts.append(_line(rng).encode("utf-8"))
+        parts.append(rng.choice(_TERMINATORS))
+    if rng.random() < 0.3:
+        parts.append(_line(rng).encode("utf-8"))
+    return b"".join(parts)
+
+
+def _random_chunks(rng: random.Random, stream: bytes) -> list[bytes]:
+    if rng.random() < 0.3:
+        # whole events per chunk, as a server flushing each event sends them
+        events = stream.split(b"\n\n")
+        return [event + b"\n\n" for event in events[:-1]] + [events[-1]]
+    chunks, pos = [], 0
+    while pos < len(stream):
+        size = rng.choice([0, 1, 2, 3, rng.randint(1, 64)])
+        chunks.append(stream[pos : pos + size])
+        pos += size
+    return chunks
+
+
+def _key(event: ServerSentEvent) -> tuple[Any, ...]:
+    return (event.event, event.data, event.id, event.retry)
+
+
+async def _aiter(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _collect(events: Iterator[ServerSentEvent]) -> tuple[list[tuple[Any, ...]], type[BaseException] | None]:
+    out = []
+    try:
+        for event in events:
+            out.append(_key(event))
+    except Exception as e:
+        return out, type(e)
+    return out, None
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_legacy_decoder(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(100):
+        stream = _random_stream(rng)
+        chunks = _random_chunks(rng, stream)
+
+        expected = _collect(LegacySSEDecoder().iter_bytes(iter([stream])))
+        assert _collect(SSEDecoder().iter_bytes(iter([stream]))) == expected, stream
+        assert _collect(SSEDecoder().iter_bytes(iter(chunks))) == expected, chunks
+
+
+async def test_async_matches_legacy_decoder() -> None:
+    rng = random.Random(1234)
+    for _ in range(100):
+        stream = _random_stream(rng)
+        chunks = _random_chunks(rng, stream)
+
+        expected = [_key(e) async for e in LegacySSEDecoder().aiter_bytes(_aiter([stream]))]
+        assert [_key(e) async for e in SSEDecoder().aiter_bytes(_aiter(chunks))] == expected, chunks
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [b"data: a\n\ndata: \xff\n\n"],
+        [b"data: a\n", b"\ndata: b\n\n: \xfe\n\n"],
+    ],
+    ids=["bad-data", "bad-comment"],
+)
+def test_invalid_utf8_raises_after_earlier_events(chunks: list[bytes]) -> None:
+    expected = _collect(LegacySSEDecoder().iter_bytes(iter(chunks)))
+
+    assert expected[1] is UnicodeDecodeError
+    assert _collect(SSEDecoder().iter_bytes(iter(chunks))) == expected
+
+
+def test_event_is_emitted_as_soon_as_its_blank_line_arrives() -> None:
+    decoder = SSEDecoder()
+    chunks = iter([b"data: a\r\n", b"\r", b"\nevent: next\n"])
+    events = decoder.iter_bytes(chunks)
+
+    assert _key(next(events)) == (None, "a", None, None)
+    assert list(events) == []
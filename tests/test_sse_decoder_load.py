@@ -0,0 +1,100 @@
+"""
+Throughput benchmark for the incremental ``SSEDecoder``.
+
+Decodes a 100k-event task-message delta stream (the shape the server sends
+for token streaming) with the incremental decoder and with
+``LegacySSEDecoder``, the line-at-a-time decoder it replaced. Two chunkings:
+one network chunk per event (a server flushing each token) and 16 KiB reads
+(a client catching up on a buffered stream). Reports decoding alone and
+decoding plus ``sse.json()``, which ``Stream``/``AsyncStream`` run on every
+event.
+
+SKIPPED by default.  Run explicitly with:
+
+    RUN_LOAD_TESTS=1 PYTHONPATH=src python -m pytest \
+        tests/test_sse_decoder_load.py \
+        -v -o "addopts=--tb=short" -s
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import random
+from typing import Any, Callable, AsyncIterator
+
+import pytest
+
+from agentex._streaming import SSEDecoder
+
+from .legacy_sse_decoder import LegacySSEDecoder
+
+N_EVENTS = 100_000
+READ_SIZE = 16 * 1024
+REPEATS = 3
+
+
+def _recorded_stream() -> list[bytes]:
+    """One SSE frame per event: start, 100k text deltas, done."""
+    rng = random.Random(0)
+    parent = {"id": "msg_1", "task_id": "task_1", "streaming_status": "IN_PROGRESS"}
+    words = ["the", " model", " is", " streaming", " tokens", ",", " одна", " 😀", "\n", " end"]
+
+    frames = [{"type": "start", "index": 0, "content": {"type": "text", "author": "agent", "content": ""}}]
+    frames += [
+        {"type": "delta", "index": 0, "delta": {"type": "text", "text_delta": rng.choice(words)}, "parent_task_message": parent}
+        for _ in range(N_EVENTS - 2)
+    ]
+    frames.append({"type": "done", "index": 0, "parent_task_message": parent})
+    return [f"data: {json.dumps(frame, ensure_ascii=False)}\n\n".encode() for frame in frames]
+
+
+def _reads(stream: bytes, size: int) -> list[bytes]:
+    return [stream[i : i + size] for i in range(0, len(stream), size)]
+
+
+async def _aiter(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _decode(decoder_cls: Callable[[], Any], chunks: list[bytes], *, parse: bool) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        count = 0
+        async for sse in decoder_cls().aiter_bytes(_aiter(chunks)):
+            if parse:
+                sse.json()
+            count += 1
+        best = min(best, time.perf_counter() - start)
+        assert count == N_EVENTS
+    return best
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_LOAD_TESTS"), reason="Load test — run with RUN_LOAD_TESTS=1")
+async def test_incremental_decoder_throughput():
+    frames = _recorded_stream()
+    stream = b"".join(frames)
+    chunkings = {"frame per chunk": frames, f"{READ_SIZE // 1024} KiB reads": _reads(stream, READ_SIZE)}
+
+    print()
+    print("=" * 80)
+    print(f"{N_EVENTS:,} events, {len(stream) / 1e6:.1f} MB, best of {REPEATS}")
+    print("=" * 80)
+    print(f"{'chunking':<18} {'':<8} {'legacy ev/s':>14} {'incremental ev/s':>18} {'speedup':>10}")
+    decode_speedups = []
+    for name, chunks in chunkings.items():
+        for parse in (False, True):
+            legacy = await _decode(LegacySSEDecoder, chunks, parse=parse)
+            incremental = await _decode(SSEDecoder, chunks, parse=parse)
+            if not parse:
+                decode_speedups.append(legacy / incremental)
+            print(
+                f"{name:<18} {'+ json' if parse else 'decode':<8} {N_EVENTS / legacy:>14,.0f} "
+                f"{N_EVENTS / incremental:>18,.0f} {legacy / incremental:>9.2f}x"
+            )
+    print("=" * 80)
+
+    assert all(speedup > 1.3 for speedup in decode_speedups)